@@ -3,17 +3,39 @@
 A collection of classes for interfacing with built-in ML/AI features in macOS.
 """
 
-from typing import Union
+import json
+import os
+import re
+from collections import Counter
+from contextlib import contextmanager
+from typing import Iterator, Literal, Union
 
-import Foundation
-import LatentSemanticMapping
+from PyXA.XALazy import lazy_import
 
-from PyXA import XABase
+Foundation = lazy_import("Foundation")
+LatentSemanticMapping = lazy_import("LatentSemanticMapping")
+XABase = lazy_import("PyXA.XABase")
+np = lazy_import("numpy")
 
 
 class XALSM:
+    def __new__(
+        cls,
+        dataset: Union[dict[str, list[str]], None] = None,
+        from_file: bool = False,
+        backend: Literal["native", "numpy"] = "native",
+    ):
+        if backend == "numpy":
+            return XANumPyLSM(dataset, from_file)
+        if backend != "native":
+            raise ValueError(f"Unknown LSM backend: {backend}")
+        return super().__new__(cls)
+
     def __init__(
-        self, dataset: Union[dict[str, list[str]], None] = None, from_file: bool = False
+        self,
+        dataset: Union[dict[str, list[str]], None] = None,
+        from_file: bool = False,
+        backend: Literal["native", "numpy"] = "native",
     ):
         """Initializes a Latent Semantic Mapping environment.
 
@@ -21,6 +43,8 @@ class XALSM:
         :type dataset: Union[dict[str, list[str]], None], optional
         :param from_file: Whether the LSM is being loaded from a file, defaults to False. Cannot be False is dataset is None.
         :type from_file: bool, optional
+        :param backend: The implementation to use -- "native" for the LatentSemanticMapping framework, or "numpy" for :class:`XANumPyLSM`, which also runs on other platforms, defaults to "native"
+        :type backend: Literal["native", "numpy"], optional
         :raises ValueError: Either you must provide a dataset, or you must load an existing map from an external file
 
         :Example 1: Classify emails based on subject line
@@ -70,8 +94,13 @@ class XALSM:
         Complete registration form asap receive your rewards - category: junk
 
         .. versionadded:: 0.1.0
+
+        .. versionchanged:: 0.3.1
+
+           Added the ``backend`` parameter.
         """
         self.__categories = {}
+        self.__training_depth = 0
         if dataset is None and not from_file:
             raise ValueError(
                 "You must either load a map from an external file or provide an initial dataset."
@@ -84,20 +113,47 @@ class XALSM:
             self.__dataset = dataset
 
             self.map = LatentSemanticMapping.LSMMapCreate(None, 0)
-            LatentSemanticMapping.LSMMapStartTraining(self.map)
-            LatentSemanticMapping.LSMMapSetProperties(
-                self.map,
-                {
-                    LatentSemanticMapping.kLSMSweepCutoffKey: 0,
-                    # LatentSemanticMapping.kLSMPrecisionKey: LatentSemanticMapping.kLSMPrecisionDouble,
-                    LatentSemanticMapping.kLSMAlgorithmKey: LatentSemanticMapping.kLSMAlgorithmSparse,
-                },
-            )
+            with self.training():
+                LatentSemanticMapping.LSMMapSetProperties(
+                    self.map,
+                    {
+                        LatentSemanticMapping.kLSMSweepCutoffKey: 0,
+                        # LatentSemanticMapping.kLSMPrecisionKey: LatentSemanticMapping.kLSMPrecisionDouble,
+                        LatentSemanticMapping.kLSMAlgorithmKey: LatentSemanticMapping.kLSMAlgorithmSparse,
+                    },
+                )
+
+                for category in dataset:
+                    self.__add_category(category)
+
+    @contextmanager
+    def training(self) -> Iterator["XALSM"]:
+        """Groups changes to the map into one training session, so that the map is compiled once when the session ends rather than after every change.
+
+        Sessions can be nested; the map is compiled when the outermost session ends. Changes are kept and compiled even if the session ends with an exception.
 
-            for category in dataset:
-                self.__add_category(category)
+        :yield: The map
+        :rtype: Iterator[XALSM]
 
-            LatentSemanticMapping.LSMMapCompile(self.map)
+        :Example: Train a map on many subject lines at once
+
+        >>> import PyXA
+        >>> lsm = PyXA.XALSM({"junk": [], "other": []})
+        >>> with lsm.training():
+        >>>     for subject, category in labelled_subjects:
+        >>>         lsm.add_text(subject, category)
+
+        .. versionadded:: 0.3.1
+        """
+        self.__training_depth += 1
+        if self.__training_depth == 1:
+            LatentSemanticMapping.LSMMapStartTraining(self.map)
+        try:
+            yield self
+        finally:
+            self.__training_depth -= 1
+            if self.__training_depth == 0:
+                LatentSemanticMapping.LSMMapCompile(self.map)
 
     def __add_category(self, category: str) -> int:
         loc = Foundation.CFLocaleGetSystem()
@@ -114,7 +170,7 @@ class XALSM:
         LatentSemanticMapping.LSMMapAddText(self.map, text_ref, category_ref)
         return category_ref
 
-    def save(self, file_path: Union[XABase.XAPath, str]) -> bool:
+    def save(self, file_path: Union["XABase.XAPath", str]) -> bool:
         """Saves the map to an external file.
 
         :param file_path: The path to save the map at
@@ -144,11 +200,16 @@ class XALSM:
             return True
         return False
 
-    def load(file_path: Union[XABase.XAPath, str]) -> "XALSM":
+    def load(
+        file_path: Union["XABase.XAPath", str],
+        backend: Literal["native", "numpy"] = "native",
+    ) -> "XALSM":
         """Loads a map from an external file.
 
         :param file_path: The file path for load the map from
         :type file_path: Union[XABase.XAPath, str]
+        :param backend: The implementation that saved the map, defaults to "native"
+        :type backend: Literal["native", "numpy"], optional
         :return: The populated LSM object
         :rtype: XALSM
 
@@ -162,7 +223,14 @@ class XALSM:
         [(2, 0.9422407150268555)]
 
         .. versionadded:: 0.1.0
+
+        .. versionchanged:: 0.3.1
+
+           Added the ``backend`` parameter.
         """
+        if backend == "numpy":
+            return XANumPyLSM.load(file_path)
+
         if isinstance(file_path, str):
             file_path = XABase.XAPath(file_path)
 
@@ -207,18 +275,15 @@ class XALSM:
 
         .. versionadded:: 0.1.0
         """
-        LatentSemanticMapping.LSMMapStartTraining(self.map)
-
         if initial_data is None:
             initial_data = []
 
         if name in self.__dataset:
             raise ValueError("The category name must be unique.")
 
-        self.__dataset[name] = initial_data
-        category_ref = self.__add_category(name)
-        LatentSemanticMapping.LSMMapCompile(self.map)
-        return category_ref
+        with self.training():
+            self.__dataset[name] = initial_data
+            return self.__add_category(name)
 
     def add_data(self, data: dict[Union[int, str], list[str]]) -> list[int]:
         """Adds the provided data, organized by category, to the active map.
@@ -247,24 +312,23 @@ class XALSM:
         .. versionadded:: 0.1.0
         """
         category_refs = []
-        LatentSemanticMapping.LSMMapStartTraining(self.map)
-        for category in data:
-            if category not in self.__dataset:
-                self.__dataset[category] = data[category]
-                category_refs.append(self.__add_category(category))
-            else:
-                loc = Foundation.CFLocaleGetSystem()
-                text_ref = LatentSemanticMapping.LSMTextCreate(None, self.map)
-                LatentSemanticMapping.LSMTextAddWords(
-                    text_ref,
-                    " ".join(data[category]),
-                    loc,
-                    LatentSemanticMapping.kLSMTextPreserveAcronyms,
-                )
-                LatentSemanticMapping.LSMMapAddText(
-                    self.map, text_ref, self.__categories[category]
-                )
-        LatentSemanticMapping.LSMMapCompile(self.map)
+        with self.training():
+            for category in data:
+                if category not in self.__dataset:
+                    self.__dataset[category] = data[category]
+                    category_refs.append(self.__add_category(category))
+                else:
+                    loc = Foundation.CFLocaleGetSystem()
+                    text_ref = LatentSemanticMapping.LSMTextCreate(None, self.map)
+                    LatentSemanticMapping.LSMTextAddWords(
+                        text_ref,
+                        " ".join(data[category]),
+                        loc,
+                        LatentSemanticMapping.kLSMTextPreserveAcronyms,
+                    )
+                    LatentSemanticMapping.LSMMapAddText(
+                        self.map, text_ref, self.__categories[category]
+                    )
         return category_refs
 
     def add_text(self, text: str, category: Union[int, str], weight: float = 1):
@@ -288,19 +352,18 @@ class XALSM:
 
         .. versionadded:: 0.1.0
         """
-        LatentSemanticMapping.LSMMapStartTraining(self.map)
         if category not in self.__dataset and category not in self.__categories:
             raise ValueError(f"Invalid category: {category}")
 
-        loc = Foundation.CFLocaleGetSystem()
-        text_ref = LatentSemanticMapping.LSMTextCreate(None, self.map)
-        LatentSemanticMapping.LSMTextAddWords(
-            text_ref, text, loc, LatentSemanticMapping.kLSMTextPreserveAcronyms
-        )
-        LatentSemanticMapping.LSMMapAddTextWithWeight(
-            self.map, text_ref, self.__categories[category], weight
-        )
-        LatentSemanticMapping.LSMMapCompile(self.map)
+        with self.training():
+            loc = Foundation.CFLocaleGetSystem()
+            text_ref = LatentSemanticMapping.LSMTextCreate(None, self.map)
+            LatentSemanticMapping.LSMTextAddWords(
+                text_ref, text, loc, LatentSemanticMapping.kLSMTextPreserveAcronyms
+            )
+            LatentSemanticMapping.LSMMapAddTextWithWeight(
+                self.map, text_ref, self.__categories[category], weight
+            )
 
     def categorize_query(
         self, query: str, num_results: int = 1
@@ -342,7 +405,33 @@ class XALSM:
 
         .. versionadded:: 0.1.0
         """
+        return self.__categorize(query, num_results, Foundation.CFLocaleGetSystem())
+
+    def categorize_many(
+        self, queries: list[str], num_results: int = 1
+    ) -> list[list[tuple[int, float]]]:
+        """Categorizes each of several queries. See :func:`categorize_query`.
+
+        :param queries: The queries to categorize
+        :type queries: list[str]
+        :param num_results: The number of categorizations to show for each query, defaults to 1
+        :type num_results: int, optional
+        :return: The categorizations of each query, in order
+        :rtype: list[list[tuple[int, float]]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> lsm = PyXA.XALSM.load("/Users/steven/Downloads/gaming-productivity.map")
+        >>> print(lsm.categorize_many(["Hidden survival base on our server", "How to stop procrastinating"]))
+        [[(1, 0.7313863635063171)], [(2, 0.9422407150268555)]]
+
+        .. versionadded:: 0.3.1
+        """
         loc = Foundation.CFLocaleGetSystem()
+        return [self.__categorize(query, num_results, loc) for query in queries]
+
+    def __categorize(self, query: str, num_results: int, loc) -> list[tuple[int, float]]:
         text_ref = LatentSemanticMapping.LSMTextCreate(None, self.map)
         LatentSemanticMapping.LSMTextAddWords(text_ref, query, loc, 0)
         rows = LatentSemanticMapping.LSMResultCreate(
@@ -356,3 +445,302 @@ class XALSM:
             score = LatentSemanticMapping.LSMResultGetScore(rows, i)
             categorization.append((category_num, score))
         return categorization
+
+
+class XANumPyLSM:
+    """A latent semantic map implemented with NumPy, with the same interface as :class:`XALSM`.
+
+    Each category is represented by the TF-IDF weights of the words in its texts. Compiling the map takes a truncated singular value decomposition of the category-term matrix, and queries are scored by their cosine similarity to each category in the reduced space. Unlike :class:`XALSM`, this backend does not require the LatentSemanticMapping framework, so it can be used on any platform where NumPy is installed.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        dataset: Union[dict[str, list[str]], None] = None,
+        from_file: bool = False,
+        dimensions: Union[int, None] = None,
+    ):
+        """Initializes a latent semantic map.
+
+        :param dataset: The initial dataset, specified as a dictionary where keys are categories and values are list of corresponding texts, defaults to None. Cannot be None if from_file is False.
+        :type dataset: Union[dict[str, list[str]], None], optional
+        :param from_file: Whether the map is being loaded from a file, defaults to False. Cannot be False is dataset is None.
+        :type from_file: bool, optional
+        :param dimensions: The number of dimensions to keep from the decomposition, defaults to one per category
+        :type dimensions: Union[int, None], optional
+        :raises ValueError: Either you must provide a dataset, or you must load an existing map from an external file
+
+        :Example:
+
+        >>> import PyXA
+        >>> lsm = PyXA.XALSM({
+        >>>     "color": ["red orange yellow green blue purple"],
+        >>>     "number": ["one two three four five six"],
+        >>> }, backend="numpy")
+        >>> print(lsm.categorize_query("green and blue"))
+        [(1, 1.0)]
+
+        .. versionadded:: 0.3.1
+        """
+        if dataset is None and not from_file:
+            raise ValueError(
+                "You must either load a map from an external file or provide an initial dataset."
+            )
+
+        self.dimensions = dimensions  #: The number of dimensions kept from the decomposition, or None to keep one per category
+        self.__categories = {}
+        self.__counts: list[Counter] = []
+        self.__training_depth = 0
+        self.__compiled = None
+
+        with self.training():
+            for category, texts in (dataset or {}).items():
+                self.__add_category(category, texts)
+
+    @contextmanager
+    def training(self) -> Iterator["XANumPyLSM"]:
+        """Groups changes to the map into one training session, so that the map is compiled once when the session ends rather than after every change. See :func:`XALSM.training`.
+
+        :yield: The map
+        :rtype: Iterator[XANumPyLSM]
+
+        .. versionadded:: 0.3.1
+        """
+        self.__training_depth += 1
+        try:
+            yield self
+        finally:
+            self.__training_depth -= 1
+            if self.__training_depth == 0:
+                self.__compile()
+
+    def save(self, file_path: Union["XABase.XAPath", str]) -> bool:
+        """Saves the map to an external file.
+
+        :param file_path: The path to save the map at
+        :type file_path: Union[XABase.XAPath, str]
+        :return: Whether the save was successful
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        names = [None] * len(self.__counts)
+        for name, category_ref in self.__categories.items():
+            if name != category_ref or names[category_ref - 1] is None:
+                names[category_ref - 1] = name
+
+        data = {
+            "dimensions": self.dimensions,
+            "categories": names,
+            "counts": [dict(counts) for counts in self.__counts],
+        }
+        try:
+            with open(_path_of(file_path), "w", encoding="utf-8") as f:
+                json.dump(data, f)
+        except OSError:
+            return False
+        return True
+
+    @staticmethod
+    def load(file_path: Union["XABase.XAPath", str]) -> "XANumPyLSM":
+        """Loads a map saved by :func:`save`.
+
+        :param file_path: The file path to load the map from
+        :type file_path: Union[XABase.XAPath, str]
+        :return: The populated map
+        :rtype: XANumPyLSM
+
+        .. versionadded:: 0.3.1
+        """
+        with open(_path_of(file_path), encoding="utf-8") as f:
+            data = json.load(f)
+
+        new_lsm = XANumPyLSM(from_file=True, dimensions=data["dimensions"])
+        with new_lsm.training():
+            for name, counts in zip(data["categories"], data["counts"]):
+                new_lsm.__add_category(name, [])
+                new_lsm.__counts[-1].update(counts)
+        return new_lsm
+
+    def add_category(
+        self, name: str, initial_data: Union[list[str], None] = None
+    ) -> int:
+        """Adds a new category to the map, optionally filling the category with initial text data.
+
+        :param name: The name of the category
+        :type name: str
+        :param initial_data: The initial texts of the category, defaults to None
+        :type initial_data: list[str]
+        :raises ValueError: The category name is already in use
+        :return: The ID of the new category
+        :rtype: int
+
+        .. versionadded:: 0.3.1
+        """
+        if name in self.__categories:
+            raise ValueError("The category name must be unique.")
+
+        with self.training():
+            return self.__add_category(name, initial_data or [])
+
+    def add_data(self, data: dict[Union[int, str], list[str]]) -> list[int]:
+        """Adds the provided data, organized by category, to the map.
+
+        :param data: A dictionary specifying new or existing categories along with data to input into them
+        :type data: dict[Union[int, str], list[str]]
+        :return: A list of newly created category IDs
+        :rtype: list[int]
+
+        .. versionadded:: 0.3.1
+        """
+        category_refs = []
+        with self.training():
+            for category, texts in data.items():
+                if category not in self.__categories:
+                    category_refs.append(self.__add_category(category, texts))
+                else:
+                    counts = self.__counts[self.__categories[category] - 1]
+                    for text in texts:
+                        counts.update(_words(text))
+        return category_refs
+
+    def add_text(self, text: str, category: Union[int, str], weight: float = 1):
+        """Adds the given text to the specified category, applying an optional weight.
+
+        :param text: The text to add to the dataset
+        :type text: str
+        :param category: The category to add the text to
+        :type category: Union[int, str]
+        :param weight: The weight to assign to the text entry, defaults to 1
+        :type weight: float, optional
+        :raises ValueError: The specified category must be a valid category name or ID
+
+        .. versionadded:: 0.3.1
+        """
+        if category not in self.__categories:
+            raise ValueError(f"Invalid category: {category}")
+
+        with self.training():
+            counts = self.__counts[self.__categories[category] - 1]
+            for word in _words(text):
+                counts[word] += weight
+
+    def categorize_query(
+        self, query: str, num_results: int = 1
+    ) -> list[tuple[int, float]]:
+        """Categorizes the query based on the current weights in the map.
+
+        :param query: The query to categorize
+        :type query: str
+        :param num_results: The number of categorizations to show, defaults to 1
+        :type num_results: int, optional
+        :return: A list of tuples identifying categories and their associated score. A higher score indicates better fit. If no word of the query is known to the map, the list will be empty.
+        :rtype: list[tuple[int, float]]
+
+        .. versionadded:: 0.3.1
+        """
+        return self.categorize_many([query], num_results)[0]
+
+    def categorize_many(
+        self, queries: list[str], num_results: int = 1
+    ) -> list[list[tuple[int, float]]]:
+        """Categorizes each of several queries at once. See :func:`categorize_query`.
+
+        :param queries: The queries to categorize
+        :type queries: list[str]
+        :param num_results: The number of categorizations to show for each query, defaults to 1
+        :type num_results: int, optional
+        :return: The categorizations of each query, in order
+        :rtype: list[list[tuple[int, float]]]
+
+        .. versionadded:: 0.3.1
+        """
+        if self.__compiled is None:
+            return [[] for _ in queries]
+        vocabulary, projection, category_vectors = self.__compiled
+
+        # Gather the known words of every query into flat arrays, then project them all at once
+        query_indices, word_indices, frequencies = [], [], []
+        for i, query in enumerate(queries):
+            for word, count in Counter(_words(query)).items():
+                index = vocabulary.get(word)
+                if index is not None:
+                    query_indices.append(i)
+                    word_indices.append(index)
+                    frequencies.append(count)
+
+        vectors = np.zeros((len(queries), projection.shape[1]))
+        if len(word_indices) > 0:
+            weights = np.log1p(np.asarray(frequencies, dtype=float))
+            np.add.at(
+                vectors,
+                np.asarray(query_indices),
+                projection[np.asarray(word_indices)] * weights[:, None],
+            )
+
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        scores = np.clip(vectors @ category_vectors.T, 0, None)
+        totals = scores.sum(axis=1, keepdims=True)
+        np.divide(scores, totals, out=scores, where=totals > 0)
+
+        num_results = min(num_results, scores.shape[1])
+        order = np.argsort(-scores, axis=1, kind="stable")[:, :num_results]
+        results = []
+        for row, indices in zip(scores, order):
+            results.append(
+                [(int(i) + 1, float(row[i])) for i in indices if row[i] > 0]
+            )
+        return results
+
+    def __add_category(self, name: Union[int, str], texts: list[str]) -> int:
+        counts = Counter()
+        for text in texts:
+            counts.update(_words(text))
+        self.__counts.append(counts)
+        category_ref = len(self.__counts)
+        self.__categories[name] = category_ref
+        self.__categories[category_ref] = category_ref
+        return category_ref
+
+    def __compile(self):
+        vocabulary = {}
+        for counts in self.__counts:
+            for word in counts:
+                vocabulary.setdefault(word, len(vocabulary))
+        if len(vocabulary) == 0:
+            self.__compiled = None
+            return
+
+        matrix = np.zeros((len(self.__counts), len(vocabulary)))
+        for row, counts in enumerate(self.__counts):
+            indices = np.fromiter((vocabulary[word] for word in counts), int, len(counts))
+            values = np.fromiter(counts.values(), float, len(counts))
+            matrix[row, indices] = np.log1p(np.clip(values, 0, None))
+
+        document_frequency = np.count_nonzero(matrix, axis=0)
+        idf = np.log((1 + len(self.__counts)) / (1 + document_frequency)) + 1
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        np.divide(matrix, norms, out=matrix, where=norms > 0)
+
+        u, s, vt = np.linalg.svd(matrix, full_matrices=False)
+        k = len(s) if self.dimensions is None else max(1, min(self.dimensions, len(s)))
+        category_vectors = u[:, :k] * s[:k]
+        norms = np.linalg.norm(category_vectors, axis=1, keepdims=True)
+        np.divide(category_vectors, norms, out=category_vectors, where=norms > 0)
+
+        # Maps a word's term frequency straight into the reduced space, with its IDF weight folded in
+        projection = vt[:k].T * idf[:, None]
+        self.__compiled = (vocabulary, projection, category_vectors)
+
+
+def _words(text: str) -> list[str]:
+    return re.findall(r"\w+", text.lower())
+
+
+def _path_of(file_path: Union["XABase.XAPath", str, os.PathLike]) -> str:
+    if hasattr(file_path, "path") and not isinstance(file_path, str):
+        return file_path.path
+    return os.fspath(file_path)
@@ -16,6 +16,7 @@ from time import sleep
 
 import PyXA.XABase
 import PyXA.XABaseScriptable
+from PyXA.XAAppIndex import XAAppIndex
 from PyXA.XAErrors import ApplicationNotFoundError
 
 
@@ -78,6 +79,10 @@ class AppBuilder:
             time.sleep(0.01)
 
     def __xa_get_path_to_app(self, app_identifier: str) -> str:
+        path = XAAppIndex.shared().find(app_identifier)
+        if path is not None:
+            return path
+
         app_paths = self.__xa_load_app_paths()
         candidate = None
         for path in app_paths:
@@ -91,6 +96,8 @@ class AppBuilder:
             if app_identifier.lower() in path.lower():
                 candidate = path
 
+        if candidate is None:
+            candidate = XAAppIndex.shared().find_containing(app_identifier)
         if candidate is not None:
             return candidate
 
@@ -4,6 +4,7 @@ Internet-related automation features that extend PyXA scripting functionality.
 """
 
 
+import hashlib
 from datetime import datetime
 from typing import List, Union
 
@@ -12,6 +13,12 @@ import requests
 from bs4 import BeautifulSoup
 
 from PyXA import XABase
+from PyXA.XADownloader import XADownloader, resolve_sources
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAFeedParser import XAFeedRecord, parse_date, parse_feed
+from PyXA.XAHTTPCache import XAHTTPCache, pooled_session
+
+_SHARED_CACHE = object()  # Default for the cache arguments, resolved to XAHTTPCache.shared() when a feed is created rather than when the module is imported
 
 
 class RSSFeed(XABase.XAObject):
@@ -20,7 +27,36 @@ class RSSFeed(XABase.XAObject):
     .. versionadded:: 0.1.0
     """
 
-    def __init__(self, url: Union[str, XABase.XAURL]):
+    def __init__(
+        self,
+        url: Union[str, XABase.XAURL],
+        cache: Union[XAHTTPCache, None] = _SHARED_CACHE,
+        session: Union[requests.Session, None] = None,
+        timeout: Union[float, None] = 30,
+        streaming: bool = False,
+        keep_xml: bool = False,
+    ):
+        """Creates a new feed reader and fetches the feed.
+
+        :param url: The URL of the RSS or Atom feed
+        :type url: Union[str, XABase.XAURL]
+        :param cache: The cache used to send conditional requests and to remember the feed's items between fetches, or None to always download and parse the whole feed, defaults to the shared :class:`PyXA.XAHTTPCache.XAHTTPCache`
+        :type cache: Union[XAHTTPCache, None], optional
+        :param session: The session to send requests with, e.g. one shared by an :class:`RSSFeedGroup`, defaults to a new connection for each request
+        :type session: Union[requests.Session, None], optional
+        :param timeout: The number of seconds to wait for the server, defaults to 30
+        :type timeout: Union[float, None], optional
+        :param streaming: Whether to parse the feed with the streaming parser in :mod:`PyXA.XAFeedParser` rather than building a BeautifulSoup tree, defaults to False. In streaming mode, each item's fields are read once into a compact record, so accessing them is fast and the document tree is not kept in memory. Publication dates are provided as datetime objects.
+        :type streaming: bool, optional
+        :param keep_xml: Whether to keep the XML of each item in streaming mode, so that it can be read from :attr:`RSSItem.xml`, defaults to False
+        :type keep_xml: bool, optional
+
+        .. versionchanged:: 0.3.1
+
+           Added the `cache`, `session`, `timeout`, `streaming`, and `keep_xml` parameters.
+
+        .. versionadded:: 0.1.0
+        """
         self.xa_apsp = AppKit.NSApplication.sharedApplication()
         self.xa_wksp = AppKit.NSWorkspace.sharedWorkspace()
         self.xa_aref = None
@@ -29,8 +65,74 @@ class RSSFeed(XABase.XAObject):
         if isinstance(url, XABase.XAURL):
             url = url.url
         self.url = url
-        request = requests.get(url)
-        self.__soup = BeautifulSoup(request.content, features="xml")
+        self.cache = XAHTTPCache.shared() if cache is _SHARED_CACHE else cache  #: The cache used for conditional requests, or None
+        self.session = session  #: The session used to send requests, or None
+        self.timeout = timeout  #: The number of seconds to wait for the server
+        self.streaming = streaming  #: Whether the feed is parsed with the streaming parser
+        self.keep_xml = keep_xml  #: Whether the XML of each item is kept in streaming mode
+
+        self.__soup = None
+        self.__records = None
+        self.__fingerprints: dict[str, str] = {}
+        self.__new_items = []
+        self.__fetch()
+
+    def __fetch(self):
+        if self.cache is None:
+            self.__fetch_and_parse()
+            return
+
+        # The fetch and the item fingerprints are written to the cache's index together
+        with self.cache.deferred_writes():
+            self.__fetch_and_parse()
+
+    def __fetch_and_parse(self):
+        if self.cache is None:
+            content = (self.session or requests).get(self.url, timeout=self.timeout).content
+            changed = True
+            previous = self.__fingerprints
+        else:
+            result = self.cache.fetch(self.url, self.session, timeout=self.timeout)
+            content = result.content
+            changed = result.changed
+            previous = self.cache.get_extra(self.url, "items", self.__fingerprints)
+
+        if not changed and (self.__soup is not None or self.__records is not None):
+            # 304 Not Modified or identical body -- nothing to reparse
+            self.__new_items = []
+            return
+
+        if self.streaming:
+            self.__records = parse_feed(content, keep_xml=self.keep_xml)
+        else:
+            self.__soup = BeautifulSoup(content, features="xml")
+
+        # Identify items by guid/id, falling back to the link, and fingerprint their fields or XML to detect edits
+        fingerprints = {}
+        new_items = []
+        for article in self.__articles():
+            key = _item_key(article)
+            if isinstance(article, XAFeedRecord):
+                fingerprint = article.fingerprint
+            else:
+                fingerprint = hashlib.sha1(str(article).encode("utf-8")).hexdigest()
+            fingerprints[key] = fingerprint
+            if previous.get(key) != fingerprint:
+                new_items.append(article)
+
+        self.__fingerprints = fingerprints
+        self.__new_items = new_items
+        if self.cache is not None:
+            self.cache.set_extra(self.url, "items", fingerprints)
+
+    def __articles(self) -> list:
+        if self.streaming:
+            return self.__records
+
+        articles = self.__soup.findAll("entry")
+        if articles == []:
+            articles = self.__soup.findAll("item")
+        return articles
 
     def items(self) -> "RSSItemList":
         """Retrieves all item and/or entry tags in the RSS feed as :class:`RSSItem` objects.
@@ -47,15 +149,36 @@ class RSSFeed(XABase.XAObject):
 
         .. versionadded:: 0.1.0
         """
-        articles = self.__soup.findAll("entry")
-        if articles == []:
-            articles = self.__soup.findAll("item")
+        return self._new_element(self.__articles(), RSSItemList)
 
-        return self._new_element(articles, RSSItemList)
+    def new_items(self) -> "RSSItemList":
+        """Retrieves the items that are new or have changed since the feed was previously fetched.
 
-    def refetch(self):
+        Items are identified by their guid or id, or by their link if they have neither. When the feed uses a cache, items are compared against those seen by the previous fetch of the same URL, even if that fetch was made by another process.
+
+        :return: The list of new and changed items
+        :rtype: RSSItemList
+
+        :Example:
+
+        >>> import PyXA
+        >>> reader = PyXA.RSSFeed("https://www.apple.com/newsroom/rss-feed.rss")
+        >>> reader.refetch()
+        >>> print(reader.new_items())
+        <<class 'PyXA.Additions.Web.RSSItemList'>['Apple unveils new Mac Studio']>
+
+        .. versionadded:: 0.3.1
+        """
+        return self._new_element(self.__new_items, RSSItemList)
+
+    def refetch(self) -> "RSSItemList":
         """Resends the GET request for the RSS feed URL and updates this object's data accordingly.
 
+        When the feed uses a cache, the request is conditional, and the feed is only reparsed if it has changed.
+
+        :return: The items that are new or have changed since the previous fetch
+        :rtype: RSSItemList
+
         :Example: Get the top 10 songs on iTunes every hour
 
         >>> import PyXA
@@ -66,24 +189,202 @@ class RSSFeed(XABase.XAObject):
         >>>     print(reader.items())
         >>>     sleep(3600)
 
+        .. versionchanged:: 0.3.1
+
+           Sends conditional requests and returns the new and changed items.
+
         .. versionadded:: 0.1.0
         """
-        request = requests.get(self.url)
-        self.__soup = BeautifulSoup(request.content, features="xml")
+        self.__fetch()
+        return self.new_items()
+
+
+def _item_key(article) -> str:
+    if isinstance(article, XAFeedRecord):
+        return article.key
+
+    for name in ("guid", "id"):
+        tag = article.find(name)
+        if tag is not None and tag.text.strip():
+            return tag.text.strip()
+
+    link = article.find("link")
+    if link is not None:
+        return link.get("href") or link.text.strip()
+
+    title = article.find("title")
+    return title.text.strip() if title is not None else str(article)
+
+
+def _item_date(article) -> Union[datetime, None]:
+    if isinstance(article, XAFeedRecord):
+        return article.publication_date
+
+    for name in ("pubDate", "published", "updated", "date"):
+        tag = article.find(name)
+        if tag is not None:
+            date = parse_date(tag.text)
+            if date is not None:
+                return date
+
+
+def _download_images(parent: XABase.XAObject, urls: list[str]) -> XABase.XAImageList:
+    # The list holds the paths of the downloaded files, which XAImageList decodes on access
+    paths = XADownloader.shared().download_many(urls, content_type="image/")
+    paths = [x for x in paths if isinstance(x, str)]
+    return parent._new_element(paths, XABase.XAImageList)
+
+
+def _sort_by_date(articles: list) -> list:
+    # Newest first, followed by undated items in their original order
+    dated = []
+    undated = []
+    for article in articles:
+        date = _item_date(article)
+        if date is None:
+            undated.append(article)
+        else:
+            dated.append((date, article))
+    dated.sort(key=lambda x: x[0], reverse=True)
+    return [x[1] for x in dated] + undated
+
+
+class RSSFeedGroup(XABase.XAObject):
+    """A group of RSS feeds fetched concurrently over a shared pool of connections.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        urls: list[Union[str, XABase.XAURL]],
+        cache: Union[XAHTTPCache, None] = _SHARED_CACHE,
+        max_workers: int = 16,
+        connections_per_host: int = 4,
+        timeout: Union[float, None] = 10,
+        retries: int = 3,
+        backoff_factor: float = 0.5,
+    ):
+        """Creates a new feed group and fetches each feed.
+
+        :param urls: The URLs of the RSS or Atom feeds
+        :type urls: list[Union[str, XABase.XAURL]]
+        :param cache: The cache used to send conditional requests, or None to always download and parse every feed, defaults to the shared :class:`PyXA.XAHTTPCache.XAHTTPCache`
+        :type cache: Union[XAHTTPCache, None], optional
+        :param max_workers: The maximum number of feeds to fetch at once, defaults to 16
+        :type max_workers: int, optional
+        :param connections_per_host: The maximum number of concurrent connections to each host, defaults to 4
+        :type connections_per_host: int, optional
+        :param timeout: The number of seconds to wait for each server, defaults to 10
+        :type timeout: Union[float, None], optional
+        :param retries: The maximum number of times to retry each request, defaults to 3
+        :type retries: int, optional
+        :param backoff_factor: The base delay in seconds between retries, doubled after each retry, defaults to 0.5
+        :type backoff_factor: float, optional
+
+        :Example:
+
+        >>> import PyXA
+        >>> group = PyXA.RSSFeedGroup([
+        >>>     "https://www.apple.com/newsroom/rss-feed.rss",
+        >>>     "https://developer.apple.com/news/rss/news.rss",
+        >>> ])
+        >>> print(group.items()[0])
+        <<class 'PyXA.Additions.Web.RSSItem'>Apple unveils new Mac Studio>
+
+        .. versionadded:: 0.3.1
+        """
+        self.xa_apsp = AppKit.NSApplication.sharedApplication()
+        self.xa_wksp = AppKit.NSWorkspace.sharedWorkspace()
+        self.xa_aref = None
+        self.xa_sevt = None
+
+        self.urls = [x.url if isinstance(x, XABase.XAURL) else x for x in urls]  #: The URLs of the feeds
+        self.cache = XAHTTPCache.shared() if cache is _SHARED_CACHE else cache  #: The cache used for conditional requests, or None
+        self.timeout = timeout  #: The number of seconds to wait for each server
+        self.session = pooled_session(connections_per_host, retries, backoff_factor)  #: The session shared by the feeds
+        self.feeds: list[RSSFeed] = []  #: The successfully fetched feeds
+        self.errors: dict[str, Exception] = {}  #: The error raised while fetching each failed feed, by URL
+
+        self.__executor = XABoundedExecutor(max_workers)
+        self.refetch()
+
+    def refetch(self) -> "RSSItemList":
+        """Fetches every feed in the group concurrently.
+
+        Feeds that failed in a previous fetch are retried. Errors are recorded in :attr:`errors` rather than raised.
+
+        :return: The items that are new or have changed since the previous fetch, newest first
+        :rtype: RSSItemList
+
+        .. versionadded:: 0.3.1
+        """
+        feeds = {feed.url: feed for feed in self.feeds}
+
+        def fetch(url: str) -> RSSFeed:
+            feed = feeds.get(url)
+            if feed is None:
+                return RSSFeed(url, self.cache, self.session, self.timeout)
+            feed.refetch()
+            return feed
+
+        if self.cache is not None:
+            with self.cache.deferred_writes():
+                results = self.__executor.map(fetch, self.urls, return_exceptions=True)
+        else:
+            results = self.__executor.map(fetch, self.urls, return_exceptions=True)
+
+        self.feeds = [x for x in results if isinstance(x, RSSFeed)]
+        self.errors = {
+            url: result
+            for url, result in zip(self.urls, results)
+            if isinstance(result, BaseException)
+        }
+        return self.new_items()
+
+    def items(self) -> "RSSItemList":
+        """Retrieves the items of every feed in the group, newest first.
+
+        :return: The merged list of items
+        :rtype: RSSItemList
+
+        .. versionadded:: 0.3.1
+        """
+        articles = [x for feed in self.feeds for x in feed.items().xa_elem]
+        return self._new_element(_sort_by_date(articles), RSSItemList)
+
+    def new_items(self) -> "RSSItemList":
+        """Retrieves the items that are new or have changed since each feed was previously fetched, newest first.
+
+        :return: The merged list of new and changed items
+        :rtype: RSSItemList
+
+        .. versionadded:: 0.3.1
+        """
+        articles = [x for feed in self.feeds for x in feed.new_items().xa_elem]
+        return self._new_element(_sort_by_date(articles), RSSItemList)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.urls) + ">"
 
 
 class RSSItemList(XABase.XAList):
     def __init__(self, properties):
         super().__init__(properties, RSSItem)
+        self._xa_records = len(self.xa_elem) > 0 and isinstance(
+            self.xa_elem[0], XAFeedRecord
+        )
 
     def xml(self) -> List[str]:
-        """Gets the raw XML of each item in the list.
+        """Gets the raw XML of each item in the list. Items of feeds parsed in streaming mode have no XML unless the feed was created with ``keep_xml=True``.
 
         :return: The list of XML strings
         :rtype: List[str]
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.xml for x in self.xa_elem]
         return [str(x) for x in self.xa_elem]
 
     def content(self) -> "RSSItemContentList":
@@ -96,7 +397,10 @@ class RSSItemList(XABase.XAList):
         """
         contents = []
         for item in self.xa_elem:
-            html = str(item.find("content").string)
+            if self._xa_records:
+                html = str(item.content)
+            else:
+                html = str(item.find("content").string)
             content_object = BeautifulSoup(html, "html.parser")
             contents.append(content_object)
         return self._new_element(contents, RSSItemContentList)
@@ -109,6 +413,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.title for x in self.xa_elem]
         return [x.find("title").text for x in self.xa_elem]
 
     def author(self) -> List[str]:
@@ -119,6 +425,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.author for x in self.xa_elem]
         return [x.find("author").text for x in self.xa_elem]
 
     def category(self) -> List[str]:
@@ -129,6 +437,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.category for x in self.xa_elem]
         return [x.find("category").text for x in self.xa_elem]
 
     def comments(self) -> List[str]:
@@ -139,6 +449,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.comments for x in self.xa_elem]
         return [x.find("comments").text for x in self.xa_elem]
 
     def description(self) -> "RSSItemContentList":
@@ -151,7 +463,10 @@ class RSSItemList(XABase.XAList):
         """
         contents = []
         for item in self.xa_elem:
-            html = str(item.find("description").string)
+            if self._xa_records:
+                html = str(item.description)
+            else:
+                html = str(item.find("description").string)
             content_object = BeautifulSoup(html, "html.parser")
             contents.append(content_object)
         return self._new_element(contents, RSSItemContentList)
@@ -164,6 +479,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.enclosure for x in self.xa_elem]
         return [x.find("enclosure").text for x in self.xa_elem]
 
     def link(self) -> List[str]:
@@ -174,6 +491,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [XABase.XAURL(x.link) for x in self.xa_elem]
         return [XABase.XAURL(x.find("link").text) for x in self.xa_elem]
 
     def publication_date(self) -> List[datetime]:
@@ -184,6 +503,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.publication_date for x in self.xa_elem]
         return [x.find("pubDate").text for x in self.xa_elem]
 
     def source(self) -> List[str]:
@@ -194,6 +515,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.source for x in self.xa_elem]
         return [x.find("source").text for x in self.xa_elem]
 
     def copyright(self) -> List[str]:
@@ -204,6 +527,8 @@ class RSSItemList(XABase.XAList):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_records:
+            return [x.copyright for x in self.xa_elem]
         return [x.find("copyright").text for x in self.xa_elem]
 
     def text(self) -> List[str]:
@@ -239,7 +564,7 @@ class RSSItem(XABase.XAObject):
     def __init__(self, properties):
         super().__init__(properties)
 
-        self.xml: str  #: The raw XML of the entry
+        self.xml: str  #: The raw XML of the entry. In streaming mode, only kept if the feed was created with ``keep_xml=True``, otherwise None
         self.content: str  #: The raw content of the entry
         self.author: str  #: The author of the entry
         self.category: str  #: The category of the entry
@@ -255,68 +580,93 @@ class RSSItem(XABase.XAObject):
 
     @property
     def xml(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.xml
         return str(self.xa_elem)
 
     @property
     def content(self) -> type:
-        html = str(self.xa_elem.find("content").string)
+        if isinstance(self.xa_elem, XAFeedRecord):
+            html = str(self.xa_elem.content)
+        else:
+            html = str(self.xa_elem.find("content").string)
         content_object = BeautifulSoup(html, "html.parser")
         return self._new_element(content_object, RSSItemContent)
 
     @property
     def author(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.author
         tag = self.xa_elem.find("author")
         if tag is not None:
             return tag.text
 
     @property
     def category(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.category
         tag = self.xa_elem.find("category")
         if tag is not None:
             return tag.get("label")
 
     @property
     def comments(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.comments
         tag = self.xa_elem.find("comments")
         if tag is not None:
             return tag.text
 
     @property
     def description(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.description
         tag = self.xa_elem.find("description")
         if tag is not None:
             return tag.string
 
     @property
     def enclosure(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.enclosure
         return self.xa_elem.find("enclosure").get("url")
 
     @property
     def link(self) -> Union[str, None]:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.link
         tag = self.xa_elem.find("link")
         if tag is not None:
             return tag.text
 
     @property
-    def publication_date(self) -> Union[str, None]:
+    def publication_date(self) -> Union[str, datetime, None]:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.publication_date
         tag = self.xa_elem.find("pubDate")
         if tag is not None:
             return tag.text
 
     @property
     def source(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.source
         tag = self.xa_elem.find("source")
         if tag is not None:
             return tag.text
 
     @property
     def title(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.title
         tag = self.xa_elem.find("title")
         if tag is not None:
             return tag.text
 
     @property
     def copyright(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.copyright
         tag = self.xa_elem.find("copyright")
         if tag is None:
             tag = self.xa_elem.find("rights")
@@ -325,6 +675,8 @@ class RSSItem(XABase.XAObject):
 
     @property
     def text(self) -> str:
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return self.xa_elem.text
         return self.xa_elem.text()
 
     def links(self) -> List[XABase.XAURL]:
@@ -343,6 +695,9 @@ class RSSItem(XABase.XAObject):
 
         .. versionadded:: 0.1.0
         """
+        if isinstance(self.xa_elem, XAFeedRecord):
+            return [XABase.XAURL(x) for x in dict.fromkeys(self.xa_elem.links)]
+
         tags = self.xa_elem.findAll("link")
         return [XABase.XAURL(x.get("href")) for x in set(tags)]
 
@@ -384,26 +739,22 @@ class RSSItemContentList(XABase.XAList):
         """
         return [x for y in self for x in y.links()]
 
-    def images(self) -> List[XABase.XAImage]:
+    def images(self) -> XABase.XAImageList:
         """Gets the images contained in each item of the list as :class:`XABase.XAImage` objects.
 
-        :return: The list of links
-        :rtype: List[XABase.XAImage]
+        The images of every item are downloaded concurrently through the shared :class:`PyXA.XADownloader.XADownloader`, and images used by several items are downloaded once. Images that cannot be downloaded are omitted. Each image is decoded when it is accessed.
+
+        :return: The list of images
+        :rtype: XABase.XAImageList
+
+        .. versionchanged:: 0.3.1
+
+           Images are downloaded concurrently and with size and time limits.
 
         .. versionadded:: 0.1.0
         """
-        img_objects = []
-        for content_item in self.xa_elem:
-            imgs = content_item.findAll("img")
-            img_objects.extend(
-                [
-                    AppKit.NSImage.alloc().initWithContentsOfURL_(
-                        AppKit.NSURL.alloc().initWithString_(x.get("src"))
-                    )
-                    for x in imgs
-                ]
-            )
-        return self._new_element(img_objects, XABase.XAImageList)
+        sources = [x.get("src") for item in self.xa_elem for x in item.findAll("img")]
+        return _download_images(self, resolve_sources(sources))
 
     def __repr__(self):
         return "<" + str(type(self)) + "Length: " + str(len(self)) + ">"
@@ -448,11 +799,13 @@ class RSSItemContent(XABase.XAObject):
         links = self.xa_elem.findAll("a")
         return [XABase.XAURL(link.get("href")) for link in links]
 
-    def images(self) -> List[XABase.XAImage]:
+    def images(self) -> XABase.XAImageList:
         """Retrieves the image referenced by each image element as a list of :class:`XABase.XAImage` objects.
 
+        The images are downloaded concurrently through the shared :class:`PyXA.XADownloader.XADownloader`. Images that cannot be downloaded are omitted. Each image is decoded when it is accessed.
+
         :return: The list of images
-        :rtype: List[XABase.XAImage]
+        :rtype: XABase.XAImageList
 
         :Example:
 
@@ -462,13 +815,11 @@ class RSSItemContent(XABase.XAObject):
         >>> print(content.images())
         [<PyXA.XABase.XAImage object at 0x10635ee80>, <PyXA.XABase.XAImage object at 0x10635ebb0>]
 
+        .. versionchanged:: 0.3.1
+
+           Images are downloaded concurrently and with size and time limits.
+
         .. versionadded:: 0.1.0
         """
-        imgs = self.xa_elem.findAll("img")
-        img_objects = [
-            AppKit.NSImage.alloc().initWithContentsOfURL_(
-                AppKit.NSURL.alloc().initWithString_(x.get("src"))
-            )
-            for x in imgs
-        ]
-        return self._new_element(img_objects, XABase.XAImageList)
+        sources = [x.get("src") for x in self.xa_elem.findAll("img")]
+        return _download_images(self, resolve_sources(sources))
@@ -0,0 +1,346 @@
+""".. versionadded:: 0.3.1
+
+A persistent index of application bundles on the disk, used to resolve application names to bundle paths without running a Spotlight query.
+"""
+
+import json
+import os
+import plistlib
+import threading
+from typing import Union
+
+DEFAULT_SEARCH_DIRECTORIES = [
+    "/Applications",
+    "/System/Applications",
+    "/System/Library/CoreServices",
+    "/System/Volumes/Preboot/Cryptexes/App/System/Applications",
+    "~/Applications",
+]
+"""The directories searched for application bundles by default.
+"""
+
+DEFAULT_CACHE_PATH = "~/Library/Caches/PyXA/app_index.json"
+"""The default location of the index's cache file.
+"""
+
+INDEX_VERSION = 1
+
+
+class XAAppIndex:
+    """An index mapping application names, display names, and bundle identifiers to application bundle paths.
+
+    The index is built by scanning the application directories for .app bundles and is saved to a small cache file. The cache is reused by later processes until the modification time of one of the scanned directories changes, at which point the index is rebuilt in the background while stale entries continue to be served.
+
+    .. versionadded:: 0.3.1
+    """
+
+    _shared: Union["XAAppIndex", None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directories: Union[list[str], None] = None,
+        cache_path: Union[str, None] = DEFAULT_CACHE_PATH,
+        max_depth: int = 3,
+    ):
+        """Creates a new application index. The index is not loaded until it is first used.
+
+        :param directories: The directories to search for application bundles, defaults to :attr:`DEFAULT_SEARCH_DIRECTORIES`
+        :type directories: Union[list[str], None], optional
+        :param cache_path: The path of the cache file, or None to keep the index in memory only, defaults to :attr:`DEFAULT_CACHE_PATH`
+        :type cache_path: Union[str, None], optional
+        :param max_depth: How many levels of non-bundle subdirectories to search, defaults to 3
+        :type max_depth: int, optional
+
+        .. versionadded:: 0.3.1
+        """
+        if directories is None:
+            directories = DEFAULT_SEARCH_DIRECTORIES
+        self.directories = [os.path.expanduser(x) for x in directories]  #: The directories searched for application bundles
+        self.cache_path = os.path.expanduser(cache_path) if cache_path is not None else None  #: The path of the cache file
+        self.max_depth = max_depth  #: How many levels of non-bundle subdirectories to search
+
+        self.__lock = threading.RLock()
+        self.__loaded = False
+        self.__rebuild_thread: Union[threading.Thread, None] = None
+        self.__mtimes: dict[str, float] = {}
+        self.__apps: list[dict] = []
+        self.__by_name: dict[str, str] = {}
+        self.__by_display_name: dict[str, str] = {}
+        self.__by_bundle_id: dict[str, str] = {}
+
+    @classmethod
+    def shared(cls) -> "XAAppIndex":
+        """Retrieves the index shared by :class:`PyXA.Application` and :class:`PyXA.AppBuilder`.
+
+        :return: The shared application index
+        :rtype: XAAppIndex
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def paths(self) -> list[str]:
+        """The path to every indexed application bundle."""
+        self.__ensure_loaded()
+        with self.__lock:
+            return [app["path"] for app in self.__apps]
+
+    @property
+    def applications(self) -> list[dict]:
+        """The path, name, display name, and bundle identifier of every indexed application bundle."""
+        self.__ensure_loaded()
+        with self.__lock:
+            return [dict(app) for app in self.__apps]
+
+    def find(self, app_identifier: str, wait: bool = True) -> Union[str, None]:
+        """Finds the path to the application bundle matching the given name, display name, bundle identifier, or path.
+
+        Only exact matches are returned, so that a lookup elsewhere, such as a Spotlight query, can find an exact match for an application outside the indexed directories before settling for a partial one; see :func:`find_containing`. If the index is being rebuilt and no match is found in the stale entries, the lookup waits for the rebuild to finish and tries again.
+
+        :param app_identifier: The name, display name, or bundle identifier of the application, case-insensitive
+        :type app_identifier: str
+        :param wait: Whether to wait for an ongoing rebuild of the index before giving up, defaults to True
+        :type wait: bool, optional
+        :return: The path to the application bundle, or None if no application matches
+        :rtype: Union[str, None]
+
+        :Example:
+
+        >>> from PyXA.XAAppIndex import XAAppIndex
+        >>> print(XAAppIndex.shared().find("com.apple.Notes"))
+        /System/Applications/Notes.app
+
+        .. versionadded:: 0.3.1
+        """
+        self.__ensure_loaded()
+        path = self.__match(app_identifier)
+
+        rebuild_thread = self.__rebuild_thread
+        if path is None and wait and rebuild_thread is not None:
+            rebuild_thread.join()
+            path = self.__match(app_identifier)
+        return path
+
+    def find_containing(self, app_identifier: str) -> Union[str, None]:
+        """Finds the path to the last indexed application bundle whose path contains the given identifier, for use once no application matches the identifier exactly.
+
+        :param app_identifier: Part of the path to the application bundle, case-insensitive
+        :type app_identifier: str
+        :return: The path to the application bundle, or None if no path contains the identifier
+        :rtype: Union[str, None]
+
+        .. versionadded:: 0.3.1
+        """
+        self.__ensure_loaded()
+        identifier = app_identifier.lower()
+        with self.__lock:
+            candidate = None
+            for app in self.__apps:
+                if identifier in app["path"].lower():
+                    candidate = app["path"]
+            return candidate
+
+    def is_stale(self) -> bool:
+        """Checks whether any of the indexed directories have changed since the index was built.
+
+        :return: True if the index must be rebuilt
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        self.__ensure_loaded()
+        with self.__lock:
+            mtimes = self.__mtimes
+        if len(mtimes) == 0:
+            return True
+        for directory, mtime in mtimes.items():
+            if self.__mtime(directory) != mtime:
+                return True
+        for directory in self.directories:
+            if directory not in mtimes and self.__mtime(directory) is not None:
+                # A search directory has been created since the index was built
+                return True
+        return False
+
+    def rebuild(self, background: bool = False) -> Union[threading.Thread, None]:
+        """Rebuilds the index by scanning the application directories, then saves it to the cache file.
+
+        :param background: Whether to rebuild the index in a background thread, defaults to False
+        :type background: bool, optional
+        :return: The thread performing the rebuild, if running in the background
+        :rtype: Union[threading.Thread, None]
+
+        .. versionadded:: 0.3.1
+        """
+        if not background:
+            self.__rebuild()
+            return None
+
+        with self.__lock:
+            if self.__rebuild_thread is None:
+                self.__rebuild_thread = threading.Thread(
+                    target=self.__rebuild, daemon=True
+                )
+                self.__rebuild_thread.start()
+            return self.__rebuild_thread
+
+    def invalidate(self):
+        """Discards the in-memory index so that it is reloaded on next use.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__loaded = False
+            self.__mtimes = {}
+
+    def __ensure_loaded(self):
+        with self.__lock:
+            if self.__loaded:
+                return
+            self.__loaded = True
+            cached = self.__load_cache()
+            if not cached:
+                # Nothing to serve yet, so other threads wait for the first build
+                self.__rebuild()
+
+        if cached and self.is_stale():
+            # Serve the cached entries while a fresh index is built
+            self.rebuild(background=True)
+
+    def __match(self, app_identifier: str) -> Union[str, None]:
+        identifier = app_identifier.lower()
+        if identifier.endswith(".app"):
+            identifier = identifier[:-4]
+
+        with self.__lock:
+            for table in (self.__by_name, self.__by_display_name, self.__by_bundle_id):
+                path = table.get(identifier)
+                if path is not None:
+                    return path
+
+            for app in self.__apps:
+                if identifier == app["path"].lower():
+                    return app["path"]
+            return None
+
+    def __rebuild(self):
+        try:
+            mtimes = {}
+            apps = []
+            for directory in self.directories:
+                self.__scan(directory, 0, mtimes, apps)
+
+            with self.__lock:
+                self.__set_entries(mtimes, apps)
+            self.__save_cache()
+        finally:
+            with self.__lock:
+                if self.__rebuild_thread is threading.current_thread():
+                    self.__rebuild_thread = None
+
+    def __scan(self, directory: str, depth: int, mtimes: dict, apps: list):
+        mtime = self.__mtime(directory)
+        if mtime is None:
+            return
+        mtimes[directory] = mtime
+
+        try:
+            entries = sorted(os.scandir(directory), key=lambda x: x.name)
+        except OSError:
+            return
+
+        for entry in entries:
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
+
+            if entry.name.endswith(".app"):
+                apps.append(self.__read_bundle(entry.path))
+            elif depth < self.max_depth and not entry.name.startswith("."):
+                self.__scan(entry.path, depth + 1, mtimes, apps)
+
+    def __read_bundle(self, path: str) -> dict:
+        name = os.path.basename(path)[:-4]
+        info = {}
+        try:
+            with open(os.path.join(path, "Contents", "Info.plist"), "rb") as f:
+                info = plistlib.load(f)
+        except (OSError, plistlib.InvalidFileException, ValueError):
+            pass
+
+        return {
+            "path": path,
+            "name": name,
+            "display_name": info.get("CFBundleDisplayName") or info.get("CFBundleName") or name,
+            "bundle_id": info.get("CFBundleIdentifier"),
+        }
+
+    def __set_entries(self, mtimes: dict, apps: list[dict]):
+        self.__mtimes = mtimes
+        self.__apps = apps
+        self.__by_name = {}
+        self.__by_display_name = {}
+        self.__by_bundle_id = {}
+
+        # Earlier directories take precedence, e.g. /Applications over ~/Applications
+        for app in reversed(apps):
+            self.__by_name[app["name"].lower()] = app["path"]
+            if app["display_name"]:
+                self.__by_display_name[str(app["display_name"]).lower()] = app["path"]
+            if app["bundle_id"]:
+                self.__by_bundle_id[str(app["bundle_id"]).lower()] = app["path"]
+
+    def __load_cache(self) -> bool:
+        if self.cache_path is None:
+            return False
+
+        try:
+            with open(self.cache_path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if data.get("version") != INDEX_VERSION or data.get("directories") != self.directories:
+            return False
+
+        self.__set_entries(data["mtimes"], data["apps"])
+        return True
+
+    def __save_cache(self):
+        if self.cache_path is None:
+            return
+
+        with self.__lock:
+            data = {
+                "version": INDEX_VERSION,
+                "directories": self.directories,
+                "mtimes": self.__mtimes,
+                "apps": self.__apps,
+            }
+
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            temp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(data, f)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # The index still works in memory if the cache can't be written
+            pass
+
+    @staticmethod
+    def __mtime(directory: str) -> Union[float, None]:
+        try:
+            return os.stat(directory).st_mtime
+        except OSError:
+            return None
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.directories) + ">"
@@ -11,32 +11,69 @@ import re
 import sys
 import threading
 import time
+import weakref
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from enum import Enum
 from pprint import pprint
-from typing import Any, Callable, Literal, Union
+from typing import Any, Callable, Iterator, Literal, Union
 
 import macimg, macimg.filters, macimg.distortions, macimg.transforms, macimg.compositions
 
 import AppKit
-import Quartz
-import requests
 import ScriptingBridge
-import DataDetection
-import libdispatch
-from bs4 import BeautifulSoup, element
 from PyObjCTools import AppHelper
 
+from PyXA.XAAppIndex import XAAppIndex
+from PyXA.XADataDetection import extract_all, extract_links, extract_many
 from PyXA.XAErrors import (
     ApplicationNotFoundError,
     InvalidPredicateError,
     AppleScriptError,
 )
+from PyXA.XADownloader import XADownloader, resolve_sources
+from PyXA.XAEvents import XAScriptResult
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAFileIndex import XAFileIndex
+from PyXA.XAHTTPCache import XAHTTPCache, XAHTTPResult, shared_session
+from PyXA.XAImagePipeline import (
+    DEPTH_OF_FIELD_FOCAL_REGION,
+    XAFusedFilters,
+    XAImageOperation,
+    XAImagePipeline,
+    relative_point,
+)
+from PyXA.XALazy import lazy_import
+from PyXA.XAMapping import ERROR_MODES, iter_map, process_map, snapshot_rows, thread_map
+from PyXA.XAPredicates import (
+    compile_conditions,
+    compile_format,
+    filter_items,
+    is_python_data,
+)
+from PyXA.XAPropertyIndex import XAPropertyIndex
+from PyXA.XAQueryResults import XAQueryResults, query_key
 from PyXA.XAProtocols import XACanOpenPath, XAClipboardCodable, XAPathLike
+from PyXA.XAScripting import (
+    XADescriptorFactory,
+    XAScriptCache,
+    compile_applescript,
+    has_run_handler,
+    run_event,
+)
+from PyXA.XASpecialization import XASpecializable
+from PyXA.XATagging import TaggingEngine
 from PyXA.XATypes import XADatetimeBlock
+from PyXA.XAViews import XAListView, view_of
 
 from .apps import application_classes
 
+# Frameworks and libraries only needed by some features are imported on first use
+Quartz = lazy_import("Quartz")
+DataDetection = lazy_import("DataDetection")
+libdispatch = lazy_import("libdispatch")
+bs4 = lazy_import("bs4")
+
 
 def OSType(s: str):
     return int.from_bytes(s.encode("UTF-8"), "big")
@@ -89,9 +126,15 @@ class XAObject:
 
     .. seealso:: :class:`XABaseScriptable.XASBObject`
 
+    .. versionchanged:: 0.3.1
+
+       The references held by every PyXA object are now stored in slots. Subclasses that declare ``__slots__ = ()`` create wrappers without a per-instance dictionary.
+
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ("xa_prnt", "xa_elem", "xa_scel", "xa_aref")
+
     _xa_sevt = None
     _xa_estr = None
     _xa_wksp = None
@@ -191,6 +234,20 @@ class XAObject:
         }
         return obj_class(properties, *args)
 
+    def _adopt(self, other: "XAObject"):
+        """Changes this object into a copy of another object, including its class.
+
+        .. versionadded:: 0.3.1
+        """
+        self.__class__ = other.__class__
+        for name in XAObject.__slots__:
+            try:
+                value = object.__getattribute__(other, name)
+            except AttributeError:
+                continue
+            object.__setattr__(self, name, value)
+        self.__dict__.update(other.__dict__)
+
     def _spawn_thread(
         self,
         function: Callable[..., Any],
@@ -286,9 +343,64 @@ class XAObject:
         return self.xa_elem == other.xa_elem
 
 
+def _index_key(property: str) -> str:
+    # Indexes are shared between a property's snake case and scripting key names, e.g. persistent_id and persistentID
+    return camelize(property).lower()
+
+
+def _resolve_selector(element: Any, property: str) -> str:
+    # Scripting keys don't always follow camel case, e.g. persistentID rather than persistentId, so the name given is tried first, then its camel case form, then a case-insensitive match among the element's methods
+    key = camelize(property)
+    for candidate in dict.fromkeys([property, key]):
+        if element.respondsToSelector_(candidate):
+            return candidate
+
+    lowered = key.lower()
+    for name in dir(element):
+        if name.lower() == lowered and element.respondsToSelector_(name):
+            return name
+    return key
+
+
+def _view_subarray(array: "AppKit.NSArray", start: int, length: int) -> "AppKit.NSArray":
+    # The elements of a subarray of an SBElementArray are unresolved references, so no events are sent for them
+    return array.subarrayWithRange_((start, length))
+
+
+def _view_take(array: "AppKit.NSArray", indices: range) -> "AppKit.NSArray":
+    return AppKit.NSArray.alloc().initWithArray_(
+        [array.objectAtIndex_(index) for index in indices]
+    )
+
+
+def _view_filter(array: "AppKit.NSArray", predicates: list[Any]) -> "AppKit.NSArray":
+    # Conditions are combined into one predicate, and format strings into one format, so each kind is evaluated once
+    conditions = XAPredicate()
+    formats, parameters = [], []
+    for predicate in predicates:
+        if isinstance(predicate, XAPredicate):
+            conditions.keys.extend(predicate.keys)
+            conditions.operators.extend(predicate.operators)
+            conditions.values.extend(predicate.values)
+        else:
+            formats.append(predicate[0])
+            parameters.extend(predicate[1])
+
+    if len(conditions.keys) > 0:
+        array = conditions.evaluate(array)
+    if len(formats) > 0:
+        format = formats[0] if len(formats) == 1 else "(" + ") AND (".join(formats) + ")"
+        array = XAPredicate.evaluate_with_format(array, format, *parameters)
+    return array
+
+
 class XAList(XAObject):
     """A wrapper around NSArray and NSMutableArray objects enabling fast enumeration and lazy evaluation of Objective-C objects.
 
+    .. versionchanged:: 0.3.1
+
+       Slicing and filtering a list now returns a list whose array is only retrieved when its elements are first needed. Chained slices and filters are combined, so they are applied to the original array at once.
+
     .. versionadded:: 0.0.3
     """
 
@@ -315,7 +427,10 @@ class XAList(XAObject):
         super().__init__(properties)
         self.xa_ocls = object_class
 
-        if not isinstance(self.xa_elem, AppKit.NSArray) and not isinstance(
+        if isinstance(self._xa_elem, XAListView):
+            # Slices and filters are applied when the array is first accessed
+            pass
+        elif not isinstance(self.xa_elem, AppKit.NSArray) and not isinstance(
             self.xa_elem, ScriptingBridge.SBElementArray
         ):
             self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
@@ -323,6 +438,34 @@ class XAList(XAObject):
         if filter is not None:
             self.xa_elem = XAPredicate().from_dict(filter).evaluate(self.xa_elem)
 
+    @property
+    def xa_elem(self) -> Union["AppKit.NSArray", "ScriptingBridge.SBElementArray"]:
+        """The wrapped array, retrieved by applying any pending slices and filters on first access."""
+        elem = self._xa_elem
+        if isinstance(elem, XAListView):
+            elem = self._xa_elem = elem.resolve(len, _view_subarray, _view_take, _view_filter)
+        return elem
+
+    @xa_elem.setter
+    def xa_elem(self, value: Any):
+        self._xa_elem = value
+        self._xa_indexes = {}
+
+    def _view(self) -> XAListView:
+        """Gets a view of the list's array, including any slices and filters that have not been applied yet.
+
+        .. versionadded:: 0.3.1
+        """
+        elem = self._xa_elem
+        if isinstance(elem, XAListView):
+            return elem
+        # Element arrays are references to the application's elements, whereas other mutable arrays are changed in place by push, insert, and pop
+        return view_of(
+            elem,
+            isinstance(elem, AppKit.NSMutableArray)
+            and not isinstance(elem, ScriptingBridge.SBElementArray),
+        )
+
     def by_property(self, property: str, value: Any) -> XAObject:
         """Retrieves the first element whose property value matches the given value, if one exists.
 
@@ -341,8 +484,20 @@ class XAList(XAObject):
         >>> print(photo)
         <<class 'PyXA.apps.PhotosApp.XAPhotosMediaItem'>id=CB24FE9F-E9DC-4A5C-A0B0-CC779B1CEDCE/L0/001>
 
+        .. versionchanged:: 0.3.1
+
+           Uses the index of the property built by :func:`build_index`, if there is one, instead of filtering the list.
+
         .. versionadded:: 0.0.6
         """
+        index = self._xa_indexes.get(_index_key(property))
+        if index is not None:
+            position = index.position(value)
+            if position is not None:
+                return self._new_element(self.xa_elem.objectAtIndex_(position), self.xa_ocls)
+            if index.excludes(value):
+                return None
+
         predicate = XAPredicate()
         predicate.add_eq_condition(property, value)
         ls = predicate.evaluate(self.xa_elem)
@@ -358,6 +513,65 @@ class XAList(XAObject):
 
         return self._new_element(obj, self.xa_ocls)
 
+    def build_index(self, property: str) -> XAPropertyIndex:
+        """Builds a hash index of the given property, retrieving the property's value for every element in one bulk request.
+
+        Once a property is indexed, :func:`by_property` and the ``by_*`` methods that use it find elements by that property with a dictionary lookup instead of filtering the list. The index reflects the list as it was when the index was built; it is discarded when the list is changed through :func:`push`, :func:`insert`, :func:`pop`, or :func:`extend`, but not when the application's data changes.
+
+        :param property: The name of the property to index, as passed to :func:`by_property`
+        :type property: str
+        :return: The index
+        :rtype: XAPropertyIndex
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> tracks = app.tracks()
+        >>> tracks.build_index("persistentID")
+        >>> for persistent_id in ["FA6E4F7A1D2A6B8C", "0C5E2D8F3B9A1E47"]:
+        >>>     print(tracks.by_persistent_id(persistent_id))
+
+        .. versionadded:: 0.3.1
+        """
+        index = XAPropertyIndex(property, self.fetch(property)[property])
+        self._xa_indexes[_index_key(property)] = index
+        return index
+
+    def by_property_many(self, property: str, values: list[Any]) -> list[Union[XAObject, None]]:
+        """Retrieves the first element whose property value matches each of the given values, building an index of the property first if there isn't one.
+
+        :param property: The property to match
+        :type property: str
+        :param values: The values to match
+        :type values: list[Any]
+        :return: The matching element for each value, or None for values that no element matches
+        :rtype: list[Union[XAObject, None]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> tracks = app.tracks().by_property_many("persistentID", ["FA6E4F7A1D2A6B8C", "0C5E2D8F3B9A1E47"])
+        >>> print([track.name for track in tracks])
+        ['Hello', 'Pursuit of Happiness (Nightmare)']
+
+        .. versionadded:: 0.3.1
+        """
+        index = self._xa_indexes.get(_index_key(property))
+        if index is None:
+            index = self.build_index(property)
+
+        elements = []
+        for value, position in zip(values, index.positions(values)):
+            if position is not None:
+                elements.append(self._new_element(self.xa_elem.objectAtIndex_(position), self.xa_ocls))
+            elif index.excludes(value):
+                elements.append(None)
+            else:
+                elements.append(self.by_property(property, value))
+        return elements
+
     def _format_for_filter(self, filter, value1, value2=None):
         if "_" in filter and " " not in filter:
             parts = filter.split("_")
@@ -368,15 +582,44 @@ class XAList(XAObject):
 
         return (filter, value1, value2)
 
-    def map(self, function: Callable[[object], object]) -> "XAList":
+    def map(
+        self,
+        function: Callable[[object, int], object],
+        mode: Literal["dispatch", "lazy", "threads", "processes"] = "dispatch",
+        properties: Union[list[str], None] = None,
+        chunk_size: Union[int, None] = None,
+        max_workers: Union[int, None] = None,
+        ordered: bool = True,
+        errors: Literal["raise", "return", "skip"] = "raise",
+    ) -> Union["XAList", Iterator[object]]:
         """Applies the given function to each element in the list and returns a new :class:`XAList` containing the results.
 
         This is most effective when the function does not access the element's properties, as this will cause the element to be fully dereferenced. In such cases, it is better (faster) to use subclass-specific fast-enumeration methods. Use this method to associate element references with other data, e.g. by wrapping each element in a dictionary.
 
+        The function is called with each element and its index. The mode determines how the calls are made:
+
+        - "dispatch" applies the function to every element using Grand Central Dispatch.
+        - "lazy" returns a generator that applies the function to each element only when its result is requested.
+        - "threads" applies the function to chunks of elements on worker threads, which suits functions that spend their time waiting on Apple Events or network requests.
+        - "processes" applies the function to chunks of elements in worker processes, which suits CPU-bound functions. Elements cannot be sent to other processes, so the function is instead called with a dictionary of the values of the given properties of each element, retrieved in one bulk request. The function must be defined at the top level of a module.
+
         :param function: The function to apply to each element
-        :type function: Callable[[object], object]
-        :return: The new list containing the results of the function
-        :rtype: XAList
+        :type function: Callable[[object, int], object]
+        :param mode: How to apply the function, defaults to "dispatch"
+        :type mode: Literal["dispatch", "lazy", "threads", "processes"], optional
+        :param properties: The properties to pass to the function in "processes" mode
+        :type properties: Union[list[str], None], optional
+        :param chunk_size: The number of consecutive elements processed by each task in "threads" and "processes" modes, defaults to four chunks per worker
+        :type chunk_size: Union[int, None], optional
+        :param max_workers: The number of worker threads or processes, defaults to the shared :class:`PyXA.XAExecutor.XABoundedExecutor` for threads and the number of CPUs for processes
+        :type max_workers: Union[int, None], optional
+        :param ordered: Whether to keep the results in element order rather than the order in which chunks finish, defaults to True
+        :type ordered: bool, optional
+        :param errors: How to handle exceptions raised by the function -- "raise" raises the first exception, "return" places each exception in the results, and "skip" leaves failed elements out of the results, defaults to "raise"
+        :type errors: Literal["raise", "return", "skip"], optional
+        :raises ValueError: The mode or error mode is invalid, or no properties were given in "processes" mode
+        :return: The new list containing the results of the function, or a generator of the results in "lazy" mode
+        :rtype: Union[XAList, Iterator[object]]
 
         :Example:
 
@@ -387,23 +630,248 @@ class XAList(XAObject):
         >>> print(indexed_notes[0])
         {'element': <<class 'PyXA.apps.Notes.XANote'>Example Note, x-coredata://314D805E-C349-42A0-96EC-380EE21392E2/ICNote/p9527>, 'id': 0}
 
+        :Example: Count the words of every note using several processes
+
+        >>> import PyXA
+        >>>
+        >>> def word_count(note, index):
+        >>>     return len(note["plaintext"].split())
+        >>>
+        >>> if __name__ == "__main__":
+        >>>     counts = PyXA.Application("Notes").notes().map(word_count, mode="processes", properties=["plaintext"])
+        >>>     print(sum(counts))
+        10482
+
+        .. versionchanged:: 0.3.1
+
+           Added the ``mode``, ``properties``, ``chunk_size``, ``max_workers``, ``ordered``, and ``errors`` parameters.
+
         .. versionadded:: 0.3.0
         """
-        new_arr = AppKit.NSMutableArray.alloc().initWithArray_(self.xa_elem)
+        if errors not in ERROR_MODES:
+            raise ValueError(f"Invalid error mode: {errors}")
+
+        def apply(obj, index):
+            return function(self._new_element(obj, self.xa_ocls), index)
+
+        if mode == "lazy":
+            return iter_map(apply, self.xa_elem, errors)
+        elif mode == "threads":
+            executor = None if max_workers is None else XABoundedExecutor(max_workers)
+            try:
+                results = list(thread_map(apply, list(self.xa_elem), chunk_size, executor, ordered, errors))
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=False)
+        elif mode == "processes":
+            if not properties:
+                raise ValueError("The properties to pass to the function must be given in processes mode.")
+            rows = snapshot_rows(self.fetch(*properties))
+            results = process_map(function, rows, chunk_size, max_workers, ordered, errors)
+        elif mode == "dispatch":
+            results = self.__dispatch_map(apply, errors)
+        else:
+            raise ValueError(f"Invalid map mode: {mode}")
+
+        new_arr = AppKit.NSMutableArray.alloc().initWithArray_(list(results))
+        return self._new_element(new_arr, XAList)
+
+    def __dispatch_map(self, function: Callable[[object, int], object], errors: str) -> list[object]:
+        elements = self.xa_elem
+        results = [None] * elements.count()
+        failures = []
 
         def apply_to_index(index):
-            new_arr.replaceObjectAtIndex_withObject_(
-                index, function(self._new_element(new_arr[index], self.xa_ocls), index)
-            )
+            try:
+                results[index] = function(elements[index], index)
+            except Exception as e:
+                results[index] = e
+                failures.append(index)
 
         queue = libdispatch.dispatch_get_global_queue(
             libdispatch.DISPATCH_QUEUE_PRIORITY_HIGH, 0
         )
-        libdispatch.dispatch_apply(
-            self.xa_elem.count(), queue, lambda i: apply_to_index(i)
-        )
+        libdispatch.dispatch_apply(len(results), queue, apply_to_index)
 
-        return self._new_element(new_arr, XAList)
+        if len(failures) > 0:
+            if errors == "raise":
+                raise results[min(failures)]
+            if errors == "skip":
+                failed = set(failures)
+                results = [x for index, x in enumerate(results) if index not in failed]
+        return results
+
+    def fetch(self, *property_names: str) -> dict[str, list[Any]]:
+        """Retrieves the values of several properties of every element in the list using a single bulk request.
+
+        Rather than sending one Apple Event per property, as calling each bulk accessor (e.g. :func:`XAMusicTrackList.artist`) does, this method retrieves every element's property record at once, then splits the records into columns. Property names can be supplied in snake case, camel case, or as the scripting dictionary's key names, e.g. ``persistent_id`` or ``persistentID``; each is mapped onto the key name the elements respond to. Properties not present in the element records are retrieved individually as a fallback.
+
+        Values are returned as the raw values provided by the scripting bridge, i.e. in the same form as the corresponding bulk accessor would receive them before any wrapping.
+
+        :param property_names: The names of the properties to retrieve
+        :type property_names: str
+        :return: A dictionary mapping each requested property name to the list of values for that property, in list order
+        :rtype: dict[str, list[Any]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> columns = app.tracks().fetch("name", "artist", "album", "bpm")
+        >>> print(columns["artist"][:3])
+        ['Kid Cudi', 'Kid Cudi', 'Kid Cudi']
+
+        .. versionadded:: 0.3.1
+        """
+        columns = {name: [] for name in property_names}
+        if len(property_names) == 0 or len(self.xa_elem) == 0:
+            return columns
+
+        element = self.xa_elem.objectAtIndex_(0)
+        keys = {name: _resolve_selector(element, name) for name in property_names}
+        if len(property_names) == 1:
+            name = property_names[0]
+            columns[name] = list(self.xa_elem.arrayByApplyingSelector_(keys[name]) or [])
+            return columns
+
+        records = list(self.xa_elem.arrayByApplyingSelector_("properties") or [])
+        if len(records) != len(self.xa_elem) or records[0] is None:
+            records = []
+
+        # Match requested names to record keys case-insensitively, e.g. persistent_id -> persistentID
+        record_keys = {}
+        if len(records) > 0:
+            record_keys = {str(key).lower(): key for key in records[0].keys()}
+
+        for name in property_names:
+            record_key = record_keys.get(keys[name].lower())
+            if record_key is None:
+                columns[name] = list(
+                    self.xa_elem.arrayByApplyingSelector_(keys[name]) or []
+                )
+            else:
+                columns[name] = [record.get(record_key) for record in records]
+        return columns
+
+    def iter_columns(
+        self,
+        properties: Union[list[str], dict[str, Union[type[Enum], None]]],
+        chunk_size: int = 10000,
+    ):
+        """Retrieves the values of several properties of every element in the list as typed columns, yielding the columns in chunks of at most `chunk_size` rows.
+
+        The raw values are retrieved using :func:`fetch`, then converted one chunk at a time, so only one chunk of typed columns is held in memory at once. See :func:`PyXA.XAExport.to_column` for the column types produced.
+
+        :param properties: The names of the properties to retrieve, or a dictionary mapping property names to the enum class to decode each property's values into (or None for non-enum properties)
+        :type properties: Union[list[str], dict[str, Union[type[Enum], None]]]
+        :param chunk_size: The maximum number of rows per chunk, defaults to 10000
+        :type chunk_size: int, optional
+        :yield: Dictionaries mapping each property name to a column of values
+        :rtype: Iterator[dict[str, Any]]
+
+        .. versionadded:: 0.3.1
+        """
+        from PyXA.XAExport import to_column
+
+        enum_types = properties if isinstance(properties, dict) else {}
+        raw_columns = self.fetch(*properties)
+        num_rows = len(self.xa_elem)
+        for start in range(0, num_rows, chunk_size):
+            yield {
+                name: to_column(values[start : start + chunk_size], enum_types.get(name))
+                for name, values in raw_columns.items()
+            }
+
+    def to_columns(
+        self, properties: Union[list[str], dict[str, Union[type[Enum], None]]]
+    ) -> dict[str, Any]:
+        """Retrieves the values of several properties of every element in the list as typed, contiguous columns.
+
+        Numeric, boolean, and date properties become NumPy arrays, text properties become :class:`PyXA.XAExport.XAStringColumn` objects, and enum properties are decoded into the given enum classes, decoding each distinct raw value only once. Requires NumPy.
+
+        :param properties: The names of the properties to retrieve, or a dictionary mapping property names to the enum class to decode each property's values into (or None for non-enum properties)
+        :type properties: Union[list[str], dict[str, Union[type[Enum], None]]]
+        :return: A dictionary mapping each property name to a column of values
+        :rtype: dict[str, Any]
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> columns = app.tracks().to_columns({
+        >>>     "name": None,
+        >>>     "played_count": None,
+        >>>     "cloud_status": app.iCloudStatus,
+        >>> })
+        >>> print(columns["played_count"].mean())
+        12.42
+
+        .. versionadded:: 0.3.1
+        """
+        from PyXA.XAExport import to_column
+
+        enum_types = properties if isinstance(properties, dict) else {}
+        return {
+            name: to_column(values, enum_types.get(name))
+            for name, values in self.fetch(*properties).items()
+        }
+
+    def export_csv(
+        self,
+        path: Union[str, "XAPath"],
+        properties: Union[list[str], dict[str, Union[type[Enum], None]]],
+        chunk_size: int = 10000,
+    ) -> int:
+        """Writes the values of several properties of every element in the list to a CSV file, one chunk of rows at a time. Enum values are written by name.
+
+        :param path: The path of the CSV file to write
+        :type path: Union[str, XAPath]
+        :param properties: The names of the properties to write, or a dictionary mapping property names to enum classes, as in :func:`to_columns`
+        :type properties: Union[list[str], dict[str, Union[type[Enum], None]]]
+        :param chunk_size: The maximum number of rows to convert and write at once, defaults to 10000
+        :type chunk_size: int, optional
+        :return: The number of rows written
+        :rtype: int
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> app.tracks().export_csv("/Users/exampleUser/Desktop/tracks.csv", ["name", "artist", "duration"])
+        2315
+
+        .. versionadded:: 0.3.1
+        """
+        from PyXA.XAExport import write_csv
+
+        if isinstance(path, XAPath):
+            path = path.path
+        return write_csv(path, self.iter_columns(properties, chunk_size), list(properties))
+
+    def export_parquet(
+        self,
+        path: Union[str, "XAPath"],
+        properties: Union[list[str], dict[str, Union[type[Enum], None]]],
+        chunk_size: int = 10000,
+    ) -> int:
+        """Writes the values of several properties of every element in the list to a Parquet file, writing each chunk of rows as a separate row group. Requires NumPy and PyArrow.
+
+        :param path: The path of the Parquet file to write
+        :type path: Union[str, XAPath]
+        :param properties: The names of the properties to write, or a dictionary mapping property names to enum classes, as in :func:`to_columns`
+        :type properties: Union[list[str], dict[str, Union[type[Enum], None]]]
+        :param chunk_size: The number of rows per row group, defaults to 10000
+        :type chunk_size: int, optional
+        :return: The number of rows written
+        :rtype: int
+
+        .. versionadded:: 0.3.1
+        """
+        from PyXA.XAExport import write_parquet
+
+        if isinstance(path, XAPath):
+            path = path.path
+        return write_parquet(path, self.iter_columns(properties, chunk_size), list(properties))
 
     def equalling(self, property: str, value: str) -> "XAList":
         """Retrieves all elements whose property value equals the given value.
@@ -722,12 +1190,16 @@ class XAList(XAObject):
         >>> top_level_playlists = app.playlists().filter("parent", "!exists")
         >>> print(top_level_playlists)
 
+        .. versionchanged:: 0.3.1
+
+           The filter is now applied when the elements of the filtered list are first needed, combined with any other filters and slices applied to the list in the meantime.
+
         .. versionadded:: 0.0.8
         """
         filter, value1, value2 = self._format_for_filter(filter, value1, value2)
-        if comparison_operation.lower() == "exists":
+        if comparison_operation is not None and comparison_operation.lower() == "exists":
             return self.exists(filter)
-        elif comparison_operation.lower() in ["not exists", "!exists", "nonexistent"]:
+        elif comparison_operation is not None and comparison_operation.lower() in ["not exists", "!exists", "nonexistent"]:
             return self.not_exists(filter)
         if comparison_operation is not None and value1 is not None:
             predicate = XAPredicate()
@@ -789,11 +1261,9 @@ class XAList(XAObject):
             elif comparison_operation in ["matches", "MATCHES"]:
                 predicate.add_match_condition(filter, value1)
 
-            filtered_list = predicate.evaluate(self.xa_elem)
-            return super()._new_element(filtered_list, self.__class__)
+            return super()._new_element(self._view().filter(predicate), self.__class__)
         else:
-            filtered_list = XAPredicate.evaluate_with_format(self.xa_elem, filter)
-            return super()._new_element(filtered_list, self.__class__)
+            return super()._new_element(self._view().filter((filter, ())), self.__class__)
 
     def at(self, index: int) -> XAObject:
         """Retrieves the element at the specified index.
@@ -873,6 +1343,7 @@ class XAList(XAObject):
         """
         objects = []
         num_added = 0
+        self._xa_indexes = {}
 
         for element in elements:
             len_before = len(self.xa_elem)
@@ -901,6 +1372,7 @@ class XAList(XAObject):
         .. versionadded:: 0.0.3
         """
         self.xa_elem.insertObject_atIndex_(element.xa_elem, index)
+        self._xa_indexes = {}
 
     def pop(self, index: int = -1) -> XAObject:
         """Removes the object at the specified index from the list and returns it.
@@ -909,16 +1381,21 @@ class XAList(XAObject):
         """
         removed = self.xa_elem.lastObject()
         self.xa_elem.removeLastObject()
+        self._xa_indexes = {}
         return self._new_element(removed, self.xa_ocls)
 
     def index(self, element: XAObject) -> int:
         """Returns the index of the first occurrence of the element in the list, or -1 if no such element exists in the list.
 
+        .. versionchanged:: 0.3.1
+
+           The list is searched for the element's reference with a single native scan before comparing wrapped elements.
+
         .. versionadded:: 0.1.2
         """
-        for index, item in enumerate(self.xa_elem):
-            if item == element.xa_elem:
-                return index
+        index = self.xa_elem.indexOfObject_(element.xa_elem)
+        if index != AppKit.NSNotFound:
+            return index
 
         for index, item in enumerate(self):
             if item == element:
@@ -957,19 +1434,17 @@ class XAList(XAObject):
 
     def __getitem__(self, key: Union[int, slice]):
         if isinstance(key, slice):
-            arr = AppKit.NSMutableArray.alloc().initWithArray_(
-                [
-                    self.xa_elem[index]
-                    for index in range(key.start, key.stop, key.step or 1)
-                ]
-            )
-            return self._new_element(arr, self.__class__)
+            return self._new_element(self._view().slice(key), self.__class__)
         if key < 0:
             key = self.xa_elem.count() + key
 
         return self._new_element(self.xa_elem.objectAtIndex_(key), self.xa_ocls)
 
     def __len__(self):
+        if isinstance(self._xa_elem, XAListView):
+            length = self._xa_elem.length(len)
+            if length is not None:
+                return length
         return len(self.xa_elem)
 
     def __reversed__(self):
@@ -1030,19 +1505,14 @@ class XAApplicationList(XAList):
         """
         removed = self.xa_elem.lastObject()
         self.xa_elem.removeLastObject()
+        self._xa_indexes = {}
         app_name = removed["kCGWindowOwnerName"]
         return Application(app_name)
 
     def __getitem__(self, key: Union[int, slice]):
         """Retrieves the wrapped application object(s) at the specified key."""
         if isinstance(key, slice):
-            arr = AppKit.NSArray.alloc().initWithArray_(
-                [
-                    self.xa_elem[index]
-                    for index in range(key.start, key.stop, key.step or 1)
-                ]
-            )
-            return self._new_element(arr, self.__class__)
+            return super().__getitem__(key)
         app_name = self.xa_elem[key]["kCGWindowOwnerName"]
         return Application(app_name)
 
@@ -1232,11 +1702,14 @@ class Application(XAObject):
         .. versionadded:: 0.1.0
         """
         # Elevate to XAApplication
-        new_self = self.__get_application(app_name)
-        self.__class__ = new_self.__class__
-        self.__dict__.update(new_self.__dict__)
+        self._adopt(self.__get_application(app_name))
 
     def __xa_get_path_to_app(self, app_identifier: str) -> str:
+        path = XAAppIndex.shared().find(app_identifier)
+        if path is not None:
+            return path
+
+        # Fall back to Spotlight for applications outside the standard directories, accepting partial matches only once no application matches exactly
         self.__xa_load_app_paths()
         candidate = None
         for path in self.app_paths:
@@ -1250,6 +1723,8 @@ class Application(XAObject):
             if app_identifier.lower() in path.lower():
                 candidate = path
 
+        if candidate is None:
+            candidate = XAAppIndex.shared().find_containing(app_identifier)
         if candidate is not None:
             return candidate
 
@@ -1800,9 +2275,17 @@ class XAApplication(XAObject, XAClipboardCodable):
 class AppleScript:
     """A class for constructing and executing AppleScript scripts.
 
+    .. versionchanged:: 0.3.1
+
+       Compiled scripts are cached and reused, and arguments are passed to the run handler as typed Apple Event parameters. All AppleScript objects with the same source share one compiled script, so the values of the script's properties and globals persist between runs, as they do in a script application that stays open. Runs of the same script on different threads take turns. Use :func:`clear_cache` to start from fresh script state.
+
     .. versionadded:: 0.0.5
     """
 
+    script_cache = XAScriptCache(compile_applescript)  #: The cache of compiled scripts shared by all AppleScript objects
+
+    _descriptors = XADescriptorFactory()
+
     def __init__(self, script: Union[str, list[str], None] = None):
         """Creates a new AppleScript object.
 
@@ -1828,6 +2311,36 @@ class AppleScript:
         elif script == None:
             self.script = []
 
+    @classmethod
+    def cache_info(cls) -> dict[str, Union[int, float]]:
+        """Retrieves statistics about the cache of compiled scripts.
+
+        :return: The number of cache hits, cache misses, and the total time in seconds spent compiling scripts, along with the current and maximum size of the cache
+        :rtype: dict[str, Union[int, float]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> script = PyXA.AppleScript(\"\"\"on run argv
+        >>>     return (item 1 of argv) * 2
+        >>> end run\"\"\")
+        >>> for x in range(100):
+        >>>     script.run([x])
+        >>> print(PyXA.AppleScript.cache_info())
+        {'hits': 99, 'misses': 1, 'compile_time': 0.0042, 'size': 1, 'max_size': 128}
+
+        .. versionadded:: 0.3.1
+        """
+        return cls.script_cache.cache_info()
+
+    @classmethod
+    def clear_cache(cls):
+        """Removes all compiled scripts from the cache and resets the cache statistics. Scripts are compiled again on their next run, which resets the values of their properties and globals.
+
+        .. versionadded:: 0.3.1
+        """
+        cls.script_cache.clear()
+
     @property
     def last_result(self) -> Any:
         return self.__last_result
@@ -2041,6 +2554,8 @@ class AppleScript:
     def run(self, args: list = None, dry_run=False) -> Any:
         """Compiles and runs the script, returning the result.
 
+        The compiled script is cached, so running the same source code again, even with different arguments, does not recompile it. Arguments are passed to the script's run handler as typed values: ints, floats, strings, bools, dates, paths, lists, and dicts arrive as the corresponding AppleScript types.
+
         :param args: A list of arguments to pass to the script, defaults to None
         :type args: list, optional
         :param dry_run: Whether to compile and check the script without running it, defaults to False
@@ -2089,56 +2604,29 @@ class AppleScript:
             'event': <NSAppleEventDescriptor: 11>
         }
 
-        .. versionadded:: 0.0.5
-        """
-        script = ""
-        for line in self.script:
-            if line.startswith("on run "):
-                argv_specifier = line.split("on run ")[1].strip()
-                script += "on run" + "\n"
-
-                if args is not None:
-                    if type(args) is not list:
-                        args = [args]
+        .. versionchanged:: 0.3.1
 
-                    args = [str(x) for x in args]
+           Arguments keep their types instead of being converted to strings, and compiled scripts are reused, keeping the values of their properties and globals between runs. The result is an :class:`PyXA.XAEvents.XAScriptResult` whose entries are computed when first accessed, and its `value` entry contains the result converted into Python values.
 
-                    script += (
-                        "set " + argv_specifier + ' to {"' + '", "'.join(args) + '"}\n'
-                    )
-                else:
-                    script += "set " + argv_specifier + " to {}\n"
-            else:
-                script += line + "\n"
-
-        full_script = AppKit.NSAppleScript.alloc().initWithSource_(script)
+        .. versionadded:: 0.0.5
+        """
+        script = "".join(line + "\n" for line in self.script)
         if dry_run:
-            status = full_script.compileAndReturnError_(None)
-            if status[1] is not None:
-                raise AppleScriptError(status[1], script)
-            return status[0]
+            AppleScript.script_cache.get(script)
+            return True
 
-        result = full_script.executeAndReturnError_(None)
+        with AppleScript.script_cache.checkout(script) as compiled_script:
+            if has_run_handler(script):
+                event = run_event(args, AppleScript._descriptors)
+                result = compiled_script.executeAppleEvent_error_(event, None)
+            else:
+                result = compiled_script.executeAndReturnError_(None)
         if result[1] is not None:
             raise AppleScriptError(result[1], script)
 
         result = result[0]
-        string_result = result.stringValue()
-        if string_result is not None:
-            string_result = string_result.replace("\r", "\n")
-
         if result is not None:
-            self.__last_result = {
-                "string": string_result,
-                "int": result.int32Value(),
-                "bool": result.booleanValue(),
-                "float": result.doubleValue(),
-                "date": result.dateValue(),
-                "file_url": result.fileURLValue(),
-                "type_code": result.typeCodeValue(),
-                "data": result.data(),
-                "event": result,
-            }
+            self.__last_result = XAScriptResult(result)
             return self.last_result
 
     def __repr__(self):
@@ -2148,14 +2636,135 @@ class AppleScript:
 class XAPredicate(XAObject, XAClipboardCodable):
     """A predicate used to filter arrays.
 
+    .. versionchanged:: 0.3.1
+
+       Predicate formats are now compiled once into reusable templates and cached, with values bound at evaluation time.
+
     .. versionadded:: 0.0.4
     """
 
+    cache_size: int = 256  #: The maximum number of compiled predicate templates to keep cached
+
+    _templates: OrderedDict = OrderedDict()
+    _templates_lock = threading.Lock()
+    _cache_stats = {"hits": 0, "misses": 0, "compile_time": 0.0}
+
     def __init__(self):
         self.keys: list[str] = []
         self.operators: list[str] = []
         self.values: list[str] = []
 
+    @classmethod
+    def cache_info(cls) -> dict[str, Union[int, float]]:
+        """Retrieves statistics about the cache of compiled predicate templates.
+
+        :return: The number of cache hits, cache misses, and the total time in seconds spent compiling templates, along with the current and maximum size of the cache
+        :rtype: dict[str, Union[int, float]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> app = PyXA.Music()
+        >>> for name in ["Song 1", "Song 2", "Song 3"]:
+        >>>     app.tracks().by_name(name)
+        >>> print(PyXA.XAPredicate.cache_info())
+        {'hits': 2, 'misses': 1, 'compile_time': 0.00012, 'size': 1, 'max_size': 256}
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._templates_lock:
+            return {
+                **cls._cache_stats,
+                "size": len(cls._templates),
+                "max_size": cls.cache_size,
+            }
+
+    @classmethod
+    def clear_cache(cls):
+        """Removes all compiled predicate templates from the cache and resets the cache statistics.
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._templates_lock:
+            cls._templates.clear()
+            cls._cache_stats.update({"hits": 0, "misses": 0, "compile_time": 0.0})
+
+    @classmethod
+    def _get_template(cls, cache_key: tuple, format: str) -> "AppKit.NSPredicate":
+        """Retrieves the compiled predicate for the given format from the cache, compiling it if necessary.
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._templates_lock:
+            template = cls._templates.get(cache_key)
+            if template is not None:
+                cls._templates.move_to_end(cache_key)
+                cls._cache_stats["hits"] += 1
+                return template
+
+        start = time.perf_counter()
+        template = AppKit.NSPredicate.predicateWithFormat_(format)
+        compile_time = time.perf_counter() - start
+
+        with cls._templates_lock:
+            cls._cache_stats["misses"] += 1
+            cls._cache_stats["compile_time"] += compile_time
+            cls._templates[cache_key] = template
+            while len(cls._templates) > cls.cache_size:
+                cls._templates.popitem(last=False)
+        return template
+
+    def compile(self) -> "AppKit.NSPredicate":
+        """Compiles the predicate's conditions into a reusable NSPredicate template.
+
+        Each condition's value is replaced by a substitution variable, so the same template is shared by all predicates with the same keys, operators, and value types. Templates are cached, so compiling an equivalent predicate again is a dictionary lookup.
+
+        :return: The predicate template
+        :rtype: AppKit.NSPredicate
+
+        .. versionadded:: 0.3.1
+        """
+        expressions = [
+            f"{key} {operator} $xa_value_{index}"
+            for index, (key, operator) in enumerate(zip(self.keys, self.operators))
+        ]
+        cache_key = (
+            tuple(self.keys),
+            tuple(self.operators),
+            tuple(type(value) for value in self.values),
+        )
+        format = "( " + " ) && ( ".join(expressions) + " )"
+        return XAPredicate._get_template(cache_key, format)
+
+    def to_function(self) -> Callable[[Any], bool]:
+        """Compiles the predicate's conditions into a native Python function.
+
+        The function can filter lists of plain data, e.g. dictionaries and strings, without creating an NSPredicate.
+
+        :return: A function that returns True for objects satisfying every condition of the predicate
+        :rtype: Callable[[Any], bool]
+
+        :Example:
+
+        >>> import PyXA
+        >>> predicate = PyXA.XAPredicate()
+        >>> predicate.add_begins_with_condition("name", "Ex")
+        >>> is_match = predicate.to_function()
+        >>> print(is_match({"name": "Example"}))
+        True
+
+        .. versionadded:: 0.3.1
+        """
+        return compile_conditions(self.keys, self.operators, self.values)
+
+    def _bind(self) -> "AppKit.NSPredicate":
+        """Binds the predicate's current values to its compiled template.
+
+        .. versionadded:: 0.3.1
+        """
+        variables = {f"xa_value_{index}": value for index, value in enumerate(self.values)}
+        return self.compile().predicateWithSubstitutionVariables_(variables)
+
     def from_dict(self, ref_dict: dict) -> "XAPredicate":
         """Populates the XAPredicate object from the supplied dictionary.
 
@@ -2206,27 +2815,46 @@ class XAPredicate(XAObject, XAClipboardCodable):
         :return: The filtered array
         :rtype: AppKit.NSArray
 
+        .. versionchanged:: 0.3.1
+
+           The predicate is now compiled once per combination of keys, operators, and value types, then reused with new values bound on each call. Arrays of plain data, such as dictionaries and strings, are filtered by a pure-Python predicate function instead.
+
         .. versionadded:: 0.0.4
         """
         target_list = target
         if isinstance(target, XAList):
             target_list = target.xa_elem
 
-        placeholders = ["%@"] * len(self.values)
-        expressions = [
-            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
-        ]
-        format = "( " + " ) && ( ".join(expressions) + " )"
-
         ls = []
-        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
-
-        try:
-            # Not sure why this is necessary sometimes, but it is.
-            ls = target_list.filteredArrayUsingPredicate_(
-                AppKit.NSPredicate.predicateWithFormat_(str(predicate))
+        if not isinstance(
+            target_list, ScriptingBridge.SBElementArray
+        ) and is_python_data(target_list):
+            # Plain data can be filtered without bridging each element to the NSPredicate
+            ls = AppKit.NSMutableArray.alloc().initWithArray_(
+                filter_items(target_list, self.to_function())
             )
-        except ValueError:
+            if isinstance(target, XAList):
+                return target.__class__(
+                    {
+                        "parent": target,
+                        "element": ls,
+                        "appref": getattr(self, "xa_aref", None),
+                    }
+                )
+            return ls
+
+        predicate = self._bind()
+
+        if isinstance(target_list, ScriptingBridge.SBElementArray):
+            try:
+                ls = target_list.filteredArrayUsingPredicate_(predicate)
+            except ValueError:
+                # Not sure why this is necessary sometimes, but it is. Only rejected predicates are parsed again from their description.
+                ls = target_list.filteredArrayUsingPredicate_(
+                    AppKit.NSPredicate.predicateWithFormat_(str(predicate))
+                )
+        else:
+            # In-memory arrays can be filtered by the bound predicate directly
             ls = target_list.filteredArrayUsingPredicate_(predicate)
 
         if isinstance(target, XAList):
@@ -2253,6 +2881,10 @@ class XAPredicate(XAObject, XAClipboardCodable):
         :return: The filtered array
         :rtype: AppKit.NSArray
 
+        .. versionchanged:: 0.3.1
+
+            Format strings without parameters are now compiled once and cached. Arrays of plain data are filtered by a pure-Python predicate function when the format is supported by :func:`PyXA.XAPredicates.compile_format`.
+
         .. versionchanged:: 0.3.0
 
             Added the :attr:`fmt_parameters` parameter.
@@ -2263,10 +2895,27 @@ class XAPredicate(XAObject, XAClipboardCodable):
         if isinstance(target, XAList):
             target_list = target.xa_elem
 
-        predicate = AppKit.NSPredicate.predicateWithFormat_argumentArray_(
-            fmt, fmt_parameters
-        )
-        ls = target_list.filteredArrayUsingPredicate_(predicate)
+        ls = None
+        if not isinstance(
+            target_list, ScriptingBridge.SBElementArray
+        ) and is_python_data(target_list):
+            try:
+                predicate = compile_format(fmt, *fmt_parameters)
+                ls = AppKit.NSMutableArray.alloc().initWithArray_(
+                    filter_items(target_list, predicate)
+                )
+            except InvalidPredicateError:
+                # Unsupported by the pure-Python engine -- use NSPredicate instead
+                pass
+
+        if ls is None:
+            if len(fmt_parameters) == 0:
+                predicate = XAPredicate._get_template(("format", fmt), fmt)
+            else:
+                predicate = AppKit.NSPredicate.predicateWithFormat_argumentArray_(
+                    fmt, fmt_parameters
+                )
+            ls = target_list.filteredArrayUsingPredicate_(predicate)
 
         if isinstance(target, XAList):
             return target.__class__(
@@ -2298,14 +2947,25 @@ class XAPredicate(XAObject, XAClipboardCodable):
         if isinstance(target, XAList):
             target_list = target.xa_elem
 
-        fmt = ""
-        for key, value in properties_dict.items():
-            if isinstance(value, str):
-                value = "'" + value + "'"
-            fmt += f"( {key} == {value} ) &&"
+        if not isinstance(
+            target_list, ScriptingBridge.SBElementArray
+        ) and is_python_data(target_list):
+            keys = list(properties_dict.keys())
+            predicate = compile_conditions(
+                keys, ["=="] * len(keys), list(properties_dict.values())
+            )
+            ls = AppKit.NSMutableArray.alloc().initWithArray_(
+                filter_items(target_list, predicate)
+            )
+        else:
+            fmt = ""
+            for key, value in properties_dict.items():
+                if isinstance(value, str):
+                    value = "'" + value + "'"
+                fmt += f"( {key} == {value} ) &&"
 
-        predicate = AppKit.NSPredicate.predicateWithFormat_(fmt[:-3])
-        ls = target_list.filteredArrayUsingPredicate_(predicate)
+            predicate = AppKit.NSPredicate.predicateWithFormat_(fmt[:-3])
+            ls = target_list.filteredArrayUsingPredicate_(predicate)
 
         if isinstance(target, XAList):
             return target.__class__(
@@ -2702,13 +3362,7 @@ class XAPredicate(XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.0.8
         """
-        placeholders = ["%@"] * len(self.values)
-        expressions = [
-            " ".join(expr) for expr in zip(self.keys, self.operators, placeholders)
-        ]
-        format = "( " + " ) && ( ".join(expressions) + " )"
-        predicate = AppKit.NSPredicate.predicateWithFormat_(format, *self.values)
-        return predicate.predicateFormat()
+        return self._bind().predicateFormat()
 
 
 class XAURLList(XAList):
@@ -2719,6 +3373,7 @@ class XAURLList(XAList):
 
     def __init__(self, properties: dict, filter: Union[dict, None] = None):
         super().__init__(properties, XAURL, filter)
+        self._xa_responses: dict[str, XAHTTPResult] = {}
 
     def base_url(self) -> list[str]:
         return [url.base_url for url in self]
@@ -2735,11 +3390,42 @@ class XAURLList(XAList):
     def port(self) -> list[int]:
         return [url.port for url in self]
 
-    def html(self) -> list[element.Tag]:
-        return [url.html for url in self]
+    def html(self) -> list["bs4.element.Tag"]:
+        return [url.html for url in self.__pages()]
 
     def title(self) -> list[str]:
-        return [url.title for url in self]
+        return [url.title for url in self.__pages()]
+
+    def fetch_pages(self, reload: bool = False) -> "XAURLList":
+        """Downloads the webpages that the URLs point to concurrently, through the shared :class:`PyXA.XAHTTPCache.XAHTTPCache` and a pool of connections. Pages that have already been downloaded are skipped unless `reload` is True.
+
+        :func:`html`, :func:`title`, :func:`extract_text`, and :func:`extract_images` call this method automatically.
+
+        :param reload: Whether to download pages that were previously downloaded, defaults to False
+        :type reload: bool, optional
+        :return: The list of URLs
+        :rtype: XAURLList
+
+        .. versionadded:: 0.3.1
+        """
+        urls = [
+            url
+            for url in dict.fromkeys(str(url.xa_elem) for url in self)
+            if reload or url not in self._xa_responses
+        ]
+        results = XAHTTPCache.shared().fetch_many(urls)
+        for url, result in zip(urls, results):
+            if isinstance(result, XAHTTPResult):
+                self._xa_responses[url] = result
+        return self
+
+    def __pages(self) -> list["XAURL"]:
+        # The element wrappers are created anew on each iteration, so the downloaded pages are kept by the list and handed to each wrapper
+        self.fetch_pages()
+        urls = list(self)
+        for url in urls:
+            url._xa_response = self._xa_responses.get(str(url.xa_elem))
+        return urls
 
     def open(self):
         """Opens each URL in the list.
@@ -2754,15 +3440,35 @@ class XAURLList(XAList):
 
         .. versionadded:: 0.1.2
         """
-        ls = [url.extract_text() for url in self]
+        ls = [url.extract_text() for url in self.__pages()]
         return ls
 
-    def extract_images(self) -> list[list["XAImage"]]:
-        """Extracts the images of each URL in the list.
+    def extract_images(self) -> list["XAImageList"]:
+        """Extracts the images of each URL in the list. The images of every webpage are downloaded concurrently, and images used by several webpages are downloaded once.
+
+        .. versionchanged:: 0.3.1
+
+           Returns a list of :class:`XAImageList` objects.
 
         .. versionadded:: 0.1.2
         """
-        ls = [url.extract_images() for url in self]
+        urls = self.__pages()
+        sources = [url._xa_image_sources() for url in urls]
+        paths = XADownloader.shared().download_many(
+            [x for url_sources in sources for x in url_sources], content_type="image/"
+        )
+
+        ls = []
+        start = 0
+        for url, url_sources in zip(urls, sources):
+            if len(url_sources) == 0:
+                # The URL points to an image, or to a webpage without images
+                ls.append(url.extract_images())
+                continue
+
+            url_paths = paths[start : start + len(url_sources)]
+            start += len(url_sources)
+            ls.append(url._xa_image_list(url_paths))
         return ls
 
 
@@ -2774,17 +3480,16 @@ class XAURL(XAObject, XAClipboardCodable):
 
     def __init__(self, url: Union[str, "AppKit.NSURL", "XAURL", "XAPath"]):
         super().__init__()
-        self.soup: BeautifulSoup = None  #: The bs4 object for the URL, starts as None until a bs4-related action is made
+        self.soup: "bs4.BeautifulSoup" = None  #: The bs4 object for the URL, starts as None until a bs4-related action is made
         self.url: str  #: The string form of the URL
+        self._xa_response: Union[XAHTTPResult, None] = None
 
         if isinstance(url, list):
             # Elevate to XAURLList
             new_self = XAURLList(
                 {"element": AppKit.NSArray.alloc().initWithArray_(url)}
             )
-            self.__dict__ = new_self.__dict__
-            self.__class__ = new_self.__class__
-            self = new_self
+            self._adopt(new_self)
             return
 
         if isinstance(url, dict):
@@ -2844,7 +3549,7 @@ class XAURL(XAObject, XAClipboardCodable):
         return self.xa_elem.port()
 
     @property
-    def html(self) -> element.Tag:
+    def html(self) -> "bs4.element.Tag":
         """The html of the URL."""
         if self.soup is None:
             self.__get_soup()
@@ -2852,14 +3557,23 @@ class XAURL(XAObject, XAClipboardCodable):
 
     @property
     def title(self) -> str:
-        """The title of the URL."""
-        if self.soup is None:
-            self.__get_soup()
-        return self.soup.title.text
+        """The title of the URL. Only the start of the webpage up to its title is parsed.
+
+        .. versionchanged:: 0.3.1
+
+           The webpage is fetched through the shared HTTP cache and is no longer parsed in full.
+        """
+        return self.__get_response().title
+
+    def __get_response(self) -> XAHTTPResult:
+        if self._xa_response is None:
+            self._xa_response = XAHTTPCache.shared().fetch(
+                str(self.xa_elem), shared_session()
+            )
+        return self._xa_response
 
     def __get_soup(self):
-        req = requests.get(str(self.xa_elem))
-        self.soup = BeautifulSoup(req.text, "html.parser")
+        self.soup = self.__get_response().soup()
 
     def open(self):
         """Opens the URL in the appropriate default application.
@@ -2883,42 +3597,46 @@ class XAURL(XAObject, XAClipboardCodable):
             self.__get_soup()
         return self.soup.get_text().splitlines()
 
-    def extract_images(self) -> list["XAImage"]:
-        """Extracts all images from HTML of the webpage that the URL points to.
+    def extract_images(self) -> "XAImageList":
+        """Extracts all images from HTML of the webpage that the URL points to. If the URL points to an image, that image is extracted instead.
+
+        The images are downloaded concurrently through the shared :class:`PyXA.XADownloader.XADownloader`, which limits their size and download time. Images that cannot be downloaded are omitted. Each image is decoded when it is accessed.
 
         :return: The list of extracted images
-        :rtype: list[XAImage]
+        :rtype: XAImageList
+
+        .. versionchanged:: 0.3.1
+
+           Returns an :class:`XAImageList`, and images are downloaded concurrently.
 
         .. versionadded:: 0.0.8
         """
-        data = AppKit.NSData.alloc().initWithContentsOfURL_(
-            AppKit.NSURL.URLWithString_(str(self.xa_elem))
+        response = self.__get_response()
+        if response.content_type.startswith("image/"):
+            content = response.content
+            data = AppKit.NSData.alloc().initWithBytes_length_(content, len(content))
+            image = AppKit.NSImage.alloc().initWithData_(data)
+            if image is not None:
+                return self._new_element([image], XAImageList)
+
+        paths = XADownloader.shared().download_many(
+            self._xa_image_sources(), content_type="image/"
         )
-        image = AppKit.NSImage.alloc().initWithData_(data)
+        return self._xa_image_list(paths)
 
-        if image is not None:
-            image_object = XAImage(image, name=self.xa_elem.pathComponents()[-1])
-            return [image_object]
-        else:
-            if self.soup is None:
-                self.__get_soup()
-
-            images = self.soup.findAll("img")
-            image_objects = []
-            for image in images:
-                image_src = image["src"]
-                if image_src.startswith("/"):
-                    image_src = str(self) + str(image["src"])
-
-                data = AppKit.NSData.alloc().initWithContentsOfURL_(
-                    AppKit.NSURL.URLWithString_(image_src)
-                )
-                image = AppKit.NSImage.alloc().initWithData_(data)
-                if image is not None:
-                    image_object = XAImage(image)
-                    image_objects.append(image_object)
+    def _xa_image_list(self, paths: list[Union[str, Exception]]) -> "XAImageList":
+        # Images that could not be downloaded are omitted
+        return self._new_element([x for x in paths if isinstance(x, str)], XAImageList)
 
-            return image_objects
+    def _xa_image_sources(self) -> list[str]:
+        response = self.__get_response()
+        if response.content_type.startswith("image/"):
+            return []
+
+        if self.soup is None:
+            self.__get_soup()
+        sources = [image.get("src") for image in self.soup.findAll("img")]
+        return resolve_sources(sources, str(self.xa_elem))
 
     def get_clipboard_representation(self) -> list[Union["AppKit.NSURL", str]]:
         """Gets a clipboard-codable representation of the URL.
@@ -3156,14 +3874,32 @@ class XAClipboard(XAObject):
         self.xa_elem.writeObjects_(content)
 
 
+class _XASpotlightObserver(AppKit.NSObject):
+    """Forwards the notifications of a metadata query to the XASpotlight object that owns it, without keeping that object alive."""
+
+    def queryNotification_(self, notification):
+        search = self.search()
+        if search is not None:
+            search._queryNotification_(notification)
+
+
 class XASpotlight(XAObject):
     """A Spotlight query for files on the disk.
 
+    Results are gathered in batches as the query runs. They can be read all at once through :attr:`results`, consumed as they arrive through :func:`stream`, or kept up to date through :func:`watch`. Completed results are cached until the query or predicate changes.
+
     .. versionadded:: 0.0.9
+
+    .. versionchanged:: 0.3.1
+
+       Added streaming and live updates. Results are no longer gathered again on every access. Added the ``backend`` parameter.
     """
 
-    def __init__(self, *query: list[Any]):
+    def __init__(self, *query: list[Any], backend: Union[XAFileIndex, None] = None):
         self.query: list[Any] = query  #: The query terms to search
+        self.backend: Union[
+            XAFileIndex, None
+        ] = backend  #: A local file index to answer the query from instead of Spotlight, e.g. when Spotlight indexing is disabled
         self.timeout: int = (
             10  #: The amount of time in seconds to timeout the search after
         )
@@ -3171,32 +3907,130 @@ class XASpotlight(XAObject):
             str, XAPredicate
         ] = None  #: The predicate to filter search results by
         self.results: list[XAPath]  #: The results of the search
-        self.__results = None
+        self.__key = None
+        self.__done = False
+        self.__live = False
+        self.__results = XAQueryResults(self.__item_path)
+        self.__on_add = None
+        self.__on_remove = None
+        self.__on_change = None
 
         self.query_object = AppKit.NSMetadataQuery.alloc().init()
+        self.__observer = _XASpotlightObserver.alloc().init()
+        self.__observer.search = weakref.ref(self)
         nc = AppKit.NSNotificationCenter.defaultCenter()
         nc.addObserver_selector_name_object_(
-            self, "_queryNotification:", None, self.query_object
+            self.__observer, "queryNotification:", None, self.query_object
         )
 
     @property
     def results(self) -> list["XAPath"]:
-        if len(self.query) == 0 and self.predicate is None:
+        key = self.__query_key()
+        if key is None:
             return []
+        if key != self.__key:
+            self.run()
+        self.__wait(lambda: self.__done, time.monotonic() + self.timeout)
+        return self.__results.results
+
+    def stream(self, timeout: Union[float, None] = None) -> Iterator["XAPath"]:
+        """Yields the results of the search as each batch of results is gathered, rather than waiting for the search to finish.
+
+        If the search has already completed and its query has not changed since, the cached results are yielded immediately.
+
+        :param timeout: The maximum amount of time in seconds to wait for results, defaults to :attr:`timeout`
+        :type timeout: Union[float, None], optional
+        :yield: The path of each result, in the order it was gathered
+        :rtype: Iterator[XAPath]
+
+        :Example:
+
+        >>> import PyXA
+        >>> search = PyXA.XASpotlight("Example")
+        >>> for path in search.stream():
+        >>>     print(path)
+        file:///Users/exampleUser/Documents/Example.txt
+        ...
+
+        .. versionadded:: 0.3.1
+        """
+        key = self.__query_key()
+        if key is None:
+            return
+        if key != self.__key:
+            self.run()
+
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        gathered = self.__results.gathered
+        index = 0
+        while True:
+            self.__wait(lambda: self.__done or len(gathered) > index, deadline)
+            while index < len(gathered):
+                yield gathered[index]
+                index += 1
+            if self.__done or time.monotonic() >= deadline:
+                break
+
+    def watch(
+        self,
+        on_add: Union[Callable[[list["XAPath"]], None], None] = None,
+        on_remove: Union[Callable[[list["XAPath"]], None], None] = None,
+        on_change: Union[Callable[[list["XAPath"]], None], None] = None,
+        batching_interval: Union[float, None] = None,
+    ) -> "XASpotlight":
+        """Runs the search as a live query that keeps its results up to date as files are created, deleted, and modified.
+
+        Each callback receives the paths of one batch of results. Results found while the search is first gathering are reported through ``on_add``. The callbacks are called from the run loop of the current thread, so the run loop must be kept running, e.g. with :func:`PyObjCTools.AppHelper.runConsoleEventLoop`. Use :func:`stop` to end the live query.
+
+        :param on_add: The function to call with the paths of new results, defaults to None
+        :type on_add: Union[Callable[[list[XAPath]], None], None], optional
+        :param on_remove: The function to call with the paths of results that no longer match the query, defaults to None
+        :type on_remove: Union[Callable[[list[XAPath]], None], None], optional
+        :param on_change: The function to call with the paths of results whose metadata changed, defaults to None
+        :type on_change: Union[Callable[[list[XAPath]], None], None], optional
+        :param batching_interval: The minimum amount of time in seconds between update notifications, defaults to the system's default interval
+        :type batching_interval: Union[float, None], optional
+        :raises ValueError: The search uses a :attr:`backend`, which does not support live queries
+        :return: The search object
+        :rtype: XASpotlight
+
+        :Example:
+
+        >>> import PyXA
+        >>> from PyObjCTools import AppHelper
+        >>> search = PyXA.XASpotlight()
+        >>> search.predicate = "kMDItemFSName ENDSWITH '.pdf'"
+        >>> search.watch(on_add=lambda paths: print("Added", paths), on_remove=lambda paths: print("Removed", paths))
+        >>> AppHelper.runConsoleEventLoop()
+
+        .. versionadded:: 0.3.1
+        """
+        if self.backend is not None:
+            raise ValueError("Live queries are only supported by Spotlight")
+
+        self.__on_add = on_add
+        self.__on_remove = on_remove
+        self.__on_change = on_change
+        if batching_interval is not None:
+            self.query_object.setNotificationBatchingInterval_(batching_interval)
+        self.__live = True
         self.run()
-        total_time = 0
-        while self.__results is None and total_time < self.timeout:
-            AppKit.NSRunLoop.currentRunLoop().runUntilDate_(
-                datetime.now() + timedelta(seconds=0.01)
-            )
-            total_time += 0.01
-        if self.__results is None:
-            return []
-        return self.__results
+        return self
+
+    def stop(self):
+        """Stops the search, ending any live updates. Results gathered so far remain available.
+
+        .. versionadded:: 0.3.1
+        """
+        self.__live = False
+        self.__done = True
+        self.query_object.stopQuery()
 
     def run(self):
         """Runs the search.
 
+        The search is always started again, even if its results are cached.
+
         :Example:
 
         >>> import PyXA
@@ -3209,6 +4043,19 @@ class XASpotlight(XAObject):
 
         .. versionadded:: 0.0.9
         """
+        self.query_object.stopQuery()
+        self.__key = self.__query_key()
+        self.__done = False
+
+        if self.backend is not None:
+            if self.predicate is not None:
+                raise ValueError("Predicates are only supported by Spotlight")
+            self.__results = XAQueryResults(XAPath)
+            self.__results.extend(self.backend.search(*self.query))
+            self.__done = True
+            return
+
+        self.__results = XAQueryResults(self.__item_path)
         if self.predicate is not None:
             # Search with custom predicate
             if isinstance(self.predicate, XAPredicate):
@@ -3249,10 +4096,6 @@ class XASpotlight(XAObject):
                 self.query[0], self.query[1], self.query[2:]
             )
 
-        AppKit.NSRunLoop.currentRunLoop().runUntilDate_(
-            datetime.now() + timedelta(seconds=0.01)
-        )
-
     def show_in_finder(self):
         """Shows the search in Finder. This might not reveal the same search results.
 
@@ -3312,14 +4155,66 @@ class XASpotlight(XAObject):
         self.query_object.setPredicate_(predicate)
         self.query_object.startQuery()
 
+    def __query_key(self) -> Union[tuple, None]:
+        predicate = self.predicate
+        if isinstance(predicate, XAPredicate):
+            predicate = predicate.get_clipboard_representation()
+        return query_key(self.query, predicate)
+
+    def __wait(self, condition: Callable[[], bool], deadline: float):
+        # Each iteration sleeps until the run loop handles an event, so the wait does not poll
+        run_loop = AppKit.NSRunLoop.currentRunLoop()
+        while not condition():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            run_loop.runMode_beforeDate_(
+                AppKit.NSDefaultRunLoopMode,
+                AppKit.NSDate.dateWithTimeIntervalSinceNow_(remaining),
+            )
+
+    def __item_path(self, item) -> "XAPath":
+        return XAPath(item.valueForAttribute_(AppKit.NSMetadataItemPathKey))
+
+    def __update(self, info):
+        added, removed, changed = self.__results.update(
+            info.get(AppKit.NSMetadataQueryUpdateAddedItemsKey) or [],
+            info.get(AppKit.NSMetadataQueryUpdateRemovedItemsKey) or [],
+            info.get(AppKit.NSMetadataQueryUpdateChangedItemsKey) or [],
+            self.query_object.resultCount(),
+        )
+
+        for callback, paths in (
+            (self.__on_add, added),
+            (self.__on_remove, removed),
+            (self.__on_change, changed),
+        ):
+            if callback is not None and len(paths) > 0:
+                callback(paths)
+
     def _queryNotification_(self, notification):
-        if notification.name() == AppKit.NSMetadataQueryDidFinishGatheringNotification:
-            self.query_object.stopQuery()
-            results = notification.object().results()
-            self.__results = [
-                XAPath(x.valueForAttribute_(AppKit.NSMetadataItemPathKey))
-                for x in results
-            ]
+        name = notification.name()
+        if name == AppKit.NSMetadataQueryDidUpdateNotification:
+            self.__update(notification.userInfo() or {})
+            return
+
+        if name not in (
+            AppKit.NSMetadataQueryGatheringProgressNotification,
+            AppKit.NSMetadataQueryDidFinishGatheringNotification,
+        ):
+            return
+
+        added = self.__results.gather(self.query_object)
+        if name == AppKit.NSMetadataQueryDidFinishGatheringNotification:
+            self.__done = True
+            if not self.__live:
+                self.query_object.stopQuery()
+        if self.__live and self.__on_add is not None and len(added) > 0:
+            self.__on_add(added)
+
+    def __del__(self):
+        AppKit.NSNotificationCenter.defaultCenter().removeObserver_(self.__observer)
+        self.query_object.stopQuery()
 
 
 ############
@@ -3470,6 +4365,21 @@ class XATextDocument(XAObject):
         return self.text.attachments(filter)
 
 
+def _data_values(matches: dict[str, list]) -> dict[str, list[Any]]:
+    # Converts the matches from PyXA.XADataDetection into PyXA types
+    converters = {
+        "urls": XAURL,
+        "emails": XAText,
+        "dates": lambda value: XADatetimeBlock(*value),
+        "addresses": lambda value: value,
+        "phone_numbers": XAText,
+    }
+    return {
+        kind: [converters[kind](match.value) for match in kind_matches]
+        for kind, kind_matches in matches.items()
+    }
+
+
 class XATextList(XAList):
     """A wrapper around lists of text objects that employs fast enumeration techniques.
 
@@ -3538,6 +4448,24 @@ class XATextList(XAList):
         ls = [attachment for attachment_list in ls for attachment in attachment_list]
         return self._new_element(ls, XAAttachmentList, filter)
 
+    def extract_all(
+        self, kinds: Union[list[str], None] = None
+    ) -> list[dict[str, list[Any]]]:
+        """Finds several kinds of data in each text of the list, reusing one data detector for the whole list. See :func:`XAText.extract_all`.
+
+        :param kinds: The kinds of data to find, any of "urls", "emails", "dates", "addresses", and "phone_numbers", defaults to all of them
+        :type kinds: Union[list[str], None], optional
+        :return: The data of each kind, for each text in the list
+        :rtype: list[dict[str, list[Any]]]
+
+        .. versionadded:: 0.3.1
+        """
+        texts = self.xa_elem
+        if hasattr(texts, "get"):
+            # Resolve the text of every scripting element in one call
+            texts = texts.get()
+        return [_data_values(x) for x in extract_many(texts, kinds)]
+
     def __repr__(self):
         try:
             if isinstance(self.xa_elem[0], ScriptingBridge.SBObject):
@@ -3654,39 +4582,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.1.0
         """
-        import NaturalLanguage
-
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLexicalClass]
-        )
-        tagger.setString_(str(self.xa_elem))
-
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
-
-        tagged_pos = []
-
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            tagged_pos.append((word_phrase, tag))
-
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLexicalClass,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_pos
+        return self.__tag("parts_of_speech", unit)
 
     def tag_languages(
         self, unit: Literal["word", "sentence", "paragraph", "document"] = "paragraph"
@@ -3707,40 +4603,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.1.0
         """
-        import NaturalLanguage
-
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLanguage]
-        )
-        tagger.setString_(str(self.xa_elem))
-
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
-
-        tagged_languages = []
-
-        def apply_tags(tag, token_range, error):
-            paragraph = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if paragraph.strip() != "":
-                tagged_languages.append((paragraph, tag))
-
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLanguage,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_languages
+        return self.__tag("languages", unit)
 
     def tag_entities(
         self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
@@ -3761,40 +4624,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.1.0
         """
-        import NaturalLanguage
-
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass]
-        )
-        tagger.setString_(str(self.xa_elem))
-
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
-
-        tagged_languages = []
-
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if word_phrase.strip() != "":
-                tagged_languages.append((word_phrase, tag))
-
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeNameTypeOrLexicalClass,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace,
-            apply_tags,
-        )
-        return tagged_languages
+        return self.__tag("entities", unit)
 
     def tag_lemmas(
         self, unit: Literal["word", "sentence", "paragraph", "document"] = "word"
@@ -3826,41 +4656,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.1.0
         """
-        import NaturalLanguage
-
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeLemma]
-        )
-        tagger.setString_(str(self.xa_elem))
-
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
-
-        tagged_lemmas = []
-
-        def apply_tags(tag, token_range, error):
-            word_phrase = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if word_phrase.strip() != "":
-                tagged_lemmas.append((word_phrase, tag))
-
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeLemma,
-            NaturalLanguage.NLTaggerOmitPunctuation
-            | NaturalLanguage.NLTaggerOmitWhitespace
-            | NaturalLanguage.NLTaggerJoinContractions,
-            apply_tags,
-        )
-        return tagged_lemmas
+        return self.__tag("lemmas", unit, join_contractions=True)
 
     def tag_sentiments(
         self,
@@ -3903,66 +4699,60 @@ class XAText(XAObject):
 
         .. versionadded:: 0.1.0
         """
-        import NaturalLanguage
-
         if sentiment_scale is None or len(sentiment_scale) == 0:
             sentiment_scale = ["Negative", "Neutral", "Positive"]
 
-        if unit == "word":
-            unit = NaturalLanguage.NLTokenUnitWord
-        elif unit == "sentence":
-            unit = NaturalLanguage.NLTokenUnitSentence
-        elif unit == "paragraph":
-            unit = NaturalLanguage.NLTokenUnitParagraph
-        elif unit == "document":
-            unit = NaturalLanguage.NLTokenUnitDocument
-
-        tagger = NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(
-            [NaturalLanguage.NLTagSchemeSentimentScore]
-        )
-        tagger.setString_(str(self.xa_elem))
-
         tagged_sentiments = []
-
-        def apply_tags(tag, token_range, error):
-            paragraph = str(self.xa_elem)[
-                token_range.location : token_range.location + token_range.length
-            ]
-            if paragraph.strip() != "":
-                # Map raw tag value to range length
-                raw_value = float(tag or 0)
-                scaled = (raw_value + 1.0) / 2.0 * (len(sentiment_scale) - 1)
-
-                label = sentiment_scale[int(scaled)]
-                tagged_sentiments.append((paragraph, label))
-
-        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
-            (0, len(str(self.xa_elem))),
-            unit,
-            NaturalLanguage.NLTagSchemeSentimentScore,
-            0,
-            apply_tags,
-        )
+        for paragraph, tag in self.__tag(
+            "sentiments", unit, omit_punctuation=False, omit_whitespace=False
+        ):
+            # Map raw tag value to range length
+            raw_value = float(tag or 0)
+            scaled = (raw_value + 1.0) / 2.0 * (len(sentiment_scale) - 1)
+            tagged_sentiments.append((paragraph, sentiment_scale[int(scaled)]))
         return tagged_sentiments
 
+    def __tag(self, scheme: str, unit: str, **options) -> list[tuple[str, str]]:
+        text = str(self.xa_elem)
+        spans = TaggingEngine.shared().tag(text, [scheme], unit, **options)[scheme]
+        return [(span.substring(text), span.tag) for span in spans]
+
+    def extract_all(
+        self, kinds: Union[list[str], None] = None
+    ) -> dict[str, list[Any]]:
+        """Finds several kinds of data in the text with a single scan.
+
+        URLs are returned as :class:`XAURL` objects, email addresses and phone numbers as :class:`XAText` objects, dates as :class:`XADatetimeBlock` tuples, and addresses as dictionaries of address components. Use :func:`extract_addresses` to geocode addresses into locations.
+
+        :param kinds: The kinds of data to find, any of "urls", "emails", "dates", "addresses", and "phone_numbers", defaults to all of them
+        :type kinds: Union[list[str], None], optional
+        :return: The data of each kind, in the order it appears in the text
+        :rtype: dict[str, list[Any]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> text = PyXA.XAText("Email jane@example.com or call 555-0100 before Friday at 5pm. The agenda is at https://example.com/agenda.")
+        >>> print(text.extract_all(["urls", "phone_numbers", "emails"]))
+        {'urls': [<<class 'PyXA.XABase.XAURL'>https://example.com/agenda>], 'phone_numbers': [<<class 'PyXA.XABase.XAText'>555-0100>], 'emails': [<<class 'PyXA.XABase.XAText'>jane@example.com>]}
+
+        .. versionadded:: 0.3.1
+        """
+        return _data_values(extract_all(str(self.xa_elem), kinds))
+
     def extract_urls(self) -> list["XAURL"]:
-        """Gets a list of URLs in the text.
+        """Gets a list of URLs in the text. Email addresses are included as "mailto:" URLs.
 
         :return: The list of URLs.
         :rtype: list[XAURL]
 
         .. versionadded:: 0.3.0
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeLink, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
-
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XAURL(match.URL()) for match in matches]
+        # NSURLs keep "mailto:" links from being given an http scheme
+        return [
+            XAURL(AppKit.NSURL.URLWithString_(x))
+            for x in extract_links(str(self.xa_elem))
+        ]
 
     def extract_dates(self) -> list["XADatetimeBlock"]:
         """Gets a list of dates and durations in the text.
@@ -3972,16 +4762,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.3.0
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeDate, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
-
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XADatetimeBlock(match.date(), match.duration()) for match in matches]
+        return self.extract_all(["dates"])["dates"]
 
     def extract_addresses(self):
         """Gets a list of addresses in the text.
@@ -3993,16 +4774,9 @@ class XAText(XAObject):
         """
         import CoreLocation
 
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypeAddress, None
-        )
-        if detector[1] is not None:
-            raise Exception()
-
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        address_dicts = [match.addressComponents() for match in matches]
+        address_dicts = self.extract_all(["addresses"])["addresses"]
+        if len(address_dicts) == 0:
+            return []
 
         geocoder = CoreLocation.CLGeocoder.alloc().init()
         addresses = []
@@ -4047,16 +4821,7 @@ class XAText(XAObject):
 
         .. versionadded:: 0.3.0
         """
-        detector = AppKit.NSDataDetector.dataDetectorWithTypes_error_(
-            AppKit.NSTextCheckingTypePhoneNumber, None
-        )
-        if detector[1] is not None:
-            raise Exception("Error creating data detector")
-
-        matches = detector[0].matchesInString_options_range_(
-            self.xa_elem, 0, AppKit.NSMakeRange(0, len(self.xa_elem))
-        )
-        return [XAText(match.phoneNumber()) for match in matches]
+        return self.extract_all(["phone_numbers"])["phone_numbers"]
 
     def paragraphs(self, filter: dict = None) -> "XAParagraphList":
         """Gets a list of paragraphs in the text.
@@ -6362,6 +7127,7 @@ class XAImageList(XAList, XAClipboardCodable):
         super().__init__(properties, obj_class, filter)
 
         self.modified = False  #: Whether the list of images has been modified since it was initialized
+        self.errors: dict[int, Exception] = {}  #: The errors raised while processing each image in the most recent batch operation, by index
 
     def __partial_init(self):
         images = [None] * self.xa_elem.count()
@@ -6382,6 +7148,21 @@ class XAImageList(XAList, XAClipboardCodable):
         self.xa_elem.enumerateObjectsUsingBlock_(init_images)
         return AppKit.NSMutableArray.alloc().initWithArray_(images)
 
+    def __run_batch(self, image_handler, images, results, *args):
+        # Run image_handler(image, index, *args) for each image on the shared bounded executor. If the handler fails, the error is recorded in self.errors and the original image is kept in its slot of results.
+        self.errors = {}
+        outcomes = XABoundedExecutor.shared().map(
+            lambda item: image_handler(item[1], item[0], *args),
+            enumerate(images),
+            return_exceptions=True,
+        )
+
+        for index, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                self.errors[index] = outcome
+                if results is not None:
+                    results[index] = images[index]
+
     def __apply_filter(self, filter_block, *args):
         images = self.__partial_init()
 
@@ -6404,12 +7185,7 @@ class XAImageList(XAList, XAClipboardCodable):
             result.addRepresentation_(rep)
             filtered_images[index] = result
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(filter_image, [image, index, *args])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(filter_image, images, filtered_images, *args)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(filtered_images)
@@ -6692,17 +7468,11 @@ class XAImageList(XAList, XAClipboardCodable):
 
         def filter_block(image, focal_region, intensity, focal_region_saturation):
             if focal_region is None:
-                center_top = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 3
-                )
-                center_bottom = Quartz.CIVector.vectorWithX_Y_(
-                    image.size().width / 2, image.size().height / 3 * 2
-                )
-                focal_region = (center_top, center_bottom)
-            else:
-                point1 = Quartz.CIVector.vectorWithX_Y_(focal_region[0])
-                point2 = Quartz.CIVector.vectorWithX_Y_(focal_region[1])
-                focal_region = (point1, point2)
+                size = (image.size().width, image.size().height)
+                focal_region = [
+                    relative_point(size, x) for x in DEPTH_OF_FIELD_FOCAL_REGION
+                ]
+            focal_region = [Quartz.CIVector.vectorWithX_Y_(*x) for x in focal_region]
 
             filter = Quartz.CIFilter.filterWithName_("CIDepthOfField")
             filter.setDefaults()
@@ -6863,14 +7633,7 @@ class XAImageList(XAList, XAClipboardCodable):
             result.addRepresentation_(rep)
             bumped_images[index] = result
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                bump_image, [image, index, center, radius, curvature]
-            )
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(bump_image, images, bumped_images, center, radius, curvature)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(bumped_images)
@@ -6921,14 +7684,7 @@ class XAImageList(XAList, XAClipboardCodable):
             result.addRepresentation_(rep)
             pinched_images[index] = result
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                pinch_image, [image, index, center, intensity]
-            )
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(pinch_image, images, pinched_images, center, intensity)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(pinched_images)
@@ -6985,14 +7741,7 @@ class XAImageList(XAList, XAClipboardCodable):
             result.addRepresentation_(rep)
             twirled_images[index] = result
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(
-                twirl_image, [image, index, center, radius, angle]
-            )
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(twirl_image, images, twirled_images, center, radius, angle)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(twirled_images)
@@ -7046,12 +7795,7 @@ class XAImageList(XAList, XAClipboardCodable):
             result.addRepresentation_(rep)
             enhanced_images[index] = result
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(enhance_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(enhance_image, images, enhanced_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(enhanced_images)
@@ -7087,12 +7831,7 @@ class XAImageList(XAList, XAClipboardCodable):
             flipped_image.unlockFocus()
             flipped_images[index] = flipped_image
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(flip_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(flip_image, images, flipped_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
@@ -7128,12 +7867,7 @@ class XAImageList(XAList, XAClipboardCodable):
             flipped_image.unlockFocus()
             flipped_images[index] = flipped_image
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(flip_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(flip_image, images, flipped_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(flipped_images)
@@ -7184,12 +7918,7 @@ class XAImageList(XAList, XAClipboardCodable):
 
             rotated_images[index] = rotated_image
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(rotate_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(rotate_image, images, rotated_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(rotated_images)
@@ -7230,12 +7959,7 @@ class XAImageList(XAList, XAClipboardCodable):
             cropped_image.unlockFocus()
             cropped_images[index] = cropped_image
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(crop_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(crop_image, images, cropped_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(cropped_images)
@@ -7284,12 +8008,7 @@ class XAImageList(XAList, XAClipboardCodable):
             scaled_image.unlockFocus()
             scaled_images[index] = scaled_image
 
-        threads = [None] * self.xa_elem.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(scale_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(scale_image, images, scaled_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
@@ -7339,12 +8058,7 @@ class XAImageList(XAList, XAClipboardCodable):
             scaled_image.unlockFocus()
             scaled_images[index] = scaled_image
 
-        threads = [None] * self.xa_elem.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(scale_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(scale_image, images, scaled_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(scaled_images)
@@ -7393,12 +8107,7 @@ class XAImageList(XAList, XAClipboardCodable):
             color_swatch.xa_elem.unlockFocus()
             padded_images[index] = color_swatch.xa_elem
 
-        threads = [None] * images.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(pad_image, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(pad_image, images, padded_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(padded_images)
@@ -7450,14 +8159,7 @@ class XAImageList(XAList, XAClipboardCodable):
             img.unlockFocus()
             overlayed_images[index] = img
 
-        threads = [None] * images.count()
-        for index, img in enumerate(images):
-            threads[index] = self._spawn_thread(
-                overlay_image, [img, index, image, size, location]
-            )
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(overlay_image, images, overlayed_images, image, size, location)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
@@ -7513,12 +8215,7 @@ class XAImageList(XAList, XAClipboardCodable):
             image.unlockFocus()
             overlayed_images[index] = image
 
-        threads = [None] * self.xa_elem.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(overlay_text, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(overlay_text, images, overlayed_images)
 
         self.modified = True
         self.xa_elem = AppKit.NSMutableArray.alloc().initWithArray_(overlayed_images)
@@ -7569,12 +8266,7 @@ class XAImageList(XAList, XAClipboardCodable):
             request_handler.performRequests_error_([request], None)
             extracted_strings[index] = image_strings
 
-        threads = [None] * self.xa_elem.count()
-        for index, image in enumerate(images):
-            threads[index] = self._spawn_thread(get_text, [image, index])
-
-        while any([t.is_alive() for t in threads]):
-            time.sleep(0.01)
+        self.__run_batch(get_text, images, None)
 
         return extracted_strings
 
@@ -7617,12 +8309,28 @@ class XAImageList(XAList, XAClipboardCodable):
         return data
 
 
+def _ci_point(
+    point: Union[tuple[float, float], None],
+    relative_default: tuple[float, float] = (0.5, 0.5),
+) -> Callable[[tuple[float, float]], "Quartz.CIVector"]:
+    """Creates a function computing a CIVector for the given point, or for a point relative to the image size if the given point is None."""
+
+    def resolve(size):
+        if point is None:
+            return Quartz.CIVector.vectorWithX_Y_(*relative_point(size, relative_default))
+        return Quartz.CIVector.vectorWithX_Y_(point[0], point[1])
+
+    return resolve
+
+
 class XAImage(macimg.Image, XAObject, XAClipboardCodable):
     """A wrapper around NSImage with specialized automation methods.
 
     .. versionadded:: 0.0.2
     """
 
+    _xa_pipeline: Union[XAImagePipeline, None] = None
+
     def __init__(
         self,
         image_reference: Union[
@@ -7659,6 +8367,120 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
     def xa_elem(self):
         return self._nsimage
 
+    @property
+    def _nsimage(self) -> "AppKit.NSImage":
+        # Every access to the underlying NSImage, including those made by macimg, renders any pending operations first
+        if self._xa_pipeline is not None and len(self._xa_pipeline) > 0:
+            self.render()
+        return self._xa_nsimage
+
+    @_nsimage.setter
+    def _nsimage(self, image: "AppKit.NSImage"):
+        self._xa_nsimage = image
+
+    def lazy(self, enabled: bool = True) -> "XAImage":
+        """Enables or disables lazy rendering for the image.
+
+        While lazy rendering is enabled, filters, distortions, and transforms are recorded instead of applied. The recorded operations are optimized and rendered when the image's pixels are next needed, e.g. when the image is saved, its text is extracted, or it is copied to the clipboard. Consecutive CoreImage filters are rendered as one chain, so a chain of filters costs a single rasterization rather than one per filter.
+
+        :param enabled: Whether to enable lazy rendering, defaults to True. Disabling lazy rendering renders any pending operations.
+        :type enabled: bool, optional
+        :return: The image object
+        :rtype: XAImage
+
+        :Example:
+
+        >>> import PyXA
+        >>> img = PyXA.XAImage("/Users/exampleUser/Desktop/Example.png").lazy()
+        >>> img.gaussian_blur().sepia().vignette().rotate(90)
+        >>> img.save("/Users/exampleUser/Desktop/Example2.png")  # Renders once here
+
+        .. versionadded:: 0.3.1
+        """
+        if enabled:
+            if self._xa_pipeline is None:
+                self._xa_pipeline = XAImagePipeline()
+        else:
+            self.render()
+            self._xa_pipeline = None
+        return self
+
+    def render(self) -> "XAImage":
+        """Renders any operations recorded while lazy rendering is enabled.
+
+        This is called automatically when the image's pixels are needed, so it only needs to be called directly to control when rendering happens.
+
+        :return: The image object, modifications included
+        :rtype: XAImage
+
+        .. versionadded:: 0.3.1
+        """
+        pipeline = self._xa_pipeline
+        if pipeline is None or len(pipeline) == 0:
+            return self
+
+        # Detach the pipeline so that operations rendered through macimg see the current NSImage
+        self._xa_pipeline = None
+        try:
+            for stage in pipeline.plan():
+                if isinstance(stage, XAFusedFilters):
+                    self.__render_filters(stage.operations)
+                elif stage.kind == "transform":
+                    self.__render_transform(stage)
+                else:
+                    result = stage.function(self)
+                    if result is not self:
+                        self._xa_nsimage = result._nsimage
+                self.modified = True
+        finally:
+            self._xa_pipeline = XAImagePipeline()
+        return self
+
+    def __defer(
+        self,
+        kind: str,
+        name: str,
+        parameters: Union[dict, None] = None,
+        function: Union[Callable, None] = None,
+    ) -> "XAImage":
+        self._xa_pipeline.add(XAImageOperation(kind, name, parameters, function))
+        return self
+
+    def __render_filters(self, operations: list[XAImageOperation]):
+        size = self._xa_nsimage.size()
+        ciimage = Quartz.CIImage.imageWithData_(self._xa_nsimage.TIFFRepresentation())
+
+        for operation in operations:
+            filter = Quartz.CIFilter.filterWithName_(operation.name)
+            filter.setDefaults()
+            for key, value in operation.resolve_parameters(
+                (size.width, size.height)
+            ).items():
+                filter.setValue_forKey_(value, key)
+            filter.setValue_forKey_(ciimage, "inputImage")
+            ciimage = filter.valueForKey_(Quartz.kCIOutputImageKey)
+
+        # Crop the result to the original image size
+        cropped = ciimage.imageByCroppingToRect_(
+            AppKit.NSMakeRect(0, 0, size.width, size.height)
+        )
+
+        # Convert back to NSImage
+        rep = AppKit.NSCIImageRep.imageRepWithCIImage_(cropped)
+        result = AppKit.NSImage.alloc().initWithSize_(rep.size())
+        result.addRepresentation_(rep)
+        self._xa_nsimage = result
+
+    def __render_transform(self, operation: XAImageOperation):
+        if operation.name == "rotate":
+            macimg.transforms.Rotate(operation.parameters["degrees"]).apply_to(self)
+        elif operation.name == "scale":
+            macimg.transforms.Scale(
+                operation.parameters["x"], operation.parameters["y"]
+            ).apply_to(self)
+        elif operation.name == "flip":
+            macimg.transforms.Flip(operation.parameters["direction"]).apply_to(self)
+
     def open(
         *images: Union[str, XAPath, list[Union[str, XAPath]]]
     ) -> Union["XAImage", XAImageList]:
@@ -7717,6 +8539,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIEdges", {"inputIntensity": intensity})
         return macimg.filters.Edges(intensity).apply_to(self)
 
     def gaussian_blur(self, intensity: float = 10) -> "XAImage":
@@ -7729,6 +8553,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIGaussianBlur", {"inputRadius": intensity})
         return macimg.filters.GaussianBlur(intensity).apply_to(self)
 
     def reduce_noise(
@@ -7745,6 +8571,12 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CINoiseReduction",
+                {"inputNoiseLevel": noise_level, "inputSharpness": sharpness},
+            )
         return macimg.filters.NoiseReduction(noise_level, sharpness).apply_to(self)
 
     def pixellate(self, pixel_size: float = 8.0) -> "XAImage":
@@ -7757,6 +8589,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIPixellate", {"inputScale": pixel_size})
         return macimg.filters.Pixellate(pixel_size).apply_to(self)
 
     def outline(self, threshold: float = 0.1) -> "XAImage":
@@ -7769,6 +8603,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CILineOverlay", {"inputThreshold": threshold})
         return macimg.filters.Outline(threshold).apply_to(self)
 
     def invert(self) -> "XAImage":
@@ -7779,6 +8615,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIColorInvert")
         return macimg.filters.Invert().apply_to(self)
 
     def sepia(self, intensity: float = 1.0) -> "XAImage":
@@ -7791,6 +8629,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CISepiaTone", {"inputIntensity": intensity})
         return macimg.filters.Sepia(intensity).apply_to(self)
 
     def vignette(self, intensity: float = 1.0) -> "XAImage":
@@ -7803,6 +8643,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIVignette", {"inputIntensity": intensity})
         return macimg.filters.Vignette(intensity).apply_to(self)
 
     def depth_of_field(
@@ -7824,6 +8666,23 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CIDepthOfField",
+                {
+                    "inputPoint0": _ci_point(
+                        focal_region[0] if focal_region else None,
+                        DEPTH_OF_FIELD_FOCAL_REGION[0],
+                    ),
+                    "inputPoint1": _ci_point(
+                        focal_region[1] if focal_region else None,
+                        DEPTH_OF_FIELD_FOCAL_REGION[1],
+                    ),
+                    "inputRadius": intensity,
+                    "inputSaturation": focal_region_saturation,
+                },
+            )
         return macimg.filters.DepthOfField(
             focal_region, intensity, focal_region_saturation
         ).apply_to(self)
@@ -7838,6 +8697,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CICrystallize", {"inputRadius": crystal_size})
         return macimg.filters.Crystallize(crystal_size).apply_to(self)
 
     def comic(self) -> "XAImage":
@@ -7848,6 +8709,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIComicEffect")
         return macimg.filters.Comic().apply_to(self)
 
     def pointillize(self, point_size: float = 20.0) -> "XAImage":
@@ -7860,6 +8723,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIPointillize", {"inputRadius": point_size})
         return macimg.filters.Pointillize(point_size).apply_to(self)
 
     def bloom(self, intensity: float = 0.5) -> "XAImage":
@@ -7872,6 +8737,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("filter", "CIBloom", {"inputIntensity": intensity})
         return macimg.filters.Bloom(intensity).apply_to(self)
 
     def monochrome(self, color: XAColor, intensity: float = 1.0) -> "XAImage":
@@ -7886,6 +8753,15 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CIColorMonochrome",
+                {
+                    "inputColor": Quartz.CIColor.alloc().initWithColor_(color.xa_elem),
+                    "inputIntensity": intensity,
+                },
+            )
         return macimg.filters.Monochrome(color, intensity).apply_to(self)
 
     def bump(
@@ -7907,6 +8783,16 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CIBumpDistortion",
+                {
+                    "inputCenter": _ci_point(center),
+                    "inputRadius": radius,
+                    "inputScale": curvature,
+                },
+            )
         return macimg.distortions.Bump(center, radius, curvature).apply_to(self)
 
     def pinch(
@@ -7923,6 +8809,12 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CIPinchDistortion",
+                {"inputCenter": _ci_point(center), "inputScale": intensity},
+            )
         return macimg.distortions.Pinch(center, intensity).apply_to(self)
 
     def twirl(
@@ -7944,6 +8836,16 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "filter",
+                "CITwirlDistortion",
+                {
+                    "inputCenter": _ci_point(center),
+                    "inputRadius": radius,
+                    "inputAngle": angle,
+                },
+            )
         return macimg.distortions.Twirl(center, radius, angle).apply_to(self)
 
     def auto_enhance(
@@ -7965,6 +8867,14 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "opaque",
+                "auto_enhance",
+                function=macimg.filters.AutoEnhance(
+                    correct_red_eye, crop_to_features, correct_rotation
+                ).apply_to,
+            )
         return macimg.filters.AutoEnhance(
             correct_red_eye, crop_to_features, correct_rotation
         ).apply_to(self)
@@ -7977,6 +8887,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("transform", "flip", {"direction": "horizontal"})
         return macimg.transforms.Flip("horizontal").apply_to(self)
 
     def flip_vertically(self) -> "XAImage":
@@ -7987,6 +8899,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("transform", "flip", {"direction": "vertical"})
         return macimg.transforms.Flip("vertical").apply_to(self)
 
     def rotate(self, degrees: float) -> "XAImage":
@@ -7999,6 +8913,8 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer("transform", "rotate", {"degrees": degrees})
         return macimg.transforms.Rotate(degrees).apply_to(self)
 
     def crop(
@@ -8015,6 +8931,10 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "opaque", "crop", function=macimg.transforms.Crop(size, corner).apply_to
+            )
         return macimg.transforms.Crop(size, corner).apply_to(self)
 
     def scale(
@@ -8031,6 +8951,12 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.0
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "transform",
+                "scale",
+                {"x": scale_factor_x, "y": scale_factor_y or scale_factor_x},
+            )
         return macimg.transforms.Scale(scale_factor_x, scale_factor_y).apply_to(self)
 
     def resize(self, width: int, height: Union[int, None] = None) -> "XAImage":
@@ -8045,6 +8971,10 @@ class XAImage(macimg.Image, XAObject, XAClipboardCodable):
 
         .. versionadded:: 0.1.1
         """
+        if self._xa_pipeline is not None:
+            return self.__defer(
+                "opaque", "resize", function=macimg.transforms.Resize(width, height).apply_to
+            )
         return macimg.transforms.Resize(width, height).apply_to(self)
 
     def save(self, file_path: Union[XAPath, str, None] = None):
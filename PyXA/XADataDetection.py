@@ -0,0 +1,333 @@
+""".. versionadded:: 0.3.1
+
+Detection of URLs, email addresses, dates, addresses, and phone numbers in text, in a single pass for all requested kinds.
+
+:class:`XANativeDetector` uses NSDataDetector, caching one detector per combination of checking types. :class:`XARegexDetector` is a pure-Python fallback for URLs, email addresses, and phone numbers that works on any platform. Both report matches as :class:`XADataMatch` spans into the original string, so their results can be compared directly.
+"""
+
+import importlib.util
+import re
+import threading
+from typing import Any, Iterable, Iterator, NamedTuple, Union
+
+from PyXA.XALazy import lazy_import
+from PyXA.XATagging import iter_strings, utf16_index_map
+
+AppKit = lazy_import("AppKit")
+
+# NSTextCheckingType
+NSTextCheckingTypeDate = 1 << 3
+NSTextCheckingTypeAddress = 1 << 4
+NSTextCheckingTypeLink = 1 << 5
+NSTextCheckingTypePhoneNumber = 1 << 11
+
+KINDS = {
+    "urls": NSTextCheckingTypeLink,
+    "emails": NSTextCheckingTypeLink,
+    "dates": NSTextCheckingTypeDate,
+    "addresses": NSTextCheckingTypeAddress,
+    "phone_numbers": NSTextCheckingTypePhoneNumber,
+}
+"""The kinds of data that can be detected, mapped to the NSTextCheckingType that detects them.
+"""
+
+
+class XADataMatch(NamedTuple):
+    """A piece of data found in the characters from `start` to `end` of a string.
+
+    The value depends on the kind of data: the URL for URLs, the address (without "mailto:") for email addresses, the phone number for phone numbers, a (date, duration) tuple for dates, and a dictionary of address components for addresses.
+
+    .. versionadded:: 0.3.1
+    """
+
+    kind: str  #: The kind of data, one of the keys of :attr:`KINDS`
+    start: int  #: The index of the first character of the match
+    end: int  #: The index after the last character of the match
+    value: Any  #: The detected value
+
+    def substring(self, text: str) -> str:
+        """Gets the matched characters from the string the match was found in.
+
+        :param text: The searched string
+        :type text: str
+        :return: The matched characters
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """
+        return text[self.start : self.end]
+
+
+def _check_kinds(kinds: Union[Iterable[str], None], supported: Iterable[str]) -> list[str]:
+    if kinds is None:
+        return list(supported)
+    kinds = list(dict.fromkeys(kinds))
+    for kind in kinds:
+        if kind not in supported:
+            raise ValueError(f"Unsupported data kind: {kind}")
+    return kinds
+
+
+class XANativeDetector:
+    """Detects data with NSDataDetector. One detector is created for each combination of checking types and reused for every text.
+
+    .. versionadded:: 0.3.1
+    """
+
+    kinds = tuple(KINDS)  #: The kinds of data this detector finds
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__detectors: dict[int, Any] = {}
+
+    def detector(self, types: int) -> Any:
+        """Gets the NSDataDetector for a combination of checking types, creating it on first use.
+
+        :param types: The NSTextCheckingType values to detect, combined with |
+        :type types: int
+        :raises ValueError: The detector could not be created
+        :return: The data detector
+        :rtype: AppKit.NSDataDetector
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            detector = self.__detectors.get(types)
+            if detector is None:
+                detector, error = AppKit.NSDataDetector.dataDetectorWithTypes_error_(types, None)
+                if error is not None:
+                    raise ValueError(f"Error creating data detector: {error}")
+                # Detectors are immutable, so one instance can be shared between threads
+                self.__detectors[types] = detector
+            return detector
+
+    def detect(self, text: str, kinds: Union[Iterable[str], None] = None) -> dict[str, list[XADataMatch]]:
+        """Finds every requested kind of data in a text with a single scan.
+
+        :param text: The text to search
+        :type text: str
+        :param kinds: The kinds of data to find, defaults to every kind in :attr:`KINDS`
+        :type kinds: Union[Iterable[str], None], optional
+        :raises ValueError: A kind of data is not supported
+        :return: The matches of each kind, in the order they appear in the text
+        :rtype: dict[str, list[XADataMatch]]
+
+        .. versionadded:: 0.3.1
+        """
+        kinds = _check_kinds(kinds, self.kinds)
+        results = {kind: [] for kind in kinds}
+        if len(kinds) == 0:
+            return results
+
+        types = 0
+        for kind in kinds:
+            types |= KINDS[kind]
+
+        index_map = utf16_index_map(text)
+        matches = self.detector(types).matchesInString_options_range_(
+            text, 0, (0, len(text.encode("utf-16-le")) // 2)
+        )
+        for match in matches:
+            match_range = match.range()
+            start, end = match_range[0], match_range[0] + match_range[1]
+            if index_map is not None:
+                start, end = index_map[start], index_map[end]
+
+            result_type = match.resultType()
+            if result_type == NSTextCheckingTypeLink:
+                url = str(match.URL().absoluteString())
+                if url.startswith("mailto:"):
+                    kind, value = "emails", url[len("mailto:") :]
+                else:
+                    kind, value = "urls", url
+            elif result_type == NSTextCheckingTypePhoneNumber:
+                kind, value = "phone_numbers", str(match.phoneNumber())
+            elif result_type == NSTextCheckingTypeDate:
+                kind, value = "dates", (match.date(), match.duration())
+            elif result_type == NSTextCheckingTypeAddress:
+                kind, value = "addresses", dict(match.addressComponents())
+            else:
+                continue
+
+            if kind in results:
+                results[kind].append(XADataMatch(kind, start, end, value))
+        return results
+
+
+class XARegexDetector:
+    """Detects URLs, email addresses, and phone numbers with regular expressions. It has no dependencies, so it works where NSDataDetector is unavailable, at the cost of recognizing fewer formats.
+
+    .. versionadded:: 0.3.1
+    """
+
+    kinds = ("urls", "emails", "phone_numbers")  #: The kinds of data this detector finds
+
+    EMAIL_PATTERN = re.compile(r"(?<![\w.+-])[\w.+-]+@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+    URL_PATTERN = re.compile(
+        r"(?:\b[A-Za-z][A-Za-z0-9+.-]*://|\bwww\.)[^\s<>\"']+"
+        r"|\b(?:[A-Za-z0-9-]+\.)+(?:com|org|net|edu|gov|io|dev|app|co|uk|us|de|fr|jp|ca|au|info|biz|me|tv)\b(?:/[^\s<>\"']*)?"
+    )
+    # The leading lookahead lets the scan skip positions that can't start a number without trying each alternative
+    PHONE_PATTERN = re.compile(r"(?=[+(\d])(?<![\w/.-])(?:(?:\+\d{1,3}[ .-]?)?(?:\(\d{1,4}\)[ .-]?)?\d{2,4}(?:[ .-]\d{2,4}){1,4}|\+?\d{7,15})(?![\w/-])")
+    DATE_LIKE_PATTERN = re.compile(r"\d{4}-\d{1,2}-\d{1,2}|\d{1,2}[.-]\d{1,2}[.-]\d{2,4}")
+
+    def detect(self, text: str, kinds: Union[Iterable[str], None] = None) -> dict[str, list[XADataMatch]]:
+        """Finds every requested kind of data in a text.
+
+        :param text: The text to search
+        :type text: str
+        :param kinds: The kinds of data to find, defaults to URLs, email addresses, and phone numbers
+        :type kinds: Union[Iterable[str], None], optional
+        :raises ValueError: A kind of data is not supported
+        :return: The matches of each kind, in the order they appear in the text
+        :rtype: dict[str, list[XADataMatch]]
+
+        .. versionadded:: 0.3.1
+        """
+        kinds = _check_kinds(kinds, self.kinds)
+        results = {kind: [] for kind in kinds}
+
+        # Email addresses are found first so that their domains aren't also reported as URLs
+        emails = []
+        if "@" in text:
+            emails = [(x.start(), x.end(), x.group()) for x in self.EMAIL_PATTERN.finditer(text)]
+        taken = [(start, end) for start, end, _ in emails]
+        if "emails" in results:
+            results["emails"] = [XADataMatch("emails", start, end, value) for start, end, value in emails]
+
+        if "urls" in results or "phone_numbers" in results:
+            for match in self.URL_PATTERN.finditer(text):
+                start, end, url = self.__trim_url(match)
+                if self.__overlaps(start, end, taken):
+                    continue
+                taken.append((start, end))
+                if "urls" in results:
+                    if "://" not in url:
+                        url = "http://" + url
+                    results["urls"].append(XADataMatch("urls", start, end, url))
+
+        if "phone_numbers" in results:
+            for match in self.PHONE_PATTERN.finditer(text):
+                number = match.group()
+                digits = sum(x.isdigit() for x in number)
+                if not 7 <= digits <= 15 or self.DATE_LIKE_PATTERN.fullmatch(number):
+                    continue
+                if self.__overlaps(match.start(), match.end(), taken):
+                    continue
+                results["phone_numbers"].append(XADataMatch("phone_numbers", match.start(), match.end(), number))
+        return results
+
+    @staticmethod
+    def __trim_url(match: re.Match) -> tuple[int, int, str]:
+        url = match.group()
+        # Trailing punctuation usually belongs to the sentence, and a closing parenthesis only belongs to the URL if it is balanced
+        while len(url) > 0 and (url[-1] in ".,;:!?'\"" or (url[-1] == ")" and url.count("(") < url.count(")"))):
+            url = url[:-1]
+        return match.start(), match.start() + len(url), url
+
+    @staticmethod
+    def __overlaps(start: int, end: int, spans: list[tuple[int, int]]) -> bool:
+        return any(start < other_end and other_start < end for other_start, other_end in spans)
+
+
+_default_detector = None
+_default_detector_lock = threading.Lock()
+
+
+def default_detector() -> Union[XANativeDetector, XARegexDetector]:
+    """Gets the shared detector used by :func:`extract_all` -- an :class:`XANativeDetector` if AppKit is available, or an :class:`XARegexDetector` otherwise.
+
+    :return: The shared detector
+    :rtype: Union[XANativeDetector, XARegexDetector]
+
+    .. versionadded:: 0.3.1
+    """
+    global _default_detector
+    with _default_detector_lock:
+        if _default_detector is None:
+            if importlib.util.find_spec("AppKit") is not None:
+                _default_detector = XANativeDetector()
+            else:
+                _default_detector = XARegexDetector()
+        return _default_detector
+
+
+def extract_all(
+    text: Any,
+    kinds: Union[Iterable[str], None] = None,
+    detector: Union[XANativeDetector, XARegexDetector, None] = None,
+) -> dict[str, list[XADataMatch]]:
+    """Finds every requested kind of data in a text with a single scan.
+
+    :param text: The text to search, as a string or an :class:`PyXA.XAText` object
+    :type text: Any
+    :param kinds: The kinds of data to find, defaults to every kind the detector supports
+    :type kinds: Union[Iterable[str], None], optional
+    :param detector: The detector to use, defaults to :func:`default_detector`
+    :type detector: Union[XANativeDetector, XARegexDetector, None], optional
+    :raises ValueError: A kind of data is not supported by the detector
+    :return: The matches of each kind, in the order they appear in the text
+    :rtype: dict[str, list[XADataMatch]]
+
+    :Example:
+
+    >>> from PyXA.XADataDetection import XARegexDetector, extract_all
+    >>> matches = extract_all("Mail jane@example.com or call +1 555 010 0199", detector=XARegexDetector())
+    >>> print([x.value for x in matches["emails"]], [x.value for x in matches["phone_numbers"]])
+    ['jane@example.com'] ['+1 555 010 0199']
+
+    .. versionadded:: 0.3.1
+    """
+    detector = detector or default_detector()
+    return detector.detect(str(getattr(text, "xa_elem", text)), kinds)
+
+
+def extract_links(
+    text: Any,
+    detector: Union[XANativeDetector, XARegexDetector, None] = None,
+) -> list[str]:
+    """Finds the links in a text: its URLs, and its email addresses as "mailto:" URLs, as NSDataDetector reports them.
+
+    :param text: The text to search, as a string or an :class:`PyXA.XAText` object
+    :type text: Any
+    :param detector: The detector to use, defaults to :func:`default_detector`
+    :type detector: Union[XANativeDetector, XARegexDetector, None], optional
+    :return: The links, in the order they appear in the text
+    :rtype: list[str]
+
+    :Example:
+
+    >>> from PyXA.XADataDetection import XARegexDetector, extract_links
+    >>> print(extract_links("Mail jane@example.com or visit https://example.com", detector=XARegexDetector()))
+    ['mailto:jane@example.com', 'https://example.com']
+
+    .. versionadded:: 0.3.1
+    """
+    matches = extract_all(text, ["urls", "emails"], detector)
+    links = sorted(matches["urls"] + matches["emails"], key=lambda x: x.start)
+    return [x.value if x.kind == "urls" else "mailto:" + x.value for x in links]
+
+
+def extract_many(
+    texts: Union[Iterable[Any], Any],
+    kinds: Union[Iterable[str], None] = None,
+    detector: Union[XANativeDetector, XARegexDetector, None] = None,
+) -> Iterator[dict[str, list[XADataMatch]]]:
+    """Finds every requested kind of data in each text of a batch, reusing one detector for the whole batch. See :func:`extract_all`.
+
+    :param texts: The texts to search, as an :class:`PyXA.XATextList` or an iterable of strings or :class:`PyXA.XAText` objects
+    :type texts: Union[Iterable[Any], Any]
+    :param kinds: The kinds of data to find, defaults to every kind the detector supports
+    :type kinds: Union[Iterable[str], None], optional
+    :param detector: The detector to use, defaults to :func:`default_detector`
+    :type detector: Union[XANativeDetector, XARegexDetector, None], optional
+    :raises ValueError: A kind of data is not supported by the detector
+    :yield: The matches of each kind, for each text in order
+    :rtype: Iterator[dict[str, list[XADataMatch]]]
+
+    .. versionadded:: 0.3.1
+    """
+    detector = detector or default_detector()
+    kinds = list(kinds) if kinds is not None else None
+    for text in iter_strings(texts):
+        yield detector.detect(text, kinds)
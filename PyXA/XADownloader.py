@@ -0,0 +1,315 @@
+""".. versionadded:: 0.3.1
+
+A bounded downloader that stores files in a content-addressed cache on the disk, used to load the images referenced by webpages and feeds without decoding them until they are needed.
+"""
+
+import hashlib
+import json
+import mimetypes
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from typing import Union
+from urllib.parse import urldefrag, urljoin, urlparse
+from urllib.request import url2pathname
+
+from PyXA.XAErrors import DownloadError
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAHTTPCache import shared_session
+from PyXA.XALazy import lazy_import
+
+requests = lazy_import("requests")
+
+DEFAULT_DOWNLOAD_DIRECTORY = "~/Library/Caches/PyXA/downloads"
+"""The default location of downloaded files.
+"""
+
+INDEX_VERSION = 1
+
+
+def resolve_sources(sources: list[Union[str, None]], base_url: Union[str, None] = None) -> list[str]:
+    """Resolves a list of possibly relative URLs, such as the `src` attributes of <img> elements, into absolute URLs. Empty sources and data URIs are skipped, fragments are removed, and each URL appears once.
+
+    :param sources: The URLs to resolve
+    :type sources: list[Union[str, None]]
+    :param base_url: The URL that relative URLs are relative to, defaults to None
+    :type base_url: Union[str, None], optional
+    :return: The distinct absolute URLs, in their original order
+    :rtype: list[str]
+
+    .. versionadded:: 0.3.1
+    """
+    urls = []
+    for source in sources:
+        source = (source or "").strip()
+        if source == "" or source.startswith("data:"):
+            continue
+        if base_url is not None:
+            source = urljoin(base_url, source)
+        urls.append(urldefrag(source)[0])
+    return list(dict.fromkeys(urls))
+
+
+class XADownloader:
+    """Downloads files concurrently into a content-addressed cache on the disk.
+
+    Each file is saved under the SHA-256 hash of its content, so identical files from different URLs are stored once. Identical URLs are downloaded once, even when they are requested from several threads at the same time. Downloads that exceed the size limit or take longer than the timeout are abandoned.
+
+    .. versionadded:: 0.3.1
+    """
+
+    _shared: Union["XADownloader", None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_DOWNLOAD_DIRECTORY,
+        max_bytes: int = 20 * 1024 * 1024,
+        timeout: float = 15,
+        max_workers: int = 8,
+        session: Union["requests.Session", None] = None,
+    ):
+        """Creates a new downloader.
+
+        :param directory: The directory to store downloaded files in, defaults to :attr:`DEFAULT_DOWNLOAD_DIRECTORY`
+        :type directory: str, optional
+        :param max_bytes: The maximum size of each file in bytes, defaults to 20 MiB
+        :type max_bytes: int, optional
+        :param timeout: The maximum number of seconds to spend downloading each file, defaults to 15
+        :type timeout: float, optional
+        :param max_workers: The maximum number of files to download at once, defaults to 8
+        :type max_workers: int, optional
+        :param session: The session to send requests with, defaults to :func:`PyXA.XAHTTPCache.shared_session`
+        :type session: Union[requests.Session, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.directory = os.path.expanduser(directory)  #: The directory containing downloaded files
+        self.max_bytes = max_bytes  #: The maximum size of each file in bytes
+        self.timeout = timeout  #: The maximum number of seconds to spend downloading each file
+        self.session = session  #: The session used to send requests, or None to use the shared session
+
+        self.__executor = XABoundedExecutor(max_workers)
+        self.__lock = threading.Lock()
+        self.__index: Union[dict[str, str], None] = None
+        self.__in_flight: dict[str, Future] = {}
+        self.__dirty = False
+
+    @classmethod
+    def shared(cls) -> "XADownloader":
+        """Retrieves the downloader shared by PyXA's web features.
+
+        :return: The shared downloader
+        :rtype: XADownloader
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def download(self, url: str, content_type: Union[str, None] = None) -> str:
+        """Downloads a file, or finds it in the cache.
+
+        :param url: The URL of the file. File URLs are returned as paths without being copied.
+        :type url: str
+        :param content_type: The prefix that the file's Content-Type header must start with, such as "image/", or None to accept any type, defaults to None
+        :type content_type: Union[str, None], optional
+        :raises DownloadError: The file could not be downloaded, is too large, took too long, or has the wrong type
+        :return: The path of the downloaded file
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """
+        return self.download_many([url], content_type, return_exceptions=False)[0]
+
+    def download_many(
+        self,
+        urls: list[str],
+        content_type: Union[str, None] = None,
+        return_exceptions: bool = True,
+    ) -> list[Union[str, Exception]]:
+        """Downloads several files concurrently. Each distinct URL is downloaded once.
+
+        :param urls: The URLs of the files
+        :type urls: list[str]
+        :param content_type: The prefix that each file's Content-Type header must start with, such as "image/", or None to accept any type, defaults to None
+        :type content_type: Union[str, None], optional
+        :param return_exceptions: Whether to place errors in the results instead of raising the first of them, defaults to True
+        :type return_exceptions: bool, optional
+        :return: The path of each downloaded file, or the error raised while downloading it, in the order of the URLs
+        :rtype: list[Union[str, Exception]]
+
+        :Example:
+
+        >>> from PyXA.XADownloader import XADownloader
+        >>> paths = XADownloader.shared().download_many([
+        >>>     "https://www.apple.com/favicon.ico",
+        >>>     "https://www.apple.com/ac/structured-data/images/knowledge_graph_logo.png",
+        >>> ], content_type="image/")
+        >>> print(paths)
+        ['/Users/exampleUser/Library/Caches/PyXA/downloads/6c1e...5a.ico', '/Users/exampleUser/Library/Caches/PyXA/downloads/a0f2...9d.png']
+
+        .. versionadded:: 0.3.1
+        """
+        futures = {}
+        for url in dict.fromkeys(urls):
+            futures[url] = self.__submit(url, content_type)
+
+        results = []
+        for url in urls:
+            error = futures[url].exception()
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+            else:
+                results.append(futures[url].result())
+
+        with self.__lock:
+            self.__save()
+        return results
+
+    def cached_path(self, url: str) -> Union[str, None]:
+        """Gets the path of a previously downloaded file.
+
+        :param url: The URL of the file
+        :type url: str
+        :return: The path of the file, or None if it has not been downloaded
+        :rtype: Union[str, None]
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            name = self.__load().get(url)
+        if name is None:
+            return None
+
+        path = os.path.join(self.directory, name)
+        return path if os.path.exists(path) else None
+
+    def __submit(self, url: str, content_type: Union[str, None]) -> Future:
+        with self.__lock:
+            future = self.__in_flight.get(url)
+            if future is not None:
+                return future
+
+            future = Future()
+            path = self.__cached_or_local(url)
+            if path is not None:
+                future.set_result(path)
+                return future
+            self.__in_flight[url] = future
+
+        def run():
+            try:
+                future.set_result(self.__download(url, content_type))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self.__lock:
+                    self.__in_flight.pop(url, None)
+
+        self.__executor.submit(run)
+        return future
+
+    def __cached_or_local(self, url: str) -> Union[str, None]:
+        parsed = urlparse(url)
+        if parsed.scheme == "file":
+            return url2pathname(parsed.path)
+
+        name = self.__load().get(url)
+        if name is not None and os.path.exists(os.path.join(self.directory, name)):
+            return os.path.join(self.directory, name)
+        return None
+
+    def __download(self, url: str, content_type: Union[str, None]) -> str:
+        if urlparse(url).scheme not in ("http", "https"):
+            raise DownloadError(url, "Only HTTP and HTTPS URLs can be downloaded.")
+
+        deadline = time.monotonic() + self.timeout
+        client = self.session or shared_session()
+        try:
+            response = client.get(url, stream=True, timeout=self.timeout)
+        except requests.RequestException as e:
+            raise DownloadError(url, str(e)) from e
+
+        with response:
+            if response.status_code != 200:
+                raise DownloadError(url, f"The server responded with status {response.status_code}.")
+
+            mime_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if content_type is not None and not mime_type.startswith(content_type):
+                raise DownloadError(url, f"Expected {content_type} content, got '{mime_type}'.")
+
+            length = response.headers.get("Content-Length")
+            if length is not None and length.isdigit() and int(length) > self.max_bytes:
+                raise DownloadError(url, f"The file is larger than {self.max_bytes} bytes.")
+
+            os.makedirs(self.directory, exist_ok=True)
+            digest = hashlib.sha256()
+            size = 0
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in response.iter_content(65536):
+                        size += len(chunk)
+                        if size > self.max_bytes:
+                            raise DownloadError(url, f"The file is larger than {self.max_bytes} bytes.")
+                        if time.monotonic() > deadline:
+                            raise DownloadError(url, f"The download took longer than {self.timeout} seconds.")
+                        digest.update(chunk)
+                        f.write(chunk)
+            except requests.RequestException as e:
+                os.remove(temp_path)
+                raise DownloadError(url, str(e)) from e
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+        extension = mimetypes.guess_extension(mime_type) or os.path.splitext(urlparse(url).path)[1]
+        name = digest.hexdigest() + extension
+        path = os.path.join(self.directory, name)
+        if os.path.exists(path):
+            # The same content was downloaded from another URL
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, path)
+
+        with self.__lock:
+            self.__load()[url] = name
+            self.__dirty = True
+        return path
+
+    def __load(self) -> dict[str, str]:
+        if self.__index is None:
+            self.__index = {}
+            try:
+                with open(os.path.join(self.directory, "index.json"), "r") as f:
+                    data = json.load(f)
+                if data.get("version") == INDEX_VERSION:
+                    self.__index = data["files"]
+            except (OSError, ValueError, KeyError):
+                pass
+        return self.__index
+
+    def __save(self):
+        if not self.__dirty:
+            return
+
+        self.__dirty = False
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = os.path.join(self.directory, "index.json")
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump({"version": INDEX_VERSION, "files": self.__index}, f)
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.directory) + ">"
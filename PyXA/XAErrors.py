@@ -1,3 +1,6 @@
+from typing import Union
+
+
 class ApplicationNotFoundError(Exception):
     def __init__(self, name: str):
         self.name = name
@@ -64,3 +67,35 @@ class AppleScriptError(Exception):
 
     def __str__(self):
         return f"Error {self.number}: {self.message} On line #{self.line_number}: '{self.near}'."
+
+
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded or exceeds the downloader's limits.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, url: str, message: str):
+        self.url = url
+        self.message = message
+        Exception.__init__(self, url, message)
+
+    def __str__(self):
+        return f"Could not download {self.url}. {self.message}"
+
+
+class ScriptWorkerError(Exception):
+    """Raised when a script run by an :class:`PyXA.XAScripting.AppleScriptPool` worker fails, or when the worker itself fails.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, message: str, number: Union[int, None] = None):
+        self.message = message
+        self.number = number  #: The AppleScript error number, or None if the worker failed
+        Exception.__init__(self, message, number)
+
+    def __str__(self):
+        if self.number is None:
+            return f"Script worker failed. {self.message}"
+        return f"Error {self.number}: {self.message}"
@@ -1,6 +1,13 @@
-import ApplicationServices
+import pathlib
+import sys
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Callable, Iterator, Union
 
-import objc
+from PyXA.XALazy import lazy_import
+
+ApplicationServices = lazy_import("ApplicationServices")
+objc = lazy_import("objc")
 
 
 def OSType(s):
@@ -1017,7 +1024,7 @@ formName = OSType("name")
 keyAEIndex = 0x6B696478
 
 
-def event_from_int(i: int) -> ApplicationServices.NSAppleEventDescriptor:
+def event_from_int(i: int) -> "ApplicationServices.NSAppleEventDescriptor":
     """Creates an Apple Event descriptor of event type typeSInt32 that stores the provided integer.
 
     .. versionadded:: 0.0.4
@@ -1025,7 +1032,7 @@ def event_from_int(i: int) -> ApplicationServices.NSAppleEventDescriptor:
     return ApplicationServices.NSAppleEventDescriptor.descriptorWithInt32_(i)
 
 
-def event_from_str(s: str) -> ApplicationServices.NSAppleEventDescriptor:
+def event_from_str(s: str) -> "ApplicationServices.NSAppleEventDescriptor":
     """Creates an Apple Event descriptor of event type typeUnicodeText that stores the provided string.
 
     .. versionadded:: 0.0.4
@@ -1037,9 +1044,282 @@ def event_from_type_code(code: int):
     return ApplicationServices.NSAppleEventDescriptor.descriptorWithTypeCode_(code)
 
 
-def event_from_bool(b: bool) -> ApplicationServices.NSAppleEventDescriptor:
+def event_from_bool(b: bool) -> "ApplicationServices.NSAppleEventDescriptor":
     """Creates an Apple Event descriptor of event type typeBoolean that stores the provided boolean value.
 
     .. versionadded:: 0.0.4
     """
     return ApplicationServices.NSAppleEventDescriptor.descriptorWithBoolean_(b)
+
+
+typeSInt16 = OSType("shor")
+typeSInt32 = OSType("long")
+typeSInt64 = OSType("comp")
+typeUInt32 = OSType("magn")
+typeIEEE32BitFloatingPoint = OSType("sing")
+typeIEEE64BitFloatingPoint = OSType("doub")
+typeBoolean = OSType("bool")
+typeChar = OSType("TEXT")
+typeUTF8Text = OSType("utf8")
+typeNull = OSType("null")
+typeType = OSType("type")
+typeEnumerated = OSType("enum")
+typeAlias = OSType("alis")
+typeWildcardData = OSType("rdat")
+keyASUserRecordFields = OSType("usrf")
+keyAEContainer = OSType("from")
+keyAEKeyData = OSType("seld")
+cMissingValue = OSType("msng")
+
+
+def code_to_str(code: int) -> str:
+    """Converts a four-character code, such as an Apple Event type code, into its string form.
+
+    .. versionadded:: 0.3.1
+    """
+    return code.to_bytes(4, "big").decode("mac_roman")
+
+
+class XAObjectSpecifier:
+    """A reference to an object in a scriptable application, decoded from an object specifier descriptor.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ("desired_class", "form", "key", "container", "descriptor")
+
+    def __init__(
+        self,
+        desired_class: str,
+        form: str,
+        key: Any,
+        container: Union["XAObjectSpecifier", None],
+        descriptor: Any,
+    ):
+        self.desired_class = desired_class  #: The four-character code of the class of the object, e.g. "docu"
+        self.form = form  #: The four-character code of how the key identifies the object, e.g. "indx" or "name"
+        self.key = key  #: The index, name, ID, or other key of the object
+        self.container = container  #: The object containing this object, or None if the application contains it
+        self.descriptor = descriptor  #: The original object specifier descriptor
+
+    def __eq__(self, other):
+        return isinstance(other, XAObjectSpecifier) and all(
+            getattr(self, x) == getattr(other, x) for x in self.__slots__[:4]
+        )
+
+    def __repr__(self):
+        container = f" of {self.container!r}" if self.container is not None else ""
+        return f"<{type(self)}{self.desired_class} {self.form} {self.key!r}{container}>"
+
+
+def _decode_list(descriptor) -> list:
+    return [
+        decode_descriptor(descriptor.descriptorAtIndex_(index))
+        for index in range(1, descriptor.numberOfItems() + 1)
+    ]
+
+
+def _decode_record(descriptor) -> dict:
+    record = {}
+    for index in range(1, descriptor.numberOfItems() + 1):
+        keyword = descriptor.keywordForDescriptorAtIndex_(index)
+        value = descriptor.descriptorAtIndex_(index)
+        if keyword == keyASUserRecordFields:
+            # User-defined fields are stored as a flat list of alternating labels and values
+            fields = _decode_list(value)
+            record.update(zip(fields[::2], fields[1::2]))
+        else:
+            record[code_to_str(keyword)] = decode_descriptor(value)
+    return record
+
+
+def _decode_string(descriptor) -> str:
+    return descriptor.stringValue()
+
+
+def _decode_int32(descriptor) -> int:
+    return descriptor.int32Value()
+
+
+def _decode_int_data(descriptor) -> int:
+    # 64-bit and unsigned integers are stored in native byte order
+    return int.from_bytes(
+        bytes(descriptor.data()), sys.byteorder, signed=descriptor.descriptorType() == typeSInt64
+    )
+
+
+def _decode_float(descriptor) -> float:
+    return descriptor.doubleValue()
+
+
+def _decode_bool(descriptor) -> bool:
+    return descriptor.booleanValue()
+
+
+def _decode_date(descriptor) -> Union[datetime, None]:
+    date = descriptor.dateValue()
+    if date is None:
+        return None
+    return datetime.fromtimestamp(date.timeIntervalSince1970())
+
+
+def _decode_file(descriptor) -> Union[pathlib.Path, None]:
+    url = descriptor.fileURLValue()
+    if url is None:
+        return None
+    return pathlib.Path(str(url.path()))
+
+
+def _decode_type(descriptor) -> Union[str, None]:
+    code = descriptor.typeCodeValue()
+    if code == cMissingValue:
+        return None
+    return code_to_str(code)
+
+
+def _decode_enum(descriptor) -> str:
+    return code_to_str(descriptor.enumCodeValue())
+
+
+def _decode_null(descriptor) -> None:
+    return None
+
+
+def _decode_data(descriptor) -> bytes:
+    return bytes(descriptor.data())
+
+
+def _decode_object_specifier(descriptor) -> XAObjectSpecifier:
+    desired_class = descriptor.descriptorForKeyword_(keyAEDesiredClass)
+    form = descriptor.descriptorForKeyword_(keyAEKeyForm)
+    key = descriptor.descriptorForKeyword_(keyAEKeyData)
+    container = descriptor.descriptorForKeyword_(keyAEContainer)
+    return XAObjectSpecifier(
+        code_to_str(desired_class.typeCodeValue()) if desired_class is not None else None,
+        code_to_str(form.enumCodeValue()) if form is not None else None,
+        decode_descriptor(key) if key is not None else None,
+        decode_descriptor(container) if container is not None else None,
+        descriptor,
+    )
+
+
+DESCRIPTOR_DECODERS: dict[int, Callable[[Any], Any]] = {
+    typeAEList: _decode_list,
+    typeAERecord: _decode_record,
+    typeUnicodeText: _decode_string,
+    typeUTF8Text: _decode_string,
+    typeChar: _decode_string,
+    typeIntlText: _decode_string,
+    typeStyledText: _decode_string,
+    typeSInt16: _decode_int32,
+    typeSInt32: _decode_int32,
+    typeSInt64: _decode_int_data,
+    typeUInt32: _decode_int_data,
+    typeIEEE32BitFloatingPoint: _decode_float,
+    typeIEEE64BitFloatingPoint: _decode_float,
+    typeBoolean: _decode_bool,
+    typeTrue: _decode_bool,
+    typeFalse: _decode_bool,
+    typeLongDateTime: _decode_date,
+    typeAlias: _decode_file,
+    typeFileURL: _decode_file,
+    typeFSRef: _decode_file,
+    typeBookmarkData: _decode_file,
+    typeType: _decode_type,
+    typeEnumerated: _decode_enum,
+    typeNull: _decode_null,
+    typeData: _decode_data,
+    typeWildcardData: _decode_data,
+    typeObjectSpecifier: _decode_object_specifier,
+}
+"""The function that decodes descriptors of each type, by type code. Add entries to support further types.
+
+.. versionadded:: 0.3.1
+"""
+
+
+def decode_descriptor(descriptor) -> Any:
+    """Converts an Apple Event descriptor into a Python value in one pass, recursing into lists, records, and object specifiers.
+
+    Only the accessors that apply to the descriptor's type are called. Lists become lists, records become dicts, text becomes str, numbers become int or float, dates become datetime objects in local time without a timezone, aliases and file URLs become :class:`pathlib.Path`, type and enumeration codes become four-character strings, missing values become None, and object specifiers become :class:`XAObjectSpecifier` objects. Record fields named by AppleScript keywords, such as ``name``, are keyed by their four-character codes, while user-defined fields keep their names. Descriptors of other types are decoded as their string value if they have one, or as their raw bytes otherwise.
+
+    :param descriptor: The descriptor to decode
+    :type descriptor: NSAppleEventDescriptor
+    :return: The decoded value
+    :rtype: Any
+
+    :Example:
+
+    >>> import PyXA
+    >>> from PyXA.XAEvents import decode_descriptor
+    >>> result = PyXA.AppleScript("return {1, \"two\", {name:\"three\", |rank|:4}}").run()
+    >>> print(decode_descriptor(result["event"]))
+    [1, 'two', {'pnam': 'three', 'rank': 4}]
+
+    .. versionadded:: 0.3.1
+    """
+    if descriptor is None:
+        return None
+
+    decoder = DESCRIPTOR_DECODERS.get(descriptor.descriptorType())
+    if decoder is not None:
+        return decoder(descriptor)
+
+    string = descriptor.stringValue()
+    if string is not None:
+        return string
+    return _decode_data(descriptor)
+
+
+class XAScriptResult(Mapping):
+    """The result of running a script, as returned by :func:`PyXA.XABase.AppleScript.run`.
+
+    The result behaves like a read-only dictionary. Each entry is computed from the result descriptor the first time it is accessed, so reading one entry does not pay for converting the descriptor into every other type.
+
+    The `value` entry contains the result decoded into native Python values by :func:`decode_descriptor`.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ("__descriptor", "__values")
+
+    def __init__(self, descriptor):
+        self.__descriptor = descriptor
+        self.__values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        values = self.__values
+        if key not in values:
+            field = _RESULT_FIELDS.get(key)
+            if field is None:
+                raise KeyError(key)
+            values[key] = field(self.__descriptor)
+        return values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_RESULT_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_RESULT_FIELDS)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _result_string(descriptor) -> Union[str, None]:
+    string = descriptor.stringValue()
+    return string.replace("\r", "\n") if string is not None else None
+
+
+_RESULT_FIELDS: dict[str, Callable[[Any], Any]] = {
+    "string": _result_string,
+    "int": lambda descriptor: descriptor.int32Value(),
+    "bool": lambda descriptor: descriptor.booleanValue(),
+    "float": lambda descriptor: descriptor.doubleValue(),
+    "date": lambda descriptor: descriptor.dateValue(),
+    "file_url": lambda descriptor: descriptor.fileURLValue(),
+    "type_code": lambda descriptor: descriptor.typeCodeValue(),
+    "data": lambda descriptor: descriptor.data(),
+    "event": lambda descriptor: descriptor,
+    "value": decode_descriptor,
+}
@@ -0,0 +1,202 @@
+""".. versionadded:: 0.3.1
+
+A bounded thread pool for running batches of independent tasks, such as applying a filter to each image in an :class:`PyXA.XABase.XAImageList`.
+"""
+
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Union
+
+
+class XABoundedExecutor:
+    """A thread pool that limits both the number of worker threads and the number of tasks waiting to run.
+
+    Submitting a task blocks while `max_pending` tasks are already queued or running, so producers cannot get far ahead of the workers. Results are delivered through :class:`concurrent.futures.Future` objects.
+
+    .. versionadded:: 0.3.1
+    """
+
+    _shared: Union["XABoundedExecutor", None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self, max_workers: Union[int, None] = None, max_pending: Union[int, None] = None
+    ):
+        """Creates a new executor. Worker threads are started on demand.
+
+        :param max_workers: The maximum number of worker threads, defaults to the number of CPUs plus 4, up to 32
+        :type max_workers: Union[int, None], optional
+        :param max_pending: The maximum number of tasks queued or running at once, defaults to twice the number of workers
+        :type max_pending: Union[int, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.__lock = threading.Lock()
+        self.__pool: Union[ThreadPoolExecutor, None] = None
+        self.__workers = threading.local()
+        self.__configure(max_workers, max_pending)
+
+    @classmethod
+    def shared(cls) -> "XABoundedExecutor":
+        """Retrieves the executor shared by PyXA's batch operations.
+
+        :return: The shared executor
+        :rtype: XABoundedExecutor
+
+        :Example:
+
+        >>> from PyXA.XAExecutor import XABoundedExecutor
+        >>> XABoundedExecutor.shared().resize(4)
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @property
+    def max_workers(self) -> int:
+        """The maximum number of worker threads."""
+        return self.__max_workers
+
+    @property
+    def max_pending(self) -> int:
+        """The maximum number of tasks queued or running at once."""
+        return self.__max_pending
+
+    def resize(
+        self, max_workers: Union[int, None] = None, max_pending: Union[int, None] = None
+    ):
+        """Changes the concurrency limits of the executor. Tasks already submitted finish on the old worker threads.
+
+        :param max_workers: The maximum number of worker threads, defaults to the number of CPUs plus 4, up to 32
+        :type max_workers: Union[int, None], optional
+        :param max_pending: The maximum number of tasks queued or running at once, defaults to twice the number of workers
+        :type max_pending: Union[int, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.__configure(max_workers, max_pending)
+        self.shutdown(wait=False)
+
+    def submit(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        """Schedules a function to run on a worker thread, blocking while the executor already has :attr:`max_pending` tasks.
+
+        When called from one of the executor's own tasks, the function is run immediately on the calling thread instead, so that tasks can use other batch operations without waiting on slots that only they can free.
+
+        :param function: The function to run
+        :type function: Callable[..., Any]
+        :return: A future representing the result of the call
+        :rtype: Future
+
+        .. versionadded:: 0.3.1
+        """
+        if getattr(self.__workers, "active", False):
+            return self.__run_inline(function, *args, **kwargs)
+
+        slots = self.__slots
+        slots.acquire()
+        try:
+            future = self.__get_pool().submit(self.__run_task, function, *args, **kwargs)
+        except BaseException:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def map(
+        self,
+        function: Callable[[Any], Any],
+        items: Iterable[Any],
+        return_exceptions: bool = False,
+    ) -> list[Any]:
+        """Calls a function on each item using the worker threads, then returns the results in the order of the items.
+
+        :param function: The function to call on each item
+        :type function: Callable[[Any], Any]
+        :param items: The items to process
+        :type items: Iterable[Any]
+        :param return_exceptions: Whether to place exceptions raised by the function in the results instead of raising the first of them, defaults to False
+        :type return_exceptions: bool, optional
+        :return: The result of each call, in item order
+        :rtype: list[Any]
+
+        :Example:
+
+        >>> from PyXA.XAExecutor import XABoundedExecutor
+        >>> executor = XABoundedExecutor(max_workers=2)
+        >>> print(executor.map(lambda x: 1 / x, [1, 2, 0], return_exceptions=True))
+        [1.0, 0.5, ZeroDivisionError('division by zero')]
+
+        .. versionadded:: 0.3.1
+        """
+        futures = [self.submit(function, item) for item in items]
+        wait(futures)
+
+        results = []
+        for future in futures:
+            error = future.exception()
+            if error is not None:
+                if not return_exceptions:
+                    raise error
+                results.append(error)
+            else:
+                results.append(future.result())
+        return results
+
+    def shutdown(self, wait: bool = True):
+        """Stops the worker threads once their tasks finish. The executor starts new worker threads if it is used again.
+
+        :param wait: Whether to block until all submitted tasks finish, defaults to True
+        :type wait: bool, optional
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            pool = self.__pool
+            self.__pool = None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def __configure(self, max_workers: Union[int, None], max_pending: Union[int, None]):
+        if max_workers is None:
+            max_workers = min(32, (os.cpu_count() or 1) + 4)
+        if max_pending is None:
+            max_pending = max_workers * 2
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be at least 1")
+
+        self.__max_workers = max_workers
+        self.__max_pending = max_pending
+        self.__slots = threading.BoundedSemaphore(max_pending)
+
+    def __run_task(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        # Marks the worker thread as busy with one of this executor's tasks while the function runs
+        workers = self.__workers
+        workers.active = True
+        try:
+            return function(*args, **kwargs)
+        finally:
+            workers.active = False
+
+    def __run_inline(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Future:
+        future = Future()
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(function(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+    def __get_pool(self) -> ThreadPoolExecutor:
+        with self.__lock:
+            if self.__pool is None:
+                self.__pool = ThreadPoolExecutor(
+                    max_workers=self.__max_workers, thread_name_prefix="PyXA"
+                )
+            return self.__pool
+
+    def __repr__(self):
+        return f"<{type(self)}(max_workers={self.__max_workers}, max_pending={self.__max_pending})>"
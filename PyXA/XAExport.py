@@ -0,0 +1,274 @@
+""".. versionadded:: 0.3.1
+
+Conversion of bulk-fetched property values into typed, contiguous columns, and streaming writers for exporting those columns to CSV and Parquet files.
+
+NumPy is required for column conversion; PyArrow is additionally required for writing Parquet files. Both are optional dependencies of PyXA and are imported on first use.
+"""
+
+import csv
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Iterable, Iterator, Union
+
+from PyXA.XALazy import lazy_import
+
+np = lazy_import("numpy")
+
+
+def _require(module_name: str, feature: str):
+    try:
+        __import__(module_name)
+    except ImportError as e:
+        raise ImportError(
+            f"{feature} requires the '{module_name}' package. Install it using: pip install {module_name}"
+        ) from e
+
+
+class XAStringColumn:
+    """A column of strings stored as one contiguous UTF-8 buffer with an array of offsets, in the style of Apache Arrow string arrays.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, values: Iterable[Union[str, None]]):
+        _require("numpy", "Column export")
+        encoded = [None if x is None else str(x).encode("utf-8") for x in values]
+
+        self.valid = np.array([x is not None for x in encoded], dtype=bool)  #: Whether each entry is non-null
+        lengths = np.fromiter((len(x) if x is not None else 0 for x in encoded), dtype=np.int64, count=len(encoded))
+        self.offsets = np.zeros(len(encoded) + 1, dtype=np.int64)  #: The start offset of each entry in :attr:`data`, followed by the total length
+        np.cumsum(lengths, out=self.offsets[1:])
+        self.data = b"".join(x for x in encoded if x is not None)  #: The UTF-8 encoded entries, concatenated
+
+    @property
+    def nbytes(self) -> int:
+        """The number of bytes used by the column's buffers."""
+        return len(self.data) + self.offsets.nbytes + self.valid.nbytes
+
+    def tolist(self) -> list[Union[str, None]]:
+        """Decodes the column into a list of strings.
+
+        :return: The entries of the column, with None for null entries
+        :rtype: list[Union[str, None]]
+
+        .. versionadded:: 0.3.1
+        """
+        return [self[index] for index in range(len(self))]
+
+    def __getitem__(self, index: int) -> Union[str, None]:
+        if index < 0:
+            index += len(self)
+        if not self.valid[index]:
+            return None
+        return self.data[self.offsets[index] : self.offsets[index + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[Union[str, None]]:
+        return (self[index] for index in range(len(self)))
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.tolist()[:10]) + ">"
+
+
+def _enum_code(value: Any) -> Any:
+    """Converts a raw enumeration value, e.g. an NSAppleEventDescriptor, to the value used by PyXA's enum classes."""
+    if isinstance(value, Enum) or isinstance(value, int) or value is None:
+        return value
+
+    if hasattr(value, "stringValue"):
+        value = value.stringValue()
+
+    if isinstance(value, str) and len(value) == 4:
+        # Four-character code, as produced by XABase.OSType
+        return int.from_bytes(value.encode("UTF-8"), "big")
+    return value
+
+
+def decode_enum(values: Iterable[Any], enum_type: type[Enum]) -> "np.ndarray":
+    """Decodes a column of raw enumeration values into members of the given enum class.
+
+    Each distinct raw value is decoded only once, then the decoded members are spread across the column by index.
+
+    :param values: The raw values
+    :type values: Iterable[Any]
+    :param enum_type: The enum class to decode the values into, e.g. :class:`PyXA.apps.Music.XAMusicApplication.RatingKind`
+    :type enum_type: type[Enum]
+    :return: An object array of enum members, with None for values that are not members of the enum
+    :rtype: np.ndarray
+
+    .. versionadded:: 0.3.1
+    """
+    _require("numpy", "Column export")
+    codes = {}
+    indices = np.empty(len(values), dtype=np.int64)
+    for index, value in enumerate(values):
+        code = _enum_code(value)
+        try:
+            indices[index] = codes.setdefault(code, len(codes))
+        except TypeError:
+            # Unhashable value
+            indices[index] = codes.setdefault(str(code), len(codes))
+
+    members = np.empty(len(codes), dtype=object)
+    for code, position in codes.items():
+        if isinstance(code, enum_type):
+            members[position] = code
+            continue
+        try:
+            members[position] = enum_type(code)
+        except ValueError:
+            members[position] = None
+    return members[indices]
+
+
+def _timestamp(value: Any) -> Any:
+    if value is None:
+        return "NaT"
+    if hasattr(value, "timeIntervalSince1970"):
+        # NSDate
+        return np.datetime64(int(value.timeIntervalSince1970() * 1e6), "us")
+    return np.datetime64(value, "us")
+
+
+def to_column(values: Iterable[Any], enum_type: Union[type[Enum], None] = None) -> Union["np.ndarray", XAStringColumn]:
+    """Converts a list of property values into a typed column.
+
+    Booleans, integers, and floats become NumPy arrays of the corresponding type. Integer columns with missing values become float arrays with NaN in place of missing values. Dates become `datetime64[us]` arrays with NaT in place of missing values. Strings become :class:`XAStringColumn` objects. Any other values are kept in an object array.
+
+    :param values: The values to convert
+    :type values: Iterable[Any]
+    :param enum_type: An enum class to decode the values into, defaults to None
+    :type enum_type: Union[type[Enum], None], optional
+    :return: The typed column
+    :rtype: Union[np.ndarray, XAStringColumn]
+
+    .. versionadded:: 0.3.1
+    """
+    _require("numpy", "Column export")
+    values = list(values)
+    if enum_type is not None:
+        return decode_enum(values, enum_type)
+
+    present = [x for x in values if x is not None]
+    has_missing = len(present) != len(values)
+    if len(present) == 0:
+        return np.array(values, dtype=object)
+
+    sample = present[0]
+    try:
+        if isinstance(sample, bool) and not has_missing and all(isinstance(x, bool) for x in present):
+            return np.array(values, dtype=bool)
+
+        if isinstance(sample, (int, float)) and not isinstance(sample, bool):
+            if all(isinstance(x, int) for x in present) and not has_missing:
+                return np.array(values, dtype=np.int64)
+            return np.array([np.nan if x is None else x for x in values], dtype=np.float64)
+
+        if isinstance(sample, (datetime, date)) or hasattr(sample, "timeIntervalSince1970"):
+            return np.array([_timestamp(x) for x in values], dtype="datetime64[us]")
+
+        if isinstance(sample, str):
+            return XAStringColumn(values)
+    except (TypeError, ValueError, OverflowError):
+        # Mixed types -- fall back to an object array
+        pass
+
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.name
+    if isinstance(value, np.datetime64):
+        return "" if np.isnat(value) else str(value)
+    if isinstance(value, float) and value != value:
+        return ""
+    return value
+
+
+def write_csv(
+    path: str, columns: Iterable[dict[str, Any]], header: Union[list[str], None] = None
+) -> int:
+    """Writes chunks of columns to a CSV file, one chunk at a time.
+
+    :param path: The path of the CSV file to write
+    :type path: str
+    :param columns: An iterable of dictionaries mapping column names to columns, such as that returned by :func:`PyXA.XABase.XAList.iter_columns`
+    :type columns: Iterable[dict[str, Any]]
+    :param header: The names and order of columns to write, defaults to the keys of the first chunk
+    :type header: Union[list[str], None], optional
+    :return: The number of rows written
+    :rtype: int
+
+    .. versionadded:: 0.3.1
+    """
+    num_rows = 0
+    header_written = False
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        for chunk in columns:
+            if header is None:
+                header = list(chunk.keys())
+            if not header_written:
+                writer.writerow(header)
+                header_written = True
+
+            for row in zip(*[chunk[name] for name in header]):
+                writer.writerow([_csv_value(x) for x in row])
+                num_rows += 1
+
+        if not header_written and header is not None:
+            writer.writerow(header)
+    return num_rows
+
+
+def _arrow_array(column: Any):
+    pa = lazy_import("pyarrow")
+    if isinstance(column, XAStringColumn):
+        return pa.array(column.tolist(), type=pa.string())
+    if column.dtype == object:
+        return pa.array([x.name if isinstance(x, Enum) else x for x in column])
+    return pa.array(column)
+
+
+def write_parquet(
+    path: str, columns: Iterable[dict[str, Any]], header: Union[list[str], None] = None
+) -> int:
+    """Writes chunks of columns to a Parquet file, writing each chunk as a row group.
+
+    :param path: The path of the Parquet file to write
+    :type path: str
+    :param columns: An iterable of dictionaries mapping column names to columns, such as that returned by :func:`PyXA.XABase.XAList.iter_columns`
+    :type columns: Iterable[dict[str, Any]]
+    :param header: The names and order of columns to write, defaults to the keys of the first chunk
+    :type header: Union[list[str], None], optional
+    :return: The number of rows written
+    :rtype: int
+
+    .. versionadded:: 0.3.1
+    """
+    _require("pyarrow", "Parquet export")
+    pa = lazy_import("pyarrow")
+    pq = lazy_import("pyarrow.parquet")
+
+    num_rows = 0
+    writer = None
+    try:
+        for chunk in columns:
+            if header is None:
+                header = list(chunk.keys())
+            table = pa.table({name: _arrow_array(chunk[name]) for name in header})
+            if writer is None:
+                writer = pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+            num_rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return num_rows
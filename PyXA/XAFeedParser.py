@@ -0,0 +1,292 @@
+""".. versionadded:: 0.3.1
+
+A streaming parser for RSS 2.0 and Atom feeds that reads each item's standard fields in a single pass.
+
+The feed is read incrementally with an XML pull parser. Each item is converted into a compact :class:`XAFeedRecord` as soon as its closing tag is read, and its XML elements are then discarded, so the whole document tree is never held in memory.
+"""
+
+import email.utils
+import hashlib
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import IO, Iterator, Union
+
+ITEM_TAGS = {"item", "entry"}
+"""The local names of the elements containing feed items.
+"""
+
+_DATE_TAGS = ("pubDate", "published", "updated", "date")
+
+# The namespaces whose elements provide an item's fields, mapped to the local names read from each, or None for all of them. Elements of other namespaces, such as Media RSS's media:title and media:content, are ignored.
+_FIELD_NAMESPACES = {
+    "": None,  # RSS 2.0
+    "http://purl.org/rss/1.0/": None,
+    "http://www.w3.org/2005/Atom": None,
+    "http://purl.org/atom/ns#": None,  # Atom 0.3
+    "http://purl.org/rss/1.0/modules/content/": {"encoded"},
+    "http://purl.org/dc/elements/1.1/": {"creator", "date"},
+}
+
+
+def parse_date(text: Union[str, None]) -> Union[datetime, None]:
+    """Parses an RFC 822 (RSS) or ISO 8601 (Atom) date. Dates without a timezone are assumed to be in UTC.
+
+    :param text: The date text
+    :type text: Union[str, None]
+    :return: The timezone-aware date, or None if the text is not a valid date
+    :rtype: Union[datetime, None]
+
+    .. versionadded:: 0.3.1
+    """
+    if not text:
+        return None
+
+    text = text.strip()
+    try:
+        date = email.utils.parsedate_to_datetime(text)
+    except (TypeError, ValueError, IndexError):
+        try:
+            date = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return date
+
+
+class XAFeedRecord:
+    """The standard fields of one RSS item or Atom entry.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = (
+        "guid",
+        "title",
+        "link",
+        "links",
+        "author",
+        "categories",
+        "comments",
+        "description",
+        "content",
+        "enclosure",
+        "publication_date",
+        "source",
+        "copyright",
+        "text",
+        "xml",
+    )
+
+    def __init__(self):
+        self.guid: Union[str, None] = None  #: The item's guid (RSS) or id (Atom)
+        self.title: Union[str, None] = None  #: The item's title
+        self.link: Union[str, None] = None  #: The item's primary link
+        self.links: list[str] = []  #: Every link in the item
+        self.author: Union[str, None] = None  #: The item's author
+        self.categories: list[str] = []  #: The item's categories
+        self.comments: Union[str, None] = None  #: The URL of the item's comments
+        self.description: Union[str, None] = None  #: The item's description (RSS) or summary (Atom)
+        self.content: Union[str, None] = None  #: The item's full content, usually HTML
+        self.enclosure: Union[str, None] = None  #: The URL of the media file enclosed in the item
+        self.publication_date: Union[datetime, None] = None  #: The item's publication date, or its update date if it has no publication date
+        self.source: Union[str, None] = None  #: The item's third-party source
+        self.copyright: Union[str, None] = None  #: The item's copyright text
+        self.text: str = ""  #: All text within the item
+        self.xml: Union[str, None] = None  #: The XML of the item, if the parser was asked to keep it
+
+    @property
+    def category(self) -> Union[str, None]:
+        """The item's first category."""
+        return self.categories[0] if len(self.categories) > 0 else None
+
+    @property
+    def key(self) -> str:
+        """An identifier for the item -- its guid, or its link or title if it has no guid."""
+        return self.guid or self.link or self.title or self.text
+
+    @property
+    def fingerprint(self) -> str:
+        """A hash of the item's fields, which changes when the item is edited. Does not depend on whether the item's XML was kept."""
+        fields = tuple(getattr(self, x) for x in self.__slots__ if x != "xml")
+        return hashlib.sha1(repr(fields).encode("utf-8")).hexdigest()
+
+    def __eq__(self, other):
+        return isinstance(other, XAFeedRecord) and all(
+            getattr(self, x) == getattr(other, x) for x in self.__slots__
+        )
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.title) + ">"
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _field_name(tag: str) -> Union[str, None]:
+    # The local name of an element that provides an item field, or None for elements of other namespaces
+    namespace, _, name = tag[1:].rpartition("}") if tag.startswith("{") else ("", "", tag)
+    if namespace not in _FIELD_NAMESPACES:
+        return None
+    names = _FIELD_NAMESPACES[namespace]
+    return name if names is None or name in names else None
+
+
+def _inner_xml(element: ET.Element) -> str:
+    # Atom content with type="xhtml" is inline markup rather than text
+    return (element.text or "") + "".join(
+        ET.tostring(child, encoding="unicode") for child in element
+    )
+
+
+def _build_record(element: ET.Element, keep_xml: bool) -> XAFeedRecord:
+    record = XAFeedRecord()
+    dates = {}
+
+    for child in element:
+        name = _field_name(child.tag)
+        if name is None:
+            continue
+        text = (child.text or "").strip()
+
+        if name == "title":
+            record.title = text
+        elif name == "link":
+            href = child.get("href")
+            rel = child.get("rel", "alternate")
+            if href is not None and rel == "enclosure":
+                record.enclosure = record.enclosure or href
+            url = href or text
+            if url:
+                record.links.append(url)
+                if record.link is None and rel == "alternate":
+                    record.link = url
+        elif name in ("guid", "id"):
+            record.guid = text
+        elif name == "author":
+            author = child.find("{*}name")
+            record.author = author.text.strip() if author is not None and author.text else text
+        elif name == "creator":
+            record.author = record.author or text
+        elif name == "category":
+            category = child.get("label") or child.get("term") or text
+            if category:
+                record.categories.append(category)
+        elif name == "comments":
+            record.comments = text
+        elif name in ("description", "summary"):
+            record.description = record.description or text
+        elif name in ("encoded", "content"):
+            record.content = _inner_xml(child).strip() if len(child) > 0 else text
+        elif name == "enclosure":
+            record.enclosure = child.get("url")
+        elif name in _DATE_TAGS:
+            dates.setdefault(name, text)
+        elif name == "source":
+            record.source = text or child.get("url")
+        elif name in ("copyright", "rights"):
+            record.copyright = text
+
+    for name in _DATE_TAGS:
+        if name in dates:
+            record.publication_date = parse_date(dates[name])
+            if record.publication_date is not None:
+                break
+
+    if record.link is None and len(record.links) > 0:
+        record.link = record.links[0]
+    record.text = "".join(element.itertext())
+    if keep_xml:
+        # The text after the item depends on how much of the document has been read
+        tail, element.tail = element.tail, None
+        record.xml = ET.tostring(element, encoding="unicode")
+        element.tail = tail
+    return record
+
+
+def iter_feed(
+    source: Union[bytes, str, IO], chunk_size: int = 65536, keep_xml: bool = False
+) -> Iterator[XAFeedRecord]:
+    """Parses an RSS or Atom feed incrementally, yielding each item as soon as it has been read.
+
+    :param source: The feed document, or a binary file-like object to read it from
+    :type source: Union[bytes, str, IO]
+    :param chunk_size: The number of bytes to read from a file-like object at once, defaults to 65536
+    :type chunk_size: int, optional
+    :param keep_xml: Whether to keep the XML of each item in :attr:`XAFeedRecord.xml`, defaults to False
+    :type keep_xml: bool, optional
+    :raises xml.etree.ElementTree.ParseError: The document is not well-formed XML
+    :yield: The records of the feed's items, in document order
+    :rtype: Iterator[XAFeedRecord]
+
+    :Example:
+
+    >>> import requests
+    >>> from PyXA.XAFeedParser import iter_feed
+    >>> response = requests.get("https://www.apple.com/newsroom/rss-feed.rss", stream=True)
+    >>> for record in iter_feed(response.raw):
+    >>>     print(record.title, record.publication_date)
+    Apple unveils new Mac Studio 2022-03-08 18:00:00+00:00
+    ...
+
+    .. versionadded:: 0.3.1
+    """
+    if isinstance(source, str):
+        source = source.encode("utf-8")
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = bytes(source)
+        chunks = (source[i : i + chunk_size] for i in range(0, len(source), chunk_size))
+    else:
+        chunks = iter(lambda: source.read(chunk_size), b"")
+
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[ET.Element] = []
+    depth_in_item = 0
+
+    def events():
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from parser.read_events()
+        parser.close()
+        yield from parser.read_events()
+
+    for event, element in events():
+        is_item = _local_name(element.tag) in ITEM_TAGS
+        if event == "start":
+            stack.append(element)
+            if is_item or depth_in_item > 0:
+                depth_in_item += 1
+            continue
+
+        stack.pop()
+        if depth_in_item > 0:
+            depth_in_item -= 1
+            if depth_in_item == 0:
+                yield _build_record(element, keep_xml)
+                # Discard the item's elements so that memory use stays flat
+                if len(stack) > 0:
+                    stack[-1].remove(element)
+                element.clear()
+
+
+def parse_feed(
+    source: Union[bytes, str, IO], chunk_size: int = 65536, keep_xml: bool = False
+) -> list[XAFeedRecord]:
+    """Parses every item in an RSS or Atom feed. See :func:`iter_feed`.
+
+    :param source: The feed document, or a binary file-like object to read it from
+    :type source: Union[bytes, str, IO]
+    :param chunk_size: The number of bytes to read from a file-like object at once, defaults to 65536
+    :type chunk_size: int, optional
+    :param keep_xml: Whether to keep the XML of each item in :attr:`XAFeedRecord.xml`, defaults to False
+    :type keep_xml: bool, optional
+    :raises xml.etree.ElementTree.ParseError: The document is not well-formed XML
+    :return: The records of the feed's items, in document order
+    :rtype: list[XAFeedRecord]
+
+    .. versionadded:: 0.3.1
+    """
+    return list(iter_feed(source, chunk_size, keep_xml))
@@ -0,0 +1,423 @@
+""".. versionadded:: 0.3.1
+
+A local index of the files in a set of directories, used to answer :class:`PyXA.XASpotlight` queries when Spotlight is unavailable, disabled, or still indexing.
+
+The index is an SQLite database holding an inverted index of the trigrams of file names, the words of text files, file extensions, and file dates. It is updated incrementally: files whose modification time and size have not changed since the last update are not read again.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Iterator, Union
+
+DEFAULT_INDEX_PATH = "~/Library/Caches/PyXA/file_index.sqlite3"
+"""The default location of the index database. Indexes using the default location add a hash of their roots and settings to the file name, so that indexes of different directories are kept apart.
+"""
+
+TEXT_EXTENSIONS = {
+    "c", "cfg", "conf", "cpp", "css", "csv", "go", "h", "htm", "html", "ini", "java",
+    "js", "json", "log", "m", "md", "markdown", "py", "rb", "rs", "rst", "sh",
+    "sql", "swift", "tex", "toml", "ts", "tsv", "txt", "xml", "yaml", "yml",
+}
+"""The extensions of the files whose content is indexed when text indexing is enabled.
+"""
+
+INDEX_VERSION = 1
+
+_WORD_PATTERN = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE NOT NULL,
+    name TEXT NOT NULL,
+    extension TEXT NOT NULL,
+    modified REAL NOT NULL,
+    created REAL NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_extension ON files (extension);
+CREATE INDEX IF NOT EXISTS files_modified ON files (modified);
+CREATE INDEX IF NOT EXISTS files_created ON files (created);
+CREATE TABLE IF NOT EXISTS grams (gram TEXT NOT NULL, file INTEGER NOT NULL, PRIMARY KEY (gram, file)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS grams_file ON grams (file);
+CREATE TABLE IF NOT EXISTS words (id INTEGER PRIMARY KEY, word TEXT UNIQUE NOT NULL);
+CREATE TABLE IF NOT EXISTS postings (word INTEGER NOT NULL, file INTEGER NOT NULL, PRIMARY KEY (word, file)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_file ON postings (file);
+"""
+
+
+def parse_query(query: tuple[Any, ...]) -> tuple[Union[datetime, None], Union[datetime, None], list[str]]:
+    """Interprets the terms of a search in the same way as :func:`PyXA.XASpotlight.run`.
+
+    A single date matches the 24 hours centered on it, two dates match the range between them, and strings or numbers must each be contained in a file's name or text. A date or pair of dates can be followed by terms.
+
+    :param query: The query terms
+    :type query: tuple[Any, ...]
+    :raises ValueError: The query does not have one of the supported shapes
+    :return: The start and end of the date range, or None if the query has no dates, and the text terms
+    :rtype: tuple[Union[datetime, None], Union[datetime, None], list[str]]
+
+    .. versionadded:: 0.3.1
+    """
+
+    def is_term(x):
+        return isinstance(x, (str, int, float)) and not isinstance(x, bool)
+
+    if len(query) == 1 and isinstance(query[0], datetime):
+        return query[0] - timedelta(hours=12), query[0] + timedelta(hours=12), []
+    if len(query) == 2 and isinstance(query[0], datetime) and isinstance(query[1], datetime):
+        return query[0], query[1], []
+    if all(is_term(x) for x in query):
+        return None, None, [str(x) for x in query]
+    if isinstance(query[0], datetime) and all(is_term(x) for x in query[1:]):
+        return query[0] - timedelta(hours=12), query[0] + timedelta(hours=12), [str(x) for x in query[1:]]
+    if (
+        len(query) > 2
+        and isinstance(query[0], datetime)
+        and isinstance(query[1], datetime)
+        and all(is_term(x) for x in query[2:])
+    ):
+        return query[0], query[1], [str(x) for x in query[2:]]
+    raise ValueError(f"Unsupported query: {query!r}")
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _words(text: str) -> set[str]:
+    return set(_WORD_PATTERN.findall(text.lower()))
+
+
+class XAFileIndex:
+    """A persistent index of the names, extensions, dates, and optionally text content of the files in a set of directories.
+
+    Name terms are matched with a trigram index and text terms with a word index, so a search does not scan the disk. Call :func:`update` to bring the index up to date; searches also update it automatically once it is older than ``refresh_interval``.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        roots: list[str],
+        path: Union[str, None] = DEFAULT_INDEX_PATH,
+        index_text: bool = False,
+        max_text_bytes: int = 1024 * 1024,
+        include_hidden: bool = False,
+        refresh_interval: Union[float, None] = 60,
+    ):
+        """Creates or opens a file index. The directories are not scanned until the index is first updated.
+
+        :param roots: The directories whose contents are indexed
+        :type roots: list[str]
+        :param path: The path of the index database, or None to keep the index in memory only, defaults to a file named after :attr:`DEFAULT_INDEX_PATH`. A database holds one index at a time: opening it with different roots or settings discards its entries.
+        :type path: Union[str, None], optional
+        :param index_text: Whether to index the words in text files, see :attr:`TEXT_EXTENSIONS`, defaults to False
+        :type index_text: bool, optional
+        :param max_text_bytes: The maximum number of bytes read from each text file, defaults to 1 MiB
+        :type max_text_bytes: int, optional
+        :param include_hidden: Whether to index files and directories whose names begin with a period, defaults to False
+        :type include_hidden: bool, optional
+        :param refresh_interval: The age in seconds after which a search updates the index first, or None to only update the index explicitly, defaults to 60
+        :type refresh_interval: Union[float, None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.roots = [os.path.abspath(os.path.expanduser(x)) for x in roots]  #: The directories whose contents are indexed
+        self.index_text = index_text  #: Whether the words in text files are indexed
+        self.max_text_bytes = max_text_bytes  #: The maximum number of bytes read from each text file
+        self.include_hidden = include_hidden  #: Whether hidden files and directories are indexed
+        self.refresh_interval = refresh_interval  #: The age in seconds after which a search updates the index first
+
+        self.__settings = repr((INDEX_VERSION, self.roots, self.index_text, self.include_hidden, self.max_text_bytes))
+        if path == DEFAULT_INDEX_PATH:
+            name, extension = os.path.splitext(path)
+            path = f"{name}-{hashlib.sha1(self.__settings.encode()).hexdigest()[:16]}{extension}"
+        self.path = os.path.expanduser(path) if path is not None else None  #: The path of the index database
+
+        self.__lock = threading.RLock()
+        self.__connection = self.__open()
+
+    @property
+    def last_update(self) -> Union[float, None]:
+        """The time of the last update of the index, as a Unix timestamp, or None if the index has never been updated."""
+        with self.__lock:
+            self.__claim()
+            row = self.__connection.execute("SELECT value FROM meta WHERE key = 'updated'").fetchone()
+        return float(row[0]) if row is not None else None
+
+    def update(self) -> dict[str, int]:
+        """Scans the indexed directories and updates the entries of new, modified, and deleted files.
+
+        :return: The number of files added, updated, and removed
+        :rtype: dict[str, int]
+
+        :Example:
+
+        >>> from PyXA.XAFileIndex import XAFileIndex
+        >>> index = XAFileIndex(["~/Documents"], index_text=True)
+        >>> print(index.update())
+        {'added': 1520, 'updated': 0, 'removed': 0}
+
+        .. versionadded:: 0.3.1
+        """
+        counts = {"added": 0, "updated": 0, "removed": 0}
+        with self.__lock:
+            self.__claim()
+            db = self.__connection
+            known = {path: (id, mtime_ns, size) for id, path, mtime_ns, size in db.execute("SELECT id, path, mtime_ns, size FROM files")}
+            seen = set()
+
+            with db:
+                for path, stat in self.__walk():
+                    seen.add(path)
+                    entry = known.get(path)
+                    if entry is None:
+                        self.__add(path, stat)
+                        counts["added"] += 1
+                    elif entry[1:] != (stat.st_mtime_ns, stat.st_size):
+                        # Modification time and size together identify a version of the file
+                        self.__modify(entry[0], path, stat)
+                        counts["updated"] += 1
+
+                removed = [entry[0] for path, entry in known.items() if path not in seen]
+                for id in removed:
+                    self.__remove(id)
+                counts["removed"] = len(removed)
+
+                db.execute("INSERT OR REPLACE INTO meta VALUES ('updated', ?)", (str(time.time()),))
+        return counts
+
+    def search(self, *query: Any, extensions: Union[list[str], None] = None) -> list[str]:
+        """Finds the files matching a query, using the same query shapes as :class:`PyXA.XASpotlight`.
+
+        A file matches a text term if the term appears in its name, or if every word of the term appears within a word of its indexed text. Matching is case-insensitive. A file matches a date range if its modification or creation date falls within the range.
+
+        :param query: The search terms -- strings, a date, two dates, or a date or two dates followed by strings
+        :type query: Any
+        :param extensions: The file extensions to limit results to, defaults to None
+        :type extensions: Union[list[str], None], optional
+        :raises ValueError: The query does not have one of the supported shapes
+        :return: The paths of the matching files, sorted
+        :rtype: list[str]
+
+        :Example:
+
+        >>> from datetime import datetime
+        >>> from PyXA.XAFileIndex import XAFileIndex
+        >>> index = XAFileIndex(["~/Documents"])
+        >>> print(index.search(datetime(2022, 10, 1), datetime(2022, 10, 8), "report"))
+        ['/Users/exampleUser/Documents/Weekly report.pdf']
+
+        .. versionadded:: 0.3.1
+        """
+        return list(self.iter_search(*query, extensions=extensions))
+
+    def iter_search(self, *query: Any, extensions: Union[list[str], None] = None) -> Iterator[str]:
+        """Finds the files matching a query, yielding their paths as they are read from the index. See :func:`search`.
+
+        :param query: The search terms -- strings, a date, two dates, or a date or two dates followed by strings
+        :type query: Any
+        :param extensions: The file extensions to limit results to, defaults to None
+        :type extensions: Union[list[str], None], optional
+        :raises ValueError: The query does not have one of the supported shapes
+        :yield: The paths of the matching files, sorted
+        :rtype: Iterator[str]
+
+        .. versionadded:: 0.3.1
+        """
+        start, end, terms = parse_query(query) if len(query) > 0 else (None, None, [])
+        if self.refresh_interval is not None:
+            last_update = self.last_update
+            if last_update is None or time.time() - last_update > self.refresh_interval:
+                self.update()
+
+        selects = []
+        params = []
+        if start is not None:
+            selects.append("SELECT id FROM files WHERE (modified > ? AND modified < ?) OR (created > ? AND created < ?)")
+            params.extend([start.timestamp(), end.timestamp()] * 2)
+        if extensions is not None:
+            extensions = [x.lower().lstrip(".") for x in extensions]
+            selects.append(f"SELECT id FROM files WHERE extension IN ({', '.join('?' * len(extensions))})")
+            params.extend(extensions)
+        for term in terms:
+            sql, term_params = self.__term_select(term.lower())
+            selects.append(sql)
+            params.extend(term_params)
+
+        if len(selects) == 0:
+            return
+
+        # Only files within the roots, in case the database holds entries written by another index
+        within_roots = " OR ".join("path = ? OR substr(path, 1, ?) = ?" for _ in self.roots) or "0"
+        for root in self.roots:
+            prefix = os.path.join(root, "")
+            params.extend([root, len(prefix), prefix])
+
+        matches = " INTERSECT ".join(f"SELECT * FROM ({x})" for x in selects)
+        with self.__lock:
+            self.__claim()
+            rows = self.__connection.execute(
+                f"SELECT path FROM files WHERE id IN ({matches}) AND ({within_roots}) ORDER BY path", params
+            ).fetchall()
+        for row in rows:
+            yield row[0]
+
+    def clear(self):
+        """Removes every entry from the index.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock, self.__connection as db:
+            for table in ("files", "grams", "words", "postings"):
+                db.execute(f"DELETE FROM {table}")
+            db.execute("DELETE FROM meta WHERE key = 'updated'")
+
+    def close(self):
+        """Closes the index database.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__connection.close()
+
+    def __term_select(self, term: str) -> tuple[str, list]:
+        # Every trigram of the term must appear in the name, then the candidates are checked for the whole term
+        grams = sorted(_trigrams(term))
+        if len(grams) > 0:
+            sql = (
+                "SELECT id FROM files WHERE id IN (SELECT file FROM grams WHERE gram IN "
+                f"({', '.join('?' * len(grams))}) GROUP BY file HAVING COUNT(*) = ?) AND instr(name, ?) > 0"
+            )
+            params = [*grams, len(grams), term]
+        else:
+            sql = "SELECT id FROM files WHERE instr(name, ?) > 0"
+            params = [term]
+
+        if self.index_text:
+            words = sorted(_words(term))
+            if len(words) > 0:
+                text_select = " INTERSECT ".join(
+                    "SELECT * FROM (SELECT file FROM postings WHERE word IN (SELECT id FROM words WHERE instr(word, ?) > 0))"
+                    for _ in words
+                )
+                sql = f"SELECT * FROM ({sql}) UNION SELECT * FROM ({text_select})"
+                params.extend(words)
+        return sql, params
+
+    def __walk(self) -> Iterator[tuple[str, os.stat_result]]:
+        directories = [x for x in self.roots if os.path.isdir(x)]
+        while len(directories) > 0:
+            directory = directories.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+
+            for entry in entries:
+                if not self.include_hidden and entry.name.startswith("."):
+                    continue
+                try:
+                    stat = entry.stat(follow_symlinks=False)
+                    if entry.is_dir(follow_symlinks=False):
+                        directories.append(entry.path)
+                except OSError:
+                    continue
+                yield entry.path, stat
+
+    def __add(self, path: str, stat: os.stat_result):
+        name = os.path.basename(path).lower()
+        extension = os.path.splitext(name)[1].lstrip(".")
+        cursor = self.__connection.execute(
+            "INSERT INTO files (path, name, extension, modified, created, size, mtime_ns) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, name, extension, stat.st_mtime, self.__created(stat), stat.st_size, stat.st_mtime_ns),
+        )
+        id = cursor.lastrowid
+        self.__connection.executemany(
+            "INSERT INTO grams (gram, file) VALUES (?, ?)", ((x, id) for x in _trigrams(name))
+        )
+        self.__index_words(id, path, extension)
+
+    def __modify(self, id: int, path: str, stat: os.stat_result):
+        self.__connection.execute(
+            "UPDATE files SET modified = ?, created = ?, size = ?, mtime_ns = ? WHERE id = ?",
+            (stat.st_mtime, self.__created(stat), stat.st_size, stat.st_mtime_ns, id),
+        )
+        if self.index_text:
+            self.__connection.execute("DELETE FROM postings WHERE file = ?", (id,))
+            self.__index_words(id, path, os.path.splitext(path)[1].lower().lstrip("."))
+
+    def __remove(self, id: int):
+        for sql in (
+            "DELETE FROM files WHERE id = ?",
+            "DELETE FROM grams WHERE file = ?",
+            "DELETE FROM postings WHERE file = ?",
+        ):
+            self.__connection.execute(sql, (id,))
+
+    def __index_words(self, id: int, path: str, extension: str):
+        if not self.index_text or extension not in TEXT_EXTENSIONS:
+            return
+
+        try:
+            with open(path, "rb") as f:
+                text = f.read(self.max_text_bytes).decode("utf-8", errors="ignore")
+        except OSError:
+            return
+
+        words = list(_words(text))
+        db = self.__connection
+        db.executemany("INSERT OR IGNORE INTO words (word) VALUES (?)", ((x,) for x in words))
+        for i in range(0, len(words), 500):
+            chunk = words[i : i + 500]
+            db.execute(
+                f"INSERT OR IGNORE INTO postings (word, file) SELECT id, ? FROM words WHERE word IN ({', '.join('?' * len(chunk))})",
+                (id, *chunk),
+            )
+
+    def __open(self) -> sqlite3.Connection:
+        if self.path is not None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        connection = sqlite3.connect(self.path or ":memory:", check_same_thread=False)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.executescript(_SCHEMA)
+        self.__connection = connection
+        self.__claim()
+        return connection
+
+    def __claim(self):
+        # An index built with different settings, possibly by another index sharing the database since this one was opened, is discarded rather than mixed with new entries
+        connection = self.__connection
+        row = connection.execute("SELECT value FROM meta WHERE key = 'settings'").fetchone()
+        if row is None or row[0] != self.__settings:
+            with connection:
+                for table in ("files", "grams", "words", "postings", "meta"):
+                    connection.execute(f"DELETE FROM {table}")
+                connection.execute("INSERT INTO meta VALUES ('settings', ?)", (self.__settings,))
+
+    @staticmethod
+    def __created(stat: os.stat_result) -> float:
+        # Linux doesn't report creation dates through stat, and the inode change time changes too often to stand in for one
+        return getattr(stat, "st_birthtime", stat.st_mtime)
+
+    def __len__(self):
+        with self.__lock:
+            self.__claim()
+            return self.__connection.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.roots) + ">"
@@ -0,0 +1,674 @@
+""".. versionadded:: 0.3.1
+
+A persistent cache of HTTP responses used to send conditional requests, so unchanged resources are neither downloaded nor reprocessed, and pooled sessions for sending many requests concurrently.
+"""
+
+import email.utils
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from html.parser import HTMLParser
+from typing import Any, Union
+
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XALazy import lazy_import
+
+bs4 = lazy_import("bs4")
+requests = lazy_import("requests")
+
+DEFAULT_CACHE_DIRECTORY = "~/Library/Caches/PyXA/http"
+"""The default location of the cache's files.
+"""
+
+DEFAULT_MEMORY_LIMIT = 32 * 1024 * 1024
+"""The default maximum number of bytes of response bodies kept in memory.
+"""
+
+DEFAULT_DISK_LIMIT = 256 * 1024 * 1024
+"""The default maximum number of bytes of response bodies kept on the disk.
+"""
+
+CACHE_VERSION = 1
+
+_shared_session: Union["requests.Session", None] = None
+_shared_session_lock = threading.Lock()
+
+_META_CHARSET = re.compile(rb"""<meta[^>]+charset=["']?([\w-]+)""", re.IGNORECASE)
+
+
+def pooled_session(
+    connections_per_host: int = 4,
+    retries: int = 3,
+    backoff_factor: float = 0.5,
+) -> "requests.Session":
+    """Creates a session that reuses connections and retries failed requests.
+
+    Each host gets a pool of at most `connections_per_host` connections. Threads sending further requests to the same host wait for a free connection rather than opening a new one. Connection errors and 429, 500, 502, 503, and 504 responses are retried with exponential backoff.
+
+    :param connections_per_host: The maximum number of concurrent connections to each host, defaults to 4
+    :type connections_per_host: int, optional
+    :param retries: The maximum number of times to retry each request, defaults to 3
+    :type retries: int, optional
+    :param backoff_factor: The base delay in seconds between retries, doubled after each retry, defaults to 0.5
+    :type backoff_factor: float, optional
+    :return: The session
+    :rtype: requests.Session
+
+    .. versionadded:: 0.3.1
+    """
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET", "HEAD"),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=connections_per_host,
+        pool_block=True,
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def shared_session() -> "requests.Session":
+    """Retrieves the pooled session shared by PyXA's web features. See :func:`pooled_session`.
+
+    :return: The shared session
+    :rtype: requests.Session
+
+    .. versionadded:: 0.3.1
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = pooled_session()
+        return _shared_session
+
+
+def _header(headers: dict, name: str) -> Union[str, None]:
+    # Stored headers are plain dicts, so look them up case-insensitively
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+def _freshness(headers: dict) -> tuple[bool, Union[float, None]]:
+    # Returns whether the response may be stored and the time until which it can be reused without revalidation
+    directives = {}
+    for directive in (_header(headers, "Cache-Control") or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+
+    if "no-store" in directives:
+        return False, None
+    if "no-cache" in directives:
+        return True, None
+
+    if "max-age" in directives:
+        try:
+            max_age = int(directives["max-age"]) - int(_header(headers, "Age") or 0)
+        except ValueError:
+            return True, None
+        return True, time.time() + max_age
+
+    expires = _header(headers, "Expires")
+    if expires is not None:
+        try:
+            return True, email.utils.parsedate_to_datetime(expires).timestamp()
+        except (TypeError, ValueError, IndexError):
+            # Invalid dates, such as "0", mean the response has already expired
+            return True, None
+    return True, None
+
+
+class _TitleParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.in_title = False
+        self.done = False
+        self.parts = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "title" and not self.done:
+            self.in_title = True
+
+    def handle_endtag(self, tag):
+        if tag == "title" and self.in_title:
+            self.in_title = False
+            self.done = True
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.parts.append(data)
+
+
+class XAHTTPResult:
+    """The outcome of fetching a URL through an :class:`XAHTTPCache`.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        url: str,
+        status_code: int,
+        content: bytes,
+        headers: Union[dict, None] = None,
+        not_modified: bool = False,
+        changed: bool = True,
+        fresh: bool = False,
+    ):
+        self.url = url  #: The requested URL
+        self.status_code = status_code  #: The HTTP status code of the response
+        self.content = content  #: The body of the resource, read from the cache if the server responded with 304 Not Modified
+        self.headers = headers or {}  #: The headers of the response
+        self.not_modified = not_modified  #: Whether the server responded with 304 Not Modified
+        self.changed = changed  #: Whether the body differs from the previously cached body
+        self.fresh = fresh  #: Whether the body was read from the cache without contacting the server
+
+        self.__text = None
+        self.__soup = None
+
+    @property
+    def content_type(self) -> str:
+        """The media type of the body from the Content-Type header, such as "text/html", or an empty string if the header is missing."""
+        return (_header(self.headers, "Content-Type") or "").split(";")[0].strip().lower()
+
+    @property
+    def encoding(self) -> str:
+        """The character encoding of the body, from the Content-Type header or a <meta> tag, otherwise UTF-8."""
+        content_type = _header(self.headers, "Content-Type") or ""
+        match = re.search(r"charset=[\"']?([\w-]+)", content_type, re.IGNORECASE)
+        if match is None:
+            match = _META_CHARSET.search(self.content[:2048])
+            if match is not None:
+                return match.group(1).decode("ascii")
+            return "utf-8"
+        return match.group(1)
+
+    @property
+    def text(self) -> str:
+        """The body decoded as text. Undecodable bytes are replaced."""
+        if self.__text is None:
+            try:
+                self.__text = self.content.decode(self.encoding, errors="replace")
+            except LookupError:
+                self.__text = self.content.decode("utf-8", errors="replace")
+        return self.__text
+
+    @property
+    def title(self) -> Union[str, None]:
+        """The text of the HTML document's <title> element. The document is only read up to the end of the title."""
+        if self.__soup is not None:
+            title = self.__soup.title
+            return title.text if title is not None else None
+
+        parser = _TitleParser()
+        text = self.text
+        for start in range(0, len(text), 4096):
+            parser.feed(text[start : start + 4096])
+            if parser.done:
+                break
+        return "".join(parser.parts) if parser.done or parser.in_title else None
+
+    def soup(self) -> "bs4.BeautifulSoup":
+        """Parses the body as HTML. The document is parsed once, when this method is first called.
+
+        :return: The parsed document
+        :rtype: bs4.BeautifulSoup
+
+        .. versionadded:: 0.3.1
+        """
+        if self.__soup is None:
+            self.__soup = bs4.BeautifulSoup(self.text, "html.parser")
+        return self.__soup
+
+    def __repr__(self):
+        return f"<{type(self)}{self.url} ({self.status_code}, changed={self.changed})>"
+
+
+class XAHTTPCache:
+    """A cache storing the validators (ETag and Last-Modified headers), body hash, and body of each fetched URL in memory and on the disk.
+
+    Fetching a URL whose Cache-Control max-age or Expires header has not yet passed returns the cached body without contacting the server. Otherwise, the URL's stored validators are sent as If-None-Match and If-Modified-Since headers, and when the server responds with 304 Not Modified, the cached body is returned instead. Either way, the result reports whether the body changed since the previous fetch, so callers can skip reprocessing unchanged resources. Responses marked no-store are never cached.
+
+    The total size of the bodies kept in memory and on the disk is bounded. The least recently used bodies are removed first.
+
+    .. versionadded:: 0.3.1
+    """
+
+    _shared: Union["XAHTTPCache", None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        directory: Union[str, None] = DEFAULT_CACHE_DIRECTORY,
+        memory_limit: int = DEFAULT_MEMORY_LIMIT,
+        disk_limit: int = DEFAULT_DISK_LIMIT,
+    ):
+        """Creates a new cache.
+
+        :param directory: The directory to store the cache's files in, or None to keep the cache in memory only, defaults to :attr:`DEFAULT_CACHE_DIRECTORY`
+        :type directory: Union[str, None], optional
+        :param memory_limit: The maximum number of bytes of bodies to keep in memory, defaults to :attr:`DEFAULT_MEMORY_LIMIT`
+        :type memory_limit: int, optional
+        :param disk_limit: The maximum number of bytes of bodies to keep on the disk, defaults to :attr:`DEFAULT_DISK_LIMIT`
+        :type disk_limit: int, optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.directory = os.path.expanduser(directory) if directory is not None else None  #: The directory containing the cache's files
+        self.memory_limit = memory_limit  #: The maximum number of bytes of bodies kept in memory
+        self.disk_limit = disk_limit  #: The maximum number of bytes of bodies kept on the disk
+
+        self.__lock = threading.RLock()
+        self.__entries: Union[dict[str, dict], None] = None
+        self.__bodies: OrderedDict[str, bytes] = OrderedDict()
+        self.__memory_size = 0
+        self.__deferral_depth = 0
+        self.__dirty = False
+
+    @classmethod
+    def shared(cls) -> "XAHTTPCache":
+        """Retrieves the cache shared by PyXA's web features.
+
+        :return: The shared HTTP cache
+        :rtype: XAHTTPCache
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def fetch(
+        self,
+        url: str,
+        session: Union["requests.Session", None] = None,
+        headers: Union[dict, None] = None,
+        timeout: Union[float, None] = 30,
+    ) -> XAHTTPResult:
+        """Sends a conditional GET request for the URL and caches the response. If the cached response is still fresh, it is returned without sending a request.
+
+        :param url: The URL to fetch
+        :type url: str
+        :param session: The session to send the request with, defaults to a new connection
+        :type session: Union[requests.Session, None], optional
+        :param headers: Additional headers to send with the request, defaults to None
+        :type headers: Union[dict, None], optional
+        :param timeout: The number of seconds to wait for the server, defaults to 30
+        :type timeout: Union[float, None], optional
+        :return: The result of the request
+        :rtype: XAHTTPResult
+
+        :Example:
+
+        >>> from PyXA.XAHTTPCache import XAHTTPCache
+        >>> result = XAHTTPCache.shared().fetch("https://www.apple.com/newsroom/rss-feed.rss")
+        >>> print(result.not_modified, result.changed)
+        True False
+
+        .. versionadded:: 0.3.1
+        """
+        client = session or requests
+        cached_body = self.body(url)
+        entry = self.__entry(url) or {}
+
+        if cached_body is not None and (entry.get("expires") or 0) > time.time():
+            return XAHTTPResult(
+                url, 200, cached_body, dict(entry.get("headers", {})), changed=False, fresh=True
+            )
+
+        request_headers = dict(headers or {})
+        if cached_body is not None:
+            request_headers.update(self.conditional_headers(url))
+
+        response = client.get(url, headers=request_headers, timeout=timeout)
+        if response.status_code == 304 and cached_body is not None:
+            # A 304 response can extend the freshness of the cached body
+            response_headers = {**entry.get("headers", {}), **response.headers}
+            self.__revalidated(url, response.headers)
+            return XAHTTPResult(
+                url, 304, cached_body, response_headers, not_modified=True, changed=False
+            )
+
+        if response.status_code != 200:
+            return XAHTTPResult(url, response.status_code, response.content, dict(response.headers))
+
+        changed = self.store(url, response.content, response.headers)
+        return XAHTTPResult(url, 200, response.content, dict(response.headers), changed=changed)
+
+    def fetch_many(
+        self,
+        urls: list[str],
+        session: Union["requests.Session", None] = None,
+        headers: Union[dict, None] = None,
+        timeout: Union[float, None] = 30,
+        executor: Union[XABoundedExecutor, None] = None,
+    ) -> list[Union[XAHTTPResult, Exception]]:
+        """Fetches several URLs concurrently. See :func:`fetch`. Each distinct URL is fetched once, and the cache's index is written once at the end.
+
+        :param urls: The URLs to fetch
+        :type urls: list[str]
+        :param session: The session to send the requests with, defaults to :func:`shared_session`
+        :type session: Union[requests.Session, None], optional
+        :param headers: Additional headers to send with each request, defaults to None
+        :type headers: Union[dict, None], optional
+        :param timeout: The number of seconds to wait for each server, defaults to 30
+        :type timeout: Union[float, None], optional
+        :param executor: The executor to send the requests from, defaults to the shared :class:`PyXA.XAExecutor.XABoundedExecutor`
+        :type executor: Union[XABoundedExecutor, None], optional
+        :return: The result of each request, or the exception it raised, in the order of the URLs
+        :rtype: list[Union[XAHTTPResult, Exception]]
+
+        :Example:
+
+        >>> from PyXA.XAHTTPCache import XAHTTPCache
+        >>> results = XAHTTPCache.shared().fetch_many(["https://www.apple.com", "https://www.apple.com/mac/"])
+        >>> print([result.title for result in results])
+        ['Apple', 'Mac - Apple']
+
+        .. versionadded:: 0.3.1
+        """
+        session = session or shared_session()
+        executor = executor or XABoundedExecutor.shared()
+        unique_urls = list(dict.fromkeys(urls))
+
+        with self.deferred_writes():
+            results = executor.map(
+                lambda url: self.fetch(url, session, headers, timeout),
+                unique_urls,
+                return_exceptions=True,
+            )
+        by_url = dict(zip(unique_urls, results))
+        return [by_url[url] for url in urls]
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Gets the If-None-Match and If-Modified-Since headers for a conditional request for the URL.
+
+        :param url: The URL to be requested
+        :type url: str
+        :return: The conditional request headers, empty if the URL is not cached
+        :rtype: dict[str, str]
+
+        .. versionadded:: 0.3.1
+        """
+        entry = self.__entry(url)
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def body(self, url: str) -> Union[bytes, None]:
+        """Gets the cached body of the URL.
+
+        :param url: The URL
+        :type url: str
+        :return: The cached body, or None if the URL is not cached
+        :rtype: Union[bytes, None]
+
+        .. versionadded:: 0.3.1
+        """
+        entry = self.__entry(url)
+        if entry is None:
+            return None
+
+        with self.__lock:
+            if url in self.__bodies:
+                self.__bodies.move_to_end(url)
+                self.__touch(url)
+                return self.__bodies[url]
+
+        if self.directory is None or not entry.get("size"):
+            return None
+        try:
+            with open(self.__body_path(url), "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        if hashlib.sha256(body).hexdigest() != entry.get("hash"):
+            # The body file is from another version of the entry
+            return None
+
+        with self.__lock:
+            self.__touch(url)
+            self.__remember(url, body)
+        return body
+
+    def store(self, url: str, body: bytes, headers: Union[dict, None] = None) -> bool:
+        """Stores the body and validators of a response for the URL.
+
+        :param url: The URL
+        :type url: str
+        :param body: The body of the response
+        :type body: bytes
+        :param headers: The headers of the response, defaults to None
+        :type headers: Union[dict, None], optional
+        :return: True if the body differs from the previously cached body
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        headers = headers or {}
+        body_hash = hashlib.sha256(body).hexdigest()
+        storable, expires = _freshness(headers)
+
+        with self.__lock:
+            entries = self.__load()
+            previous = entries.pop(url, {})
+            changed = previous.get("hash") != body_hash
+            if not storable:
+                self.__forget(url)
+                if previous.get("size"):
+                    self.__remove_body_file(url)
+                self.__save()
+                return changed
+
+            entry = {
+                "etag": _header(headers, "ETag"),
+                "last_modified": _header(headers, "Last-Modified"),
+                "hash": body_hash,
+                "expires": expires,
+                "headers": {
+                    "Content-Type": _header(headers, "Content-Type") or "",
+                },
+                "extra": previous.get("extra", {}),
+            }
+            entries[url] = entry
+
+            self.__remember(url, body)
+            if self.directory is not None and len(body) <= self.disk_limit:
+                if changed or not previous.get("size") or not os.path.exists(self.__body_path(url)):
+                    self.__write(self.__body_path(url), body)
+                entry["size"] = len(body)
+                self.__trim_disk()
+            self.__save()
+        return changed
+
+    def get_extra(self, url: str, key: str, default: Any = None) -> Any:
+        """Gets additional data stored alongside the URL's entry, such as the identifiers of the items in a feed.
+
+        :param url: The URL
+        :type url: str
+        :param key: The name of the data
+        :type key: str
+        :param default: The value to return if no data is stored, defaults to None
+        :type default: Any, optional
+        :return: The stored data
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        entry = self.__entry(url)
+        if entry is None:
+            return default
+        return entry.get("extra", {}).get(key, default)
+
+    def set_extra(self, url: str, key: str, value: Any):
+        """Stores additional JSON-serializable data alongside the URL's entry. Does nothing if the URL is not cached.
+
+        :param url: The URL
+        :type url: str
+        :param key: The name of the data
+        :type key: str
+        :param value: The data to store
+        :type value: Any
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            entry = self.__load().get(url)
+            if entry is None:
+                return
+            entry.setdefault("extra", {})[key] = value
+            self.__save()
+
+    @contextmanager
+    def deferred_writes(self):
+        """Delays writing the cache's index to the disk until the end of the `with` block, so that a batch of fetches writes the index once rather than once per fetch. Applies to fetches made from any thread.
+
+        :Example:
+
+        >>> from PyXA.XAHTTPCache import XAHTTPCache
+        >>> cache = XAHTTPCache.shared()
+        >>> with cache.deferred_writes():
+        >>>     for url in urls:
+        >>>         cache.fetch(url)
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__deferral_depth += 1
+        try:
+            yield self
+        finally:
+            with self.__lock:
+                self.__deferral_depth -= 1
+                if self.__deferral_depth == 0 and self.__dirty:
+                    self.__save()
+
+    def clear(self):
+        """Removes every entry from the cache.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            if self.directory is not None:
+                for url in list(self.__load()):
+                    self.__remove_body_file(url)
+            self.__entries = {}
+            self.__bodies = OrderedDict()
+            self.__memory_size = 0
+            self.__save()
+
+    def __entry(self, url: str) -> Union[dict, None]:
+        with self.__lock:
+            return self.__load().get(url)
+
+    def __touch(self, url: str):
+        # Entries are kept in least recently used order, which is also saved in the index
+        entries = self.__load()
+        if url in entries:
+            entries[url] = entries.pop(url)
+
+    def __revalidated(self, url: str, headers: dict):
+        _, expires = _freshness(headers)
+        with self.__lock:
+            entry = self.__load().get(url)
+            if entry is not None and entry.get("expires") != expires:
+                entry["expires"] = expires
+                self.__save()
+
+    def __remember(self, url: str, body: bytes):
+        self.__forget(url)
+        if len(body) > self.memory_limit:
+            return
+
+        self.__bodies[url] = body
+        self.__memory_size += len(body)
+        while self.__memory_size > self.memory_limit:
+            _, evicted = self.__bodies.popitem(last=False)
+            self.__memory_size -= len(evicted)
+
+    def __forget(self, url: str):
+        body = self.__bodies.pop(url, None)
+        if body is not None:
+            self.__memory_size -= len(body)
+
+    def __trim_disk(self):
+        entries = self.__load()
+        total = sum(entry.get("size", 0) for entry in entries.values())
+        for url, entry in entries.items():
+            if total <= self.disk_limit:
+                break
+            if entry.get("size"):
+                total -= entry.pop("size")
+                self.__remove_body_file(url)
+
+    def __remove_body_file(self, url: str):
+        try:
+            os.remove(self.__body_path(url))
+        except OSError:
+            pass
+
+    def __load(self) -> dict[str, dict]:
+        if self.__entries is None:
+            self.__entries = {}
+            if self.directory is not None:
+                try:
+                    with open(os.path.join(self.directory, "index.json"), "r") as f:
+                        data = json.load(f)
+                    if data.get("version") == CACHE_VERSION:
+                        self.__entries = data["entries"]
+                except (OSError, ValueError, KeyError):
+                    pass
+        return self.__entries
+
+    def __save(self):
+        if self.directory is None:
+            return
+        if self.__deferral_depth > 0:
+            self.__dirty = True
+            return
+
+        self.__dirty = False
+        data = json.dumps({"version": CACHE_VERSION, "entries": self.__entries})
+        self.__write(os.path.join(self.directory, "index.json"), data.encode("utf-8"))
+
+    def __body_path(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha256(url.encode("utf-8")).hexdigest())
+
+    def __write(self, path: str, data: bytes):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, path)
+        except OSError:
+            # The cache still works in memory if its files can't be written
+            pass
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.directory) + ">"
@@ -0,0 +1,217 @@
+""".. versionadded:: 0.3.1
+
+A graph of deferred image operations and the optimizer that plans how to render it.
+
+This module is independent of AppKit and Quartz. Operations are plain descriptions -- a CoreImage filter name and its parameters, or a named transform -- and the optimizer only rewrites those descriptions. :class:`PyXA.XABase.XAImage` renders the optimized plan when the image's pixels are needed.
+"""
+
+from typing import Any, Callable, Literal, Union
+
+DEPTH_OF_FIELD_FOCAL_REGION = ((1 / 2, 1 / 3), (1 / 2, 2 / 3))
+"""The default focal line of the depth of field filter, through the center third of the image, as points relative to the image's width and height.
+"""
+
+
+def relative_point(size: tuple[float, float], point: tuple[float, float]) -> tuple[float, float]:
+    """Converts a point given relative to an image's width and height into a point in pixels.
+
+    :param size: The width and height of the image
+    :type size: tuple[float, float]
+    :param point: The point, as fractions of the width and height
+    :type point: tuple[float, float]
+    :return: The point in pixels
+    :rtype: tuple[float, float]
+
+    .. versionadded:: 0.3.1
+    """
+    return size[0] * point[0], size[1] * point[1]
+
+
+class XAImageOperation:
+    """A single deferred image operation.
+
+    Operations come in three kinds:
+
+    - "filter": A CoreImage filter, identified by its name, e.g. "CISepiaTone". Consecutive filters are fused into one CoreImage chain.
+    - "transform": A named geometric transform ("rotate", "scale", or "flip") that consecutive transforms of the same name can be folded into.
+    - "opaque": Any other operation, performed by calling :attr:`function` with the image. Opaque operations are never rewritten.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        kind: Literal["filter", "transform", "opaque"],
+        name: str,
+        parameters: Union[dict[str, Any], None] = None,
+        function: Union[Callable[[Any], Any], None] = None,
+    ):
+        self.kind = kind  #: The kind of operation -- "filter", "transform", or "opaque"
+        self.name = name  #: The CoreImage filter name or transform name
+        self.parameters = parameters or {}  #: The operation's parameters. For filters, these are input keys mapped to values, or to functions that compute the value from the image size
+        self.function = function  #: The function performing an opaque operation
+
+    def resolve_parameters(self, size: tuple[float, float]) -> dict[str, Any]:
+        """Computes the operation's parameter values for an image of the given size.
+
+        :param size: The width and height of the image
+        :type size: tuple[float, float]
+        :return: The parameter values
+        :rtype: dict[str, Any]
+
+        .. versionadded:: 0.3.1
+        """
+        return {
+            key: value(size) if callable(value) else value
+            for key, value in self.parameters.items()
+        }
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, XAImageOperation)
+            and self.kind == other.kind
+            and self.name == other.name
+            and self.parameters == other.parameters
+            and self.function is other.function
+        )
+
+    def __repr__(self):
+        return f"<{type(self)}{self.kind}:{self.name}{self.parameters}>"
+
+
+class XAFusedFilters:
+    """A run of consecutive filter operations that are rendered as a single CoreImage chain.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, operations: list[XAImageOperation]):
+        self.operations = operations  #: The filter operations, in application order
+
+    def __eq__(self, other):
+        return isinstance(other, XAFusedFilters) and self.operations == other.operations
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str([x.name for x in self.operations]) + ">"
+
+
+def _fold(previous: XAImageOperation, current: XAImageOperation) -> Union[XAImageOperation, None, bool]:
+    """Combines two consecutive transforms. Returns the combined operation, None if the two cancel out, or False if they cannot be combined."""
+    if previous.kind != "transform" or current.kind != "transform" or previous.name != current.name:
+        return False
+
+    if current.name == "rotate":
+        if previous.parameters["degrees"] % 90 != 0 or current.parameters["degrees"] % 90 != 0:
+            # Each rotation by other angles enlarges the canvas, so two rotations differ from one combined rotation
+            return False
+        degrees = previous.parameters["degrees"] + current.parameters["degrees"]
+        return XAImageOperation("transform", "rotate", {"degrees": degrees})
+
+    if current.name == "scale":
+        x = previous.parameters["x"] * current.parameters["x"]
+        y = previous.parameters["y"] * current.parameters["y"]
+        return XAImageOperation("transform", "scale", {"x": x, "y": y})
+
+    if current.name == "flip" and previous.parameters["direction"] == current.parameters["direction"]:
+        return None
+    return False
+
+
+def _is_identity(operation: XAImageOperation) -> bool:
+    if operation.kind != "transform":
+        return False
+    if operation.name == "rotate":
+        return operation.parameters["degrees"] % 360 == 0
+    if operation.name == "scale":
+        return operation.parameters["x"] == 1 and operation.parameters["y"] == 1
+    return False
+
+
+def optimize(
+    operations: list[XAImageOperation],
+) -> list[Union[XAImageOperation, XAFusedFilters]]:
+    """Plans the rendering of a sequence of image operations.
+
+    The optimizer folds consecutive rotations by multiples of 90 degrees into one rotation and consecutive scalings into one scaling. It cancels pairs of flips in the same direction and removes transforms that do nothing. It then groups consecutive filters into :class:`XAFusedFilters` stages so that each group is rendered once rather than once per filter.
+
+    :param operations: The operations, in application order
+    :type operations: list[XAImageOperation]
+    :return: The stages to render, in order
+    :rtype: list[Union[XAImageOperation, XAFusedFilters]]
+
+    :Example:
+
+    >>> from PyXA.XAImagePipeline import XAImageOperation, optimize
+    >>> print(optimize([
+    >>>     XAImageOperation("filter", "CIGaussianBlur", {"inputRadius": 10}),
+    >>>     XAImageOperation("filter", "CISepiaTone", {"inputIntensity": 1.0}),
+    >>>     XAImageOperation("transform", "rotate", {"degrees": 90}),
+    >>>     XAImageOperation("transform", "rotate", {"degrees": 270}),
+    >>> ]))
+    [<<class 'PyXA.XAImagePipeline.XAFusedFilters'>['CIGaussianBlur', 'CISepiaTone']>]
+
+    .. versionadded:: 0.3.1
+    """
+    folded: list[XAImageOperation] = []
+    for operation in operations:
+        if len(folded) > 0:
+            combined = _fold(folded[-1], operation)
+            if combined is not False:
+                folded.pop()
+                if combined is not None:
+                    folded.append(combined)
+                continue
+        folded.append(operation)
+
+    stages: list[Union[XAImageOperation, XAFusedFilters]] = []
+    for operation in folded:
+        if _is_identity(operation):
+            continue
+
+        if operation.kind == "filter":
+            if len(stages) > 0 and isinstance(stages[-1], XAFusedFilters):
+                stages[-1].operations.append(operation)
+            else:
+                stages.append(XAFusedFilters([operation]))
+        else:
+            stages.append(operation)
+    return stages
+
+
+class XAImagePipeline:
+    """A recorded sequence of image operations awaiting rendering.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self):
+        self.operations: list[XAImageOperation] = []  #: The recorded operations, in application order
+
+    def add(self, operation: XAImageOperation) -> "XAImagePipeline":
+        """Appends an operation to the pipeline.
+
+        :param operation: The operation to append
+        :type operation: XAImageOperation
+        :return: The pipeline object
+        :rtype: XAImagePipeline
+
+        .. versionadded:: 0.3.1
+        """
+        self.operations.append(operation)
+        return self
+
+    def plan(self) -> list[Union[XAImageOperation, XAFusedFilters]]:
+        """Optimizes the recorded operations into rendering stages. See :func:`optimize`.
+
+        :return: The stages to render, in order
+        :rtype: list[Union[XAImageOperation, XAFusedFilters]]
+
+        .. versionadded:: 0.3.1
+        """
+        return optimize(self.operations)
+
+    def __len__(self):
+        return len(self.operations)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str([x.name for x in self.operations]) + ">"
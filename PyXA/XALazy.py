@@ -0,0 +1,105 @@
+""".. versionadded:: 0.3.1
+
+Utilities for deferring expensive imports until the imported module is first used.
+"""
+
+import importlib
+import subprocess
+import sys
+from types import ModuleType
+from typing import Union
+
+
+class XALazyModule(ModuleType):
+    """A placeholder for a module that is imported the first time one of its attributes is accessed.
+
+    Attributes are copied onto the placeholder as they are accessed, so later lookups cost the same as lookups on the real module.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_xa_module"] = None
+
+    def _xa_load(self) -> ModuleType:
+        module = self.__dict__["_xa_module"]
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_xa_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        value = getattr(self._xa_load(), attr)
+        self.__dict__[attr] = value
+        return value
+
+    def __dir__(self):
+        return dir(self._xa_load())
+
+    def __repr__(self):
+        state = "loaded" if self.__dict__["_xa_module"] is not None else "not loaded"
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> Union[ModuleType, XALazyModule]:
+    """Returns the named module if it has already been imported, or a placeholder that imports it on first use otherwise.
+
+    :param name: The absolute name of the module, e.g. "bs4.element"
+    :type name: str
+    :return: The module or a lazy placeholder for it
+    :rtype: Union[ModuleType, XALazyModule]
+
+    :Example:
+
+    >>> from PyXA.XALazy import lazy_import
+    >>> requests = lazy_import("requests")
+    >>> print(requests)
+    <lazy module 'requests' (not loaded)>
+    >>> response = requests.get("https://www.apple.com")  # requests is imported here
+
+    .. versionadded:: 0.3.1
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return XALazyModule(name)
+
+
+def import_costs(
+    statement: str = "import PyXA", python: Union[str, None] = None
+) -> list[tuple[str, float, float]]:
+    """Measures the time spent importing each module while running the given statement in a fresh interpreter.
+
+    Uses Python's `-X importtime` option, so measurements are not affected by modules already imported in the current process.
+
+    :param statement: The Python statement to measure, defaults to "import PyXA"
+    :type statement: str, optional
+    :param python: The Python executable to run, defaults to the current interpreter
+    :type python: Union[str, None], optional
+    :return: The name, own import time, and cumulative import time in seconds of each imported module, sorted by cumulative time with the most expensive first
+    :rtype: list[tuple[str, float, float]]
+
+    :Example:
+
+    >>> from PyXA.XALazy import import_costs
+    >>> for name, own, cumulative in import_costs()[:3]:
+    >>>     print(f"{name}: {cumulative * 1000:.1f} ms")
+    PyXA: 25.1 ms
+    PyXA.apps: 0.3 ms
+    PyXA.XALazy: 0.2 ms
+
+    .. versionadded:: 0.3.1
+    """
+    process = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+    )
+
+    costs = []
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        costs.append((name.strip(), int(own) / 1e6, int(cumulative) / 1e6))
+    return sorted(costs, key=lambda x: x[2], reverse=True)
@@ -0,0 +1,246 @@
+""".. versionadded:: 0.3.1
+
+Lazy, threaded, and multiprocess strategies for applying a function to each item of a list, as used by :func:`PyXA.XABase.XAList.map`.
+
+Work is divided into chunks of consecutive items so that the cost of scheduling a task is paid once per chunk rather than once per item, and only a bounded number of chunks is in flight at once, so results can be consumed while later chunks are still running. Functions are called with each item and its index.
+"""
+
+import math
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence, Union
+
+from PyXA.XAExecutor import XABoundedExecutor
+
+ERROR_MODES = ("raise", "return", "skip")
+"""The ways of handling an exception raised by the mapped function: raise it, return it in place of the item's result, or leave the item out of the results.
+"""
+
+
+def snapshot(value: Any) -> Any:
+    """Converts a value retrieved from the scripting bridge into a plain, picklable Python value.
+
+    Strings, numbers, and booleans become their base Python types, dates become :class:`datetime` objects, and arrays and dictionaries are converted recursively. Other values are returned unchanged.
+
+    :param value: The value to convert
+    :type value: Any
+    :return: The converted value
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if value is None or type(value) in (str, int, float, bool, bytes, datetime):
+        return value
+    if isinstance(value, bool):
+        return bool(value)
+    if isinstance(value, str):
+        return str(value)
+    if isinstance(value, int):
+        return int(value)
+    if isinstance(value, float):
+        return float(value)
+    if hasattr(value, "timeIntervalSince1970"):
+        # NSDate
+        return datetime.fromtimestamp(value.timeIntervalSince1970())
+    if hasattr(value, "items"):
+        return {snapshot(key): snapshot(x) for key, x in value.items()}
+    if isinstance(value, (list, tuple)) or hasattr(value, "count") and hasattr(value, "objectAtIndex_"):
+        return [snapshot(x) for x in value]
+    return value
+
+
+def snapshot_rows(columns: dict[str, list[Any]]) -> list[dict[str, Any]]:
+    """Converts columns of property values, such as those returned by :func:`PyXA.XABase.XAList.fetch`, into one dictionary of plain values per element.
+
+    :param columns: A dictionary mapping property names to the list of values of that property
+    :type columns: dict[str, list[Any]]
+    :return: A dictionary of property values for each element, in list order
+    :rtype: list[dict[str, Any]]
+
+    .. versionadded:: 0.3.1
+    """
+    names = list(columns)
+    converted = [[snapshot(x) for x in columns[name]] for name in names]
+    return [dict(zip(names, values)) for values in zip(*converted)]
+
+
+def iter_map(
+    function: Callable[[Any, int], Any],
+    items: Iterable[Any],
+    errors: Literal["raise", "return", "skip"] = "raise",
+) -> Iterator[Any]:
+    """Applies a function to each item on the calling thread, producing each result only when it is requested.
+
+    :param function: The function to call with each item and its index
+    :type function: Callable[[Any, int], Any]
+    :param items: The items to process
+    :type items: Iterable[Any]
+    :param errors: How to handle exceptions raised by the function, see :attr:`ERROR_MODES`, defaults to "raise"
+    :type errors: Literal["raise", "return", "skip"], optional
+    :yield: The result for each item, in item order
+    :rtype: Iterator[Any]
+
+    .. versionadded:: 0.3.1
+    """
+    _check_errors(errors)
+    for index, item in enumerate(items):
+        if errors == "raise":
+            yield function(item, index)
+            continue
+
+        try:
+            result = function(item, index)
+        except Exception as e:
+            if errors == "return":
+                yield e
+        else:
+            yield result
+
+
+def thread_map(
+    function: Callable[[Any, int], Any],
+    items: Sequence[Any],
+    chunk_size: Union[int, None] = None,
+    executor: Union[XABoundedExecutor, None] = None,
+    ordered: bool = True,
+    errors: Literal["raise", "return", "skip"] = "raise",
+) -> Iterator[Any]:
+    """Applies a function to chunks of items on worker threads. Best suited to functions that spend most of their time waiting, e.g. on Apple Events or network requests, since only one thread runs Python code at a time.
+
+    :param function: The function to call with each item and its index
+    :type function: Callable[[Any, int], Any]
+    :param items: The items to process
+    :type items: Sequence[Any]
+    :param chunk_size: The number of consecutive items processed by each task, defaults to dividing the items into four chunks per worker
+    :type chunk_size: Union[int, None], optional
+    :param executor: The executor to run the chunks on, defaults to the shared :class:`PyXA.XAExecutor.XABoundedExecutor`
+    :type executor: Union[XABoundedExecutor, None], optional
+    :param ordered: Whether to produce results in item order rather than as each chunk finishes, defaults to True
+    :type ordered: bool, optional
+    :param errors: How to handle exceptions raised by the function, see :attr:`ERROR_MODES`, defaults to "raise"
+    :type errors: Literal["raise", "return", "skip"], optional
+    :yield: The result for each item
+    :rtype: Iterator[Any]
+
+    .. versionadded:: 0.3.1
+    """
+    _check_errors(errors)
+    executor = executor or XABoundedExecutor.shared()
+    chunk_size = chunk_size or _default_chunk_size(len(items), executor.max_workers)
+    window = executor.max_pending
+
+    def submit(start: int) -> Future:
+        return executor.submit(_run_chunk, function, start, items[start : start + chunk_size], errors)
+
+    yield from _run_chunks(submit, range(0, len(items), chunk_size), window, ordered, errors)
+
+
+def process_map(
+    function: Callable[[Any, int], Any],
+    items: Sequence[Any],
+    chunk_size: Union[int, None] = None,
+    max_workers: Union[int, None] = None,
+    ordered: bool = True,
+    errors: Literal["raise", "return", "skip"] = "raise",
+) -> Iterator[Any]:
+    """Applies a function to chunks of items in worker processes. Best suited to CPU-bound functions.
+
+    The function, the items, and the results must be picklable, so the function must be defined at the top level of a module and the items should be plain data, such as the rows returned by :func:`snapshot_rows`.
+
+    :param function: The function to call with each item and its index
+    :type function: Callable[[Any, int], Any]
+    :param items: The items to process
+    :type items: Sequence[Any]
+    :param chunk_size: The number of consecutive items processed by each task, defaults to dividing the items into four chunks per worker
+    :type chunk_size: Union[int, None], optional
+    :param max_workers: The number of worker processes, defaults to the number of CPUs
+    :type max_workers: Union[int, None], optional
+    :param ordered: Whether to produce results in item order rather than as each chunk finishes, defaults to True
+    :type ordered: bool, optional
+    :param errors: How to handle exceptions raised by the function, see :attr:`ERROR_MODES`, defaults to "raise"
+    :type errors: Literal["raise", "return", "skip"], optional
+    :yield: The result for each item
+    :rtype: Iterator[Any]
+
+    .. versionadded:: 0.3.1
+    """
+    _check_errors(errors)
+    if len(items) == 0:
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    chunk_size = chunk_size or _default_chunk_size(len(items), max_workers)
+    num_chunks = math.ceil(len(items) / chunk_size)
+    pool = ProcessPoolExecutor(max_workers=min(max_workers, num_chunks))
+
+    def submit(start: int) -> Future:
+        return pool.submit(_run_chunk, function, start, items[start : start + chunk_size], errors)
+
+    try:
+        yield from _run_chunks(submit, range(0, len(items), chunk_size), max_workers * 2, ordered, errors)
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _check_errors(errors: str):
+    if errors not in ERROR_MODES:
+        raise ValueError(f"Invalid error mode: {errors}")
+
+
+def _default_chunk_size(num_items: int, num_workers: int) -> int:
+    return max(1, math.ceil(num_items / (num_workers * 4)))
+
+
+def _run_chunk(
+    function: Callable[[Any, int], Any], start: int, chunk: Sequence[Any], errors: str
+) -> tuple[list[Any], list[int]]:
+    # Returns the chunk's results along with the offsets of the results that are exceptions raised by the function
+    if errors == "raise":
+        return [function(item, start + offset) for offset, item in enumerate(chunk)], []
+
+    results, failures = [], []
+    for offset, item in enumerate(chunk):
+        try:
+            results.append(function(item, start + offset))
+        except Exception as e:
+            results.append(e)
+            failures.append(offset)
+    return results, failures
+
+
+def _run_chunks(
+    submit: Callable[[int], Future],
+    starts: Iterable[int],
+    window: int,
+    ordered: bool,
+    errors: str,
+) -> Iterator[Any]:
+    pending = deque()
+
+    def finish_one() -> Iterator[Any]:
+        if ordered:
+            future = pending.popleft()
+        else:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            future = next(iter(done))
+            pending.remove(future)
+
+        results, failures = future.result()
+        if errors == "skip" and len(failures) > 0:
+            failed = set(failures)
+            results = [x for offset, x in enumerate(results) if offset not in failed]
+        yield from results
+
+    try:
+        for start in starts:
+            pending.append(submit(start))
+            while len(pending) >= window:
+                yield from finish_one()
+        while len(pending) > 0:
+            yield from finish_one()
+    finally:
+        # Stop chunks that have not started if the results are abandoned or a chunk fails
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,479 @@
+""".. versionadded:: 0.3.1
+
+A pure-Python predicate engine for filtering already-materialized data.
+
+Lists of plain data, such as dictionaries, strings, and numbers, do not need to be bridged to Objective-C and filtered by an NSPredicate. The functions in this module compile :class:`PyXA.XABase.XAPredicate` conditions and NSPredicate-style format strings into native Python functions that can filter such lists directly.
+"""
+
+import re
+import unicodedata
+from collections.abc import Mapping
+from datetime import date
+from functools import lru_cache
+from typing import Any, Callable, Iterable
+
+from PyXA.XAErrors import InvalidPredicateError
+
+PYTHON_DATA_TYPES = (Mapping, str, bytes, int, float, date, tuple, list)
+"""Element types that the pure-Python predicate engine can filter directly.
+"""
+
+
+def is_python_data(elements: Iterable[Any]) -> bool:
+    """Determines whether a list holds plain data that can be filtered without bridging to an NSPredicate.
+
+    Only the first element is checked, since lists wrapped by PyXA are homogeneous.
+
+    :param elements: The list to check
+    :type elements: Iterable[Any]
+    :return: True if the list is non-empty and holds plain data
+    :rtype: bool
+
+    .. versionadded:: 0.3.1
+    """
+    try:
+        if len(elements) == 0:
+            return False
+        first = elements[0]
+    except (TypeError, IndexError, KeyError):
+        return False
+    return isinstance(first, PYTHON_DATA_TYPES)
+
+
+def filter_items(
+    elements: Iterable[Any], predicate: Callable[[Any], bool]
+) -> list[Any]:
+    """Filters a list using a compiled predicate function.
+
+    :param elements: The list to filter
+    :type elements: Iterable[Any]
+    :param predicate: A function returned by :func:`compile_conditions` or :func:`compile_format`
+    :type predicate: Callable[[Any], bool]
+    :return: The elements for which the predicate is true, in their original order
+    :rtype: list[Any]
+
+    .. versionadded:: 0.3.1
+    """
+    return [x for x in elements if predicate(x)]
+
+
+############################
+### Values and Key Paths ###
+############################
+def _get_value(obj: Any, key: str) -> Any:
+    if isinstance(obj, Mapping):
+        return obj.get(key)
+    return getattr(obj, key, None)
+
+
+def _key_path_getter(key_path: str) -> Callable[[Any], Any]:
+    parts = key_path.split(".")
+    if parts[0].upper() == "SELF":
+        parts = parts[1:]
+
+    if len(parts) == 0:
+        return lambda obj: obj
+
+    if len(parts) == 1:
+        key = parts[0]
+        return lambda obj: _get_value(obj, key)
+
+    def get_path(obj):
+        for part in parts:
+            if obj is None:
+                return None
+            obj = _get_value(obj, part)
+        return obj
+
+    return get_path
+
+
+def _normalizer(options: str) -> Callable[[Any], Any]:
+    """Returns a function applying the [c] (case-insensitive) and [d] (diacritic-insensitive) options to string values."""
+    if options == "":
+        return lambda value: value
+
+    def normalize(value):
+        if not isinstance(value, str):
+            return value
+        if "d" in options:
+            value = "".join(
+                c
+                for c in unicodedata.normalize("NFD", value)
+                if not unicodedata.combining(c)
+            )
+        if "c" in options:
+            value = value.casefold()
+        return value
+
+    return normalize
+
+
+###################
+### Comparisons ###
+###################
+def _ordered(compare: Callable[[Any, Any], bool]) -> Callable[[Any, Any], bool]:
+    def safe_compare(lhs, rhs):
+        if lhs is None or rhs is None:
+            return False
+        try:
+            return compare(lhs, rhs)
+        except TypeError:
+            return False
+
+    return safe_compare
+
+
+def _between(lhs, bounds):
+    if lhs is None or bounds is None or len(bounds) != 2:
+        return False
+    try:
+        return bounds[0] <= lhs <= bounds[1]
+    except TypeError:
+        return False
+
+
+def _begins_with(lhs, rhs):
+    return isinstance(lhs, str) and isinstance(rhs, str) and lhs.startswith(rhs)
+
+
+def _ends_with(lhs, rhs):
+    return isinstance(lhs, str) and isinstance(rhs, str) and lhs.endswith(rhs)
+
+
+def _contains(lhs, rhs):
+    if lhs is None or rhs is None:
+        return False
+    if isinstance(lhs, str):
+        return isinstance(rhs, str) and rhs in lhs
+    try:
+        return rhs in lhs
+    except TypeError:
+        return False
+
+
+def _in(lhs, rhs):
+    return _contains(rhs, lhs)
+
+
+@lru_cache(maxsize=256)
+def _compile_regex(pattern: str, flags: int) -> re.Pattern:
+    return re.compile(pattern, flags)
+
+
+def _matches(lhs, rhs, flags=0):
+    if not isinstance(lhs, str) or not isinstance(rhs, str):
+        return False
+    return _compile_regex(rhs, flags).fullmatch(lhs) is not None
+
+
+def _like(lhs, rhs, flags=0):
+    if not isinstance(lhs, str) or not isinstance(rhs, str):
+        return False
+    pattern = re.escape(rhs).replace(r"\*", ".*").replace(r"\?", ".")
+    return _compile_regex(pattern, flags | re.DOTALL).fullmatch(lhs) is not None
+
+
+_COMPARISONS = {
+    "==": lambda lhs, rhs: lhs == rhs,
+    "!=": lambda lhs, rhs: lhs != rhs,
+    ">": _ordered(lambda lhs, rhs: lhs > rhs),
+    "<": _ordered(lambda lhs, rhs: lhs < rhs),
+    ">=": _ordered(lambda lhs, rhs: lhs >= rhs),
+    "<=": _ordered(lambda lhs, rhs: lhs <= rhs),
+    "BETWEEN": _between,
+    "BEGINSWITH": _begins_with,
+    "ENDSWITH": _ends_with,
+    "CONTAINS": _contains,
+    "IN": _in,
+    "MATCHES": _matches,
+    "LIKE": _like,
+}
+
+_OPERATOR_ALIASES = {
+    "=": "==",
+    "<>": "!=",
+    "=>": ">=",
+    "=<": "<=",
+}
+
+
+def _comparison(operator: str, options: str = "") -> Callable[[Any, Any], bool]:
+    operator = _OPERATOR_ALIASES.get(operator, operator.upper())
+    compare = _COMPARISONS.get(operator)
+    if compare is None:
+        raise InvalidPredicateError(f"Unsupported operator '{operator}'.")
+
+    if operator in ("MATCHES", "LIKE"):
+        # Case-insensitivity is handled by the regular expression itself
+        flags = re.IGNORECASE if "c" in options else 0
+        options = options.replace("c", "")
+        regex_compare = compare
+        compare = lambda lhs, rhs: regex_compare(lhs, rhs, flags)
+
+    if options == "":
+        return compare
+
+    normalize = _normalizer(options)
+
+    def compare_normalized(lhs, rhs):
+        if isinstance(rhs, (list, tuple)):
+            rhs = [normalize(x) for x in rhs]
+        return compare(normalize(lhs), normalize(rhs))
+
+    return compare_normalized
+
+
+def compile_conditions(
+    keys: list[str], operators: list[str], values: list[Any]
+) -> Callable[[Any], bool]:
+    """Compiles a list of conditions, joined by AND, into a predicate function.
+
+    The conditions use the same form as those held by :class:`PyXA.XABase.XAPredicate`, i.e. a key path, an operator such as `==` or `BEGINSWITH`, and a value to compare against.
+
+    :param keys: The key path of each condition
+    :type keys: list[str]
+    :param operators: The comparison operator of each condition
+    :type operators: list[str]
+    :param values: The value to compare against in each condition
+    :type values: list[Any]
+    :raises InvalidPredicateError: Raised when a condition uses an unsupported operator
+    :return: A function that returns True for elements satisfying every condition
+    :rtype: Callable[[Any], bool]
+
+    :Example:
+
+    >>> from PyXA.XAPredicates import compile_conditions, filter_items
+    >>> items = [{"name": "Example", "size": 10}, {"name": "Other", "size": 20}]
+    >>> predicate = compile_conditions(["name", "size"], ["BEGINSWITH", ">"], ["Ex", 5])
+    >>> print(filter_items(items, predicate))
+    [{'name': 'Example', 'size': 10}]
+
+    .. versionadded:: 0.3.1
+    """
+    tests = [
+        (_key_path_getter(key), _comparison(operator), value)
+        for key, operator, value in zip(keys, operators, values)
+    ]
+
+    if len(tests) == 1:
+        getter, compare, value = tests[0]
+        return lambda obj: compare(getter(obj), value)
+
+    return lambda obj: all(compare(getter(obj), value) for getter, compare, value in tests)
+
+
+######################
+### Format Strings ###
+######################
+_TOKEN_PATTERN = re.compile(
+    r"""
+    \s*(?:
+        (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)
+      | (?P<placeholder>%@|%K|%d|%i|%f|%ld|%lu)
+      | (?P<operator>==|=>|=<|>=|<=|!=|<>|&&|\|\||=|>|<|!)
+      | (?P<punctuation>[(){},])
+      | (?P<options>\[(?:c|d|cd|dc)\])
+      | (?P<word>[$@A-Za-z_][\w.$@]*)
+    )
+    """,
+    re.VERBOSE,
+)
+
+_KEYWORD_OPERATORS = {
+    "BETWEEN",
+    "BEGINSWITH",
+    "ENDSWITH",
+    "CONTAINS",
+    "MATCHES",
+    "LIKE",
+    "IN",
+}
+
+_LITERALS = {
+    "TRUE": True,
+    "YES": True,
+    "FALSE": False,
+    "NO": False,
+    "NIL": None,
+    "NULL": None,
+}
+
+_UNSUPPORTED = {"ANY", "ALL", "SOME", "NONE", "SUBQUERY", "FUNCTION"}
+
+
+def _tokenize(fmt: str) -> list[tuple[str, str]]:
+    tokens = []
+    position = 0
+    fmt = fmt.rstrip()
+    while position < len(fmt):
+        match = _TOKEN_PATTERN.match(fmt, position)
+        if match is None or match.end() == position:
+            raise InvalidPredicateError(f"Unexpected character at position {position} of '{fmt}'.")
+        position = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _FormatParser:
+    """A recursive-descent parser producing predicate functions from NSPredicate-style format strings."""
+
+    def __init__(self, fmt: str, parameters: tuple):
+        self.tokens = _tokenize(fmt)
+        self.parameters = list(parameters)
+        self.position = 0
+
+    def parse(self) -> Callable[[Any], bool]:
+        predicate = self.__or()
+        if self.position != len(self.tokens):
+            raise InvalidPredicateError(f"Unexpected token '{self.__peek()[1]}'.")
+        return predicate
+
+    def __peek(self) -> tuple[str, str]:
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return ("end", "")
+
+    def __next(self) -> tuple[str, str]:
+        token = self.__peek()
+        if token[0] == "end":
+            raise InvalidPredicateError("Unexpected end of format string.")
+        self.position += 1
+        return token
+
+    def __is_word(self, *words: str) -> bool:
+        kind, value = self.__peek()
+        return kind == "word" and value.upper() in words
+
+    def __or(self) -> Callable[[Any], bool]:
+        terms = [self.__and()]
+        while self.__is_word("OR") or self.__peek() == ("operator", "||"):
+            self.__next()
+            terms.append(self.__and())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda obj: any(term(obj) for term in terms)
+
+    def __and(self) -> Callable[[Any], bool]:
+        terms = [self.__not()]
+        while self.__is_word("AND") or self.__peek() == ("operator", "&&"):
+            self.__next()
+            terms.append(self.__not())
+        if len(terms) == 1:
+            return terms[0]
+        return lambda obj: all(term(obj) for term in terms)
+
+    def __not(self) -> Callable[[Any], bool]:
+        if self.__is_word("NOT") or self.__peek() == ("operator", "!"):
+            self.__next()
+            term = self.__not()
+            return lambda obj: not term(obj)
+        return self.__primary()
+
+    def __primary(self) -> Callable[[Any], bool]:
+        if self.__peek() == ("punctuation", "("):
+            self.__next()
+            predicate = self.__or()
+            if self.__next() != ("punctuation", ")"):
+                raise InvalidPredicateError("Expected ')'.")
+            return predicate
+
+        if self.__is_word("TRUEPREDICATE"):
+            self.__next()
+            return lambda obj: True
+
+        if self.__is_word("FALSEPREDICATE"):
+            self.__next()
+            return lambda obj: False
+
+        lhs = self.__operand()
+
+        kind, value = self.__next()
+        if kind == "operator" and value not in ("&&", "||", "!"):
+            operator = value
+        elif kind == "word" and value.upper() in _KEYWORD_OPERATORS:
+            operator = value.upper()
+        else:
+            raise InvalidPredicateError(f"Expected a comparison operator, got '{value}'.")
+
+        options = ""
+        if self.__peek()[0] == "options":
+            options = self.__next()[1][1:-1]
+
+        rhs = self.__operand()
+        compare = _comparison(operator, options)
+        return lambda obj: compare(lhs(obj), rhs(obj))
+
+    def __operand(self) -> Callable[[Any], Any]:
+        kind, value = self.__next()
+
+        if kind == "string":
+            text = re.sub(r"\\(.)", r"\1", value[1:-1])
+            return lambda obj: text
+
+        if kind == "number":
+            number = float(value) if any(c in value for c in ".eE") else int(value)
+            return lambda obj: number
+
+        if kind == "placeholder":
+            if len(self.parameters) == 0:
+                raise InvalidPredicateError("Not enough parameters for format string.")
+            parameter = self.parameters.pop(0)
+            if value == "%K":
+                return _key_path_getter(str(parameter))
+            return lambda obj: parameter
+
+        if kind == "punctuation" and value == "{":
+            items = []
+            while self.__peek() != ("punctuation", "}"):
+                items.append(self.__operand())
+                if self.__peek() == ("punctuation", ","):
+                    self.__next()
+            self.__next()
+            return lambda obj: [item(obj) for item in items]
+
+        if kind == "word":
+            upper = value.upper()
+            if upper in _LITERALS:
+                literal = _LITERALS[upper]
+                return lambda obj: literal
+            if upper in _UNSUPPORTED or value.startswith("$") or value.startswith("@"):
+                raise InvalidPredicateError(f"Unsupported expression '{value}'.")
+            return _key_path_getter(value)
+
+        raise InvalidPredicateError(f"Unexpected token '{value}'.")
+
+
+@lru_cache(maxsize=256)
+def _compile_format_cached(fmt: str) -> Callable[[Any], bool]:
+    return _FormatParser(fmt, ()).parse()
+
+
+def compile_format(fmt: str, *parameters: Any) -> Callable[[Any], bool]:
+    """Compiles an NSPredicate-style format string into a predicate function.
+
+    Supports comparisons using `==`, `!=`, `>`, `<`, `>=`, `<=`, `BETWEEN`, `BEGINSWITH`, `ENDSWITH`, `CONTAINS`, `IN`, `MATCHES`, and `LIKE`, including the `[c]` and `[d]` options; compound predicates using `AND`, `OR`, and `NOT`; key paths, `SELF`, and `%@` and `%K` placeholders. Aggregate operations such as `ANY` and `SUBQUERY` are not supported.
+
+    :param fmt: The format string
+    :type fmt: str
+    :param parameters: Values to substitute for placeholders in the format string
+    :type parameters: Any
+    :raises InvalidPredicateError: Raised when the format string cannot be compiled
+    :return: A function that returns True for elements satisfying the predicate
+    :rtype: Callable[[Any], bool]
+
+    :Example:
+
+    >>> from PyXA.XAPredicates import compile_format, filter_items
+    >>> items = [{"name": "Example", "size": 10}, {"name": "Other", "size": 20}]
+    >>> predicate = compile_format("name BEGINSWITH[c] 'ex' OR size > %@", 15)
+    >>> print(len(filter_items(items, predicate)))
+    2
+
+    .. versionadded:: 0.3.1
+    """
+    if len(parameters) == 0:
+        return _compile_format_cached(fmt)
+    return _FormatParser(fmt, parameters).parse()
@@ -0,0 +1,90 @@
+""".. versionadded:: 0.3.1
+
+Hash indexes mapping the values of one property of a list's elements to the elements' positions, used by :func:`PyXA.XABase.XAList.build_index` to look elements up by property value without filtering the whole list.
+"""
+
+from typing import Any, Iterable, Union
+
+_PLAIN_TYPES = (str, int, float)
+
+
+class XAPropertyIndex:
+    """Maps each value of a property to the position of the first element with that value.
+
+    Values that cannot be hashed are left out of the index. In that case the index is incomplete, and a value not found in it may still belong to an element.
+
+    The index holds the raw values provided by the scripting bridge, such as NSDate objects and enum codes, which are not equal to their Python counterparts. A value not found in the index is therefore only known to be absent if it is a plain string or number; see :func:`excludes`.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ("property", "complete", "__positions")
+
+    def __init__(self, property: str, values: Iterable[Any]):
+        """Builds an index of a column of property values.
+
+        :param property: The name of the indexed property
+        :type property: str
+        :param values: The property value of each element, in list order
+        :type values: Iterable[Any]
+
+        .. versionadded:: 0.3.1
+        """
+        self.property = property  #: The name of the indexed property
+        self.complete = True  #: Whether every value was added to the index
+        self.__positions: dict[Any, int] = {}
+
+        positions = self.__positions
+        for position, value in enumerate(values):
+            try:
+                positions.setdefault(value, position)
+            except TypeError:
+                self.complete = False
+
+    def position(self, value: Any) -> Union[int, None]:
+        """Finds the position of the first element with the given value.
+
+        :param value: The value to look up
+        :type value: Any
+        :return: The element's position, or None if no indexed element has the value
+        :rtype: Union[int, None]
+
+        .. versionadded:: 0.3.1
+        """
+        try:
+            return self.__positions.get(value)
+        except TypeError:
+            return None
+
+    def excludes(self, value: Any) -> bool:
+        """Whether the value is known not to belong to any element, without filtering the list. This holds for plain strings and numbers missing from a complete index; other values, such as dates and enum members, may equal an indexed value of another type.
+
+        :param value: The value to look up
+        :type value: Any
+        :return: True if no element has the value
+        :rtype: bool
+
+        .. versionadded:: 0.3.1
+        """
+        return self.complete and type(value) in _PLAIN_TYPES and self.position(value) is None
+
+    def positions(self, values: Iterable[Any]) -> list[Union[int, None]]:
+        """Finds the position of the first element with each of the given values.
+
+        :param values: The values to look up
+        :type values: Iterable[Any]
+        :return: The position for each value, or None for values that no indexed element has
+        :rtype: list[Union[int, None]]
+
+        .. versionadded:: 0.3.1
+        """
+        return [self.position(value) for value in values]
+
+    def __len__(self):
+        return len(self.__positions)
+
+    def __contains__(self, value: Any):
+        return self.position(value) is not None
+
+    def __repr__(self):
+        return f"<{type(self)}{self.property}, {len(self)} values>"
@@ -0,0 +1,151 @@
+""".. versionadded:: 0.3.1
+
+Bookkeeping for the results of a running metadata query, as used by :class:`PyXA.XABase.XASpotlight`.
+
+A query appends results to its result array as it gathers them, so only the results added since the previous read are converted. Once gathering finishes, a live query reports added, removed, and changed results through update notifications, which are applied to the same results.
+"""
+
+from typing import Any, Callable, Iterable, Union
+
+
+def query_key(query: tuple[Any, ...], predicate: Union[str, None]) -> Union[tuple, None]:
+    """Identifies the search a query's terms and predicate describe, so that its results can be reused until either changes.
+
+    :param query: The query terms
+    :type query: tuple[Any, ...]
+    :param predicate: The predicate format, which takes precedence over the terms, or None
+    :type predicate: Union[str, None]
+    :return: The key of the search, or None if there is nothing to search for
+    :rtype: Union[tuple, None]
+
+    .. versionadded:: 0.3.1
+    """
+    if predicate is not None:
+        return ((), predicate)
+    if len(query) == 0:
+        return None
+    return (tuple(query), None)
+
+
+class XAQueryResults:
+    """The results of a metadata query, mapped from the query's items to values such as paths.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ("convert", "gathered", "__values", "__count", "__results")
+
+    def __init__(self, convert: Callable[[Any], Any]):
+        """Creates an empty set of results.
+
+        :param convert: The function that converts a query item into a result, e.g. by reading its path attribute
+        :type convert: Callable[[Any], Any]
+
+        .. versionadded:: 0.3.1
+        """
+        self.convert = convert  #: The function that converts a query item into a result
+        self.gathered: list[Any] = []  #: The results found while gathering, in the order they were found
+        self.__values: dict[Any, Any] = {}
+        self.__count = 0
+        self.__results = None
+
+    @property
+    def results(self) -> list[Any]:
+        """The current results, including changes reported by updates."""
+        if self.__results is None:
+            self.__results = list(self.__values.values())
+        return self.__results
+
+    def gather(self, query: Any) -> list[Any]:
+        """Reads the results the query has added to its result array since the previous read. The query's updates are paused while reading.
+
+        :param query: The query, e.g. an NSMetadataQuery
+        :type query: Any
+        :return: The new results
+        :rtype: list[Any]
+
+        .. versionadded:: 0.3.1
+        """
+        added = []
+        query.disableUpdates()
+        try:
+            count = query.resultCount()
+            for index in range(self.__count, count):
+                item = query.resultAtIndex_(index)
+                if item not in self.__values:
+                    value = self.convert(item)
+                    self.__values[item] = value
+                    added.append(value)
+            self.__count = count
+        finally:
+            query.enableUpdates()
+
+        self.__add(added)
+        return added
+
+    def extend(self, items: Iterable[Any]):
+        """Adds results that were found without a query, such as those from a local index.
+
+        :param items: The items to convert and add
+        :type items: Iterable[Any]
+
+        .. versionadded:: 0.3.1
+        """
+        added = []
+        for item in items:
+            if item not in self.__values:
+                value = self.convert(item)
+                self.__values[item] = value
+                added.append(value)
+        self.__add(added)
+
+    def update(
+        self,
+        added: Iterable[Any],
+        removed: Iterable[Any],
+        changed: Iterable[Any],
+        count: int,
+    ) -> tuple[list[Any], list[Any], list[Any]]:
+        """Applies a live query's update notification to the results.
+
+        :param added: The items that now match the query
+        :type added: Iterable[Any]
+        :param removed: The items that no longer match the query
+        :type removed: Iterable[Any]
+        :param changed: The items whose attributes changed, e.g. because they were renamed or moved
+        :type changed: Iterable[Any]
+        :param count: The number of results the query reports after the update
+        :type count: int
+        :return: The added, removed, and changed results
+        :rtype: tuple[list[Any], list[Any], list[Any]]
+
+        .. versionadded:: 0.3.1
+        """
+        values = self.__values
+        added_values, removed_values, changed_values = [], [], []
+        for item in added:
+            if item not in values:
+                values[item] = self.convert(item)
+                added_values.append(values[item])
+        for item in removed:
+            value = values.pop(item, None)
+            removed_values.append(value if value is not None else self.convert(item))
+        for item in changed:
+            values[item] = self.convert(item)
+            changed_values.append(values[item])
+
+        # Later gathering reads start after the items the update already covered
+        self.__count = count
+        self.__results = None
+        return added_values, removed_values, changed_values
+
+    def __add(self, added: list[Any]):
+        if len(added) > 0:
+            self.gathered.extend(added)
+            self.__results = None
+
+    def __len__(self):
+        return len(self.__values)
+
+    def __repr__(self):
+        return f"<{type(self)}{len(self)} results>"
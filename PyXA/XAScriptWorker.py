@@ -0,0 +1,111 @@
+""".. versionadded:: 0.3.1
+
+The worker program run by each process of an :class:`PyXA.XAScripting.AppleScriptPool`.
+
+Workers read requests from standard input and write responses to standard output, one JSON message per line (see :func:`PyXA.XAScripting.encode_message`). A request has the form ``{"script": source, "args": arguments}``. A successful response has the form ``{"result": {...}}``, with the same keys as the result of :func:`PyXA.XABase.AppleScript.run` except `event`, and a failed response has the form ``{"error": {"number": number, "message": message}}``. Requests are handled one at a time, in order.
+
+Any program that follows this protocol can be used as a worker.
+"""
+
+import sys
+from datetime import datetime
+from typing import Any, BinaryIO, Callable, Union
+
+from PyXA.XAErrors import AppleScriptError
+from PyXA.XAEvents import XAScriptResult
+from PyXA.XAScripting import (
+    XADescriptorFactory,
+    XAScriptCache,
+    compile_applescript,
+    decode_message,
+    encode_message,
+    has_run_handler,
+    run_event,
+)
+
+
+def serve(
+    execute: Callable[[str, Any], dict],
+    requests: Union[BinaryIO, None] = None,
+    responses: Union[BinaryIO, None] = None,
+):
+    """Handles requests until the input is closed.
+
+    Standard output is redirected to standard error while requests are handled, so output printed by scripts or libraries cannot corrupt the responses.
+
+    :param execute: The function that runs a script with its arguments and returns the result dictionary, raising an exception if the script fails
+    :type execute: Callable[[str, Any], dict]
+    :param requests: The stream to read requests from, defaults to standard input
+    :type requests: Union[BinaryIO, None], optional
+    :param responses: The stream to write responses to, defaults to standard output
+    :type responses: Union[BinaryIO, None], optional
+
+    .. versionadded:: 0.3.1
+    """
+    requests = requests or sys.stdin.buffer
+    responses = responses or sys.stdout.buffer
+    sys.stdout = sys.stderr
+
+    for line in requests:
+        if not line.strip():
+            continue
+
+        try:
+            request = decode_message(line)
+            response = {"result": execute(request["script"], request.get("args"))}
+        except Exception as e:
+            # AppleScriptError provides the error number and message of the script
+            message = getattr(e, "message", None) or f"{type(e).__name__}: {e}"
+            response = {"error": {"number": getattr(e, "number", None), "message": message}}
+
+        responses.write(encode_message(response))
+        responses.flush()
+
+
+def execute_applescript(source: str, args: Any, cache: Union[XAScriptCache, None] = None) -> dict:
+    """Runs AppleScript source code in the current process, passing the arguments to its run handler.
+
+    :param source: The source code
+    :type source: str
+    :param args: The arguments of the run handler
+    :type args: Any
+    :param cache: The cache of compiled scripts, defaults to a cache shared by every call
+    :type cache: Union[XAScriptCache, None], optional
+    :raises AppleScriptError: The script could not be compiled or raised an error
+    :return: The result of the script
+    :rtype: dict
+
+    .. versionadded:: 0.3.1
+    """
+    with (cache or _cache).checkout(source) as script:
+        if has_run_handler(source):
+            result, error = script.executeAppleEvent_error_(run_event(args, _descriptors), None)
+        else:
+            result, error = script.executeAndReturnError_(None)
+    if error is not None:
+        raise AppleScriptError(error, source)
+
+    result = XAScriptResult(result)
+    date = result["date"]
+    file_url = result["file_url"]
+    data = result["data"]
+    return {
+        "string": result["string"],
+        "int": result["int"],
+        "bool": result["bool"],
+        "float": result["float"],
+        # Local time without a timezone, like the dates decoded into the value
+        "date": datetime.fromtimestamp(date.timeIntervalSince1970()) if date is not None else None,
+        "file_url": str(file_url.path()) if file_url is not None else None,
+        "type_code": result["type_code"],
+        "data": bytes(data) if data is not None else None,
+        "value": result["value"],
+    }
+
+
+_cache = XAScriptCache(compile_applescript)
+_descriptors = XADescriptorFactory()
+
+
+if __name__ == "__main__":
+    serve(execute_applescript)
@@ -0,0 +1,670 @@
+""".. versionadded:: 0.3.1
+
+Support for running AppleScripts efficiently: a cache of compiled scripts, the conversion of Python arguments into Apple Event descriptors passed to a script's run handler, and a pool of worker processes that run scripts in parallel.
+
+The cache and the argument conversion do not depend on a particular compiler or descriptor implementation, so they can be used with the AppleScript components of the system or with stand-ins. Likewise, the pool can run any worker program that speaks its protocol; see :mod:`PyXA.XAScriptWorker`.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Any, Callable, Iterator, Union
+
+from PyXA.XAErrors import AppleScriptError, ScriptWorkerError
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XALazy import lazy_import
+
+AppKit = lazy_import("AppKit")
+
+
+def _four_char_code(code: str) -> int:
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+kCoreEventClass = _four_char_code("aevt")
+kAEOpenApplication = _four_char_code("oapp")
+keyDirectObject = _four_char_code("----")
+keyASUserRecordFields = _four_char_code("usrf")
+kAutoGenerateReturnID = -1
+kAnyTransactionID = 0
+
+
+class XAScriptCache:
+    """A thread-safe least-recently-used cache of compiled scripts, keyed by the hash of their source code.
+
+    Every use of a source shares one compiled script, so the values a script assigns to its properties and globals persist between runs until the script is evicted or the cache is cleared. Use :func:`checkout` to run a script without other threads running it at the same time.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(self, compiler: Callable[[str], Any], max_size: int = 128):
+        """Creates a new script cache.
+
+        :param compiler: The function that compiles source code into a runnable script, raising an exception if the source cannot be compiled
+        :type compiler: Callable[[str], Any]
+        :param max_size: The maximum number of compiled scripts to keep, defaults to 128
+        :type max_size: int, optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.compiler = compiler  #: The function used to compile source code
+        self.max_size = max_size  #: The maximum number of compiled scripts to keep
+
+        self.__lock = threading.Lock()
+        self.__scripts: OrderedDict[str, tuple[Any, threading.Lock]] = OrderedDict()
+        self.__stats = {"hits": 0, "misses": 0, "compile_time": 0.0}
+
+    def get(self, source: str) -> Any:
+        """Retrieves the compiled form of the source code, compiling it if it is not cached.
+
+        :param source: The source code of the script
+        :type source: str
+        :return: The compiled script
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__get_entry(source)[0]
+
+    @contextmanager
+    def checkout(self, source: str) -> Iterator[Any]:
+        """Retrieves the compiled form of the source code, compiling it if it is not cached, and holds it for the calling thread until the block exits.
+
+        Compiled scripts such as NSAppleScript objects are not thread-safe, so other threads checking out the same script wait for the block to exit.
+
+        :param source: The source code of the script
+        :type source: str
+        :yield: The compiled script
+        :rtype: Iterator[Any]
+
+        :Example:
+
+        >>> from PyXA.XAScripting import XAScriptCache, compile_applescript
+        >>> cache = XAScriptCache(compile_applescript)
+        >>> with cache.checkout("return 1") as script:
+        >>>     result, error = script.executeAndReturnError_(None)
+
+        .. versionadded:: 0.3.1
+        """
+        script, lock = self.__get_entry(source)
+        with lock:
+            yield script
+
+    def __get_entry(self, source: str) -> tuple[Any, threading.Lock]:
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        with self.__lock:
+            entry = self.__scripts.get(key)
+            if entry is not None:
+                self.__scripts.move_to_end(key)
+                self.__stats["hits"] += 1
+                return entry
+
+        # Compilation errors propagate to the caller and are not cached
+        start = time.perf_counter()
+        script = self.compiler(source)
+        compile_time = time.perf_counter() - start
+
+        with self.__lock:
+            self.__stats["misses"] += 1
+            self.__stats["compile_time"] += compile_time
+            entry = self.__scripts.setdefault(key, (script, threading.Lock()))
+            self.__scripts.move_to_end(key)
+            while len(self.__scripts) > self.max_size:
+                self.__scripts.popitem(last=False)
+        return entry
+
+    def cache_info(self) -> dict[str, Union[int, float]]:
+        """Retrieves statistics about the cache.
+
+        :return: The number of cache hits, cache misses, and the total time in seconds spent compiling scripts, along with the current and maximum size of the cache
+        :rtype: dict[str, Union[int, float]]
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            return {
+                **self.__stats,
+                "size": len(self.__scripts),
+                "max_size": self.max_size,
+            }
+
+    def clear(self):
+        """Removes all compiled scripts from the cache and resets the cache statistics.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            self.__scripts.clear()
+            self.__stats.update({"hits": 0, "misses": 0, "compile_time": 0.0})
+
+    def __len__(self):
+        return len(self.__scripts)
+
+    def __repr__(self):
+        return "<" + str(type(self)) + str(self.cache_info()) + ">"
+
+
+class XADescriptorFactory:
+    """Creates the NSAppleEventDescriptor objects used to pass arguments to scripts. Subclasses can create other representations of the same values.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def null(self) -> Any:
+        return AppKit.NSAppleEventDescriptor.nullDescriptor()
+
+    def boolean(self, value: bool) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithBoolean_(value)
+
+    def integer(self, value: int) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithInt32_(value)
+
+    def real(self, value: float) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithDouble_(value)
+
+    def string(self, value: str) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithString_(value)
+
+    def date(self, value: datetime) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithDate_(value)
+
+    def file(self, path: str) -> Any:
+        return AppKit.NSAppleEventDescriptor.descriptorWithFileURL_(
+            AppKit.NSURL.fileURLWithPath_(path)
+        )
+
+    def list(self, items: list[Any]) -> Any:
+        descriptor = AppKit.NSAppleEventDescriptor.listDescriptor()
+        for index, item in enumerate(items):
+            descriptor.insertDescriptor_atIndex_(item, index + 1)
+        return descriptor
+
+    def record(self, fields: dict[str, Any]) -> Any:
+        # Records with arbitrary labels store their fields as a flat list of alternating labels and values
+        user_fields = []
+        for label, value in fields.items():
+            user_fields.extend([self.string(label), value])
+
+        descriptor = AppKit.NSAppleEventDescriptor.recordDescriptor()
+        descriptor.setDescriptor_forKeyword_(self.list(user_fields), keyASUserRecordFields)
+        return descriptor
+
+    def run_event(self, arguments: Any) -> Any:
+        """Creates an Apple Event that calls a script's run handler with the given arguments.
+
+        :param arguments: The descriptor of the list of arguments
+        :type arguments: Any
+        :return: The Apple Event
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        event = AppKit.NSAppleEventDescriptor.appleEventWithEventClass_eventID_targetDescriptor_returnID_transactionID_(
+            kCoreEventClass,
+            kAEOpenApplication,
+            AppKit.NSAppleEventDescriptor.currentProcessDescriptor(),
+            kAutoGenerateReturnID,
+            kAnyTransactionID,
+        )
+        event.setParamDescriptor_forKeyword_(arguments, keyDirectObject)
+        return event
+
+
+def to_descriptor(value: Any, factory: XADescriptorFactory) -> Any:
+    """Converts a Python value into an Apple Event descriptor, so that it reaches a script with its type intact.
+
+    None becomes missing value; bools, ints, floats, strings, and dates become the corresponding AppleScript types; paths become file references; lists and tuples become lists; and dicts become records. Ints outside the 32-bit range are passed as reals. Other objects are passed as their string representation.
+
+    :param value: The value to convert
+    :type value: Any
+    :param factory: The factory that creates the descriptors
+    :type factory: XADescriptorFactory
+    :return: The descriptor
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if value is None:
+        return factory.null()
+    if isinstance(value, bool):
+        return factory.boolean(value)
+    if isinstance(value, int):
+        if -(2**31) <= value < 2**31:
+            return factory.integer(value)
+        return factory.real(float(value))
+    if isinstance(value, float):
+        return factory.real(value)
+    if isinstance(value, os.PathLike):
+        return factory.file(os.fspath(value))
+    if isinstance(value, str):
+        return factory.string(value)
+    if isinstance(value, datetime):
+        return factory.date(value)
+    if isinstance(value, date):
+        return factory.date(datetime(value.year, value.month, value.day))
+    if hasattr(value, "path") and hasattr(value, "xa_elem") and isinstance(value.path, str):
+        # XAPath
+        return factory.file(value.path)
+    if isinstance(value, (list, tuple)):
+        return factory.list([to_descriptor(x, factory) for x in value])
+    if isinstance(value, dict):
+        return factory.record({str(k): to_descriptor(v, factory) for k, v in value.items()})
+    return factory.string(str(value))
+
+
+def run_event(arguments: Union[list, Any, None], factory: XADescriptorFactory) -> Any:
+    """Creates an Apple Event that calls a script's run handler with the given arguments.
+
+    :param arguments: The arguments, or a single argument, or None to pass an empty list
+    :type arguments: Union[list, Any, None]
+    :param factory: The factory that creates the descriptors
+    :type factory: XADescriptorFactory
+    :return: The Apple Event
+    :rtype: Any
+
+    .. versionadded:: 0.3.1
+    """
+    if arguments is None:
+        arguments = []
+    elif not isinstance(arguments, (list, tuple)):
+        arguments = [arguments]
+    return factory.run_event(to_descriptor(list(arguments), factory))
+
+
+def compile_applescript(source: str) -> "AppKit.NSAppleScript":
+    """Compiles AppleScript source code.
+
+    :param source: The source code
+    :type source: str
+    :raises AppleScriptError: The source code could not be compiled
+    :return: The compiled script
+    :rtype: AppKit.NSAppleScript
+
+    .. versionadded:: 0.3.1
+    """
+    script = AppKit.NSAppleScript.alloc().initWithSource_(source)
+    success, error = script.compileAndReturnError_(None)
+    if error is not None:
+        raise AppleScriptError(error, source)
+    return script
+
+
+def has_run_handler(source: str) -> bool:
+    """Checks whether AppleScript source code declares a run handler that accepts arguments, such as `on run argv`.
+
+    :param source: The source code
+    :type source: str
+    :return: True if the script's run handler accepts arguments
+    :rtype: bool
+
+    .. versionadded:: 0.3.1
+    """
+    return any(
+        line.strip().startswith("on run ") and len(line.split()) > 2
+        for line in source.splitlines()
+    )
+
+
+def encode_message(message: dict) -> bytes:
+    """Encodes a request or response of the script worker protocol as one line of JSON. Dates, paths, and bytes are tagged so that they are decoded with their types intact.
+
+    :param message: The message
+    :type message: dict
+    :return: The encoded message, ending with a newline
+    :rtype: bytes
+
+    .. versionadded:: 0.3.1
+    """
+
+    def default(value):
+        if isinstance(value, datetime):
+            return {"$date": value.isoformat()}
+        if isinstance(value, date):
+            return {"$date": datetime(value.year, value.month, value.day).isoformat()}
+        if isinstance(value, os.PathLike):
+            return {"$file": os.fspath(value)}
+        if isinstance(value, (bytes, bytearray)):
+            return {"$bytes": base64.b64encode(value).decode("ascii")}
+        return str(value)
+
+    return json.dumps(message, default=default).encode("utf-8") + b"\n"
+
+
+def decode_message(line: bytes) -> dict:
+    """Decodes a request or response of the script worker protocol. See :func:`encode_message`.
+
+    :param line: The encoded message
+    :type line: bytes
+    :return: The message
+    :rtype: dict
+
+    .. versionadded:: 0.3.1
+    """
+
+    def object_hook(value):
+        if len(value) == 1:
+            if "$date" in value:
+                return datetime.fromisoformat(value["$date"])
+            if "$file" in value:
+                return _WorkerPath(value["$file"])
+            if "$bytes" in value:
+                return base64.b64decode(value["$bytes"])
+        return value
+
+    return json.loads(line, object_hook=object_hook)
+
+
+class _WorkerPath(str, os.PathLike):
+    # A path received from the protocol, passed to scripts as a file reference
+    def __fspath__(self):
+        return str(self)
+
+
+class _ScriptWorker:
+    def __init__(self, command: list[str], env: Union[dict, None]):
+        self.requests = 0
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env
+        )
+        self.responses: queue.Queue = queue.Queue()
+        threading.Thread(target=self.__read, daemon=True).start()
+
+    def __read(self):
+        for line in self.process.stdout:
+            self.responses.put(line)
+        # End of output -- the worker exited
+        self.responses.put(None)
+
+    def call(self, request: dict, timeout: Union[float, None]) -> dict:
+        self.requests += 1
+        try:
+            self.process.stdin.write(encode_message(request))
+            self.process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise ScriptWorkerError(f"Could not send the script to the worker: {e}") from e
+
+        try:
+            line = self.responses.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"The script did not finish within {timeout} seconds.") from None
+        if line is None:
+            raise ScriptWorkerError(f"The worker exited with status {self.process.wait()}.")
+        return decode_message(line)
+
+    def stop(self):
+        try:
+            self.process.kill()
+        except OSError:
+            pass
+        self.process.wait()
+        for stream in (self.process.stdin, self.process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+
+class AppleScriptPool:
+    """A pool of long-lived worker processes that run AppleScripts in parallel.
+
+    Each worker compiles and runs scripts in its own process, caching compiled scripts between calls, so scripts that are run repeatedly are compiled once per worker. Scripts are sent to idle workers over a pipe, and results are returned as dictionaries with the same keys as the result of :func:`PyXA.XABase.AppleScript.run`, except that `event` is always None. A worker that crashes or exceeds the timeout is replaced by a new one.
+
+    .. versionadded:: 0.3.1
+    """
+
+    def __init__(
+        self,
+        size: int = 4,
+        timeout: Union[float, None] = 60,
+        recycle_after: Union[int, None] = None,
+        command: Union[list[str], None] = None,
+        env: Union[dict, None] = None,
+    ):
+        """Creates a new pool and starts its workers.
+
+        :param size: The number of worker processes, defaults to 4
+        :type size: int, optional
+        :param timeout: The default number of seconds to wait for each script before stopping its worker, or None to wait indefinitely, defaults to 60
+        :type timeout: Union[float, None], optional
+        :param recycle_after: The number of scripts after which each worker is replaced by a new one, or None to keep workers until they fail, defaults to None
+        :type recycle_after: Union[int, None], optional
+        :param command: The command that starts a worker, defaults to running :mod:`PyXA.XAScriptWorker` with the current Python interpreter
+        :type command: Union[list[str], None], optional
+        :param env: The environment variables of the workers, defaults to the environment of the current process
+        :type env: Union[dict, None], optional
+
+        :Example:
+
+        >>> import PyXA
+        >>> with PyXA.AppleScriptPool(size=4) as pool:
+        >>>     results = pool.run_many(["return 1 + 1", "return path to desktop as text"])
+        >>> print([result["string"] for result in results])
+        ['2', 'Macintosh HD:Users:exampleUser:Desktop:']
+
+        .. versionadded:: 0.3.1
+        """
+        if size < 1:
+            raise ValueError("An AppleScriptPool needs at least one worker.")
+
+        self.size = size  #: The number of worker processes
+        self.timeout = timeout  #: The default number of seconds to wait for each script
+        self.recycle_after = recycle_after  #: The number of scripts after which each worker is replaced
+        self.command = command or [sys.executable, "-m", "PyXA.XAScriptWorker"]  #: The command that starts a worker
+        self.env = env  #: The environment variables of the workers
+
+        self.__lock = threading.Lock()
+        self.__closed = False
+        self.__workers: set[_ScriptWorker] = set()
+        self.__idle: queue.Queue = queue.Queue()
+        self.__executor = XABoundedExecutor(size)
+        self.__started = time.perf_counter()
+        self.__metrics = {
+            "scripts": 0,
+            "errors": 0,
+            "timeouts": 0,
+            "crashes": 0,
+            "restarts": 0,
+            "busy_time": 0.0,
+        }
+
+        for _ in range(size):
+            self.__idle.put(self.__start_worker())
+
+    def run(
+        self,
+        script: Union[str, list[str], Any],
+        args: Union[list, Any, None] = None,
+        timeout: Union[float, None, bool] = False,
+    ) -> dict[str, Any]:
+        """Runs a script on the next idle worker, waiting for a worker to become idle if necessary.
+
+        :param script: The source code of the script, its lines, or an :class:`PyXA.XABase.AppleScript` object
+        :type script: Union[str, list[str], AppleScript]
+        :param args: The arguments to pass to the script's run handler, defaults to None
+        :type args: Union[list, Any, None], optional
+        :param timeout: The number of seconds to wait for the script, or None to wait indefinitely, defaults to the pool's timeout
+        :type timeout: Union[float, None], optional
+        :raises ScriptWorkerError: The script raised an error, or its worker failed
+        :raises TimeoutError: The script did not finish in time
+        :return: The result of the script
+        :rtype: dict[str, Any]
+
+        .. versionadded:: 0.3.1
+        """
+        if timeout is False:
+            timeout = self.timeout
+        request = {"script": _source(script), "args": args}
+
+        worker = self.__idle.get()
+        if worker is None or self.__closed:
+            # Wake the next caller waiting for a worker, which also finds the pool closed
+            self.__idle.put(None)
+            raise ScriptWorkerError("The pool is closed.")
+
+        start = time.perf_counter()
+        replace = False
+        try:
+            response = worker.call(request, timeout)
+        except TimeoutError:
+            replace = True
+            self.__count("timeouts")
+            raise
+        except ScriptWorkerError:
+            replace = True
+            self.__count("crashes")
+            raise
+        finally:
+            with self.__lock:
+                self.__metrics["scripts"] += 1
+                self.__metrics["busy_time"] += time.perf_counter() - start
+            if self.recycle_after is not None and worker.requests >= self.recycle_after:
+                replace = True
+            self.__release(worker, replace)
+
+        if "error" in response:
+            self.__count("errors")
+            error = response["error"]
+            raise ScriptWorkerError(error.get("message", ""), error.get("number"))
+        return {**response["result"], "event": None}
+
+    def submit(
+        self,
+        script: Union[str, list[str], Any],
+        args: Union[list, Any, None] = None,
+        timeout: Union[float, None, bool] = False,
+    ) -> Future:
+        """Schedules a script to run on the next idle worker. See :func:`run`.
+
+        :return: A future that resolves to the result of the script
+        :rtype: Future
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__executor.submit(self.run, script, args, timeout)
+
+    def run_many(
+        self,
+        scripts: list[Union[str, list[str], Any]],
+        args: Union[list, None] = None,
+        return_exceptions: bool = True,
+    ) -> list[Union[dict[str, Any], Exception]]:
+        """Runs several scripts in parallel across the pool's workers.
+
+        :param scripts: The scripts to run
+        :type scripts: list[Union[str, list[str], AppleScript]]
+        :param args: The arguments for each script, in the same order as the scripts, defaults to None
+        :type args: Union[list, None], optional
+        :param return_exceptions: Whether to place errors in the results instead of raising the first of them, defaults to True
+        :type return_exceptions: bool, optional
+        :return: The result of each script, or the error it raised, in the order of the scripts
+        :rtype: list[Union[dict[str, Any], Exception]]
+
+        .. versionadded:: 0.3.1
+        """
+        if args is None:
+            args = [None] * len(scripts)
+        return self.__executor.map(
+            lambda pair: self.run(*pair),
+            list(zip(scripts, args)),
+            return_exceptions=return_exceptions,
+        )
+
+    def metrics(self) -> dict[str, Union[int, float]]:
+        """Retrieves statistics about the scripts run by the pool.
+
+        :return: The number of scripts run, scripts that raised errors, timeouts, worker crashes, and worker restarts; the total time workers spent running scripts; the time since the pool was created; the average number of scripts completed per second; and the average time per script
+        :rtype: dict[str, Union[int, float]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> pool = PyXA.AppleScriptPool()
+        >>> pool.run_many(["return 1"] * 1000)
+        >>> print(pool.metrics())
+        {'scripts': 1000, 'errors': 0, 'timeouts': 0, 'crashes': 0, 'restarts': 0, 'busy_time': 3.82, 'elapsed': 1.05, 'throughput': 952.4, 'average_time': 0.0038}
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            metrics = dict(self.__metrics)
+        elapsed = time.perf_counter() - self.__started
+        metrics["elapsed"] = elapsed
+        metrics["throughput"] = metrics["scripts"] / elapsed if elapsed > 0 else 0.0
+        metrics["average_time"] = metrics["busy_time"] / metrics["scripts"] if metrics["scripts"] > 0 else 0.0
+        return metrics
+
+    def close(self):
+        """Stops the pool's workers. Scripts that are running are abandoned.
+
+        .. versionadded:: 0.3.1
+        """
+        with self.__lock:
+            if self.__closed:
+                return
+            self.__closed = True
+            workers = list(self.__workers)
+            self.__workers.clear()
+
+        for worker in workers:
+            worker.stop()
+        self.__idle.put(None)
+        self.__executor.shutdown(wait=False)
+
+    def __start_worker(self) -> _ScriptWorker:
+        worker = _ScriptWorker(self.command, self.env)
+        with self.__lock:
+            self.__workers.add(worker)
+        return worker
+
+    def __release(self, worker: _ScriptWorker, replace: bool):
+        with self.__lock:
+            closed = self.__closed
+            if replace or closed:
+                self.__workers.discard(worker)
+        if closed:
+            worker.stop()
+            return
+
+        if replace:
+            worker.stop()
+            self.__count("restarts")
+            worker = self.__start_worker()
+        self.__idle.put(worker)
+
+    def __count(self, metric: str):
+        with self.__lock:
+            self.__metrics[metric] += 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def __repr__(self):
+        return "<" + str(type(self)) + f"{self.size} workers>"
+
+
+def _source(script: Union[str, list[str], Any]) -> str:
+    if isinstance(script, str):
+        return script
+    if isinstance(script, list):
+        return "".join(line + "\n" for line in script)
+    # AppleScript objects
+    return "".join(line + "\n" for line in script.script)
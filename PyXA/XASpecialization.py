@@ -0,0 +1,75 @@
+""".. versionadded:: 0.3.1
+
+Deferred specialization of element wrappers into the subclass matching the scripting class of their element.
+
+Wrappers such as :class:`PyXA.apps.Music.XAMusicTrack` used to look up their element's class when they were created, sending an Apple Event for every element of a list as it was iterated. A specializable wrapper is instead created as the general class and only looks up its element's class the first time an attribute that only a subclass defines is used.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+
+class XASpecializable:
+    """A mixin for wrappers that become a more specific subclass when a subclass-only attribute is first used.
+
+    Classes using the mixin set :attr:`_xa_specializations` to a table mapping the values returned by :func:`_xa_specialization_key` to subclasses. For instances to change class, the class and its subclasses must share the same instance layout, e.g. by each declaring ``__slots__ = ()``.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ()
+
+    _xa_specializations: dict[Any, type] = {}  #: The subclass for each specialization key, shared by all instances
+
+    def _xa_specialization_key(self) -> Any:
+        """Retrieves the key of the subclass to specialize into, by default the element's object class.
+
+        .. versionadded:: 0.3.1
+        """
+        return self.object_class
+
+    def specialize(self) -> Any:
+        """Changes the class of the object to the subclass matching its element's scripting class, if the object has not been specialized already.
+
+        :return: A reference to the object
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        if _is_owner(type(self)):
+            subclass = self._xa_specializations.get(self._xa_specialization_key())
+            if subclass is not None:
+                self.__class__ = subclass
+        return self
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when the attribute is not found on the current class
+        cls = type(self)
+        if name in _deferred_attributes(cls) and type(self.specialize()) is not cls:
+            return getattr(self, name)
+        raise AttributeError(f"{cls.__name__!r} object has no attribute {name!r}")
+
+    def __setattr__(self, name: str, value: Any):
+        if name in _deferred_attributes(type(self)):
+            self.specialize()
+        super().__setattr__(name, value)
+
+
+def _is_owner(cls: type) -> bool:
+    # Only instances of the class that defines the specialization table are specialized; subclasses already are
+    return "_xa_specializations" in vars(cls)
+
+
+@lru_cache(maxsize=None)
+def _deferred_attributes(cls: type) -> frozenset:
+    # The attributes defined by the specializations of a class but not by the class itself
+    if not _is_owner(cls):
+        return frozenset()
+
+    names = set()
+    for subclass in cls._xa_specializations.values():
+        for base in subclass.__mro__:
+            if issubclass(cls, base):
+                break
+            names.update(name for name in vars(base) if not name.startswith("__"))
+    return frozenset(name for name in names if not hasattr(cls, name))
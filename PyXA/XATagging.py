@@ -0,0 +1,277 @@
+""".. versionadded:: 0.3.1
+
+A reusable engine for tagging text with several NaturalLanguage tag schemes at once.
+
+Taggers are created once per combination of schemes and reused for every text, and each text is divided into tokens once no matter how many schemes it is tagged with. Tags are reported as offset spans into the original string rather than as copied substrings.
+"""
+
+import threading
+from typing import Any, Callable, Iterable, Iterator, Literal, NamedTuple, Union
+
+from PyXA.XALazy import lazy_import
+
+NaturalLanguage = lazy_import("NaturalLanguage")
+
+SCHEMES = {
+    "parts_of_speech": "LexicalClass",
+    "languages": "Language",
+    "entities": "NameTypeOrLexicalClass",
+    "lemmas": "Lemma",
+    "sentiments": "SentimentScore",
+}
+"""The tag schemes supported by :class:`TaggingEngine`, mapped to their NaturalLanguage identifiers.
+"""
+
+UNITS = {"word": 0, "sentence": 1, "paragraph": 2, "document": 3}
+"""The values of NLTokenUnit for each unit of text.
+"""
+
+# NLTaggerOptions
+NLTaggerOmitPunctuation = 1 << 1
+NLTaggerOmitWhitespace = 1 << 2
+NLTaggerJoinContractions = 1 << 5
+
+
+class XATagSpan(NamedTuple):
+    """A tag applied to the characters from `start` to `end` of a string.
+
+    .. versionadded:: 0.3.1
+    """
+
+    start: int  #: The index of the first character of the token
+    end: int  #: The index after the last character of the token
+    tag: Union[str, None]  #: The tag of the token
+
+    def substring(self, text: str) -> str:
+        """Gets the tagged token from the string it was found in.
+
+        :param text: The tagged string
+        :type text: str
+        :return: The token
+        :rtype: str
+
+        .. versionadded:: 0.3.1
+        """
+        return text[self.start : self.end]
+
+
+def utf16_index_map(text: str) -> Union[list[int], None]:
+    """Maps offsets in UTF-16 code units, as used in the ranges reported by Cocoa APIs, to indices in a Python string. The offsets differ once the string contains characters outside the Basic Multilingual Plane, such as emoji.
+
+    :param text: The string
+    :type text: str
+    :return: The Python index for each UTF-16 offset up to and including the end of the string, or None if the offsets are the same as the indices
+    :rtype: Union[list[int], None]
+
+    .. versionadded:: 0.3.1
+    """
+    if text.isascii() or all(ord(x) < 0x10000 for x in text):
+        return None
+
+    index_map = []
+    for index, character in enumerate(text):
+        index_map.append(index)
+        if ord(character) >= 0x10000:
+            index_map.append(index)
+    index_map.append(len(text))
+    return index_map
+
+
+def _text_of(item: Any) -> str:
+    if isinstance(item, str):
+        return item
+    if hasattr(item, "xa_elem"):
+        return str(item.xa_elem)
+    return str(item)
+
+
+def iter_strings(texts: Union[Iterable[Any], Any]) -> Iterator[str]:
+    """Iterates over the strings of an :class:`PyXA.XATextList` or of an iterable of strings or :class:`PyXA.XAText` objects.
+
+    :param texts: The texts
+    :type texts: Union[Iterable[Any], Any]
+    :yield: The string of each text
+    :rtype: Iterator[str]
+
+    .. versionadded:: 0.3.1
+    """
+    if hasattr(texts, "xa_elem") and not isinstance(texts.xa_elem, str):
+        # Read the strings from the list's elements without wrapping each one in an XAText
+        texts = texts.xa_elem
+    for item in texts:
+        yield _text_of(item)
+
+
+class TaggingEngine:
+    """Tags text with one or more NaturalLanguage tag schemes, reusing taggers between texts.
+
+    A tagger is created for each distinct set of schemes the first time it is used and is kept for the lifetime of the engine. Taggers are not thread-safe, so each thread uses its own.
+
+    .. versionadded:: 0.3.1
+    """
+
+    _shared: Union["TaggingEngine", None] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, tagger_factory: Union[Callable[[list[str]], Any], None] = None):
+        """Creates a new tagging engine.
+
+        :param tagger_factory: The function that creates a tagger for a list of NaturalLanguage scheme identifiers, defaults to creating an NLTagger
+        :type tagger_factory: Union[Callable[[list[str]], Any], None], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.tagger_factory = tagger_factory or self.__create_tagger  #: The function used to create taggers
+        self.__local = threading.local()
+
+    @classmethod
+    def shared(cls) -> "TaggingEngine":
+        """Retrieves the engine used by the tagging methods of :class:`PyXA.XAText`.
+
+        :return: The shared tagging engine
+        :rtype: TaggingEngine
+
+        .. versionadded:: 0.3.1
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    def tag(
+        self,
+        text: Any,
+        schemes: Iterable[str],
+        unit: Literal["word", "sentence", "paragraph", "document"] = "word",
+        omit_punctuation: bool = True,
+        omit_whitespace: bool = True,
+        join_contractions: bool = False,
+    ) -> dict[str, list[XATagSpan]]:
+        """Tags a text with each of the given schemes in a single pass over its tokens.
+
+        :param text: The text to tag, as a string or an :class:`PyXA.XAText` object
+        :type text: Any
+        :param schemes: The names of the schemes to tag with, see :attr:`SCHEMES`
+        :type schemes: Iterable[str]
+        :param unit: The grammatical unit to divide the text into for tagging, defaults to "word"
+        :type unit: Literal["word", "sentence", "paragraph", "document"], optional
+        :param omit_punctuation: Whether to skip punctuation tokens, defaults to True
+        :type omit_punctuation: bool, optional
+        :param omit_whitespace: Whether to skip whitespace tokens, defaults to True
+        :type omit_whitespace: bool, optional
+        :param join_contractions: Whether to treat contractions as single tokens, defaults to False
+        :type join_contractions: bool, optional
+        :raises ValueError: A scheme or unit is not supported
+        :return: The spans tagged by each scheme, in the order of the tokens
+        :rtype: dict[str, list[XATagSpan]]
+
+        :Example:
+
+        >>> from PyXA.XATagging import TaggingEngine
+        >>> text = "Tim Cook is the CEO of Apple."
+        >>> spans = TaggingEngine.shared().tag(text, ["entities", "lemmas"])
+        >>> print([(span.substring(text), span.tag) for span in spans["entities"]][:2])
+        [('Tim', 'PersonalName'), ('Cook', 'PersonalName')]
+
+        .. versionadded:: 0.3.1
+        """
+        schemes = list(dict.fromkeys(schemes))
+        if len(schemes) == 0:
+            return {}
+        for scheme in schemes:
+            if scheme not in SCHEMES:
+                raise ValueError(f"Unsupported tag scheme: {scheme}")
+        if unit not in UNITS:
+            raise ValueError(f"Unsupported tag unit: {unit}")
+
+        options = 0
+        if omit_punctuation:
+            options |= NLTaggerOmitPunctuation
+        if omit_whitespace:
+            options |= NLTaggerOmitWhitespace
+        if join_contractions:
+            options |= NLTaggerJoinContractions
+
+        text = _text_of(text)
+        identifiers = [SCHEMES[x] for x in schemes]
+        tagger = self.__tagger(identifiers)
+        tagger.setString_(text)
+
+        index_map = utf16_index_map(text)
+        unit_value = UNITS[unit]
+        spans = {scheme: [] for scheme in schemes}
+        primary, others = schemes[0], list(zip(schemes[1:], identifiers[1:]))
+
+        def apply_tags(tag, token_range, stop):
+            location, length = token_range[0], token_range[1]
+            start, end = location, location + length
+            if index_map is not None:
+                start, end = index_map[start], index_map[end]
+            if text[start:end].isspace() or start == end:
+                return
+
+            spans[primary].append(XATagSpan(start, end, tag))
+            # The token boundaries are found once; the other schemes are looked up at the same token
+            for scheme, identifier in others:
+                other_tag, _ = tagger.tagAtIndex_unit_scheme_tokenRange_(
+                    location, unit_value, identifier, None
+                )
+                spans[scheme].append(XATagSpan(start, end, other_tag))
+
+        tagger.enumerateTagsInRange_unit_scheme_options_usingBlock_(
+            (0, len(text.encode("utf-16-le")) // 2),
+            unit_value,
+            identifiers[0],
+            options,
+            apply_tags,
+        )
+        return spans
+
+    def tag_many(
+        self,
+        texts: Union[Iterable[Any], Any],
+        schemes: Iterable[str],
+        unit: Literal["word", "sentence", "paragraph", "document"] = "word",
+        **options,
+    ) -> Iterator[dict[str, list[XATagSpan]]]:
+        """Tags each text in a batch, reusing one tagger for the whole batch. See :func:`tag`.
+
+        :param texts: The texts to tag, as an :class:`PyXA.XATextList` or an iterable of strings or :class:`PyXA.XAText` objects
+        :type texts: Union[Iterable[Any], Any]
+        :param schemes: The names of the schemes to tag with, see :attr:`SCHEMES`
+        :type schemes: Iterable[str]
+        :param unit: The grammatical unit to divide the texts into for tagging, defaults to "word"
+        :type unit: Literal["word", "sentence", "paragraph", "document"], optional
+        :param options: The options accepted by :func:`tag`
+        :raises ValueError: A scheme or unit is not supported
+        :yield: The spans tagged by each scheme, for each text in order
+        :rtype: Iterator[dict[str, list[XATagSpan]]]
+
+        :Example:
+
+        >>> import PyXA
+        >>> from PyXA.XATagging import TaggingEngine
+        >>> notes = PyXA.Application("Notes").notes().plaintext()
+        >>> for spans in TaggingEngine.shared().tag_many(notes, ["parts_of_speech", "entities", "lemmas"]):
+        >>>     print(len(spans["entities"]))
+
+        .. versionadded:: 0.3.1
+        """
+        schemes = list(schemes)
+        for text in iter_strings(texts):
+            yield self.tag(text, schemes, unit, **options)
+
+    def __tagger(self, identifiers: list[str]) -> Any:
+        taggers = getattr(self.__local, "taggers", None)
+        if taggers is None:
+            taggers = self.__local.taggers = {}
+
+        key = frozenset(identifiers)
+        tagger = taggers.get(key)
+        if tagger is None:
+            tagger = taggers[key] = self.tagger_factory(sorted(key))
+        return tagger
+
+    @staticmethod
+    def __create_tagger(identifiers: list[str]) -> Any:
+        return NaturalLanguage.NLTagger.alloc().initWithTagSchemes_(identifiers)
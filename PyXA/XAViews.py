@@ -0,0 +1,158 @@
+""".. versionadded:: 0.3.1
+
+Deferred slices and filters of the arrays wrapped by :class:`PyXA.XABase.XAList`.
+
+Slicing or filtering a list records the operation in a view instead of copying the array. Consecutive slices are composed into a single range and consecutive filters are combined into a single predicate, so a chain such as ``tracks().filter(...)[10:][:100]`` is resolved with one filter and one subarray when its elements are first needed.
+"""
+
+from typing import Any, Callable, Sequence, Union
+
+
+class XAListView:
+    """A pending sequence of slices and filters applied to a source array.
+
+    Views are immutable; slicing or filtering a view returns a new view.
+
+    .. versionadded:: 0.3.1
+    """
+
+    __slots__ = ("source", "operations")
+
+    def __init__(self, source: Any, operations: tuple[tuple[str, tuple[Any, ...]], ...] = ()):
+        """Creates a view of an array.
+
+        :param source: The array to view
+        :type source: Any
+        :param operations: The pending operations, as pairs of "slice" or "filter" and the slices or predicates to apply in one step, defaults to no operations
+        :type operations: tuple[tuple[str, tuple[Any, ...]], ...], optional
+
+        .. versionadded:: 0.3.1
+        """
+        self.source = source  #: The array the operations are applied to
+        self.operations = operations  #: The pending operations
+
+    def slice(self, key: slice) -> "XAListView":
+        """Adds a slice to the end of the view's operations.
+
+        :param key: The slice to apply
+        :type key: slice
+        :return: The new view
+        :rtype: XAListView
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__then("slice", key)
+
+    def filter(self, predicate: Any) -> "XAListView":
+        """Adds a filter to the end of the view's operations.
+
+        :param predicate: The predicate to filter by, in any form accepted by the function that resolves the view
+        :type predicate: Any
+        :return: The new view
+        :rtype: XAListView
+
+        .. versionadded:: 0.3.1
+        """
+        return self.__then("filter", predicate)
+
+    def length(self, count: Callable[[Any], int]) -> Union[int, None]:
+        """Calculates the number of elements in the view without resolving it, if possible.
+
+        :param count: The function that counts the elements of the source array
+        :type count: Callable[[Any], int]
+        :return: The number of elements, or None if the view has filters and must be resolved to be counted
+        :rtype: Union[int, None]
+
+        .. versionadded:: 0.3.1
+        """
+        if any(kind == "filter" for kind, _ in self.operations):
+            return None
+
+        num_elements = count(self.source)
+        for _, slices in self.operations:
+            num_elements = len(compose_slices(num_elements, slices))
+        return num_elements
+
+    def resolve(
+        self,
+        count: Callable[[Any], int],
+        subarray: Callable[[Any, int, int], Any],
+        take: Callable[[Any, range], Any],
+        filter: Callable[[Any, Sequence[Any]], Any],
+    ) -> Any:
+        """Applies the view's operations to its source array.
+
+        :param count: The function that counts the elements of an array
+        :type count: Callable[[Any], int]
+        :param subarray: The function that retrieves the given number of consecutive elements of an array, starting at the given index
+        :type subarray: Callable[[Any, int, int], Any]
+        :param take: The function that retrieves the elements of an array at each index in a range
+        :type take: Callable[[Any, range], Any]
+        :param filter: The function that filters an array by all of a list of predicates
+        :type filter: Callable[[Any, Sequence[Any]], Any]
+        :return: The resulting array
+        :rtype: Any
+
+        .. versionadded:: 0.3.1
+        """
+        array = self.source
+        for kind, items in self.operations:
+            if kind == "filter":
+                array = filter(array, items)
+                continue
+
+            indices = compose_slices(count(array), items)
+            if indices.step == 1:
+                array = subarray(array, indices.start, len(indices))
+            else:
+                array = take(array, indices)
+        return array
+
+    def __then(self, kind: str, item: Any) -> "XAListView":
+        operations = self.operations
+        if len(operations) > 0 and operations[-1][0] == kind:
+            # Merge with the previous operation of the same kind
+            return XAListView(self.source, operations[:-1] + ((kind, operations[-1][1] + (item,)),))
+        return XAListView(self.source, operations + ((kind, (item,)),))
+
+    def __repr__(self):
+        return f"<{type(self)}{self.operations}>"
+
+
+def view_of(source: Any, mutable: bool) -> XAListView:
+    """Creates a view of an array. Arrays that can be changed in place are copied first, so that later changes to them do not alter the elements of the view, as they would not alter a slice or filter applied immediately.
+
+    :param source: The array to view
+    :type source: Any
+    :param mutable: Whether the array can be changed in place
+    :type mutable: bool
+    :return: The new view
+    :rtype: XAListView
+
+    .. versionadded:: 0.3.1
+    """
+    return XAListView(source.copy() if mutable else source)
+
+
+def compose_slices(num_elements: int, slices: Sequence[slice]) -> range:
+    """Composes slices applied one after another into the range of indices they select, following Python's rules for negative and omitted bounds.
+
+    :param num_elements: The number of elements in the sliced array
+    :type num_elements: int
+    :param slices: The slices, in the order they are applied
+    :type slices: Sequence[slice]
+    :return: The indices of the selected elements in the sliced array
+    :rtype: range
+
+    :Example:
+
+    >>> from PyXA.XAViews import compose_slices
+    >>> print(compose_slices(100, [slice(10, None), slice(None, -5), slice(None, None, 2)]))
+    range(10, 95, 2)
+
+    .. versionadded:: 0.3.1
+    """
+    indices = range(num_elements)
+    for key in slices:
+        indices = indices[key]
+    return indices
@@ -2,57 +2,89 @@ import importlib
 import sys
 from types import ModuleType
 
-from PyXA import XABase, XABaseScriptable, XAEvents, Additions
-
-from .XABase import (
-    # Base Types
-    XAText,
-    XAURL,
-    XAPath,
-    XAColor,
-    XASound,
-    XAImage,
-    XAVideo,
-    XALocation,
-    Application,
-    # Utilities
-    AppleScript,
-    XAPredicate,
-    # System Features
-    XAClipboard,
-    XASpotlight,
-    # Alerts, Dialogs, Menus, and Notifications
-    XAFilePicker,
-    XAFolderPicker,
-    XAApplicationPicker,
-    XADialog,
-    XAFileNameDialog,
-    XAColorPicker,
-    XAColorPickerStyle,
-    XAMenu,
-    # Constants
-    VERSION,
-    application_classes,
-    # XAFinderExtension,
-    # Methods
-    current_application,
-    running_applications,
-    active_browser,
-)
+from .apps import application_classes
 
 old_module = sys.modules["PyXA"]
 
+
+def _application_wrapper(app_name: str):
+    def wrapper():
+        return importlib.import_module(".XABase", "PyXA").Application(app_name)
+
+    return wrapper
+
+
 # Adds apps as methods on PyXA module, e.g. PyXA.Calendar() --> XACalendarApplication instance
 for index, app_name in enumerate(application_classes):
     wrapper_name = app_name.title().replace(" ", "")
-    setattr(
-        old_module,
-        wrapper_name,
-        lambda local_app_name=app_name: Application(local_app_name),
-    )
+    setattr(old_module, wrapper_name, _application_wrapper(app_name))
+
+# JIT imports -- importing PyXA stays cheap; AppKit, ScriptingBridge, etc. are loaded once a PyXA type is first used
+submodules = {
+    "XABase",
+    "XABaseScriptable",
+    "XAEvents",
+    "XAErrors",
+    "XATypes",
+    "XAProtocols",
+    "XAPredicates",
+    "XAAppIndex",
+    "XALazy",
+    "XAExport",
+    "XAExecutor",
+    "XAImagePipeline",
+    "XAHTTPCache",
+    "XAFeedParser",
+    "XADownloader",
+    "XAFileIndex",
+    "XATagging",
+    "XADataDetection",
+    "XAMapping",
+    "XAViews",
+    "XAPropertyIndex",
+    "XASpecialization",
+    "XAQueryResults",
+    "XAScripting",
+    "XAScriptWorker",
+    "Additions",
+    "apps",
+}
 
-# JIT imports
 module_map = {
+    # Base Types
+    "XAText": ".XABase",
+    "XAURL": ".XABase",
+    "XAPath": ".XABase",
+    "XAColor": ".XABase",
+    "XASound": ".XABase",
+    "XAImage": ".XABase",
+    "XAVideo": ".XABase",
+    "XALocation": ".XABase",
+    "Application": ".XABase",
+    # Utilities
+    "AppleScript": ".XABase",
+    "AppleScriptPool": ".XAScripting",
+    "XAPredicate": ".XABase",
+    "TaggingEngine": ".XATagging",
+    # System Features
+    "XAClipboard": ".XABase",
+    "XASpotlight": ".XABase",
+    # Alerts, Dialogs, Menus, and Notifications
+    "XAFilePicker": ".XABase",
+    "XAFolderPicker": ".XABase",
+    "XAApplicationPicker": ".XABase",
+    "XADialog": ".XABase",
+    "XAFileNameDialog": ".XABase",
+    "XAColorPicker": ".XABase",
+    "XAColorPickerStyle": ".XABase",
+    "XAMenu": ".XABase",
+    # Constants
+    "VERSION": ".XABase",
+    # Methods
+    "current_application": ".XABase",
+    "running_applications": ".XABase",
+    "active_browser": ".XABase",
+    # Additions
     "XACommandDetector": ".Additions.Speech",
     "XASpeech": ".Additions.Speech",
     "XASpeechRecognizer": ".Additions.Speech",
@@ -60,6 +92,7 @@ module_map = {
     "XAMicrophone": ".Additions.Devices",
     "XAScreen": ".Additions.Devices",
     "XALSM": ".Additions.Learn",
+    "XANumPyLSM": ".Additions.Learn",
     "SDEFParser": ".Additions.Utils",
     "AppBuilder": ".Additions.Utils",
     "XAMenuBar": ".Additions.UI",
@@ -68,6 +101,7 @@ module_map = {
     "XANotification": ".Additions.UI",
     "XAHUD": ".Additions.UI",
     "RSSFeed": ".Additions.Web",
+    "RSSFeedGroup": ".Additions.Web",
 }
 
 
@@ -76,9 +110,21 @@ class module(ModuleType):
         if attr in old_module.__dict__:
             return getattr(old_module, attr)
 
-        if attr in module_map:
+        if attr in submodules:
+            value = importlib.import_module("." + attr, "PyXA")
+        elif attr in module_map:
             module = importlib.import_module(module_map[attr], "PyXA")
-            return getattr(module, attr)
+            value = getattr(module, attr)
+        else:
+            raise AttributeError(f"module 'PyXA' has no attribute '{attr}'")
+
+        setattr(self, attr, value)
+        return value
+
+    def __dir__(self):
+        return sorted(
+            set(old_module.__dict__) | submodules | set(module_map)
+        )
 
 
 sys.modules["PyXA"] = module("PyXA")
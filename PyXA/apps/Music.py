@@ -1071,6 +1071,8 @@ class XAMusicItem(XABase.XAObject):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -2939,32 +2941,23 @@ class XAMusicTrackList(XAMusicItemList):
         return super()._format_for_filter(filter, value1, value2)
 
 
-class XAMusicTrack(XAMusicItem):
+class XAMusicTrack(XAMusicItem, XABase.XASpecializable):
     """A class for managing and interacting with tracks in Music.app.
 
     .. seealso:: :class:`XAMusicTrackList`
 
+    .. versionchanged:: 0.3.1
+
+       Tracks no longer look up their object class when they are created. A track becomes an :class:`XAMusicFileTrack`, :class:`XAMusicSharedTrack`, or :class:`XAMusicURLTrack` the first time an attribute specific to one of those classes is used, or when :func:`specialize` is called.
+
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
-        if not hasattr(self, "xa_specialized"):
-            oldDict = self.__dict__.copy()
-            if self.object_class == MusicObjectClass.SHARED_TRACK:
-                self.__class__ = XAMusicSharedTrack
-
-            elif self.object_class == MusicObjectClass.FILE_TRACK:
-                self.__class__ = XAMusicFileTrack
-
-            elif self.object_class == MusicObjectClass.URL_TRACK:
-                self.__class__ = XAMusicURLTrack
-
-            self.xa_specialized = True
-            self.__init__(properties)
-            self.__dict__.update(oldDict)
-
     @property
     def album(self) -> str:
         """The name of the track's album."""
@@ -3609,6 +3602,8 @@ class XAMusicFileTrack(XAMusicTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -3642,6 +3637,8 @@ class XAMusicSharedTrack(XAMusicTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -3675,6 +3672,8 @@ class XAMusicAudioCDTrack(XAMusicTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -3712,6 +3711,8 @@ class XAMusicURLTrack(XAMusicTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -3727,6 +3728,13 @@ class XAMusicURLTrack(XAMusicTrack):
         self.set_property("address", address.xa_elem)
 
 
+XAMusicTrack._xa_specializations = {
+    MusicObjectClass.SHARED_TRACK: XAMusicSharedTrack,
+    MusicObjectClass.FILE_TRACK: XAMusicFileTrack,
+    MusicObjectClass.URL_TRACK: XAMusicURLTrack,
+}
+
+
 class XAMusicUserPlaylistList(XAMusicPlaylistList):
     """A wrapper around lists of music user playlists that employs fast enumeration techniques.
 
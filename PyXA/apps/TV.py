@@ -683,6 +683,8 @@ class XATVItem(XABase.XAObject):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -1664,32 +1666,23 @@ class XATVTrackList(XATVItemList):
         return super()._format_for_filter(filter, value1, value2)
 
 
-class XATVTrack(XATVItem):
+class XATVTrack(XATVItem, XABase.XASpecializable):
     """A class for managing and interacting with tracks in media apps.
 
     .. seealso:: :class:`XATVSharedTrack`, :class:`XATVFileTrack`, :class:`XATVRemoteURLTrack`
 
+    .. versionchanged:: 0.3.1
+
+       Tracks no longer look up their object class when they are created. A track becomes an :class:`XATVFileTrack`, :class:`XATVSharedTrack`, or :class:`XATVURLTrack` the first time an attribute specific to one of those classes is used, or when :func:`specialize` is called.
+
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
-        if not hasattr(self, "xa_specialized"):
-            oldDict = self.__dict__.copy()
-            if self.object_class == TVObjectClass.SHARED_TRACK:
-                self.__class__ = XATVSharedTrack
-
-            elif self.object_class == TVObjectClass.FILE_TRACK:
-                self.__class__ = XATVFileTrack
-
-            elif self.object_class == TVObjectClass.URL_TRACK:
-                self.__class__ = XATVURLTrack
-
-            self.xa_specialized = True
-            self.__init__(properties)
-            self.__dict__.update(oldDict)
-
     @property
     def album(self) -> str:
         """The name of the track's album."""
@@ -2158,6 +2151,8 @@ class XATVFileTrack(XATVTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -2191,6 +2186,8 @@ class XATVSharedTrack(XATVTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -2219,6 +2216,8 @@ class XATVURLTrack(XATVTrack):
     .. versionadded:: 0.0.1
     """
 
+    __slots__ = ()
+
     def __init__(self, properties):
         super().__init__(properties)
 
@@ -2234,6 +2233,13 @@ class XATVURLTrack(XATVTrack):
         self.set_property("address", address.xa_elem)
 
 
+XATVTrack._xa_specializations = {
+    TVObjectClass.SHARED_TRACK: XATVSharedTrack,
+    TVObjectClass.FILE_TRACK: XATVFileTrack,
+    TVObjectClass.URL_TRACK: XATVURLTrack,
+}
+
+
 class XATVUserPlaylistList(XATVPlaylistList):
     """A wrapper around lists of music user playlists that employs fast enumeration techniques.
 
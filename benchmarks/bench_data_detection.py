@@ -0,0 +1,64 @@
+"""Compares the data detection backends on synthetic text with known URLs, email addresses, and phone numbers.
+
+Usage: python benchmarks/bench_data_detection.py [--texts N]
+
+Each backend available on the current platform is timed on the whole batch, scanning for all three kinds at once and for each kind separately. Its matches are scored against the data inserted into the text. NSDataDetector is only available on macOS; the regex backend runs everywhere.
+"""
+
+import argparse
+import importlib.util
+import random
+import time
+
+from PyXA.XADataDetection import XANativeDetector, XARegexDetector, extract_many
+
+KINDS = ["urls", "emails", "phone_numbers"]
+WORDS = "the meeting notes are attached please review them before friday and send comments to the team".split()
+
+
+def synthetic_texts(count: int) -> tuple[list[str], list[dict[str, set[str]]]]:
+    rng = random.Random(0)
+    texts, expected = [], []
+    for i in range(count):
+        url = f"https://example{i % 50}.com/docs/{i}"
+        email = f"user{i}@example{i % 7}.org"
+        phone = f"+1 555 {rng.randrange(100, 999)} {rng.randrange(1000, 9999)}"
+        words = [rng.choice(WORDS) for _ in range(60)]
+        for data in (url, email, phone):
+            words.insert(rng.randrange(len(words)), data)
+        texts.append(" ".join(words) + ".")
+        expected.append({"urls": {url}, "emails": {email}, "phone_numbers": {phone}})
+    return texts, expected
+
+
+def score(results: list[dict], expected: list[dict]) -> str:
+    scores = []
+    for kind in KINDS:
+        found = sum(len({m.substring(t) for m in r[kind]} & e[kind]) for t, r, e in zip(texts, results, expected))
+        total = sum(len(r[kind]) for r in results)
+        wanted = sum(len(e[kind]) for e in expected)
+        scores.append(f"{kind} {found}/{wanted} found, {total - found} extra")
+    return "; ".join(scores)
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--texts", type=int, default=5000, help="The number of texts to scan")
+    args = parser.parse_args()
+
+    texts, expected = synthetic_texts(args.texts)
+    detectors = {"regex": XARegexDetector()}
+    if importlib.util.find_spec("AppKit") is not None:
+        detectors["NSDataDetector"] = XANativeDetector()
+
+    for name, detector in detectors.items():
+        results = timed(f"{name}: all kinds in one pass", lambda: list(extract_many(texts, KINDS, detector)))
+        timed(f"{name}: one pass per kind", lambda: [list(extract_many(texts, [kind], detector)) for kind in KINDS])
+        print(f"  {score(results, expected)}\n")
@@ -0,0 +1,92 @@
+"""Compares reading every item's fields through BeautifulSoup, as RSSFeed does by default, with the streaming parser in PyXA.XAFeedParser.
+
+Usage: python benchmarks/bench_feed_parser.py [--items N] [--repeat N]
+
+The feeds are synthetic RSS 2.0 and Atom documents. The soup-based path needs lxml for BeautifulSoup's XML parser and is skipped if lxml is not installed.
+"""
+
+import argparse
+import time
+import tracemalloc
+from email.utils import formatdate
+
+from PyXA.XAFeedParser import parse_feed
+
+FIELDS = ("title", "link", "guid", "author", "category", "description", "encoded", "pubDate")
+
+
+def synthetic_rss(num_items: int) -> bytes:
+    items = "".join(
+        f"<item><title>Item {i}</title><link>http://example.com/{i}</link><guid>{i}</guid>"
+        f"<author>author{i % 10}@example.com</author><category>Category {i % 7}</category>"
+        f"<description>Description of item {i}</description>"
+        f"<content:encoded><![CDATA[<p>{'Lorem ipsum dolor sit amet. ' * 20}</p>]]></content:encoded>"
+        f"<pubDate>{formatdate(1_660_000_000 + i * 60)}</pubDate></item>"
+        for i in range(num_items)
+    )
+    return (
+        '<?xml version="1.0"?><rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">'
+        f"<channel><title>Synthetic</title>{items}</channel></rss>"
+    ).encode("utf-8")
+
+
+def synthetic_atom(num_items: int) -> bytes:
+    entries = "".join(
+        f'<entry><title>Entry {i}</title><link href="http://example.com/{i}"/><id>urn:{i}</id>'
+        f'<author><name>Author {i % 10}</name></author><category term="c{i % 7}"/>'
+        f"<summary>Summary of entry {i}</summary>"
+        f"<content type=\"html\">{'Lorem ipsum dolor sit amet. ' * 20}</content>"
+        f"<updated>2022-10-04T08:{i % 60:02d}:00Z</updated></entry>"
+        for i in range(num_items)
+    )
+    return f'<?xml version="1.0"?><feed xmlns="http://www.w3.org/2005/Atom"><title>Synthetic</title>{entries}</feed>'.encode("utf-8")
+
+
+def soup_fields(document: bytes) -> list:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(document, features="xml")
+    items = soup.find_all("item") or soup.find_all("entry")
+    return [[item.find(field) for field in FIELDS] for item in items]
+
+
+def streaming_fields(document: bytes) -> list:
+    return [
+        [r.title, r.link, r.guid, r.author, r.category, r.description, r.content, r.publication_date]
+        for r in parse_feed(document)
+    ]
+
+
+def measure(label: str, function, document: bytes, repeat: int):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(document)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    function(document)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<30} {best * 1000:9.1f} ms {peak / 2**20:9.1f} MiB peak")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=10000, help="The number of items per feed")
+    parser.add_argument("--repeat", type=int, default=3, help="The number of timed runs of each parser")
+    args = parser.parse_args()
+
+    try:
+        import lxml  # noqa: F401
+
+        has_lxml = True
+    except ImportError:
+        has_lxml = False
+
+    for kind, document in (("RSS", synthetic_rss(args.items)), ("Atom", synthetic_atom(args.items))):
+        print(f"{kind}, {args.items} items, {len(document) / 2**20:.1f} MiB")
+        if has_lxml:
+            measure("BeautifulSoup + find()", soup_fields, document, args.repeat)
+        measure("XAFeedParser.parse_feed", streaming_fields, document, args.repeat)
+        print()
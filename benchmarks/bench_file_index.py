@@ -0,0 +1,93 @@
+"""Compares searching a directory tree by walking it with searching an XAFileIndex of the same tree.
+
+Usage: python benchmarks/bench_file_index.py [--files N] [--text] [--changes N]
+
+The tree is synthetic and created in a temporary directory. Each file is named from a small vocabulary and, with --text, contains a few lines of words from the same vocabulary.
+"""
+
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from PyXA.XAFileIndex import TEXT_EXTENSIONS, XAFileIndex
+
+WORDS = [
+    "alpha", "budget", "camera", "draft", "export", "final", "garden", "invoice", "journal", "kernel",
+    "ledger", "meeting", "notes", "outline", "photo", "quarter", "report", "summary", "travel", "update",
+]
+
+
+def make_tree(root: str, num_files: int, text: bool):
+    rng = random.Random(0)
+    now = time.time()
+    for i in range(num_files):
+        directory = os.path.join(root, *(f"dir{rng.randrange(10)}" for _ in range(2)))
+        os.makedirs(directory, exist_ok=True)
+        name = "_".join(rng.sample(WORDS, 2)) + f"_{i}." + rng.choice(["txt", "md", "pdf", "py"])
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            if text:
+                f.write("\n".join(" ".join(rng.choices(WORDS, k=12)) for _ in range(20)))
+        mtime = now - rng.uniform(0, 365) * 86400
+        os.utime(path, (mtime, mtime))
+
+
+def walk_search(root: str, term: str, start: datetime, end: datetime, text: bool) -> list[str]:
+    # The equivalent search without an index: stat every file and read every text file
+    results = []
+    for directory, _, names in os.walk(root):
+        for name in names:
+            path = os.path.join(directory, name)
+            mtime = os.stat(path).st_mtime
+            if not start.timestamp() < mtime < end.timestamp():
+                continue
+            if term in name.lower():
+                results.append(path)
+            elif text and os.path.splitext(name)[1][1:] in TEXT_EXTENSIONS:
+                with open(path, errors="ignore") as f:
+                    if term in f.read().lower():
+                        results.append(path)
+    return sorted(results)
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=20000, help="The number of files to create")
+    parser.add_argument("--text", action="store_true", help="Index the content of text files")
+    parser.add_argument("--changes", type=int, default=100, help="The number of files to modify before the incremental update")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        root = os.path.join(directory, "files")
+        make_tree(root, args.files, args.text)
+        index = XAFileIndex([root], path=os.path.join(directory, "index.sqlite3"), index_text=args.text, refresh_interval=None)
+
+        timed("Initial update", index.update)
+        timed("Update, no changes", index.update)
+
+        paths = random.Random(1).sample(index.search(extensions=["txt", "md"]), args.changes)
+        for path in paths:
+            with open(path, "a") as f:
+                f.write("\nmodified")
+        counts = timed(f"Update, {args.changes} files modified", index.update)
+
+        end = datetime.now()
+        start = end - timedelta(days=30)
+        timed("Search: term", lambda: index.search("report"))
+        timed("Search: two terms", lambda: index.search("report", "summary"))
+        timed("Search: date", lambda: index.search(end - timedelta(days=7)))
+        results = timed("Search: date range and term", lambda: index.search(start, end, "invoice"))
+        walked = timed("os.walk: date range and term", lambda: walk_search(root, "invoice", start, end, args.text))
+
+        print(f"\n{len(index)} entries, {counts['updated']} updated incrementally, {len(results)} results (walk found {len(walked)})")
+        index.close()
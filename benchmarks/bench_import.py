@@ -0,0 +1,40 @@
+"""Reports the per-module import cost of PyXA.
+
+Usage: python benchmarks/bench_import.py [statement] [--top N]
+
+Each measurement runs in a fresh interpreter using ``python -X importtime``.
+"""
+
+import argparse
+import time
+
+from PyXA.XALazy import import_costs
+
+STATEMENTS = [
+    "import PyXA",
+    "import PyXA; PyXA.Application",
+    "import PyXA; PyXA.XAText",
+    "import PyXA; PyXA.RSSFeed",
+]
+
+
+def report(statement: str, top: int):
+    start = time.perf_counter()
+    costs = import_costs(statement)
+    elapsed = time.perf_counter() - start
+
+    total = max((x[2] for x in costs), default=0)
+    print(f"{statement!r}: {total * 1000:.1f} ms importing, {elapsed * 1000:.1f} ms wall time")
+    for name, own, cumulative in costs[:top]:
+        print(f"    {cumulative * 1000:9.1f} ms cumulative {own * 1000:9.1f} ms self  {name}")
+    print()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("statement", nargs="?", help="The statement to measure")
+    parser.add_argument("--top", type=int, default=15, help="The number of modules to list")
+    args = parser.parse_args()
+
+    for statement in [args.statement] if args.statement else STATEMENTS:
+        report(statement, args.top)
@@ -0,0 +1,75 @@
+"""Compares training a latent semantic map one text at a time with training it in one session, and categorizing queries one at a time with categorizing them in a batch.
+
+Usage: python benchmarks/bench_lsm.py [--subjects N] [--unbatched N] [--backend native|numpy]
+
+The subjects are synthetic mail subject lines drawn from a vocabulary per category plus shared filler words. Training without a session compiles the map after every text, so it is timed on the first --unbatched subjects only. The native backend requires macOS; the NumPy backend runs everywhere.
+"""
+
+import argparse
+import random
+import time
+
+from PyXA.Additions.Learn import XALSM
+
+CATEGORIES = {
+    "spam": "deal offer free winner prize cash discount urgent claim bonus",
+    "work": "meeting agenda report deadline project review budget quarter schedule draft",
+    "travel": "flight hotel booking itinerary airport boarding trip reservation gate luggage",
+    "social": "party dinner birthday photos weekend friends invite wedding brunch game",
+}
+FILLER = "re fwd your the for and our new this about please today update".split()
+
+
+def synthetic_subjects(count: int, seed: int) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    names = list(CATEGORIES)
+    subjects = []
+    for _ in range(count):
+        category = rng.choice(names)
+        words = rng.choices(CATEGORIES[category].split(), k=3) + rng.choices(FILLER, k=4)
+        rng.shuffle(words)
+        subjects.append((" ".join(words), category))
+    return subjects
+
+
+def train(backend: str, subjects: list[tuple[str, str]], session: bool) -> XALSM:
+    lsm = XALSM({name: [] for name in CATEGORIES}, backend=backend)
+    if session:
+        with lsm.training():
+            for subject, category in subjects:
+                lsm.add_text(subject, category)
+    else:
+        for subject, category in subjects:
+            lsm.add_text(subject, category)
+    return lsm
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--subjects", type=int, default=50000, help="The number of subjects to train on and to categorize")
+    parser.add_argument("--unbatched", type=int, default=1000, help="The number of subjects to train on without a session")
+    parser.add_argument("--backend", choices=["native", "numpy"], default="numpy", help="The map implementation to use")
+    args = parser.parse_args()
+
+    subjects = synthetic_subjects(args.subjects, 0)
+    queries = synthetic_subjects(args.subjects, 1)
+    names = list(CATEGORIES)
+
+    timed(f"Train {args.unbatched}, compile each", lambda: train(args.backend, subjects[: args.unbatched], False))
+    timed(f"Train {args.unbatched}, one session", lambda: train(args.backend, subjects[: args.unbatched], True))
+    lsm = timed(f"Train {args.subjects}, one session", lambda: train(args.backend, subjects, True))
+
+    texts = [text for text, _ in queries]
+    single = timed(f"Categorize {len(texts)}, one at a time", lambda: [lsm.categorize_query(text) for text in texts])
+    batched = timed(f"Categorize {len(texts)}, categorize_many", lambda: lsm.categorize_many(texts))
+
+    correct = sum(len(r) > 0 and names[r[0][0] - 1] == category for r, (_, category) in zip(batched, queries))
+    same = [[c for c, _ in r] for r in single] == [[c for c, _ in r] for r in batched]
+    print(f"\n{correct}/{len(queries)} correct, batch categories match single queries: {same}")
@@ -0,0 +1,63 @@
+"""Compares the strategies used by XAList.map on synthetic lists.
+
+Usage: python benchmarks/bench_map.py [--items N] [--wait MS] [--work N]
+
+Two functions are mapped over the items: one that waits for --wait milliseconds per item, standing in for an Apple Event or network request, and one that does --work iterations of arithmetic per item. Each is timed applied in a loop, lazily, on worker threads, and in worker processes.
+"""
+
+import argparse
+import time
+from functools import partial
+
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAMapping import iter_map, process_map, thread_map
+
+
+
+def wait_for_reply(item, index, wait):
+    time.sleep(wait)
+    return item["id"]
+
+
+def compute(item, index, work):
+    total = item["id"]
+    for i in range(work):
+        total = (total * 31 + i) % 1000003
+    return total
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=2000, help="The number of items to map over")
+    parser.add_argument("--wait", type=float, default=1, help="The milliseconds the I/O-bound function waits per item")
+    parser.add_argument("--work", type=int, default=5000, help="The iterations of the CPU-bound function per item")
+    args = parser.parse_args()
+
+    items = [{"id": i, "name": f"Item {i}"} for i in range(args.items)]
+    executor = XABoundedExecutor(max_workers=16)
+
+    # Partial functions of top-level functions can be sent to worker processes
+    for function in (partial(wait_for_reply, wait=args.wait / 1000), partial(compute, work=args.work)):
+        print(function.func.__name__)
+        expected = timed("  loop", lambda: [function(x, i) for i, x in enumerate(items)])
+        lazy = iter_map(function, items)
+        timed("  lazy, first result", lambda: next(lazy))
+        timed("  lazy, all results", lambda: list(iter_map(function, items)))
+        for chunk_size in (1, 16, None):
+            label = f"  threads, chunks of {chunk_size or 'default'}"
+            results = timed(label, lambda: list(thread_map(function, items, chunk_size, executor)))
+            assert results == expected
+        results = timed("  threads, unordered", lambda: list(thread_map(function, items, None, executor, ordered=False)))
+        assert sorted(results) == sorted(expected)
+        results = timed("  processes", lambda: list(process_map(function, items)))
+        assert results == expected
+        print()
+
+    executor.shutdown()
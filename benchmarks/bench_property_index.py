@@ -0,0 +1,44 @@
+"""Compares looking up elements by property value with a linear scan and with an XAPropertyIndex.
+
+Usage: python benchmarks/bench_property_index.py [--elements N] [--lookups N]
+
+The property values are synthetic persistent IDs. The scan stands in for evaluating an equality predicate over the whole list once per lookup, as the by_* methods do without an index.
+"""
+
+import argparse
+import random
+import time
+
+from PyXA.XAPropertyIndex import XAPropertyIndex
+
+
+def scan(values: list[str], value: str):
+    for position, x in enumerate(values):
+        if x == value:
+            return position
+    return None
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=40000, help="The number of elements in the list")
+    parser.add_argument("--lookups", type=int, default=10000, help="The number of values to look up")
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    values = [f"{rng.getrandbits(64):016X}" for _ in range(args.elements)]
+    lookups = rng.sample(values, args.lookups // 2) + [f"{rng.getrandbits(64):016X}" for _ in range(args.lookups - args.lookups // 2)]
+    rng.shuffle(lookups)
+
+    scanned = timed("Linear scan per lookup", lambda: [scan(values, x) for x in lookups])
+    index = timed("Build index", lambda: XAPropertyIndex("persistentID", values))
+    found = timed("Index lookups", lambda: index.positions(lookups))
+    assert found == scanned
+    print(f"\n{sum(x is not None for x in found)}/{len(lookups)} values found")
@@ -0,0 +1,86 @@
+"""Compares fetching many RSS feeds one at a time with fetching them through an RSSFeedGroup.
+
+Usage: python benchmarks/bench_rss.py [--feeds N] [--items N] [--latency SECONDS]
+
+The feeds are synthetic and served from a local HTTP server that supports ETag validation. The server adds a fixed delay to each response to simulate network latency.
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyXA.Additions.Web import RSSFeed, RSSFeedGroup
+from PyXA.XAHTTPCache import XAHTTPCache
+
+
+def synthetic_feed(index: int, num_items: int) -> bytes:
+    items = "".join(
+        f"<item><title>Feed {index} item {i}</title><guid>{index}-{i}</guid>"
+        f"<link>http://example.com/{index}/{i}</link>"
+        f"<pubDate>{formatdate(1_660_000_000 + index * 60 + i * 3600)}</pubDate>"
+        f"<description>Item {i} of feed {index}</description></item>"
+        for i in range(num_items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {index}</title>{items}</channel></rss>'.encode("utf-8")
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        index = int(self.path.strip("/").split(".")[0])
+        etag = f'"{index}"'
+        time.sleep(self.server.latency)
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        body = self.server.feeds[index]
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def timed(label: str, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label:<40} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--feeds", type=int, default=300, help="The number of feeds to serve")
+    parser.add_argument("--items", type=int, default=20, help="The number of items per feed")
+    parser.add_argument("--latency", type=float, default=0.02, help="The delay added to each response, in seconds")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+    server.daemon_threads = True
+    server.latency = args.latency
+    server.feeds = [synthetic_feed(i, args.items) for i in range(args.feeds)]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = [f"http://127.0.0.1:{server.server_address[1]}/{i}.xml" for i in range(args.feeds)]
+
+    with tempfile.TemporaryDirectory() as directory:
+        cache = XAHTTPCache(directory)
+        timed("Serial RSSFeed, no cache", lambda: [RSSFeed(url, cache=None) for url in urls])
+        timed("RSSFeedGroup, no cache", lambda: RSSFeedGroup(urls, cache=None))
+        group = timed("RSSFeedGroup, cold cache", lambda: RSSFeedGroup(urls, cache=cache))
+        new_items = timed("RSSFeedGroup.refetch(), warm cache", group.refetch)
+        print(f"\n{len(group.items())} items, {len(new_items)} new after refetch, {len(group.errors)} errors")
+
+    server.shutdown()
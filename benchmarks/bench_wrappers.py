@@ -0,0 +1,153 @@
+"""Compares element wrappers that specialize themselves when created with slotted wrappers that specialize on first use of a subclass attribute.
+
+Usage: python benchmarks/bench_wrappers.py [--elements N] [--event-latency US]
+
+The elements are fake scripting elements whose object class lookup stands in for an Apple Event, taking --event-latency microseconds. The eager wrappers mirror how XAMusicTrack was specialized before: a dict-backed object that looks up its object class and re-runs __init__ as the subclass. The deferred wrappers use __slots__ and PyXA.XASpecialization.XASpecializable, as XAMusicTrack now does. Memory is the size of the wrappers and their list, divided by the number of elements.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from PyXA.XASpecialization import XASpecializable
+
+KINDS = ["file", "file", "file", "shared", "url"]
+
+
+class FakeElement:
+    latency = 0.0
+    events = 0
+
+    def __init__(self, kind: str):
+        self.kind = kind
+
+    def objectClass(self) -> str:
+        FakeElement.events += 1
+        if FakeElement.latency > 0:
+            end = time.perf_counter() + FakeElement.latency
+            while time.perf_counter() < end:
+                pass
+        return self.kind
+
+    def name(self) -> str:
+        return "Track"
+
+    def location(self) -> str:
+        return "/Music/track.m4a"
+
+
+class EagerObject:
+    def __init__(self, properties: dict):
+        self.xa_prnt = properties.get("parent", None)
+        self.xa_elem = properties.get("element", None)
+        self.xa_scel = properties.get("scriptable_element", None)
+        self.xa_aref = properties.get("appref", None)
+
+
+class EagerTrack(EagerObject):
+    def __init__(self, properties: dict):
+        super().__init__(properties)
+
+        if not hasattr(self, "xa_specialized"):
+            old_dict = self.__dict__.copy()
+            kind = self.xa_elem.objectClass()
+            if kind == "file":
+                self.__class__ = EagerFileTrack
+            elif kind == "shared":
+                self.__class__ = EagerSharedTrack
+            self.xa_specialized = True
+            self.__init__(properties)
+            self.__dict__.update(old_dict)
+
+    @property
+    def name(self) -> str:
+        return self.xa_elem.name()
+
+
+class EagerFileTrack(EagerTrack):
+    @property
+    def location(self) -> str:
+        return self.xa_elem.location()
+
+
+class EagerSharedTrack(EagerTrack):
+    pass
+
+
+class SlottedObject:
+    __slots__ = ("xa_prnt", "xa_elem", "xa_scel", "xa_aref")
+
+    def __init__(self, properties: dict):
+        self.xa_prnt = properties.get("parent", None)
+        self.xa_elem = properties.get("element", None)
+        self.xa_scel = properties.get("scriptable_element", None)
+        self.xa_aref = properties.get("appref", None)
+
+
+class DeferredTrack(SlottedObject, XASpecializable):
+    __slots__ = ()
+
+    @property
+    def object_class(self) -> str:
+        return self.xa_elem.objectClass()
+
+    @property
+    def name(self) -> str:
+        return self.xa_elem.name()
+
+
+class DeferredFileTrack(DeferredTrack):
+    __slots__ = ()
+
+    @property
+    def location(self) -> str:
+        return self.xa_elem.location()
+
+
+class DeferredSharedTrack(DeferredTrack):
+    __slots__ = ()
+
+
+DeferredTrack._xa_specializations = {"file": DeferredFileTrack, "shared": DeferredSharedTrack}
+
+
+def wrap_all(cls: type, elements: list[FakeElement]) -> list:
+    return [cls({"parent": None, "element": element, "appref": None}) for element in elements]
+
+
+def measure(label: str, cls: type, elements: list[FakeElement]):
+    tracemalloc.start()
+    wrappers = wrap_all(cls, elements)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del wrappers
+
+    FakeElement.events = 0
+    start = time.perf_counter()
+    wrappers = wrap_all(cls, elements)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:9.1f} ms {memory / len(elements):7.0f} B/element {FakeElement.events:7d} events")
+
+    FakeElement.events = 0
+    start = time.perf_counter()
+    names = [x.name for x in wrappers]
+    print(f"{'  read name of each':<40} {(time.perf_counter() - start) * 1000:9.1f} ms {'':17} {FakeElement.events:7d} events")
+
+    FakeElement.events = 0
+    start = time.perf_counter()
+    locations = [getattr(x, "location", None) for x in wrappers]
+    print(f"{'  read location of each':<40} {(time.perf_counter() - start) * 1000:9.1f} ms {'':17} {FakeElement.events:7d} events")
+    return names, locations
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--elements", type=int, default=40000, help="The number of elements to wrap")
+    parser.add_argument("--event-latency", type=float, default=50, help="The microseconds each object class lookup takes")
+    args = parser.parse_args()
+    FakeElement.latency = args.event_latency / 1e6
+
+    elements = [FakeElement(KINDS[i % len(KINDS)]) for i in range(args.elements)]
+    eager = measure("Eager, dict-backed wrappers", EagerTrack, elements)
+    deferred = measure("Deferred, slotted wrappers", DeferredTrack, elements)
+    assert eager == deferred
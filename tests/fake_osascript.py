@@ -0,0 +1,46 @@
+"""A stand-in for the AppleScript worker used to test AppleScriptPool without AppleScript.
+
+Understands a few commands in place of AppleScript source code:
+    return <text>    returns the text
+    args             returns the arguments
+    delay <seconds>  waits, then returns
+    fail <number>    raises a script error
+    crash            exits without responding
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyXA.XAScriptWorker import serve
+
+
+class FakeScriptError(Exception):
+    def __init__(self, number, message):
+        super().__init__(message)
+        self.number = number
+        self.message = message
+
+
+def execute(source, args):
+    command, _, argument = source.strip().partition(" ")
+    result = {"string": None, "int": 0, "bool": False, "float": 0.0, "date": None, "file_url": None, "type_code": 0, "data": None}
+
+    if command == "return":
+        result["string"] = argument
+    elif command == "args":
+        result["data"] = args
+    elif command == "delay":
+        time.sleep(float(argument))
+    elif command == "fail":
+        raise FakeScriptError(int(argument), "The script failed.")
+    elif command == "crash":
+        os._exit(3)
+    result["int"] = os.getpid()
+    return result
+
+
+if __name__ == "__main__":
+    serve(execute)
@@ -0,0 +1,76 @@
+import os
+import plistlib
+import tempfile
+import time
+import unittest
+
+from PyXA.XAAppIndex import XAAppIndex
+
+
+class TestAppIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = self.temp_dir.name
+        self.apps_dir = os.path.join(self.root, "Applications")
+        self.cache_path = os.path.join(self.root, "Caches", "app_index.json")
+
+        self.make_app(self.apps_dir, "Notes", "com.apple.Notes")
+        self.make_app(self.apps_dir, "Visual Studio Code", "com.microsoft.VSCode", "Code")
+        self.make_app(os.path.join(self.apps_dir, "Utilities"), "Terminal", "com.apple.Terminal")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_app(self, directory, name, bundle_id, display_name=None):
+        contents = os.path.join(directory, name + ".app", "Contents")
+        os.makedirs(contents)
+        info = {"CFBundleIdentifier": bundle_id, "CFBundleName": display_name or name}
+        with open(os.path.join(contents, "Info.plist"), "wb") as f:
+            plistlib.dump(info, f)
+
+    def make_index(self):
+        return XAAppIndex([self.apps_dir], cache_path=self.cache_path)
+
+    def test_lookups(self):
+        index = self.make_index()
+        notes_path = os.path.join(self.apps_dir, "Notes.app")
+        code_path = os.path.join(self.apps_dir, "Visual Studio Code.app")
+
+        self.assertEqual(index.find("notes"), notes_path)
+        self.assertEqual(index.find("Notes.app"), notes_path)
+        self.assertEqual(index.find("com.apple.notes"), notes_path)
+        self.assertEqual(index.find("Code"), code_path)
+        self.assertEqual(index.find("Visual Studio Code"), code_path)
+        self.assertEqual(index.find("terminal"), os.path.join(self.apps_dir, "Utilities", "Terminal.app"))
+        self.assertIsNone(index.find("Nonexistent"))
+
+    def test_partial_matches(self):
+        index = self.make_index()
+        code_path = os.path.join(self.apps_dir, "Visual Studio Code.app")
+
+        # Partial matches are left to find_containing, which callers use after every exact lookup fails
+        self.assertIsNone(index.find("Studio"))
+        self.assertEqual(index.find_containing("Studio"), code_path)
+        self.assertEqual(index.find_containing("utilities"), os.path.join(self.apps_dir, "Utilities", "Terminal.app"))
+        self.assertIsNone(index.find_containing("Nonexistent"))
+
+    def test_cache_is_reused(self):
+        self.make_index().find("Notes")
+        self.assertTrue(os.path.exists(self.cache_path))
+
+        index = self.make_index()
+        self.assertFalse(index.is_stale())
+        self.assertEqual(len(index.paths), 3)
+
+    def test_cache_is_invalidated_by_mtime(self):
+        self.make_index().find("Notes")
+        time.sleep(0.01)
+        self.make_app(self.apps_dir, "Safari", "com.apple.Safari")
+        os.utime(self.apps_dir, (time.time() + 1, time.time() + 1))
+
+        index = self.make_index()
+        self.assertEqual(index.find("Safari"), os.path.join(self.apps_dir, "Safari.app"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,126 @@
+import unittest
+
+import PyXA
+from PyXA.XABase import XAList, XAPredicate
+
+try:
+    import AppKit
+except ImportError:
+    AppKit = None
+
+
+class FakeRecord(dict):
+    """Stands in for a scripting element, whose properties are its keys."""
+
+    def respondsToSelector_(self, selector):
+        return selector in self
+
+    def __dir__(self):
+        return list(self.keys())
+
+
+class FakeElementArray(list):
+    """Stands in for an SBElementArray, counting each bulk request made against it."""
+
+    def __init__(self, records):
+        super().__init__(FakeRecord(record) for record in records)
+        self.requests = []
+
+    def objectAtIndex_(self, index):
+        return self[index]
+
+    def arrayByApplyingSelector_(self, selector):
+        self.requests.append(selector)
+        if selector == "properties":
+            return [dict(record) for record in self]
+        return [record.get(selector) for record in self]
+
+
+def make_list(records, list_class=XAList):
+    ls = list_class.__new__(list_class)
+    ls.xa_elem = FakeElementArray(records)
+    ls.xa_ocls = None
+    ls.xa_prnt = None
+    ls.xa_aref = None
+    return ls
+
+
+class TestXAListFetch(unittest.TestCase):
+    def setUp(self):
+        self.records = [
+            {"name": "Track 1", "artist": "A", "bpm": 120, "persistentID": "01"},
+            {"name": "Track 2", "artist": "B", "bpm": 90, "persistentID": "02"},
+            {"name": "Track 3", "artist": "A", "bpm": 100, "persistentID": "03"},
+        ]
+
+    def test_fetch_uses_one_request(self):
+        ls = make_list(self.records)
+        columns = ls.fetch("name", "artist", "bpm")
+        self.assertEqual(ls.xa_elem.requests, ["properties"])
+        self.assertEqual(columns["name"], ["Track 1", "Track 2", "Track 3"])
+        self.assertEqual(columns["artist"], ["A", "B", "A"])
+        self.assertEqual(columns["bpm"], [120, 90, 100])
+
+    def test_fetch_maps_snake_case_names(self):
+        ls = make_list(self.records)
+        columns = ls.fetch("name", "persistent_id")
+        self.assertEqual(columns["persistent_id"], ["01", "02", "03"])
+
+    def test_fetch_single_property(self):
+        ls = make_list(self.records)
+        self.assertEqual(ls.fetch("bpm"), {"bpm": [120, 90, 100]})
+        self.assertEqual(ls.xa_elem.requests, ["bpm"])
+
+    def test_fetch_resolves_selector_case(self):
+        # persistent_id camelizes to persistentId, but the scripting key is persistentID
+        ls = make_list(self.records)
+        self.assertEqual(ls.fetch("persistent_id"), {"persistent_id": ["01", "02", "03"]})
+        self.assertEqual(ls.xa_elem.requests, ["persistentID"])
+
+    def test_fetch_empty(self):
+        ls = make_list([])
+        self.assertEqual(ls.fetch("name", "artist"), {"name": [], "artist": []})
+        self.assertEqual(ls.xa_elem.requests, [])
+
+
+@unittest.skipIf(AppKit is None, "requires AppKit")
+class TestXAPredicateCache(unittest.TestCase):
+    def setUp(self):
+        XAPredicate.clear_cache()
+        self.arr = AppKit.NSArray.alloc().initWithArray_(
+            [{"name": "a", "size": 1}, {"name": "b", "size": 2}, {"name": "c", "size": 3}]
+        )
+
+    def test_equivalent_predicates_share_template(self):
+        for name in ["a", "b", "c"]:
+            predicate = XAPredicate()
+            predicate.add_eq_condition("name", name)
+            ls = predicate.evaluate(self.arr)
+            self.assertEqual(len(ls), 1)
+            self.assertEqual(ls[0]["name"], name)
+
+        info = XAPredicate.cache_info()
+        self.assertEqual(info["misses"], 1)
+        self.assertEqual(info["hits"], 2)
+        self.assertEqual(info["size"], 1)
+
+    def test_between_condition(self):
+        predicate = XAPredicate()
+        predicate.add_between_condition("size", 2, 3)
+        self.assertEqual(len(predicate.evaluate(self.arr)), 2)
+
+    def test_cache_is_bounded(self):
+        old_size = XAPredicate.cache_size
+        XAPredicate.cache_size = 2
+        try:
+            for key in ["name", "size", "other"]:
+                predicate = XAPredicate()
+                predicate.add_eq_condition(key, 1)
+                predicate.compile()
+            self.assertEqual(XAPredicate.cache_info()["size"], 2)
+        finally:
+            XAPredicate.cache_size = old_size
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import unittest
+
+from PyXA.XADataDetection import (
+    NSTextCheckingTypeLink,
+    NSTextCheckingTypePhoneNumber,
+    XADataMatch,
+    XANativeDetector,
+    XARegexDetector,
+    extract_all,
+    extract_links,
+    extract_many,
+)
+
+
+class TestRegexDetector(unittest.TestCase):
+    def setUp(self):
+        self.detector = XARegexDetector()
+
+    def values(self, text, kind):
+        return [x.value for x in extract_all(text, [kind], self.detector)[kind]]
+
+    def test_urls(self):
+        text = "See https://example.com/a_(b), www.python.org and apple.com/mac. Or ftp://files.example.net!"
+        self.assertEqual(
+            self.values(text, "urls"),
+            ["https://example.com/a_(b)", "http://www.python.org", "http://apple.com/mac", "ftp://files.example.net"],
+        )
+        self.assertEqual(self.values("(https://example.com/page)", "urls"), ["https://example.com/page"])
+
+    def test_emails_are_not_urls(self):
+        text = "Write to jane.doe+news@example.co.uk today."
+        matches = extract_all(text, detector=self.detector)
+        self.assertEqual(matches["emails"], [XADataMatch("emails", 9, 36, "jane.doe+news@example.co.uk")])
+        self.assertEqual(matches["urls"], [])
+
+    def test_links_include_emails(self):
+        text = "Mail jane@example.com or see https://example.com, then bob@example.org"
+        self.assertEqual(
+            extract_links(text, self.detector),
+            ["mailto:jane@example.com", "https://example.com", "mailto:bob@example.org"],
+        )
+
+    def test_phone_numbers(self):
+        text = "Call +1 (555) 010-0199, 030 1234 5678 or 5550100. Not 2022-10-01, 12.5 or 42."
+        self.assertEqual(self.values(text, "phone_numbers"), ["+1 (555) 010-0199", "030 1234 5678", "5550100"])
+        self.assertEqual(self.values("https://example.com/5550100199", "phone_numbers"), [])
+
+    def test_spans(self):
+        text = "\U0001F389 Mail me at a@example.com"
+        match = extract_all(text, ["emails"], self.detector)["emails"][0]
+        self.assertEqual(match.substring(text), "a@example.com")
+
+    def test_unsupported_kinds(self):
+        with self.assertRaises(ValueError):
+            extract_all("Tomorrow at 5pm", ["dates"], self.detector)
+
+    def test_batch(self):
+        class TextList:
+            xa_elem = ["a@example.com", "no data", "www.example.com"]
+
+        results = list(extract_many(TextList(), ["emails", "urls"], self.detector))
+        self.assertEqual([len(x["emails"]) + len(x["urls"]) for x in results], [1, 0, 1])
+
+
+class FakeURL:
+    def __init__(self, url):
+        self.url = url
+
+    def absoluteString(self):
+        return self.url
+
+
+class FakeMatch:
+    def __init__(self, result_type, location, length, url=None, phone_number=None):
+        self.result_type = result_type
+        self.match_range = (location, length)
+        self.url = url
+        self.phone_number = phone_number
+
+    def resultType(self):
+        return self.result_type
+
+    def range(self):
+        return self.match_range
+
+    def URL(self):
+        return FakeURL(self.url)
+
+    def phoneNumber(self):
+        return self.phone_number
+
+
+class FakeDataDetector:
+    def __init__(self, matches):
+        self.matches = matches
+        self.scans = 0
+
+    def matchesInString_options_range_(self, text, options, text_range):
+        self.scans += 1
+        return self.matches
+
+
+class NativeDetector(XANativeDetector):
+    def __init__(self, detector):
+        super().__init__()
+        self.fake = detector
+        self.requested_types = []
+
+    def detector(self, types):
+        self.requested_types.append(types)
+        return self.fake
+
+
+class TestNativeDetector(unittest.TestCase):
+    def test_single_scan_grouped_by_kind(self):
+        text = "\U0001F389 a@example.com https://example.com 555-0100"
+        fake = FakeDataDetector(
+            [
+                FakeMatch(NSTextCheckingTypeLink, 3, 13, url="mailto:a@example.com"),
+                FakeMatch(NSTextCheckingTypeLink, 17, 19, url="https://example.com"),
+                FakeMatch(NSTextCheckingTypePhoneNumber, 37, 8, phone_number="555-0100"),
+            ]
+        )
+        detector = NativeDetector(fake)
+        matches = detector.detect(text, ["urls", "emails", "phone_numbers"])
+
+        self.assertEqual(fake.scans, 1)
+        self.assertEqual(detector.requested_types, [NSTextCheckingTypeLink | NSTextCheckingTypePhoneNumber])
+        self.assertEqual([x.substring(text) for x in matches["emails"]], ["a@example.com"])
+        self.assertEqual(matches["emails"][0].value, "a@example.com")
+        self.assertEqual(matches["urls"][0].substring(text), "https://example.com")
+        self.assertEqual(matches["phone_numbers"][0].value, "555-0100")
+
+        # Matches of kinds that weren't requested are dropped
+        self.assertEqual(detector.detect(text, ["urls"]), {"urls": [matches["urls"][0]]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyXA.XADownloader import XADownloader, resolve_sources
+from PyXA.XAErrors import DownloadError
+from PyXA.XAHTTPCache import pooled_session
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\x00" * 64
+
+
+class ImageServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.paths = []
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        with self.server.lock:
+            self.server.paths.append(self.path)
+
+        if self.path.startswith("/slow"):
+            time.sleep(0.2)
+
+        if self.path.startswith("/page"):
+            body, content_type = b"<html></html>", "text/html"
+        elif self.path.startswith("/large"):
+            body, content_type = b"x" * 10000, "image/png"
+        elif self.path.startswith("/missing"):
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        else:
+            body, content_type = PNG, "image/png"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        if not self.path.startswith("/large"):
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestXADownloader(unittest.TestCase):
+    def setUp(self):
+        self.server = ImageServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def downloader(self, **kwargs):
+        return XADownloader(self.directory.name, session=pooled_session(retries=0), **kwargs)
+
+    def test_duplicates_are_downloaded_once(self):
+        downloader = self.downloader()
+        urls = [self.server.url("/slow/a.png"), self.server.url("/b.png"), self.server.url("/slow/a.png")]
+        paths = downloader.download_many(urls, content_type="image/")
+
+        self.assertEqual(paths[0], paths[2])
+        self.assertEqual(sorted(self.server.paths), ["/b.png", "/slow/a.png"])
+        with open(paths[0], "rb") as f:
+            self.assertEqual(f.read(), PNG)
+
+    def test_files_are_content_addressed(self):
+        paths = self.downloader().download_many([self.server.url("/a.png"), self.server.url("/b.png")])
+        self.assertEqual(paths[0], paths[1])
+        self.assertTrue(paths[0].endswith(".png"))
+
+    def test_cache_persists(self):
+        path = self.downloader().download(self.server.url("/a.png"))
+        downloader = self.downloader()
+        self.assertEqual(downloader.cached_path(self.server.url("/a.png")), path)
+        self.assertEqual(downloader.download(self.server.url("/a.png")), path)
+        self.assertEqual(len(self.server.paths), 1)
+
+    def test_limits(self):
+        downloader = self.downloader(max_bytes=1000, timeout=0.1)
+        results = downloader.download_many(
+            [
+                self.server.url("/large.png"),
+                self.server.url("/slow/c.png"),
+                self.server.url("/page.html"),
+                self.server.url("/missing.png"),
+                "ftp://example.com/a.png",
+            ],
+            content_type="image/",
+        )
+        for result in results:
+            self.assertIsInstance(result, DownloadError)
+        self.assertEqual([x for x in os.listdir(self.directory.name) if x.endswith(".tmp")], [])
+
+        with self.assertRaises(DownloadError):
+            downloader.download(self.server.url("/large.png"))
+
+    def test_file_urls_are_not_copied(self):
+        self.assertEqual(self.downloader().download("file:///tmp/a.png"), "/tmp/a.png")
+
+    def test_resolve_sources(self):
+        sources = ["/a.png", "b.png#top", None, "", "data:image/png;base64,AAAA", "http://other.com/c.png", "/a.png"]
+        self.assertEqual(
+            resolve_sources(sources, "http://example.com/news/index.html"),
+            ["http://example.com/a.png", "http://example.com/news/b.png", "http://other.com/c.png"],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+import pathlib
+import sys
+import unittest
+from datetime import datetime
+
+from PyXA.XAEvents import (
+    DESCRIPTOR_DECODERS,
+    OSType,
+    XAObjectSpecifier,
+    XAScriptResult,
+    decode_descriptor,
+)
+
+
+class FakeDate:
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+    def timeIntervalSince1970(self):
+        return self.timestamp
+
+
+class FakeURL:
+    def __init__(self, path):
+        self._path = path
+
+    def path(self):
+        return self._path
+
+
+class FakeDescriptor:
+    """Stands in for NSAppleEventDescriptor, recording which accessors are called."""
+
+    def __init__(self, type_code, value=None, items=None, keywords=None, data=b""):
+        self.type_code = OSType(type_code)
+        self.value = value
+        self.items = items or []
+        self.keywords = keywords or []
+        self.raw = data
+        self.calls = []
+
+    def __call(self, name, value):
+        self.calls.append(name)
+        return value
+
+    def descriptorType(self):
+        return self.type_code
+
+    def numberOfItems(self):
+        return len(self.items)
+
+    def descriptorAtIndex_(self, index):
+        return self.items[index - 1]
+
+    def keywordForDescriptorAtIndex_(self, index):
+        return OSType(self.keywords[index - 1])
+
+    def descriptorForKeyword_(self, keyword):
+        for name, item in zip(self.keywords, self.items):
+            if OSType(name) == keyword:
+                return item
+        return None
+
+    def stringValue(self):
+        return self.__call("stringValue", self.value if isinstance(self.value, str) else None)
+
+    def int32Value(self):
+        return self.__call("int32Value", self.value)
+
+    def doubleValue(self):
+        return self.__call("doubleValue", self.value)
+
+    def booleanValue(self):
+        return self.__call("booleanValue", self.value)
+
+    def dateValue(self):
+        return self.__call("dateValue", self.value)
+
+    def fileURLValue(self):
+        return self.__call("fileURLValue", self.value)
+
+    def typeCodeValue(self):
+        return self.__call("typeCodeValue", OSType(self.value))
+
+    def enumCodeValue(self):
+        return self.__call("enumCodeValue", OSType(self.value))
+
+    def data(self):
+        return self.__call("data", self.raw)
+
+
+def text(value):
+    return FakeDescriptor("utxt", value)
+
+
+def integer(value):
+    return FakeDescriptor("long", value)
+
+
+class TestDecodeDescriptor(unittest.TestCase):
+    def test_scalars(self):
+        self.assertEqual(decode_descriptor(text("abc")), "abc")
+        self.assertEqual(decode_descriptor(integer(5)), 5)
+        self.assertEqual(decode_descriptor(FakeDescriptor("doub", 1.5)), 1.5)
+        self.assertIs(decode_descriptor(FakeDescriptor("true", True)), True)
+        self.assertEqual(decode_descriptor(FakeDescriptor("ldt ", FakeDate(0))), datetime.fromtimestamp(0))
+        self.assertEqual(decode_descriptor(FakeDescriptor("alis", FakeURL("/tmp/a"))), pathlib.Path("/tmp/a"))
+        self.assertEqual(decode_descriptor(FakeDescriptor("enum", "yes ")), "yes ")
+        self.assertEqual(decode_descriptor(FakeDescriptor("type", "docu")), "docu")
+        self.assertIsNone(decode_descriptor(FakeDescriptor("type", "msng")))
+        self.assertIsNone(decode_descriptor(FakeDescriptor("null")))
+        self.assertIsNone(decode_descriptor(None))
+
+    def test_wide_integers(self):
+        data = (-(2**40)).to_bytes(8, sys.byteorder, signed=True)
+        self.assertEqual(decode_descriptor(FakeDescriptor("comp", data=data)), -(2**40))
+        data = (2**32 - 1).to_bytes(4, sys.byteorder)
+        self.assertEqual(decode_descriptor(FakeDescriptor("magn", data=data)), 2**32 - 1)
+
+    def test_only_relevant_accessors_are_called(self):
+        descriptor = integer(5)
+        decode_descriptor(descriptor)
+        self.assertEqual(descriptor.calls, ["int32Value"])
+
+    def test_unknown_types(self):
+        self.assertEqual(decode_descriptor(FakeDescriptor("abcd", "fallback")), "fallback")
+        self.assertEqual(decode_descriptor(FakeDescriptor("abcd", data=b"\x01")), b"\x01")
+
+    def test_lists_and_records(self):
+        user_fields = FakeDescriptor("list", items=[text("name"), text("A"), text("tags"), FakeDescriptor("list", items=[integer(1)])])
+        record = FakeDescriptor("reco", items=[integer(3), user_fields], keywords=["pidx", "usrf"])
+        self.assertEqual(
+            decode_descriptor(FakeDescriptor("list", items=[record, text("b")])),
+            [{"pidx": 3, "name": "A", "tags": [1]}, "b"],
+        )
+
+    def test_object_specifiers(self):
+        application = FakeDescriptor("null")
+        window = FakeDescriptor(
+            "obj ",
+            items=[FakeDescriptor("type", "cwin"), FakeDescriptor("enum", "indx"), integer(1), application],
+            keywords=["want", "form", "seld", "from"],
+        )
+        document = FakeDescriptor(
+            "obj ",
+            items=[FakeDescriptor("type", "docu"), FakeDescriptor("enum", "name"), text("Notes"), window],
+            keywords=["want", "form", "seld", "from"],
+        )
+        specifier = decode_descriptor(document)
+        self.assertIsInstance(specifier, XAObjectSpecifier)
+        self.assertEqual((specifier.desired_class, specifier.form, specifier.key), ("docu", "name", "Notes"))
+        self.assertEqual(specifier.container, XAObjectSpecifier("cwin", "indx", 1, None, window))
+        self.assertIs(specifier.descriptor, document)
+
+    def test_decoders_can_be_added(self):
+        DESCRIPTOR_DECODERS[OSType("zzzz")] = lambda descriptor: "custom"
+        try:
+            self.assertEqual(decode_descriptor(FakeDescriptor("zzzz")), "custom")
+        finally:
+            del DESCRIPTOR_DECODERS[OSType("zzzz")]
+
+
+class TestXAScriptResult(unittest.TestCase):
+    def test_fields_are_computed_on_access(self):
+        descriptor = FakeDescriptor("utxt", "line 1\rline 2")
+        result = XAScriptResult(descriptor)
+        self.assertEqual(descriptor.calls, [])
+
+        self.assertEqual(result["string"], "line 1\nline 2")
+        self.assertEqual(result["string"], "line 1\nline 2")
+        self.assertEqual(descriptor.calls, ["stringValue"])
+        self.assertIs(result["event"], descriptor)
+        self.assertEqual(result["value"], "line 1\rline 2")
+
+    def test_mapping_interface(self):
+        result = XAScriptResult(integer(3))
+        self.assertEqual(
+            list(result),
+            ["string", "int", "bool", "float", "date", "file_url", "type_code", "data", "event", "value"],
+        )
+        self.assertEqual(result.get("int"), 3)
+        self.assertIsNone(result.get("missing"))
+        self.assertNotIn("missing", result)
+        with self.assertRaises(KeyError):
+            result["missing"]
+
+
+if __name__ == "__main__":
+    unittest.main()
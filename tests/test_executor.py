@@ -0,0 +1,93 @@
+import threading
+import time
+import unittest
+
+from PyXA.XAExecutor import XABoundedExecutor
+
+
+class TestXABoundedExecutor(unittest.TestCase):
+    def setUp(self):
+        self.executor = XABoundedExecutor(max_workers=3, max_pending=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_results_are_ordered(self):
+        def fake_transform(x):
+            # Later items finish first
+            time.sleep((10 - x) / 1000)
+            return x * 2
+
+        self.assertEqual(self.executor.map(fake_transform, range(10)), [x * 2 for x in range(10)])
+
+    def test_concurrency_is_bounded(self):
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def fake_transform(x):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.005)
+            with lock:
+                state["running"] -= 1
+            return x
+
+        self.executor.map(fake_transform, range(30))
+        self.assertLessEqual(state["peak"], 3)
+
+    def test_submission_applies_backpressure(self):
+        release = threading.Event()
+        submitted = []
+
+        def submit_all():
+            for index in range(6):
+                self.executor.submit(release.wait)
+                submitted.append(index)
+
+        producer = threading.Thread(target=submit_all, daemon=True)
+        producer.start()
+        time.sleep(0.05)
+        self.assertEqual(len(submitted), 4)
+
+        release.set()
+        producer.join(1)
+        self.assertEqual(len(submitted), 6)
+
+    def test_errors_are_captured_per_item(self):
+        def fake_transform(x):
+            if x == 2:
+                raise ValueError("bad image")
+            return x
+
+        results = self.executor.map(fake_transform, range(4), return_exceptions=True)
+        self.assertEqual(results[:2], [0, 1])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertEqual(results[3], 3)
+
+        with self.assertRaises(ValueError):
+            self.executor.map(fake_transform, range(4))
+
+    def test_nested_submissions_run_inline(self):
+        def outer(x):
+            future = self.executor.submit(threading.current_thread)
+            return future.result() is threading.current_thread()
+
+        results = self.executor.map(outer, range(8))
+        self.assertEqual(results, [True] * 8)
+
+        future = self.executor.submit(lambda: self.executor.submit(int, "x").exception())
+        self.assertIsInstance(future.result(1), ValueError)
+
+    def test_resize(self):
+        self.executor.resize(max_workers=1)
+        self.assertEqual(self.executor.max_workers, 1)
+        self.assertEqual(self.executor.max_pending, 2)
+        self.assertEqual(self.executor.map(lambda x: x + 1, [1, 2]), [2, 3])
+
+        with self.assertRaises(ValueError):
+            self.executor.resize(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
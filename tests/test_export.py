@@ -0,0 +1,88 @@
+import csv
+import os
+import tempfile
+import unittest
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+
+from PyXA.XAExport import XAStringColumn, decode_enum, to_column, write_csv
+
+
+class Status(Enum):
+    MATCHED = int.from_bytes(b"kMat", "big")
+    UPLOADED = int.from_bytes(b"kUpl", "big")
+
+
+class FakeDescriptor:
+    def __init__(self, code):
+        self.code = code
+
+    def stringValue(self):
+        return self.code
+
+
+class TestExport(unittest.TestCase):
+    def test_numeric_columns(self):
+        self.assertEqual(to_column([1, 2, 3]).dtype, np.int64)
+        self.assertEqual(to_column([True, False]).dtype, np.bool_)
+
+        column = to_column([1, None, 3])
+        self.assertEqual(column.dtype, np.float64)
+        self.assertTrue(np.isnan(column[1]))
+
+    def test_datetime_column(self):
+        column = to_column([datetime(2022, 1, 1), None])
+        self.assertEqual(column.dtype, np.dtype("datetime64[us]"))
+        self.assertTrue(np.isnat(column[1]))
+
+    def test_string_column(self):
+        column = to_column(["a", None, "élan"])
+        self.assertIsInstance(column, XAStringColumn)
+        self.assertEqual(column.tolist(), ["a", None, "élan"])
+        self.assertEqual(column.data, "aélan".encode("utf-8"))
+        self.assertEqual(len(column), 3)
+
+    def test_mixed_column(self):
+        column = to_column([1, "a"])
+        self.assertEqual(column.dtype, object)
+
+    def test_decode_enum(self):
+        values = [FakeDescriptor("kMat"), FakeDescriptor("kUpl"), FakeDescriptor("kMat"), FakeDescriptor("none")]
+        column = decode_enum(values, Status)
+        self.assertEqual(list(column), [Status.MATCHED, Status.UPLOADED, Status.MATCHED, None])
+
+    def test_write_csv(self):
+        chunks = [
+            {"name": to_column(["a", "b"]), "status": decode_enum([FakeDescriptor("kMat")] * 2, Status)},
+            {"name": to_column(["c"]), "status": decode_enum([FakeDescriptor("kUpl")], Status)},
+        ]
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.csv")
+            self.assertEqual(write_csv(path, chunks), 3)
+            with open(path, newline="") as f:
+                rows = list(csv.reader(f))
+
+        self.assertEqual(rows, [["name", "status"], ["a", "MATCHED"], ["b", "MATCHED"], ["c", "UPLOADED"]])
+
+    def test_write_csv_empty_chunks(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "out.csv")
+            self.assertEqual(write_csv(path, iter([{"a": []}, {"a": [1, 2]}]), ["a"]), 2)
+            with open(path, newline="") as f:
+                self.assertEqual(list(csv.reader(f)), [["a"], ["1"], ["2"]])
+
+            # An empty list is exported as the header alone
+            self.assertEqual(write_csv(path, iter([{"a": []}]), ["a"]), 0)
+            with open(path, newline="") as f:
+                self.assertEqual(list(csv.reader(f)), [["a"]])
+
+            self.assertEqual(write_csv(path, iter([]), ["a"]), 0)
+            with open(path, newline="") as f:
+                self.assertEqual(list(csv.reader(f)), [["a"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
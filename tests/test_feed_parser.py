@@ -0,0 +1,145 @@
+import io
+import unittest
+from datetime import datetime, timezone
+
+from PyXA.XAFeedParser import iter_feed, parse_date, parse_feed
+
+RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel>
+    <title>Example</title>
+    <link>http://example.com/</link>
+    <item>
+        <title>First</title>
+        <link>http://example.com/1</link>
+        <guid isPermaLink="false">item-1</guid>
+        <dc:creator>Jane</dc:creator>
+        <category>News</category>
+        <category>Apple</category>
+        <comments>http://example.com/1#comments</comments>
+        <description>Summary of the first item</description>
+        <content:encoded><![CDATA[<p>Full content</p>]]></content:encoded>
+        <enclosure url="http://example.com/1.mp3" length="100" type="audio/mpeg"/>
+        <pubDate>Mon, 03 Oct 2022 12:00:00 GMT</pubDate>
+        <source url="http://other.com/feed">Other</source>
+    </item>
+    <item>
+        <title>Second</title>
+        <link>http://example.com/2</link>
+        <pubDate>not a date</pubDate>
+    </item>
+</channel>
+</rss>
+"""
+
+ATOM = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+    <title>Example</title>
+    <entry>
+        <title>Atom entry</title>
+        <id>urn:uuid:1225c695</id>
+        <link rel="enclosure" href="http://example.com/a.mp3"/>
+        <link href="http://example.com/a"/>
+        <author><name>John</name></author>
+        <category term="tech" label="Technology"/>
+        <summary>Short</summary>
+        <content type="xhtml"><div xmlns="http://www.w3.org/1999/xhtml">Rich <b>text</b></div></content>
+        <updated>2022-10-04T08:30:00Z</updated>
+        <rights>CC BY</rights>
+    </entry>
+</feed>
+"""
+
+MEDIA_RSS = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+    <item>
+        <title>Photo post</title>
+        <media:title>Photo caption</media:title>
+        <link>http://example.com/photo</link>
+        <content:encoded><![CDATA[<p>Full content</p>]]></content:encoded>
+        <media:content url="http://example.com/photo.jpg" medium="image">
+            <media:title>Photo title</media:title>
+            <media:description>Photo description</media:description>
+        </media:content>
+        <media:description>Caption description</media:description>
+        <description>Summary</description>
+    </item>
+</channel>
+</rss>
+"""
+
+
+class TestFeedParser(unittest.TestCase):
+    def test_rss_fields(self):
+        first, second = parse_feed(RSS)
+        self.assertEqual(first.title, "First")
+        self.assertEqual(first.link, "http://example.com/1")
+        self.assertEqual(first.guid, "item-1")
+        self.assertEqual(first.author, "Jane")
+        self.assertEqual(first.categories, ["News", "Apple"])
+        self.assertEqual(first.category, "News")
+        self.assertEqual(first.comments, "http://example.com/1#comments")
+        self.assertEqual(first.description, "Summary of the first item")
+        self.assertEqual(first.content, "<p>Full content</p>")
+        self.assertEqual(first.enclosure, "http://example.com/1.mp3")
+        self.assertEqual(first.publication_date, datetime(2022, 10, 3, 12, tzinfo=timezone.utc))
+        self.assertEqual(first.source, "Other")
+        self.assertEqual(first.key, "item-1")
+        self.assertIsNone(first.xml)
+
+        self.assertIsNone(second.publication_date)
+        self.assertEqual(second.key, "http://example.com/2")
+
+    def test_atom_fields(self):
+        (entry,) = parse_feed(ATOM)
+        self.assertEqual(entry.title, "Atom entry")
+        self.assertEqual(entry.guid, "urn:uuid:1225c695")
+        self.assertEqual(entry.link, "http://example.com/a")
+        self.assertEqual(entry.links, ["http://example.com/a.mp3", "http://example.com/a"])
+        self.assertEqual(entry.enclosure, "http://example.com/a.mp3")
+        self.assertEqual(entry.author, "John")
+        self.assertEqual(entry.categories, ["Technology"])
+        self.assertEqual(entry.description, "Short")
+        self.assertIn("Rich", entry.content)
+        self.assertIn("text</", entry.content)
+        self.assertEqual(entry.publication_date, datetime(2022, 10, 4, 8, 30, tzinfo=timezone.utc))
+        self.assertEqual(entry.copyright, "CC BY")
+
+    def test_other_namespaces_are_ignored(self):
+        (item,) = parse_feed(MEDIA_RSS)
+        self.assertEqual(item.title, "Photo post")
+        self.assertEqual(item.link, "http://example.com/photo")
+        self.assertEqual(item.content, "<p>Full content</p>")
+        self.assertEqual(item.description, "Summary")
+
+    def test_keep_xml(self):
+        first, _ = parse_feed(RSS, keep_xml=True)
+        self.assertIn("<title>First</title>", first.xml)
+
+        # Keeping the XML does not change the fingerprint, but editing a field does
+        self.assertEqual(first.fingerprint, parse_feed(RSS)[0].fingerprint)
+        edited = parse_feed(RSS.replace(b"Full content", b"Edited content"))[0]
+        self.assertNotEqual(edited.fingerprint, first.fingerprint)
+
+    def test_chunked_input_matches_whole_document(self):
+        whole = parse_feed(RSS)
+        self.assertEqual(parse_feed(io.BytesIO(RSS), chunk_size=7), whole)
+        self.assertEqual(parse_feed(RSS.decode("utf-8"), chunk_size=13), whole)
+
+    def test_items_are_yielded_incrementally(self):
+        items = "".join(f"<item><guid>{i}</guid></item>" for i in range(1000))
+        document = f"<rss><channel>{items}</channel></rss>".encode("utf-8")
+        records = iter_feed(io.BytesIO(document), chunk_size=64, keep_xml=False)
+        self.assertEqual(next(records).guid, "0")
+        self.assertEqual([record.guid for record in records], [str(i) for i in range(1, 1000)])
+
+    def test_parse_date(self):
+        self.assertEqual(parse_date("2022-10-04T08:30:00+02:00").utcoffset().total_seconds(), 7200)
+        self.assertEqual(parse_date("2022-10-04").tzinfo, timezone.utc)
+        self.assertIsNone(parse_date(""))
+        self.assertIsNone(parse_date("yesterday"))
+
+
+if __name__ == "__main__":
+    unittest.main()
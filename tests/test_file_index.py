@@ -0,0 +1,149 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+from datetime import datetime, timedelta
+
+from PyXA.XAFileIndex import XAFileIndex, parse_query
+
+
+class TestFileIndex(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = os.path.join(self.temp_dir.name, "files")
+        self.index_path = os.path.join(self.temp_dir.name, "index.sqlite3")
+
+        self.make_file("Weekly Report.pdf", b"%PDF", days_ago=3)
+        self.make_file("notes/todo.txt", b"Buy milk\nRenew passport", days_ago=1)
+        self.make_file("notes/ideas.md", b"A streaming report generator", days_ago=10)
+        self.make_file("src/report_builder.py", b"def build(): pass", days_ago=30)
+        self.make_file(".hidden/report.txt", b"secret")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_file(self, name, content, days_ago=0):
+        path = os.path.join(self.root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        mtime = time.time() - days_ago * 86400
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def make_index(self, **kwargs):
+        index = XAFileIndex([self.root], path=self.index_path, **kwargs)
+        self.addCleanup(index.close)
+        return index
+
+    def names(self, paths):
+        return [os.path.relpath(x, self.root) for x in paths]
+
+    def test_parse_query(self):
+        date1, date2 = datetime(2022, 10, 1), datetime(2022, 10, 8)
+        self.assertEqual(parse_query(("a", 2)), (None, None, ["a", "2"]))
+        self.assertEqual(parse_query((date1,)), (date1 - timedelta(hours=12), date1 + timedelta(hours=12), []))
+        self.assertEqual(parse_query((date1, date2)), (date1, date2, []))
+        self.assertEqual(parse_query((date1, "a")), (date1 - timedelta(hours=12), date1 + timedelta(hours=12), ["a"]))
+        self.assertEqual(parse_query((date1, date2, "a")), (date1, date2, ["a"]))
+        with self.assertRaises(ValueError):
+            parse_query(("a", date1))
+
+    def test_name_search(self):
+        index = self.make_index()
+        self.assertEqual(self.names(index.search("report")), ["Weekly Report.pdf", "src/report_builder.py"])
+        self.assertEqual(self.names(index.search("report", "py")), ["src/report_builder.py"])
+        self.assertEqual(self.names(index.search("no")), ["notes"])
+        self.assertEqual(index.search("nonexistent"), [])
+        self.assertEqual(self.names(index.search(extensions=[".MD"])), ["notes/ideas.md"])
+
+    def test_text_search(self):
+        index = self.make_index(index_text=True)
+        self.assertEqual(self.names(index.search("passport")), ["notes/todo.txt"])
+        self.assertEqual(self.names(index.search("milk renew")), ["notes/todo.txt"])
+        self.assertEqual(self.names(index.search("milk generator")), [])
+        self.assertEqual(
+            self.names(index.search("report")),
+            ["Weekly Report.pdf", "notes/ideas.md", "src/report_builder.py"],
+        )
+
+    def test_date_search(self):
+        index = self.make_index()
+        now = datetime.now()
+        self.assertEqual(self.names(index.search(now - timedelta(days=3))), ["Weekly Report.pdf"])
+
+        paths = self.names(index.search(now - timedelta(days=11), now - timedelta(days=2)))
+        self.assertEqual(paths, ["Weekly Report.pdf", "notes/ideas.md"])
+
+        paths = self.names(index.search(now - timedelta(days=11), now - timedelta(days=2), "report"))
+        self.assertEqual(paths, ["Weekly Report.pdf"])
+
+    def test_incremental_update(self):
+        index = self.make_index(index_text=True, refresh_interval=None)
+        self.assertEqual(index.update(), {"added": 6, "updated": 0, "removed": 0})
+        self.assertEqual(index.update(), {"added": 0, "updated": 0, "removed": 0})
+
+        self.make_file("notes/todo.txt", b"Call the plumber", days_ago=1)
+        os.remove(os.path.join(self.root, "Weekly Report.pdf"))
+        self.make_file("draft.txt", b"")
+        self.assertEqual(index.update(), {"added": 1, "updated": 1, "removed": 1})
+
+        self.assertEqual(index.search("passport"), [])
+        self.assertEqual(self.names(index.search("plumber")), ["notes/todo.txt"])
+        self.assertEqual(self.names(index.search("report")), ["notes/ideas.md", "src/report_builder.py"])
+
+    def test_index_persists(self):
+        self.make_index().update()
+        index = self.make_index(refresh_interval=None)
+        self.assertEqual(len(index), 6)
+        self.assertIsNotNone(index.last_update)
+
+        # Different settings start a new index
+        index = self.make_index(include_hidden=True, refresh_interval=None)
+        self.assertEqual(len(index), 0)
+        index.update()
+        self.assertIn(".hidden/report.txt", self.names(index.search("report")))
+
+    def test_shared_database(self):
+        other_root = os.path.join(self.temp_dir.name, "other")
+        os.makedirs(other_root)
+        with open(os.path.join(other_root, "beta.txt"), "w"):
+            pass
+
+        index = self.make_index(refresh_interval=0)
+        other = XAFileIndex([other_root], path=self.index_path, refresh_interval=0)
+        self.addCleanup(other.close)
+
+        # Each index only returns files within its roots, rebuilding the database if the other index replaced it
+        self.assertEqual(other.search("report"), [])
+        self.assertEqual(other.search("beta"), [os.path.join(other_root, "beta.txt")])
+        self.assertEqual(len(index.search("report")), 2)
+        self.assertEqual(index.search("beta"), [])
+        self.assertEqual(other.search("beta"), [os.path.join(other_root, "beta.txt")])
+
+    def test_default_path(self):
+        with mock.patch.dict(os.environ, {"HOME": self.temp_dir.name}):
+            index = XAFileIndex([self.root])
+            self.addCleanup(index.close)
+            other = XAFileIndex([self.root], include_hidden=True)
+            self.addCleanup(other.close)
+            same = XAFileIndex([self.root])
+            self.addCleanup(same.close)
+
+        self.assertTrue(index.path.startswith(self.temp_dir.name))
+        self.assertNotEqual(index.path, other.path)
+        self.assertEqual(index.path, same.path)
+
+    def test_refresh_interval(self):
+        index = self.make_index(refresh_interval=None)
+        self.assertEqual(index.search("report"), [])
+
+        index = self.make_index(refresh_interval=0)
+        self.assertEqual(len(index.search("report")), 2)
+        self.make_file("report2.txt", b"")
+        self.assertEqual(len(index.search("report")), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,216 @@
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAHTTPCache import XAHTTPCache, XAHTTPResult, pooled_session
+
+
+class FeedServer(ThreadingHTTPServer):
+    """A local stand-in for a feed host that honors If-None-Match."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FeedHandler)
+        self.body = b"<rss><channel><item><guid>1</guid></item></channel></rss>"
+        self.version = 1
+        self.requests = []
+        self.paths = []
+        self.failures = 0
+        self.extra_headers = {}
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/feed.xml"
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        server.requests.append(dict(self.headers))
+        server.paths.append(self.path)
+        etag = f'"v{server.version}"'
+
+        if server.failures > 0:
+            server.failures -= 1
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            for name, value in server.extra_headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", "Mon, 03 Oct 2022 12:00:00 GMT")
+        self.send_header("Content-Length", str(len(server.body)))
+        for name, value in server.extra_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(server.body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestXAHTTPCache(unittest.TestCase):
+    def setUp(self):
+        self.server = FeedServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.directory.cleanup()
+
+    def test_conditional_requests(self):
+        cache = XAHTTPCache(self.directory.name)
+
+        result = cache.fetch(self.server.url)
+        self.assertEqual(result.status_code, 200)
+        self.assertTrue(result.changed)
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+
+        result = cache.fetch(self.server.url)
+        self.assertTrue(result.not_modified)
+        self.assertFalse(result.changed)
+        self.assertEqual(result.content, self.server.body)
+        self.assertEqual(self.server.requests[-1]["If-None-Match"], '"v1"')
+        self.assertEqual(self.server.requests[-1]["If-Modified-Since"], "Mon, 03 Oct 2022 12:00:00 GMT")
+
+        self.server.version = 2
+        self.server.body = b"<rss><channel><item><guid>2</guid></item></channel></rss>"
+        result = cache.fetch(self.server.url)
+        self.assertEqual(result.status_code, 200)
+        self.assertTrue(result.changed)
+        self.assertEqual(result.content, self.server.body)
+
+    def test_unchanged_body_without_validators(self):
+        cache = XAHTTPCache(None)
+        cache.fetch(self.server.url)
+
+        # A new version with the same body is downloaded but reported as unchanged
+        self.server.version = 2
+        result = cache.fetch(self.server.url)
+        self.assertFalse(result.not_modified)
+        self.assertFalse(result.changed)
+
+    def test_cache_persists(self):
+        XAHTTPCache(self.directory.name).fetch(self.server.url)
+        XAHTTPCache(self.directory.name).set_extra(self.server.url, "items", {"1": "abc"})
+
+        cache = XAHTTPCache(self.directory.name)
+        result = cache.fetch(self.server.url)
+        self.assertTrue(result.not_modified)
+        self.assertEqual(result.content, self.server.body)
+        self.assertEqual(cache.get_extra(self.server.url, "items"), {"1": "abc"})
+
+        cache.clear()
+        self.assertIsNone(XAHTTPCache(self.directory.name).body(self.server.url))
+
+    def test_deferred_writes(self):
+        cache = XAHTTPCache(self.directory.name)
+        index_path = os.path.join(self.directory.name, "index.json")
+
+        with cache.deferred_writes():
+            cache.fetch(self.server.url)
+            self.assertFalse(os.path.exists(index_path))
+        self.assertTrue(os.path.exists(index_path))
+
+    def test_pooled_session_retries(self):
+        session = pooled_session(connections_per_host=2, retries=2, backoff_factor=0)
+        self.server.failures = 2
+        result = XAHTTPCache(None).fetch(self.server.url, session)
+        self.assertEqual(result.status_code, 200)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_fresh_responses_are_reused(self):
+        cache = XAHTTPCache(self.directory.name)
+        self.server.extra_headers = {"Cache-Control": "public, max-age=60"}
+        cache.fetch(self.server.url)
+
+        result = cache.fetch(self.server.url)
+        self.assertTrue(result.fresh)
+        self.assertEqual(result.content, self.server.body)
+        self.assertEqual(len(self.server.requests), 1)
+
+        # A response that must be revalidated is still conditional
+        self.server.extra_headers = {"Cache-Control": "no-cache"}
+        cache.clear()
+        cache.fetch(self.server.url)
+        self.assertTrue(cache.fetch(self.server.url).not_modified)
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_expired_responses_are_revalidated(self):
+        cache = XAHTTPCache(None)
+        self.server.extra_headers = {"Cache-Control": "max-age=0"}
+        cache.fetch(self.server.url)
+
+        # The 304 response extends the freshness of the cached body
+        self.server.extra_headers = {"Cache-Control": "max-age=60"}
+        self.assertTrue(cache.fetch(self.server.url).not_modified)
+        self.assertTrue(cache.fetch(self.server.url).fresh)
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_no_store_responses_are_not_cached(self):
+        cache = XAHTTPCache(self.directory.name)
+        self.server.extra_headers = {"Cache-Control": "no-store"}
+        cache.fetch(self.server.url)
+        self.assertIsNone(cache.body(self.server.url))
+        self.assertNotIn("If-None-Match", self.server.requests[-1])
+
+    def test_size_limits(self):
+        body = b"x" * 100
+        cache = XAHTTPCache(None, memory_limit=250)
+        for i in range(3):
+            cache.store(f"http://example.com/{i}", body)
+        self.assertIsNone(cache.body("http://example.com/0"))
+        self.assertEqual(cache.body("http://example.com/2"), body)
+
+        cache = XAHTTPCache(self.directory.name, memory_limit=0, disk_limit=250)
+        for i in range(3):
+            cache.store(f"http://example.com/{i}", body)
+            if i == 1:
+                # Reading the first body makes the second the least recently used
+                cache.body("http://example.com/0")
+        self.assertEqual(cache.body("http://example.com/0"), body)
+        self.assertIsNone(cache.body("http://example.com/1"))
+        self.assertEqual(len([x for x in os.listdir(self.directory.name) if x != "index.json"]), 2)
+
+    def test_fetch_many(self):
+        cache = XAHTTPCache(None)
+        urls = [self.server.url + "?a", self.server.url + "?b", self.server.url + "?a", "http://127.0.0.1:1/"]
+        executor = XABoundedExecutor(max_workers=4)
+        results = cache.fetch_many(urls, pooled_session(retries=0), executor=executor)
+        executor.shutdown()
+
+        self.assertEqual([x.url for x in results[:3]], urls[:3])
+        self.assertIs(results[0], results[2])
+        self.assertIsInstance(results[3], Exception)
+        self.assertEqual(sorted(self.server.paths), ["/feed.xml?a", "/feed.xml?b"])
+
+
+class TestXAHTTPResult(unittest.TestCase):
+    def test_title_without_full_parse(self):
+        body = "<html><head><title>Caf&eacute; \u2014 Menu</title></head><body>" + "<p>x</p>" * 10000
+        result = XAHTTPResult("http://example.com", 200, body.encode("utf-8"), {"Content-Type": "text/html; charset=utf-8"})
+        self.assertEqual(result.title, "Caf\u00e9 \u2014 Menu")
+
+    def test_encoding(self):
+        body = '<meta charset="iso-8859-1"><title>Caf\u00e9</title>'.encode("latin-1")
+        result = XAHTTPResult("http://example.com", 200, body)
+        self.assertEqual(result.encoding, "iso-8859-1")
+        self.assertEqual(result.title, "Caf\u00e9")
+        self.assertIsNone(XAHTTPResult("http://example.com", 200, b"<p>No title</p>").title)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+
+from PyXA.XAImagePipeline import (
+    DEPTH_OF_FIELD_FOCAL_REGION,
+    XAFusedFilters,
+    XAImageOperation,
+    XAImagePipeline,
+    optimize,
+    relative_point,
+)
+
+
+def blur(radius=10):
+    return XAImageOperation("filter", "CIGaussianBlur", {"inputRadius": radius})
+
+
+def sepia():
+    return XAImageOperation("filter", "CISepiaTone", {"inputIntensity": 1.0})
+
+
+def rotate(degrees):
+    return XAImageOperation("transform", "rotate", {"degrees": degrees})
+
+
+def scale(x, y):
+    return XAImageOperation("transform", "scale", {"x": x, "y": y})
+
+
+def flip(direction):
+    return XAImageOperation("transform", "flip", {"direction": direction})
+
+
+def crop(image):
+    return image
+
+
+class TestImagePipeline(unittest.TestCase):
+    def test_consecutive_filters_are_fused(self):
+        stages = optimize([blur(), sepia(), rotate(45), blur(5)])
+        self.assertEqual(stages, [XAFusedFilters([blur(), sepia()]), rotate(45), XAFusedFilters([blur(5)])])
+
+    def test_transforms_are_folded(self):
+        self.assertEqual(optimize([rotate(90), rotate(180)]), [rotate(270)])
+        self.assertEqual(optimize([scale(2, 2), scale(0.5, 3)]), [scale(1.0, 6)])
+        self.assertEqual(optimize([rotate(45), rotate(45)]), [rotate(45), rotate(45)])
+
+    def test_identities_are_removed(self):
+        self.assertEqual(optimize([rotate(90), rotate(270)]), [])
+        self.assertEqual(optimize([scale(1, 1)]), [])
+        self.assertEqual(optimize([flip("horizontal"), flip("horizontal")]), [])
+        self.assertEqual(optimize([flip("horizontal"), flip("vertical")]), [flip("horizontal"), flip("vertical")])
+
+    def test_removed_transforms_join_filter_chains(self):
+        stages = optimize([blur(), flip("vertical"), flip("vertical"), sepia()])
+        self.assertEqual(stages, [XAFusedFilters([blur(), sepia()])])
+
+    def test_opaque_operations_are_barriers(self):
+        operation = XAImageOperation("opaque", "crop", function=crop)
+        stages = optimize([rotate(90), operation, rotate(90), blur(), operation, sepia()])
+        self.assertEqual(
+            stages,
+            [rotate(90), operation, rotate(90), XAFusedFilters([blur()]), operation, XAFusedFilters([sepia()])],
+        )
+
+    def test_parameters_resolve_from_size(self):
+        operation = XAImageOperation("filter", "CIBumpDistortion", {"inputCenter": lambda size: (size[0] / 2, size[1] / 2), "inputRadius": 300})
+        self.assertEqual(operation.resolve_parameters((100, 50)), {"inputCenter": (50, 25), "inputRadius": 300})
+
+    def test_pipeline_records_operations(self):
+        pipeline = XAImagePipeline().add(blur()).add(sepia())
+        self.assertEqual(len(pipeline), 2)
+        self.assertEqual(pipeline.plan(), [XAFusedFilters([blur(), sepia()])])
+
+
+class TestDepthOfField(unittest.TestCase):
+    def test_default_focal_region(self):
+        # Both the deferred and the immediate filter resolve their default focal line with these points
+        size = (300, 600)
+        points = [relative_point(size, x) for x in DEPTH_OF_FIELD_FOCAL_REGION]
+        self.assertEqual(points, [(150, 200), (150, 400)])
+        for x, y in points:
+            self.assertTrue(0 <= x <= size[0] and 0 <= y <= size[1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import os
+import tempfile
+import unittest
+
+from PyXA.Additions.Learn import XALSM, XANumPyLSM
+
+DATASET = {
+    "color": ["red orange yellow green", "emerald blue purple pink grey"],
+    "number": ["one two three four five", "six seven eight nine ten"],
+}
+
+
+class TestNumPyLSM(unittest.TestCase):
+    def setUp(self):
+        self.lsm = XALSM(DATASET, backend="numpy")
+
+    def test_backend_selects_implementation(self):
+        self.assertIsInstance(self.lsm, XANumPyLSM)
+        with self.assertRaises(ValueError):
+            XALSM(DATASET, backend="other")
+
+    def test_requires_dataset(self):
+        with self.assertRaises(ValueError):
+            XANumPyLSM()
+
+    def test_categorize_query(self):
+        self.assertEqual(self.lsm.categorize_query("emerald green three")[0][0], 1)
+        self.assertEqual(self.lsm.categorize_query("six and seven")[0][0], 2)
+        self.assertEqual(self.lsm.categorize_query("unknown words only"), [])
+
+        results = self.lsm.categorize_query("blue two", num_results=2)
+        self.assertEqual([category for category, _ in results], [1, 2])
+        self.assertAlmostEqual(sum(score for _, score in results), 1.0)
+
+    def test_categorize_many_matches_single_queries(self):
+        queries = ["purple pink", "nine ten", "", "green eight eight", "nothing"]
+        self.assertEqual(
+            self.lsm.categorize_many(queries, 2),
+            [self.lsm.categorize_query(query, 2) for query in queries],
+        )
+
+    def test_training_compiles_once(self):
+        compiled = []
+        original = self.lsm._XANumPyLSM__compile
+        self.lsm._XANumPyLSM__compile = lambda: (compiled.append(True), original())
+
+        with self.lsm.training():
+            category = self.lsm.add_category("animal", ["cat dog"])
+            for text in ["horse cow", "sheep goat", "cat"]:
+                self.lsm.add_text(text, "animal")
+            self.lsm.add_data({"number": ["eleven twelve"], "fruit": ["apple pear"]})
+            self.assertEqual(compiled, [])
+
+        self.assertEqual(compiled, [True])
+        self.assertEqual(category, 3)
+        self.assertEqual(self.lsm.categorize_query("goat")[0][0], 3)
+        self.assertEqual(self.lsm.categorize_query("twelve")[0][0], 2)
+        self.assertEqual(self.lsm.categorize_query("pear")[0][0], 4)
+
+    def test_training_compiles_on_error(self):
+        with self.assertRaises(RuntimeError):
+            with self.lsm.training():
+                self.lsm.add_text("crimson scarlet", "color")
+                raise RuntimeError
+
+        self.assertEqual(self.lsm.categorize_query("crimson")[0][0], 1)
+
+    def test_invalid_category(self):
+        with self.assertRaises(ValueError):
+            self.lsm.add_text("text", "missing")
+        with self.assertRaises(ValueError):
+            self.lsm.add_category("color")
+
+    def test_weight(self):
+        self.lsm.add_text("shared", "color", weight=1)
+        self.lsm.add_text("shared", 2, weight=5)
+        self.assertEqual(self.lsm.categorize_query("shared")[0][0], 2)
+
+    def test_dimensions(self):
+        queries = ["red", "ten", "red ten"]
+        lsm = XANumPyLSM(DATASET, dimensions=10)
+        self.assertEqual(lsm.categorize_many(queries, 2), self.lsm.categorize_many(queries, 2))
+
+        # With one dimension the two categories can no longer both be matched
+        lsm = XANumPyLSM(DATASET, dimensions=1)
+        self.assertTrue(all(len(result) <= 1 for result in lsm.categorize_many(queries, 2)))
+
+    def test_save_and_load(self):
+        self.lsm.add_text("crimson", "color", weight=2.5)
+        queries = ["emerald green three", "six and seven", "crimson"]
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "map.json")
+            self.assertTrue(self.lsm.save(path))
+            loaded = XALSM.load(path, backend="numpy")
+
+        self.assertIsInstance(loaded, XANumPyLSM)
+        self.assertEqual(loaded.categorize_many(queries, 2), self.lsm.categorize_many(queries, 2))
+        loaded.add_text("scarlet", "color")
+        self.assertEqual(loaded.categorize_query("scarlet")[0][0], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+import threading
+import time
+import unittest
+from datetime import datetime
+
+from PyXA.XAExecutor import XABoundedExecutor
+from PyXA.XAMapping import iter_map, process_map, snapshot, snapshot_rows, thread_map
+
+
+def square(item, index):
+    return item * item + index
+
+
+def fail_on_odd(item, index):
+    if item % 2 == 1:
+        raise ValueError(item)
+    return item
+
+
+class FakeDate:
+    def __init__(self, timestamp):
+        self.timestamp = timestamp
+
+    def timeIntervalSince1970(self):
+        return self.timestamp
+
+
+class PyObjCLikeString(str):
+    pass
+
+
+class TestIterMap(unittest.TestCase):
+    def test_lazy(self):
+        calls = []
+
+        def record(item, index):
+            calls.append(index)
+            return item
+
+        results = iter_map(record, range(100))
+        self.assertEqual(calls, [])
+        self.assertEqual([next(results), next(results)], [0, 1])
+        self.assertEqual(calls, [0, 1])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            list(iter_map(fail_on_odd, range(4)))
+
+        results = list(iter_map(fail_on_odd, range(4), errors="return"))
+        self.assertEqual(results[0::2], [0, 2])
+        self.assertTrue(all(isinstance(x, ValueError) for x in results[1::2]))
+
+        self.assertEqual(list(iter_map(fail_on_odd, range(4), errors="skip")), [0, 2])
+
+        with self.assertRaises(ValueError):
+            list(iter_map(square, range(4), errors="ignore"))
+
+
+class TestThreadMap(unittest.TestCase):
+    def setUp(self):
+        self.executor = XABoundedExecutor(max_workers=4)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def test_ordered(self):
+        def slow_square(item, index):
+            # Later items finish first
+            time.sleep((50 - item) / 10000)
+            return square(item, index)
+
+        results = list(thread_map(slow_square, list(range(50)), 3, self.executor))
+        self.assertEqual(results, [square(x, x) for x in range(50)])
+
+    def test_unordered(self):
+        results = list(thread_map(square, list(range(50)), 4, self.executor, ordered=False))
+        self.assertEqual(sorted(results), [square(x, x) for x in range(50)])
+
+    def test_chunks_run_in_parallel(self):
+        threads = set()
+
+        def record(item, index):
+            threads.add(threading.current_thread().name)
+            time.sleep(0.002)
+            return item
+
+        list(thread_map(record, list(range(40)), 1, self.executor))
+        self.assertGreater(len(threads), 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            list(thread_map(fail_on_odd, list(range(10)), 2, self.executor))
+
+        results = list(thread_map(fail_on_odd, list(range(10)), 2, self.executor, errors="return"))
+        self.assertEqual(len(results), 10)
+        self.assertIsInstance(results[3], ValueError)
+
+        results = list(thread_map(fail_on_odd, list(range(10)), 2, self.executor, errors="skip"))
+        self.assertEqual(results, [0, 2, 4, 6, 8])
+
+    def test_nested_batches(self):
+        # The mapped function runs another batch on the same executor while the map holds every slot
+        def nested(item, index):
+            return sum(self.executor.map(lambda x: x * item, range(3)))
+
+        results = []
+        worker = threading.Thread(
+            target=lambda: results.extend(thread_map(nested, list(range(40)), 1, self.executor)), daemon=True
+        )
+        worker.start()
+        worker.join(5)
+        self.assertFalse(worker.is_alive())
+        self.assertEqual(results, [3 * x for x in range(40)])
+
+    def test_empty(self):
+        self.assertEqual(list(thread_map(square, [], executor=self.executor)), [])
+
+
+class TestProcessMap(unittest.TestCase):
+    def test_ordered(self):
+        results = list(process_map(square, list(range(100)), max_workers=2))
+        self.assertEqual(results, [square(x, x) for x in range(100)])
+
+    def test_unordered_and_errors(self):
+        results = list(process_map(fail_on_odd, list(range(20)), 3, 2, ordered=False, errors="skip"))
+        self.assertEqual(sorted(results), list(range(0, 20, 2)))
+
+        with self.assertRaises(ValueError):
+            list(process_map(fail_on_odd, list(range(20)), 3, 2))
+
+    def test_empty(self):
+        self.assertEqual(list(process_map(square, [])), [])
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_values(self):
+        self.assertIs(type(snapshot(PyObjCLikeString("name"))), str)
+        self.assertEqual(snapshot(FakeDate(0)), datetime.fromtimestamp(0))
+        self.assertEqual(snapshot({"a": [1, FakeDate(60)]}), {"a": [1, datetime.fromtimestamp(60)]})
+        self.assertEqual(snapshot((True, None, 2.5)), [True, None, 2.5])
+
+    def test_rows(self):
+        rows = snapshot_rows({"name": ["a", "b"], "count": [1, 2]})
+        self.assertEqual(rows, [{"name": "a", "count": 1}, {"name": "b", "count": 2}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+
+from PyXA.XAErrors import InvalidPredicateError
+from PyXA.XAPredicates import (
+    compile_conditions,
+    compile_format,
+    filter_items,
+    is_python_data,
+)
+
+
+class TestPredicates(unittest.TestCase):
+    def setUp(self):
+        self.items = [
+            {"name": "Example", "size": 10, "tags": ["a"], "owner": {"name": "Steve"}},
+            {"name": "Other", "size": 20, "tags": ["b"], "owner": {"name": "Dan"}},
+            {"name": "éxotic", "size": 5, "tags": [], "owner": None},
+        ]
+
+    def names(self, predicate):
+        return [x["name"] for x in filter_items(self.items, predicate)]
+
+    def test_conditions(self):
+        self.assertEqual(self.names(compile_conditions(["size"], ["=="], [10])), ["Example"])
+        self.assertEqual(self.names(compile_conditions(["size"], ["!="], [10])), ["Other", "éxotic"])
+        self.assertEqual(self.names(compile_conditions(["size"], [">"], [5])), ["Example", "Other"])
+        self.assertEqual(self.names(compile_conditions(["size"], ["<="], [10])), ["Example", "éxotic"])
+        self.assertEqual(self.names(compile_conditions(["size"], ["BETWEEN"], [[5, 10]])), ["Example", "éxotic"])
+        self.assertEqual(self.names(compile_conditions(["name"], ["BEGINSWITH"], ["Ex"])), ["Example"])
+        self.assertEqual(self.names(compile_conditions(["name"], ["ENDSWITH"], ["er"])), ["Other"])
+        self.assertEqual(self.names(compile_conditions(["name"], ["CONTAINS"], ["x"])), ["Example", "éxotic"])
+        self.assertEqual(self.names(compile_conditions(["name"], ["MATCHES"], ["O.*"])), ["Other"])
+
+    def test_conditions_are_joined_by_and(self):
+        predicate = compile_conditions(["name", "size"], ["CONTAINS", "<"], ["x", 10])
+        self.assertEqual(self.names(predicate), ["éxotic"])
+
+    def test_key_paths(self):
+        self.assertEqual(self.names(compile_format("owner.name == 'Dan'")), ["Other"])
+
+    def test_format_strings(self):
+        self.assertEqual(self.names(compile_format("name BEGINSWITH[c] 'ex' OR size > %@", 15)), ["Example", "Other"])
+        self.assertEqual(self.names(compile_format("name BEGINSWITH[cd] 'ex'")), ["Example", "éxotic"])
+        self.assertEqual(self.names(compile_format("size BETWEEN {5, 10} AND NOT (name == 'Example')")), ["éxotic"])
+        self.assertEqual(self.names(compile_format("'a' IN tags")), ["Example"])
+        self.assertEqual(self.names(compile_format("%K LIKE[c] 'ex*'", "name")), ["Example"])
+        self.assertEqual(self.names(compile_format("TRUEPREDICATE")), ["Example", "Other", "éxotic"])
+
+    def test_self(self):
+        predicate = compile_format("SELF ENDSWITH 'bc' && SELF != \"xbc\"")
+        self.assertEqual(filter_items(["abc", "xbc", "bcd"], predicate), ["abc"])
+
+    def test_unsupported_format(self):
+        with self.assertRaises(InvalidPredicateError):
+            compile_format("ANY tags == 'a'")
+
+        with self.assertRaises(InvalidPredicateError):
+            compile_format("size >")
+
+    def test_is_python_data(self):
+        self.assertTrue(is_python_data(self.items))
+        self.assertTrue(is_python_data(["a", "b"]))
+        self.assertFalse(is_python_data([]))
+        self.assertFalse(is_python_data([object()]))
+
+
+if __name__ == "__main__":
+    unittest.main()
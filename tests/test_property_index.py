@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime
+from enum import IntEnum
+
+from PyXA.XAPropertyIndex import XAPropertyIndex
+
+
+class TestXAPropertyIndex(unittest.TestCase):
+    def test_first_position_wins(self):
+        index = XAPropertyIndex("name", ["a", "b", "a", "c"])
+        self.assertEqual(index.position("a"), 0)
+        self.assertEqual(index.position("c"), 3)
+        self.assertIsNone(index.position("d"))
+        self.assertEqual(len(index), 3)
+        self.assertTrue(index.complete)
+
+    def test_positions(self):
+        values = [f"id{i}" for i in range(1000)]
+        index = XAPropertyIndex("id", values)
+        self.assertEqual(index.positions(["id999", "missing", "id0"]), [999, None, 0])
+        self.assertIn("id5", index)
+        self.assertNotIn("id1000", index)
+
+    def test_unhashable_values(self):
+        index = XAPropertyIndex("tags", [["a"], "b", None])
+        self.assertFalse(index.complete)
+        self.assertEqual(index.position("b"), 1)
+        self.assertEqual(index.position(None), 2)
+        self.assertIsNone(index.position(["a"]))
+
+    def test_excludes(self):
+        class Kind(IntEnum):
+            SONG = 3
+
+        index = XAPropertyIndex("size", [1, 2.5, "a"])
+        self.assertTrue(index.excludes(3))
+        self.assertTrue(index.excludes("b"))
+        self.assertFalse(index.excludes(1))
+
+        # Values of other types may equal the raw indexed values, so they must be filtered for
+        self.assertFalse(index.excludes(datetime(2022, 10, 3)))
+        self.assertFalse(index.excludes(Kind.SONG))
+        self.assertFalse(index.excludes(None))
+
+        incomplete = XAPropertyIndex("tags", [["a"], "b"])
+        self.assertFalse(incomplete.excludes("c"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+
+from PyXA.XAQueryResults import XAQueryResults, query_key
+
+
+class FakeQuery:
+    """Stands in for NSMetadataQuery, recording how its results are read."""
+
+    def __init__(self):
+        self.items = []
+        self.reads = []
+        self.updates_enabled = True
+
+    def disableUpdates(self):
+        self.updates_enabled = False
+
+    def enableUpdates(self):
+        self.updates_enabled = True
+
+    def resultCount(self):
+        return len(self.items)
+
+    def resultAtIndex_(self, index):
+        # Results must only be read while updates are paused
+        assert not self.updates_enabled
+        self.reads.append(index)
+        if self.items[index] == "broken":
+            raise RuntimeError(index)
+        return self.items[index]
+
+
+def path(item):
+    return "/" + item
+
+
+class TestXAQueryResults(unittest.TestCase):
+    def setUp(self):
+        self.query = FakeQuery()
+        self.results = XAQueryResults(path)
+
+    def test_gather_reads_only_new_results(self):
+        self.query.items = ["a", "b"]
+        self.assertEqual(self.results.gather(self.query), ["/a", "/b"])
+        self.query.items += ["c"]
+        self.assertEqual(self.results.gather(self.query), ["/c"])
+        self.assertEqual(self.results.gather(self.query), [])
+
+        self.assertEqual(self.query.reads, [0, 1, 2])
+        self.assertEqual(self.results.gathered, ["/a", "/b", "/c"])
+        self.assertEqual(self.results.results, ["/a", "/b", "/c"])
+        self.assertTrue(self.query.updates_enabled)
+
+    def test_updates_are_enabled_after_errors(self):
+        self.query.items = ["a", "broken"]
+        with self.assertRaises(RuntimeError):
+            self.results.gather(self.query)
+        self.assertTrue(self.query.updates_enabled)
+
+    def test_updates(self):
+        self.query.items = ["a", "b"]
+        self.results.gather(self.query)
+
+        # b is renamed, a is deleted, and c and d are created
+        self.query.items = ["b", "c", "d"]
+        changes = self.results.update(["c", "d", "b"], ["a", "x"], ["b"], 3)
+        self.assertEqual(changes, (["/c", "/d"], ["/a", "/x"], ["/b"]))
+        self.assertEqual(self.results.results, ["/b", "/c", "/d"])
+        self.assertEqual(len(self.results), 3)
+
+        # Gathering after an update does not report the updated items again
+        self.assertEqual(self.results.gather(self.query), [])
+        self.assertEqual(self.results.gathered, ["/a", "/b"])
+
+    def test_results_are_cached_until_changed(self):
+        self.query.items = ["a"]
+        self.results.gather(self.query)
+        results = self.results.results
+        self.assertIs(self.results.results, results)
+
+        self.query.items += ["b"]
+        self.results.gather(self.query)
+        self.assertIsNot(self.results.results, results)
+        self.assertEqual(self.results.results, ["/a", "/b"])
+
+    def test_extend(self):
+        self.results.extend(["a", "b", "a"])
+        self.assertEqual(self.results.gathered, ["/a", "/b"])
+
+    def test_query_key(self):
+        self.assertIsNone(query_key((), None))
+        self.assertEqual(query_key(("a", 1), None), query_key(["a", 1], None))
+        self.assertNotEqual(query_key(("a",), None), query_key(("b",), None))
+        self.assertEqual(query_key(("a",), "kMDItemFSName == 'a'"), query_key((), "kMDItemFSName == 'a'"))
+
+
+if __name__ == "__main__":
+    unittest.main()
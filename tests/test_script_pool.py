@@ -0,0 +1,91 @@
+import os
+import sys
+import time
+import unittest
+from datetime import datetime, timezone
+
+from PyXA.XAErrors import ScriptWorkerError
+from PyXA.XAScripting import AppleScriptPool, decode_message, encode_message
+
+FAKE_WORKER = [sys.executable, os.path.join(os.path.dirname(__file__), "fake_osascript.py")]
+
+
+class TestAppleScriptPool(unittest.TestCase):
+    def pool(self, **kwargs):
+        pool = AppleScriptPool(command=FAKE_WORKER, **kwargs)
+        self.addCleanup(pool.close)
+        return pool
+
+    def test_results(self):
+        pool = self.pool(size=2)
+        result = pool.run("return hello")
+        self.assertEqual(result["string"], "hello")
+        self.assertIsNone(result["event"])
+        self.assertEqual(pool.run(["return a", "b"])["string"], "a\nb")
+
+    def test_arguments_keep_their_types(self):
+        args = [1, 2.5, "x", True, None, datetime(2022, 10, 3, tzinfo=timezone.utc), [1, {"a": b"\x00"}]]
+        self.assertEqual(self.pool(size=1).run("args", args)["data"], args)
+
+    def test_scripts_run_in_parallel(self):
+        pool = self.pool(size=4)
+        start = time.perf_counter()
+        results = pool.run_many(["delay 0.3"] * 4)
+        self.assertLess(time.perf_counter() - start, 1.0)
+        self.assertEqual(len({result["int"] for result in results}), 4)
+
+        metrics = pool.metrics()
+        self.assertEqual(metrics["scripts"], 4)
+        self.assertGreater(metrics["busy_time"], 1.0)
+        self.assertGreater(metrics["throughput"], 0)
+
+    def test_script_errors(self):
+        pool = self.pool(size=1)
+        pid = pool.run("return 1")["int"]
+        with self.assertRaises(ScriptWorkerError) as context:
+            pool.run("fail -1728")
+        self.assertEqual(context.exception.number, -1728)
+
+        # Script errors don't affect the worker
+        self.assertEqual(pool.run("return 1")["int"], pid)
+        self.assertEqual(pool.metrics()["errors"], 1)
+
+    def test_crashed_workers_are_replaced(self):
+        pool = self.pool(size=1)
+        with self.assertRaises(ScriptWorkerError) as context:
+            pool.run("crash")
+        self.assertIsNone(context.exception.number)
+        self.assertEqual(pool.run("return ok")["string"], "ok")
+        self.assertEqual(pool.metrics()["crashes"], 1)
+        self.assertEqual(pool.metrics()["restarts"], 1)
+
+    def test_timeouts(self):
+        pool = self.pool(size=1, timeout=0.2)
+        with self.assertRaises(TimeoutError):
+            pool.run("delay 5")
+        self.assertEqual(pool.run("delay 0.5", timeout=2)["string"], None)
+        self.assertEqual(pool.metrics()["timeouts"], 1)
+
+    def test_recycling(self):
+        pool = self.pool(size=1, recycle_after=2)
+        pids = [pool.run("return x")["int"] for _ in range(4)]
+        self.assertEqual(pids[0], pids[1])
+        self.assertNotEqual(pids[1], pids[2])
+        self.assertEqual(pool.metrics()["restarts"], 2)
+
+    def test_closed_pool(self):
+        pool = self.pool(size=1)
+        pool.close()
+        with self.assertRaises(ScriptWorkerError):
+            pool.run("return 1")
+
+    def test_protocol_round_trip(self):
+        message = {"script": "return 1", "args": [datetime(2022, 1, 1), b"abc", os.sep]}
+        line = encode_message(message)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(line.count(b"\n"), 1)
+        self.assertEqual(decode_message(line), message)
+
+
+if __name__ == "__main__":
+    unittest.main()
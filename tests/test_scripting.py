@@ -0,0 +1,160 @@
+import pathlib
+import threading
+import time
+import unittest
+from datetime import date, datetime
+
+from PyXA.XAScripting import XADescriptorFactory, XAScriptCache, run_event, to_descriptor
+
+
+class FakeDescriptors(XADescriptorFactory):
+    """Represents descriptors as (type, value) tuples."""
+
+    def null(self):
+        return ("null", None)
+
+    def boolean(self, value):
+        return ("bool", value)
+
+    def integer(self, value):
+        return ("int", value)
+
+    def real(self, value):
+        return ("real", value)
+
+    def string(self, value):
+        return ("string", value)
+
+    def date(self, value):
+        return ("date", value)
+
+    def file(self, path):
+        return ("file", path)
+
+    def list(self, items):
+        return ("list", items)
+
+    def record(self, fields):
+        return ("record", fields)
+
+    def run_event(self, arguments):
+        return ("event", arguments)
+
+
+class FakeCompiler:
+    def __init__(self):
+        self.compiled = []
+
+    def __call__(self, source):
+        if "syntax error" in source:
+            raise ValueError(source)
+        self.compiled.append(source)
+        return object()
+
+
+class TestXAScriptCache(unittest.TestCase):
+    def test_scripts_are_compiled_once(self):
+        compiler = FakeCompiler()
+        cache = XAScriptCache(compiler)
+        script = cache.get("return 1")
+        self.assertIs(cache.get("return 1"), script)
+        self.assertIsNot(cache.get("return 2"), script)
+
+        info = cache.cache_info()
+        self.assertEqual((info["hits"], info["misses"], info["size"]), (1, 2, 2))
+        self.assertGreaterEqual(info["compile_time"], 0)
+        self.assertEqual(compiler.compiled, ["return 1", "return 2"])
+
+    def test_least_recently_used_scripts_are_evicted(self):
+        compiler = FakeCompiler()
+        cache = XAScriptCache(compiler, max_size=2)
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")
+        cache.get("c")
+        cache.get("a")
+        cache.get("b")
+        self.assertEqual(compiler.compiled, ["a", "b", "c", "b"])
+        self.assertEqual(len(cache), 2)
+
+    def test_errors_are_not_cached(self):
+        cache = XAScriptCache(FakeCompiler())
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get("syntax error")
+        self.assertEqual(cache.cache_info()["misses"], 0)
+
+        cache.get("return 1")
+        cache.clear()
+        self.assertEqual(cache.cache_info(), {"hits": 0, "misses": 0, "compile_time": 0.0, "size": 0, "max_size": 128})
+
+    def test_checkout_is_exclusive(self):
+        cache = XAScriptCache(FakeCompiler())
+        state = {"running": 0, "peak": 0}
+        lock = threading.Lock()
+
+        def run():
+            with cache.checkout("return 1") as script:
+                self.assertIs(script, cache.get("return 1"))
+                with lock:
+                    state["running"] += 1
+                    state["peak"] = max(state["peak"], state["running"])
+                time.sleep(0.002)
+                with lock:
+                    state["running"] -= 1
+
+        threads = [threading.Thread(target=lambda: [run() for _ in range(10)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(state["peak"], 1)
+
+        # Other scripts can run meanwhile
+        with cache.checkout("return 1"):
+            with cache.checkout("return 2"):
+                pass
+
+    def test_concurrent_use(self):
+        cache = XAScriptCache(FakeCompiler(), max_size=8)
+        threads = [threading.Thread(target=lambda: [cache.get(str(i % 10)) for i in range(500)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = cache.cache_info()
+        self.assertEqual(info["hits"] + info["misses"], 2000)
+        self.assertEqual(info["size"], 8)
+
+
+class TestArgumentMarshalling(unittest.TestCase):
+    def setUp(self):
+        self.factory = FakeDescriptors()
+
+    def test_scalars(self):
+        convert = lambda x: to_descriptor(x, self.factory)
+        self.assertEqual(convert(None), ("null", None))
+        self.assertEqual(convert(True), ("bool", True))
+        self.assertEqual(convert(5), ("int", 5))
+        self.assertEqual(convert(2**40), ("real", float(2**40)))
+        self.assertEqual(convert(1.5), ("real", 1.5))
+        self.assertEqual(convert("text"), ("string", "text"))
+        self.assertEqual(convert(datetime(2022, 10, 3, 12)), ("date", datetime(2022, 10, 3, 12)))
+        self.assertEqual(convert(date(2022, 10, 3)), ("date", datetime(2022, 10, 3)))
+        self.assertEqual(convert(pathlib.PurePosixPath("/tmp/a.txt")), ("file", "/tmp/a.txt"))
+        self.assertEqual(convert(complex(1, 2)), ("string", "(1+2j)"))
+
+    def test_collections(self):
+        self.assertEqual(
+            to_descriptor({"name": "A", "tags": [1, "b"]}, self.factory),
+            ("record", {"name": ("string", "A"), "tags": ("list", [("int", 1), ("string", "b")])}),
+        )
+
+    def test_run_event(self):
+        self.assertEqual(run_event([5, "6"], self.factory), ("event", ("list", [("int", 5), ("string", "6")])))
+        self.assertEqual(run_event(5, self.factory), ("event", ("list", [("int", 5)])))
+        self.assertEqual(run_event(None, self.factory), ("event", ("list", [])))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+from PyXA.XASpecialization import XASpecializable
+
+
+class FakeElement:
+    def __init__(self, object_class):
+        self.object_class = object_class
+        self.lookups = 0
+
+
+class Item:
+    __slots__ = ("xa_elem",)
+
+    def __init__(self, element):
+        self.xa_elem = element
+
+
+class Track(Item, XASpecializable):
+    __slots__ = ()
+
+    @property
+    def object_class(self):
+        self.xa_elem.lookups += 1
+        return self.xa_elem.object_class
+
+    @property
+    def name(self):
+        return "name"
+
+
+class FileTrack(Track):
+    __slots__ = ()
+
+    @property
+    def location(self):
+        return "/path"
+
+    @location.setter
+    def location(self, location):
+        self.xa_elem.location = location
+
+
+class URLTrack(Track):
+    __slots__ = ()
+
+    def address(self):
+        return "https://example.com"
+
+
+Track._xa_specializations = {"file": FileTrack, "url": URLTrack}
+
+
+class TestXASpecializable(unittest.TestCase):
+    def test_creation_does_not_look_up_class(self):
+        element = FakeElement("file")
+        track = Track(element)
+        self.assertIs(type(track), Track)
+        self.assertEqual(track.name, "name")
+        self.assertEqual(element.lookups, 0)
+        self.assertFalse(hasattr(track, "__dict__"))
+
+    def test_subclass_attribute_specializes(self):
+        element = FakeElement("file")
+        track = Track(element)
+        self.assertEqual(track.location, "/path")
+        self.assertIs(type(track), FileTrack)
+        self.assertEqual(track.location, "/path")
+        self.assertEqual(element.lookups, 1)
+
+    def test_subclass_setter_specializes(self):
+        element = FakeElement("file")
+        track = Track(element)
+        track.location = "/other"
+        self.assertIs(type(track), FileTrack)
+        self.assertEqual(element.location, "/other")
+
+    def test_attribute_of_other_subclass(self):
+        track = Track(FakeElement("url"))
+        with self.assertRaises(AttributeError):
+            track.location
+        self.assertIs(type(track), URLTrack)
+        self.assertEqual(track.address(), "https://example.com")
+
+    def test_unknown_class_and_attribute(self):
+        element = FakeElement("other")
+        track = Track(element)
+        with self.assertRaises(AttributeError):
+            track.location
+        self.assertIs(type(track), Track)
+
+        with self.assertRaises(AttributeError):
+            track.missing
+        self.assertEqual(element.lookups, 1)
+
+    def test_specialize(self):
+        element = FakeElement("url")
+        track = Track(element)
+        self.assertIs(track.specialize(), track)
+        self.assertIs(type(track), URLTrack)
+        track.specialize()
+        self.assertEqual(element.lookups, 1)
+
+    def test_created_subclass_is_not_respecialized(self):
+        element = FakeElement("url")
+        track = FileTrack(element)
+        track.specialize()
+        self.assertIs(type(track), FileTrack)
+        self.assertEqual(element.lookups, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
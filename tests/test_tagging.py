@@ -0,0 +1,116 @@
+import re
+import unittest
+
+from PyXA.XATagging import SCHEMES, UNITS, NLTaggerOmitPunctuation, TaggingEngine, XATagSpan
+
+TAGS = {
+    "LexicalClass": lambda token: "Noun" if token[0].isupper() else "Word",
+    "Lemma": lambda token: token.lower().rstrip("s"),
+    "Language": lambda token: "en",
+}
+
+
+def utf16_length(text):
+    return len(text.encode("utf-16-le")) // 2
+
+
+class FakeTagger:
+    """Tags words and paragraphs, reporting ranges in UTF-16 code units like NLTagger."""
+
+    created = []
+
+    def __init__(self, schemes):
+        self.schemes = schemes
+        self.string = None
+        self.enumerations = 0
+        FakeTagger.created.append(self)
+
+    def setString_(self, string):
+        self.string = string
+
+    def tokens(self, unit, options):
+        pattern = r"\w+|[^\w\s]" if unit == UNITS["word"] else r"[^\n]*\n?"
+        for match in re.finditer(pattern, self.string):
+            token = match.group()
+            if token == "" or (options & NLTaggerOmitPunctuation and not token[0].isalnum()):
+                continue
+            start = utf16_length(self.string[: match.start()])
+            yield token, (start, utf16_length(token))
+
+    def enumerateTagsInRange_unit_scheme_options_usingBlock_(self, range, unit, scheme, options, block):
+        assert scheme in self.schemes
+        self.enumerations += 1
+        for token, token_range in self.tokens(unit, options):
+            block(TAGS[scheme](token), token_range, None)
+
+    def tagAtIndex_unit_scheme_tokenRange_(self, index, unit, scheme, token_range):
+        assert scheme in self.schemes
+        for token, token_range in self.tokens(unit, 0):
+            if token_range[0] <= index < token_range[0] + token_range[1]:
+                return TAGS[scheme](token), token_range
+        return None, (index, 0)
+
+
+class TestTaggingEngine(unittest.TestCase):
+    def setUp(self):
+        FakeTagger.created = []
+        self.engine = TaggingEngine(FakeTagger)
+
+    def test_single_scheme(self):
+        text = "Apples and pears."
+        spans = self.engine.tag(text, ["parts_of_speech"])
+        self.assertEqual(
+            spans["parts_of_speech"],
+            [XATagSpan(0, 6, "Noun"), XATagSpan(7, 10, "Word"), XATagSpan(11, 16, "Word")],
+        )
+        self.assertEqual([x.substring(text) for x in spans["parts_of_speech"]], ["Apples", "and", "pears"])
+
+    def test_several_schemes_in_one_pass(self):
+        spans = self.engine.tag("Apples and pears", ["parts_of_speech", "lemmas"])
+        self.assertEqual([x.tag for x in spans["lemmas"]], ["apple", "and", "pear"])
+        self.assertEqual([x[:2] for x in spans["lemmas"]], [x[:2] for x in spans["parts_of_speech"]])
+        self.assertEqual(len(FakeTagger.created), 1)
+        self.assertEqual(FakeTagger.created[0].enumerations, 1)
+        self.assertEqual(FakeTagger.created[0].schemes, sorted([SCHEMES["parts_of_speech"], SCHEMES["lemmas"]]))
+
+    def test_taggers_are_reused(self):
+        texts = ["One note", "Another note", "A third note"]
+        results = list(self.engine.tag_many(texts, ["lemmas", "parts_of_speech"]))
+        self.engine.tag("Reordered schemes", ["parts_of_speech", "lemmas"])
+        self.engine.tag("Different schemes", ["languages"])
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(len(results[2]["lemmas"]), 3)
+        self.assertEqual(len(FakeTagger.created), 2)
+
+    def test_batch_accepts_text_objects(self):
+        class Text:
+            def __init__(self, string):
+                self.xa_elem = string
+
+        class TextList:
+            xa_elem = ["First text", "Second text"]
+
+        self.assertEqual(len(list(self.engine.tag_many(TextList(), ["lemmas"]))), 2)
+        self.assertEqual(self.engine.tag(Text("Wrapped text"), ["lemmas"])["lemmas"][1].tag, "text")
+
+    def test_units_and_blank_tokens(self):
+        text = "First line\n\nSecond line"
+        spans = self.engine.tag(text, ["languages"], unit="paragraph", omit_whitespace=False)
+        self.assertEqual([x.substring(text) for x in spans["languages"]], ["First line\n", "Second line"])
+
+    def test_offsets_outside_the_bmp(self):
+        text = "Party \U0001F389 time"
+        spans = self.engine.tag(text, ["parts_of_speech"], omit_punctuation=False)["parts_of_speech"]
+        self.assertEqual([x.substring(text) for x in spans], ["Party", "\U0001F389", "time"])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            self.engine.tag("Text", ["colors"])
+        with self.assertRaises(ValueError):
+            self.engine.tag("Text", ["lemmas"], unit="chapter")
+        self.assertEqual(self.engine.tag("Text", []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import unittest
+
+from PyXA.XAViews import XAListView, compose_slices, view_of
+
+
+class FakeArray:
+    """Records the operations used to resolve a view."""
+
+    def __init__(self, items, log):
+        self.items = items
+        self.log = log
+
+    def __len__(self):
+        self.log.append("count")
+        return len(self.items)
+
+
+def resolver(log):
+    def subarray(array, start, length):
+        log.append(("subarray", start, length))
+        return FakeArray(array.items[start : start + length], log)
+
+    def take(array, indices):
+        log.append(("take", indices))
+        return FakeArray([array.items[i] for i in indices], log)
+
+    def filter(array, predicates):
+        log.append(("filter", len(predicates)))
+        return FakeArray([x for x in array.items if all(p(x) for p in predicates)], log)
+
+    return len, subarray, take, filter
+
+
+class TestComposeSlices(unittest.TestCase):
+    def test_matches_python_slicing(self):
+        items = list(range(50))
+        cases = [
+            [slice(None, 10)],
+            [slice(-10, None)],
+            [slice(5, -5), slice(2, None, 3)],
+            [slice(None, None, -1), slice(3, 8)],
+            [slice(100, 200)],
+            [slice(-100, 5), slice(None, -1)],
+            [slice(10, 40, 2), slice(None, None, -2)],
+        ]
+        for slices in cases:
+            expected = items
+            for key in slices:
+                expected = expected[key]
+            self.assertEqual([items[i] for i in compose_slices(len(items), slices)], expected, slices)
+
+
+class TestXAListView(unittest.TestCase):
+    def setUp(self):
+        self.log = []
+        self.source = FakeArray(list(range(100)), self.log)
+
+    def test_views_are_immutable(self):
+        view = XAListView(self.source)
+        sliced = view.slice(slice(0, 10))
+        self.assertEqual(view.operations, ())
+        self.assertEqual(len(sliced.operations), 1)
+
+    def test_slices_resolve_to_one_subarray(self):
+        view = XAListView(self.source).slice(slice(10, None)).slice(slice(None, -5)).slice(slice(2, 20))
+        result = view.resolve(*resolver(self.log))
+        self.assertEqual(result.items, list(range(12, 30)))
+        self.assertEqual(self.log, ["count", ("subarray", 12, 18)])
+
+    def test_stepped_slice_uses_take(self):
+        result = XAListView(self.source).slice(slice(None, None, -10)).resolve(*resolver(self.log))
+        self.assertEqual(result.items, list(range(99, -1, -10)))
+        self.assertEqual(self.log[1], ("take", range(99, -1, -10)))
+
+    def test_filters_are_combined(self):
+        view = (
+            XAListView(self.source)
+            .filter(lambda x: x % 2 == 0)
+            .filter(lambda x: x > 50)
+            .slice(slice(None, 3))
+            .filter(lambda x: x != 54)
+        )
+        result = view.resolve(*resolver(self.log))
+        self.assertEqual(result.items, [52, 56])
+        self.assertEqual(self.log, [("filter", 2), "count", ("subarray", 0, 3), ("filter", 1)])
+
+    def test_length(self):
+        view = XAListView(self.source).slice(slice(-30, None)).slice(slice(None, None, 4))
+        self.assertEqual(view.length(len), 8)
+        self.assertIsNone(view.filter(lambda x: True).length(len))
+        self.assertEqual(self.log, ["count"])
+
+    def test_empty_slice(self):
+        result = XAListView(self.source).slice(slice(200, 300)).resolve(*resolver(self.log))
+        self.assertEqual(result.items, [])
+        self.assertEqual(self.log[1], ("subarray", 100, 0))
+
+    def test_mutable_sources_are_copied(self):
+        items = ["a", "b", "c"]
+        head = view_of(items, mutable=True).slice(slice(None, 2))
+        items.insert(0, "x")
+        self.assertEqual(head.resolve(len, lambda a, start, length: a[start : start + length], None, None), ["a", "b"])
+
+        shared = view_of(items, mutable=False)
+        self.assertIs(shared.source, items)
+
+
+if __name__ == "__main__":
+    unittest.main()